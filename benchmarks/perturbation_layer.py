@@ -0,0 +1,150 @@
+"""
+Measures the overhead a PerturbationLayer adds to the activation it wraps.
+
+The device resident layer is compared with the previous implementation,
+which moved every activation to the host and back to perturb it.
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+import torch
+from torch import nn
+
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.noises.model_distribution_shift.bitflip import Bitflip
+from neuroshift.model.noises.model_distribution_shift.stuck_at_fault import (
+    StuckAtFault,
+)
+from neuroshift.model.noises.multiplicative_gaussian import (
+    MultiplicativeGaussian,
+)
+from neuroshift.model.noises.perturbation import Perturbation
+from neuroshift.model.noises.targets.perturbation_layer import (
+    PerturbationLayer,
+)
+from neuroshift.model.noises.targets.target import Target
+
+SHAPES: List[Tuple[int, ...]] = [(32, 64, 56, 56), (32, 256, 14, 14)]
+WARMUP: int = 3
+REPEATS: int = 20
+
+
+class HostRoundTripLayer(nn.Module):
+    """
+    The previous PerturbationLayer, perturbing the activation on the host.
+    """
+
+    def __init__(
+        self,
+        layer: nn.Module,
+        perturbation: Perturbation,
+        device: torch.device,
+    ) -> None:
+        """
+        Initializes a HostRoundTripLayer object.
+
+        Args:
+            layer (nn.Module): The layer to be perturbed.
+            perturbation (Perturbation): The perturbation to apply.
+            device (torch.device): The device of the model.
+        """
+        super().__init__()
+        self.__layer: nn.Module = layer
+        self.__perturbation: Perturbation = perturbation
+        self.__device: torch.device = device
+
+    def forward(self, tensor: torch.Tensor) -> torch.Tensor:
+        """
+        Forward pass of the layer.
+
+        Args:
+            tensor (torch.Tensor): The input tensor.
+
+        Returns:
+            torch.Tensor: The perturbed output of the layer.
+        """
+        tensor = self.__layer(tensor)
+
+        return self.__perturbation.apply_to_tensor(tensor.to("cpu")).to(
+            self.__device
+        )
+
+
+def measure(
+    function: Callable[[torch.Tensor], torch.Tensor],
+    tensor: torch.Tensor,
+) -> float:
+    """
+    Measure the mean time of a call.
+
+    Args:
+        function (Callable[[torch.Tensor], torch.Tensor]): The function.
+        tensor (torch.Tensor): The argument of the function.
+
+    Returns:
+        float: The mean time of a call in milliseconds.
+    """
+    with torch.no_grad():
+        for _ in range(WARMUP):
+            function(tensor)
+
+        if tensor.is_cuda:
+            torch.cuda.synchronize()
+
+        start = time.perf_counter()
+        for _ in range(REPEATS):
+            function(tensor)
+
+        if tensor.is_cuda:
+            torch.cuda.synchronize()
+
+    return (time.perf_counter() - start) * 1000 / REPEATS
+
+
+def main() -> None:
+    """
+    Run the benchmark on every available device and print the overhead
+        of each perturbation per layer call.
+    """
+    devices = [torch.device("cpu")]
+    if torch.cuda.is_available():
+        devices.append(torch.device("cuda:0"))
+
+    perturbations: List[Perturbation] = [
+        AdditiveGaussian(),
+        MultiplicativeGaussian(),
+        Bitflip(),
+        StuckAtFault(),
+    ]
+    for perturbation in perturbations:
+        perturbation.set_target(Target.MODEL_ACTIVATION)
+
+    print(
+        f"{'device':<8}{'shape':<20}{'perturbation':<26}"
+        f"{'relu':>10}{'host':>10}{'device':>10}"
+    )
+    for device in devices:
+        for shape in SHAPES:
+            tensor = torch.rand(shape, device=device)
+            activation = nn.ReLU()
+            baseline = measure(activation, tensor)
+
+            for perturbation in perturbations:
+                generator = torch.Generator(device=device)
+                host = HostRoundTripLayer(activation, perturbation, device)
+                resident = PerturbationLayer(
+                    activation, perturbation, generator=generator
+                )
+
+                print(
+                    f"{device.type:<8}{str(shape):<20}"
+                    f"{perturbation.get_name():<26}"
+                    f"{baseline:>8.2f}ms"
+                    f"{measure(host, tensor) - baseline:>8.2f}ms"
+                    f"{measure(resident, tensor) - baseline:>8.2f}ms"
+                )
+
+
+if __name__ == "__main__":
+    main()
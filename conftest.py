@@ -23,6 +23,8 @@ WANTED_SUBDIRS = [
     "testanalytics",
     "models/database",
     "datasets/database",
+    "cache",
+    "records",
 ]
 
 DO_NOT_DELETE = ["testfiles", "testdatasets", "testmodels", "testanalytics"]
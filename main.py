@@ -14,6 +14,7 @@ if __name__ == "__main__":
 
     JOB_QUEUE = JobQueue.get_instance()
     JOB_QUEUE.start_workers(conf.WORKERS)
+    JOB_QUEUE.resume_jobs()
 
     PATH = "neuroshift/view/page_runners/"
 
@@ -50,8 +50,13 @@ def load_conf(path: str) -> None:
 
 config_file: str | None = "neuroconf.toml"
 MAX_RETRIES: int = 3
+RETRY_BACKOFF: float = 1.0
+JOB_TIMEOUT: float = 0.0
 BATCH_SIZE: int = 32
 WORKERS: int = 3
+PREFETCH_DEPTH: int = 2
+CHECKPOINT_INTERVAL: int = 100
+BATCH_WINDOW: float = 0.01
 ANALYTICS_PATH: str = "data/analytics/"
 DATASET_PATH: str = "data/datasets/"
 DATASET_SETTINGS: str = "datasets.json"
@@ -62,6 +67,12 @@ ALLOWED_MODEL_FILETYPES: List[str] = [".onnx"]
 ALLOWED_IMAGE_FILETYPES: List[str] = [".jpg", ".jpeg", ".png"]
 ANALYTIC_NAMES: List[str] = ["key"]
 MAX_WIDTH: int = 500
+CACHE_PATH: str = "data/cache/"
+RESULT_CACHE_SIZE: int = 256
+RESULT_CACHE_AGE: int = 604800
+ACTIVATION_CACHE_ON_DISK: bool = False
+ACTIVATION_CACHE_SIZE: int = 268435456
+DATASET_CACHE_SIZE: int = 1073741824
 
 if config_file is not None:
     load_conf(config_file)
@@ -1,8 +1,9 @@
 """This module contains the AnalyticsController class."""
 
-from typing_extensions import List
+from typing_extensions import Iterator, List
 
 from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytic_record import AnalyticRecord
 from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.data.model import Model
 from neuroshift.model.data.dataset import Dataset
@@ -80,6 +81,36 @@ class AnalyticsController:
         """
         return AnalyticsController.__analytics.get_analytic(job_id)
 
+    @staticmethod
+    def follow_progress(job_id: str) -> Iterator[Analytic]:
+        """
+        Follow the progress of the job of an analytic.
+
+        The analytic is yielded once right away and then every time it
+            changed, blocking in between instead of polling. Changes
+            happening while the caller handles an update are coalesced
+            into the next one. The last yield happens once the job is over.
+
+        Args:
+            job_id (str): The job ID of the analytic.
+
+        Yields:
+            Analytic: The analytic after at least one change.
+        """
+        analytic = AnalyticsController.get_analytics(job_id)
+        if analytic is None:
+            return
+
+        version = analytic.get_version()
+        while True:
+            finished = analytic.is_finished()
+            yield analytic
+
+            if finished:
+                return
+
+            version = analytic.wait_for_update(version)
+
     @staticmethod
     def delete_analytics(job_id: str) -> None:
         """
@@ -103,6 +134,51 @@ class AnalyticsController:
         """
         return AnalyticsController.__analytics.get_saved()
 
+    @staticmethod
+    def get_saved_records() -> List[AnalyticRecord]:
+        """
+        Get the records of every saved analytic without loading them.
+
+        Returns:
+            List[AnalyticRecord]: The list of records.
+        """
+        return AnalyticsController.__analytics.get_saved_records()
+
+    @staticmethod
+    def open_saved_analytics(record: AnalyticRecord) -> None | Analytic:
+        """
+        Get the saved analytic of a record, loading it from the disk
+            if needed.
+
+        Args:
+            record (AnalyticRecord): The record of the analytic.
+
+        Returns:
+            None | Analytic: The analytic if it could be loaded,
+                None otherwise.
+        """
+        return AnalyticsController.__analytics.load_saved(record)
+
+    @staticmethod
+    def update_saved_record(record: AnalyticRecord) -> None:
+        """
+        Store the changed name and description of a saved analytic.
+
+        Args:
+            record (AnalyticRecord): The changed record.
+        """
+        AnalyticsController.__analytics.update_record(record)
+
+    @staticmethod
+    def delete_saved_record(record: AnalyticRecord) -> None:
+        """
+        Delete a saved analytic by its record.
+
+        Args:
+            record (AnalyticRecord): The record of the analytic.
+        """
+        AnalyticsController.__analytics.delete_record(record)
+
     @staticmethod
     def save_analytics(analytic: Analytic, name: str, desc: str) -> bool:
         """
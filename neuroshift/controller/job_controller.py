@@ -0,0 +1,49 @@
+"""This module contains the JobController class."""
+
+from typing import List
+
+from neuroshift.model.job_queue import JobQueue
+from neuroshift.model.jobs.dead_letter import DeadLetter
+
+
+class JobController:
+    """
+    Controller class for inspecting the jobs of the NeuroShift Dashboard.
+    """
+
+    __job_queue: JobQueue = JobQueue.get_instance()
+
+    @staticmethod
+    def get_dead_letters() -> List[DeadLetter]:
+        """
+        Get the jobs that failed for good, after their retries.
+
+        Returns:
+            List[DeadLetter]: The failed jobs, the oldest first.
+        """
+        return JobController.__job_queue.get_dead_letters()
+
+    @staticmethod
+    def get_dead_letter(job_id: str) -> DeadLetter | None:
+        """
+        Get the failure of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+
+        Returns:
+            DeadLetter | None: The failure of the job,
+                or None if the job did not fail for good.
+        """
+        for dead_letter in JobController.__job_queue.get_dead_letters():
+            if dead_letter.get_job_id() == job_id:
+                return dead_letter
+
+        return None
+
+    @staticmethod
+    def clear_dead_letters() -> None:
+        """
+        Forget the jobs that failed for good.
+        """
+        JobController.__job_queue.clear_dead_letters()
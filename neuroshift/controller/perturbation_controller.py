@@ -1,5 +1,7 @@
 """This modules contains the PerturbationController class."""
 
+from typing import List, Tuple
+
 from torchvision import transforms  # type: ignore
 
 import neuroshift.config as conf
@@ -11,8 +13,18 @@ from neuroshift.model.noises.perturbation import Perturbation
 from neuroshift.model.data.dataset import Image
 from neuroshift.model.jobs.inference_job import InferenceJob
 from neuroshift.model.jobs.attack_job import AttackJob
+from neuroshift.model.jobs.dataset_attack_job import DatasetAttackJob
+from neuroshift.model.jobs.epsilon_sweep_job import EpsilonSweepJob
+from neuroshift.model.jobs.multi_model_inference_job import (
+    MultiModelInferenceJob,
+)
 from neuroshift.model.jobs.perturbation_job import PerturbationJob
+from neuroshift.model.jobs.trial_ensemble_job import TrialEnsembleJob
+from neuroshift.model.inference_batcher import InferenceBatcher
 from neuroshift.model.job_queue import JobQueue
+from neuroshift.model.noises.targets.layer_selection import LayerSelection
+from neuroshift.model.result_cache import ResultCache
+from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.utils import Utils
 
 
@@ -45,33 +57,22 @@ class PerturbationController:
         return Utils.image_to_url(tensor_to_pil(perturbed_tensor))
 
     @staticmethod
-    def single_image_inference(image: Image) -> str:
+    def single_image_inference(image: Image) -> Tuple[str, float]:
         """
         Performs inference on a single image using the selected model.
 
+        The image is batched with the other single image requests for the
+            same model that arrive within conf.BATCH_WINDOW seconds.
+
         Args:
             image (Image): The image to perform inference on.
 
         Returns:
-            str: The ID of the inference job.
+            Tuple[str, float]: The predicted class and its confidence.
         """
         model: Model = DatabaseController.get_selected_model()
 
-        dataset = Dataset(
-            name="placeholder",
-            file_name="placeholder",
-            desc="placeholder",
-            classes=[image.get_class()],
-            images=[image],
-        )
-
-        inference_job: InferenceJob = InferenceJob(
-            model=model, dataset=dataset
-        )
-
-        PerturbationController.__job_queue.add_job(inference_job)
-
-        return inference_job.get_job_id()
+        return InferenceBatcher.get_instance().submit(model, image).result()
 
     @staticmethod
     def start_inference() -> str:
@@ -84,11 +85,19 @@ class PerturbationController:
         model: Model = DatabaseController.get_selected_model()
         dataset: Dataset = DatabaseController.get_selected_dataset()
 
+        cached_job_id = ResultCache.get_instance().get(
+            model=model, dataset=dataset
+        )
+        if cached_job_id is not None:
+            return cached_job_id
+
         inference_job: InferenceJob = InferenceJob(
             model=model, dataset=dataset, perturbation_job=None
         )
 
-        PerturbationController.__job_queue.add_job(inference_job)
+        PerturbationController.__enqueue_inference(
+            inference_job, model=model, dataset=dataset
+        )
 
         return inference_job.get_job_id()
 
@@ -108,17 +117,81 @@ class PerturbationController:
 
         job = AttackJob(image=image, model=model, attack=attack)
 
+        Analytics.get_instance().add_analytic(job.get_analytic())
         cls.__job_queue.add_job(job)
 
         return job.get_job_id()
 
+    @classmethod
+    def start_dataset_attack(cls, attack: Attack) -> Tuple[str, str]:
+        """
+        Starts an adversarial attack job on every image of the selected
+            dataset using the selected model.
+
+        Args:
+            attack (Attack): The attack to perform.
+
+        Returns:
+            Tuple[str, str]: The ID of the analytic of the clean images
+                and the ID of the attack job, whose analytic holds the
+                predictions on the adversarial images.
+        """
+        model: Model = DatabaseController.get_selected_model()
+        dataset: Dataset = DatabaseController.get_selected_dataset()
+
+        job = DatasetAttackJob(model=model, dataset=dataset, attack=attack)
+
+        analytics = Analytics.get_instance()
+        analytics.add_analytic(job.get_clean_analytic())
+        analytics.add_analytic(job.get_analytic())
+        cls.__job_queue.add_job(job)
+
+        return job.get_clean_analytic().job_id, job.get_job_id()
+
+    @classmethod
+    def start_epsilon_sweep(
+        cls, epsilons: List[float]
+    ) -> List[Tuple[float, str]]:
+        """
+        Starts a Fast Gradient Sign Method attack on every image of the
+            selected dataset using the selected model, for several epsilons.
+
+        Args:
+            epsilons (List[float]): The epsilons of the attack.
+
+        Returns:
+            List[Tuple[float, str]]: The epsilons and the IDs of the
+                analytics of their adversarial images. The first ID is
+                the ID of the job.
+        """
+        model: Model = DatabaseController.get_selected_model()
+        dataset: Dataset = DatabaseController.get_selected_dataset()
+
+        job = EpsilonSweepJob(model=model, dataset=dataset, epsilons=epsilons)
+
+        analytics = Analytics.get_instance()
+        for analytic in job.get_analytics():
+            analytics.add_analytic(analytic)
+        cls.__job_queue.add_job(job)
+
+        return [
+            (epsilon, analytic.job_id)
+            for epsilon, analytic in zip(
+                job.get_epsilons(), job.get_analytics()
+            )
+        ]
+
     @staticmethod
-    def start_dds(perturbation: Perturbation) -> str:
+    def start_dds(
+        perturbation: Perturbation, seed: int | None = None
+    ) -> str:
         """
         Starts a dataset perturbation job using the selected model and dataset.
 
         Args:
             perturbation (Perturbation): The perturbation to apply.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
 
         Returns:
             str: The ID of the perturbation job.
@@ -126,25 +199,140 @@ class PerturbationController:
         model: Model = DatabaseController.get_selected_model()
         dataset: Dataset = DatabaseController.get_selected_dataset()
 
+        # the job keeps the current parameter values, which the result is
+        # looked up with
         perturbation_job = PerturbationJob(
             entity=dataset, perturbation=perturbation
         )
+        cached_job_id = ResultCache.get_instance().get(
+            model=model,
+            dataset=dataset,
+            perturbation=perturbation,
+            seed=seed,
+            parameter_values=perturbation_job.get_parameter_values(),
+        )
+        if cached_job_id is not None:
+            return cached_job_id
 
         inference_job: InferenceJob = InferenceJob(
-            model=model, dataset=dataset, perturbation_job=perturbation_job
+            model=model,
+            dataset=dataset,
+            perturbation_job=perturbation_job,
+            seed=seed,
         )
 
-        PerturbationController.__job_queue.add_job(inference_job)
+        PerturbationController.__enqueue_inference(
+            inference_job,
+            model=model,
+            dataset=dataset,
+            perturbation=perturbation,
+            seed=seed,
+            parameter_values=perturbation_job.get_parameter_values(),
+        )
 
         return inference_job.get_job_id()
 
+    @classmethod
+    def start_dds_comparison(
+        cls,
+        models: List[Model],
+        perturbation: Perturbation,
+        seed: int | None = None,
+    ) -> List[str]:
+        """
+        Starts a dataset perturbation job evaluating several models on the
+            same perturbed images of the selected dataset.
+
+        Models whose result is cached are not evaluated again.
+
+        Args:
+            models (List[Model]): The models to compare.
+            perturbation (Perturbation): The perturbation to apply.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
+
+        Returns:
+            List[str]: The IDs of the analytics of the models, in the order
+                of the models.
+        """
+        dataset: Dataset = DatabaseController.get_selected_dataset()
+        result_cache = ResultCache.get_instance()
+        perturbation_job = PerturbationJob(
+            entity=dataset, perturbation=perturbation
+        )
+        parameter_values = perturbation_job.get_parameter_values()
+
+        cached_job_ids: List[str | None] = [
+            result_cache.get(
+                model=model,
+                dataset=dataset,
+                perturbation=perturbation,
+                seed=seed,
+                parameter_values=parameter_values,
+            )
+            for model in models
+        ]
+        uncached_models = [
+            model
+            for model, job_id in zip(models, cached_job_ids)
+            if job_id is None
+        ]
+        if not uncached_models:
+            return [
+                job_id for job_id in cached_job_ids if job_id is not None
+            ]
+
+        job = MultiModelInferenceJob(
+            models=uncached_models,
+            dataset=dataset,
+            perturbation_job=perturbation_job,
+            seed=seed,
+        )
+
+        analytics = Analytics.get_instance()
+        uncached_analytics = iter(job.get_analytics())
+        job_ids: List[str] = []
+        for model, job_id in zip(models, cached_job_ids):
+            if job_id is None:
+                analytic = next(uncached_analytics)
+                analytics.add_analytic(analytic)
+                result_cache.put(
+                    job_id=analytic.job_id,
+                    model=model,
+                    dataset=dataset,
+                    perturbation=perturbation,
+                    seed=seed,
+                    parameter_values=parameter_values,
+                )
+                job_id = analytic.job_id
+
+            job_ids.append(job_id)
+
+        cls.__job_queue.add_job(job)
+
+        return job_ids
+
     @staticmethod
-    def start_mds(perturbation: Perturbation) -> str:
+    def start_mds(
+        perturbation: Perturbation,
+        seed: int | None = None,
+        activation_boundary: str | None = None,
+        layers: LayerSelection | None = None,
+    ) -> str:
         """
         Starts a model perturbation job using the selected model and dataset.
 
         Args:
             perturbation (Perturbation): The perturbation to apply.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
+            activation_boundary (str | None, optional): The name of the
+                layer from which on activations are perturbed, the clean
+                activations before it are cached across runs.
+                Defaults to None.
+            layers (LayerSelection | None, optional): The activations to
+                perturb. Every activation is perturbed if None.
+                Defaults to None.
 
         Returns:
             str: The ID of the perturbation job.
@@ -152,14 +340,129 @@ class PerturbationController:
         model: Model = DatabaseController.get_selected_model()
         dataset: Dataset = DatabaseController.get_selected_dataset()
 
+        options = []
+        if activation_boundary is not None:
+            options.append(f"activation boundary {activation_boundary}")
+        if layers is not None:
+            options.append(str(layers))
+        variant = ", ".join(options) if options else None
         perturbation_job = PerturbationJob(
-            entity=model, perturbation=perturbation, is_model=True
+            entity=model,
+            perturbation=perturbation,
+            is_model=True,
+            activation_boundary=activation_boundary,
+            layers=layers,
+        )
+        cached_job_id = ResultCache.get_instance().get(
+            model=model,
+            dataset=dataset,
+            perturbation=perturbation,
+            seed=seed,
+            variant=variant,
+            parameter_values=perturbation_job.get_parameter_values(),
         )
+        if cached_job_id is not None:
+            return cached_job_id
 
         inference_job: InferenceJob = InferenceJob(
-            model=model, dataset=dataset, perturbation_job=perturbation_job
+            model=model,
+            dataset=dataset,
+            perturbation_job=perturbation_job,
+            seed=seed,
         )
 
-        PerturbationController.__job_queue.add_job(inference_job)
+        PerturbationController.__enqueue_inference(
+            inference_job,
+            model=model,
+            dataset=dataset,
+            perturbation=perturbation,
+            seed=seed,
+            variant=variant,
+            parameter_values=perturbation_job.get_parameter_values(),
+        )
 
         return inference_job.get_job_id()
+
+    @classmethod
+    def start_trial_ensemble(
+        cls,
+        perturbation: Perturbation,
+        trials: int,
+        seed: int | None = None,
+    ) -> List[str]:
+        """
+        Starts several trials of a parameter perturbation of the selected
+            model at once, using the selected dataset.
+
+        Args:
+            perturbation (Perturbation): The perturbation to apply, it has
+                to target the parameters of the model.
+            trials (int): The number of trials.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
+
+        Returns:
+            List[str]: The IDs of the analytics of the trials. The first
+                ID is the ID of the job.
+        """
+        model: Model = DatabaseController.get_selected_model()
+        dataset: Dataset = DatabaseController.get_selected_dataset()
+
+        job = TrialEnsembleJob(
+            model=model,
+            dataset=dataset,
+            perturbation=perturbation,
+            trials=trials,
+            seed=seed,
+        )
+
+        analytics = Analytics.get_instance()
+        for analytic in job.get_analytics():
+            analytics.add_analytic(analytic)
+        cls.__job_queue.add_job(job)
+
+        return [analytic.job_id for analytic in job.get_analytics()]
+
+    @staticmethod
+    def __enqueue_inference(
+        inference_job: InferenceJob,
+        model: Model,
+        dataset: Dataset,
+        perturbation: Perturbation | None = None,
+        seed: int | None = None,
+        variant: str | None = None,
+        parameter_values: List[Tuple[str, float]] | None = None,
+    ) -> None:
+        """
+        Registers the analytic of an inference job, stores it in the
+            result cache and adds the job to the job queue.
+
+        The analytic is registered before the job starts, so that
+            identical requests arriving in the meantime share it.
+
+        Args:
+            inference_job (InferenceJob): The inference job to enqueue.
+            model (Model): The model used by the job.
+            dataset (Dataset): The dataset used by the job.
+            perturbation (Perturbation | None, optional): The perturbation
+                applied by the job. Defaults to None.
+            seed (int | None, optional): The seed of the perturbation.
+                Defaults to None.
+            variant (str | None, optional): A description of the options
+                of the job changing its result. Defaults to None.
+            parameter_values (List[Tuple[str, float]] | None, optional):
+                The values of the parameters of the perturbation the job
+                was created with. Defaults to None.
+        """
+        Analytics.get_instance().add_analytic(inference_job.get_analytic())
+        ResultCache.get_instance().put(
+            job_id=inference_job.get_job_id(),
+            model=model,
+            dataset=dataset,
+            perturbation=perturbation,
+            seed=seed,
+            variant=variant,
+            parameter_values=parameter_values,
+        )
+
+        PerturbationController.__job_queue.add_job(inference_job)
@@ -1,7 +1,6 @@
 """This module contains the SettingsController class."""
 
 import json
-import time
 
 from streamlit.runtime.uploaded_file_manager import UploadedFile
 
@@ -108,12 +107,12 @@ class SettingsController:
         """
         job_id = PerturbationController.start_inference()
 
-        analytic: Analytic | None = AnalyticsController.get_analytics(job_id)
+        analytic: Analytic | None = None
+        for analytic in AnalyticsController.follow_progress(job_id):
+            pass
 
-        while analytic is None or not analytic.is_done():
-            if analytic is None:
-                analytic = AnalyticsController.get_analytics(job_id)
-            time.sleep(0.1)
+        if analytic is None:
+            return False
 
         result: JobResult = analytic.get_result()
 
@@ -0,0 +1,137 @@
+"""This module contains the CheckpointStore class."""
+
+import os
+import pickle
+import threading
+from typing import Any, Dict, List
+from typing_extensions import Self
+
+import neuroshift.config as conf
+
+
+class CheckpointStore:
+    """
+    Stores the checkpoints of unfinished jobs on disk.
+
+    A checkpoint is a picklable dictionary describing the progress of a
+        job, stored in one file per job under conf.CACHE_PATH. A
+        checkpoint is replaced atomically, so a crash while saving leaves
+        the previous checkpoint intact.
+    """
+
+    __FOLDER_NAME: str = "checkpoints"
+    __EXTENSION: str = ".ckpt"
+    __instance: Self | None = None
+
+    @classmethod
+    def get_instance(cls) -> "CheckpointStore":
+        """
+        Returns the singleton instance of the CheckpointStore class.
+
+        Returns:
+            CheckpointStore: The singleton instance of the CheckpointStore
+                class.
+        """
+        if cls.__instance is None:
+            cls.__instance = CheckpointStore()
+
+        return cls.__instance
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the CheckpointStore class.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+
+    def save(self, job_id: str, checkpoint: Dict[str, Any]) -> None:
+        """
+        Store the checkpoint of a job, replacing the previous one.
+
+        Args:
+            job_id (str): The ID of the job.
+            checkpoint (Dict[str, Any]): The checkpoint of the job.
+        """
+        path = CheckpointStore.__get_path(job_id)
+        with self.__lock:
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with open(f"{path}.tmp", "wb") as f:
+                    pickle.dump(checkpoint, f)
+                os.replace(f"{path}.tmp", path)
+            except (OSError, pickle.PicklingError, AttributeError, TypeError):
+                pass
+
+    def load(self, job_id: str) -> Dict[str, Any] | None:
+        """
+        Load the checkpoint of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+
+        Returns:
+            Dict[str, Any] | None: The checkpoint of the job,
+                or None if there is none or it cannot be read.
+        """
+        with self.__lock:
+            try:
+                with open(CheckpointStore.__get_path(job_id), "rb") as f:
+                    return pickle.load(f)
+            except Exception:  # noqa (unpickling can raise anything)
+                return None
+
+    def delete(self, job_id: str) -> None:
+        """
+        Delete the checkpoint of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+        """
+        with self.__lock:
+            try:
+                os.remove(CheckpointStore.__get_path(job_id))
+            except OSError:
+                pass
+
+    def get_job_ids(self) -> List[str]:
+        """
+        Get the IDs of the jobs with a checkpoint.
+
+        Returns:
+            List[str]: The IDs of the jobs, the oldest checkpoint first.
+        """
+        folder = os.path.join(conf.CACHE_PATH, CheckpointStore.__FOLDER_NAME)
+        with self.__lock:
+            try:
+                names = [
+                    name
+                    for name in os.listdir(folder)
+                    if name.endswith(CheckpointStore.__EXTENSION)
+                ]
+                names.sort(
+                    key=lambda name: os.path.getmtime(
+                        os.path.join(folder, name)
+                    )
+                )
+            except OSError:
+                return []
+
+        return [
+            name[: -len(CheckpointStore.__EXTENSION)] for name in names
+        ]
+
+    @staticmethod
+    def __get_path(job_id: str) -> str:
+        """
+        Get the path of the checkpoint file of a job.
+
+        Args:
+            job_id (str): The ID of the job.
+
+        Returns:
+            str: The path of the checkpoint file.
+        """
+        return os.path.join(
+            conf.CACHE_PATH,
+            CheckpointStore.__FOLDER_NAME,
+            f"{job_id}{CheckpointStore.__EXTENSION}",
+        )
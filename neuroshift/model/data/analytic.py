@@ -1,12 +1,15 @@
 """This module contains the Analytic class."""
 
-from typing import Dict, List, Union
+from typing import Any, Dict, List, Union
 import csv
 import io
+import threading
+import time
 
 from neuroshift.model.data.image import Image
 from neuroshift.model.data.prediction import Prediction
 from neuroshift.model.data.const import Const
+from neuroshift.model.data.metrics_snapshot import MetricsSnapshot
 from neuroshift.model.data.model import Model
 from neuroshift.model.data.dataset import Dataset
 from neuroshift.model.jobs.job_result import JobResult
@@ -17,6 +20,10 @@ class Analytic:
     """
     Represents an analytic object that stores predictions and calculates
         evaluation metrics.
+
+    Every change of the predictions, the result or the done flag bumps
+        the version of the analytic and wakes up the threads waiting for
+        it (see wait_for_update), so that views do not have to poll.
     """
 
     __name_id: int = 0
@@ -49,6 +56,13 @@ class Analytic:
         self.key: str = (
             key if key else Analytic.get_key(model, dataset, noise_name)
         )
+        self.__model_name: str | None = (
+            model.get_file_name() if model is not None else None
+        )
+        self.__dataset_name: str | None = (
+            dataset.get_file_name() if dataset is not None else None
+        )
+        self.__noise_name: str | None = noise_name
         self.__result: JobResult | None = None
         self.__total_predictions: int = total_predictions
         self.__classes: List[str] = (
@@ -56,10 +70,14 @@ class Analytic:
         )
         self.__class_analytics: Dict[str, Dict[str, Union[int, float]]] = {}
         self.__predictions: List[Prediction] = []
+        self.__metrics: MetricsSnapshot | None = None
         self.__done: bool = False
         self.__is_reference = False
         self.__name: str | None = None
         self.__desc: str | None = None
+        self.__created: float | None = time.time()
+        self.__version: int = 0
+        self.__changed: threading.Condition = threading.Condition()
 
     @staticmethod
     def get_key(
@@ -95,41 +113,73 @@ class Analytic:
 
         return f"Analytic {cls.__name_id}"
 
-    def get_overall_accuracy(self) -> float:
+    def get_model_name(self) -> str | None:
         """
-        Get the overall accuracy of the analytic.
+        Get the file name of the model used for the predictions.
 
         Returns:
-            float: The overall accuracy.
+            str | None: The file name of the model, or None if unknown.
         """
-        if len(self.__predictions) == 0:
-            return 0
+        return self.__model_name
+
+    def get_dataset_name(self) -> str | None:
+        """
+        Get the file name of the dataset used for the predictions.
 
-        accuracies = []
+        Returns:
+            str | None: The file name of the dataset, or None if unknown.
+        """
+        return self.__dataset_name
 
-        for class_name in self.__classes:
-            accuracy = self.get_class_accuracy(class_name)
-            accuracies.append(accuracy)
+    def get_noise_name(self) -> str | None:
+        """
+        Get the name of the noise applied to the dataset.
 
-        return sum(accuracies) / len(accuracies)
+        Returns:
+            str | None: The name of the noise, or None if no noise was
+                applied or it is unknown.
+        """
+        return self.__noise_name
 
-    def get_overall_precision(self) -> float:
+    def get_metrics(self) -> MetricsSnapshot:
         """
-        Get the overall precision of the analytic.
+        Get the per-class and overall metrics of the analytic.
+
+        The snapshot is computed once per version of the analytic, so that
+            the metrics are only computed again after it changed. It is
+            computed under the lock of the analytic, so it never sees the
+            counts of a batch of predictions half updated.
 
         Returns:
-            float: The overall precision.
+            MetricsSnapshot: The metrics at the current version.
         """
-        if len(self.__predictions) == 0:
-            return 0
+        with self.__changed:
+            metrics = self.__metrics
+            if metrics is None or metrics.get_version() != self.__version:
+                metrics = MetricsSnapshot(
+                    self.__version, self.__classes, self.__class_analytics
+                )
+                self.__metrics = metrics
+
+        return metrics
 
-        precisions = []
+    def get_overall_accuracy(self) -> float:
+        """
+        Get the overall accuracy of the analytic.
+
+        Returns:
+            float: The overall accuracy.
+        """
+        return self.get_metrics().get_overall(MetricsSnapshot.ACCURACY)
 
-        for class_name in self.__classes:
-            precision = self.get_class_precision(class_name)
-            precisions.append(precision)
+    def get_overall_precision(self) -> float:
+        """
+        Get the overall precision of the analytic.
 
-        return sum(precisions) / len(precisions)
+        Returns:
+            float: The overall precision.
+        """
+        return self.get_metrics().get_overall(MetricsSnapshot.PRECISION)
 
     def get_overall_recall(self) -> float:
         """
@@ -138,16 +188,7 @@ class Analytic:
         Returns:
             float: The overall recall.
         """
-        if len(self.__predictions) == 0:
-            return 0
-
-        recalls = []
-
-        for class_name in self.__classes:
-            recall = self.get_class_recall(class_name)
-            recalls.append(recall)
-
-        return sum(recalls) / len(recalls)
+        return self.get_metrics().get_overall(MetricsSnapshot.RECALL)
 
     def get_overall_f1(self) -> float:
         """
@@ -156,16 +197,7 @@ class Analytic:
         Returns:
             float: The overall F1 score.
         """
-        if len(self.__predictions) == 0:
-            return 0
-
-        precision = self.get_overall_precision()
-        recall = self.get_overall_recall()
-
-        if precision + recall == 0:
-            return 0
-
-        return 2 * precision * recall / (precision + recall)
+        return self.get_metrics().get_overall(MetricsSnapshot.F1)
 
     def get_class_accuracy(self, class_name: str) -> float:
         """
@@ -177,18 +209,8 @@ class Analytic:
         Returns:
             float: The accuracy for the class.
         """
-        if class_name not in self.__class_analytics:
-            return 0
-
-        class_dict = self.__class_analytics[class_name]
-
-        true_positive = class_dict["true_positive"]
-        true_negative = class_dict["true_negative"]
-        false_positive = class_dict["false_positive"]
-        false_negative = class_dict["false_negative"]
-
-        return (true_positive + true_negative) / (
-            true_positive + true_negative + false_positive + false_negative
+        return self.get_metrics().get_class(
+            MetricsSnapshot.ACCURACY, class_name
         )
 
     def get_class_precision(self, class_name: str) -> float:
@@ -201,18 +223,9 @@ class Analytic:
         Returns:
             float: The precision for the class.
         """
-        if class_name not in self.__class_analytics:
-            return 0
-
-        class_dict = self.__class_analytics[class_name]
-
-        true_positive = class_dict["true_positive"]
-        false_positive = class_dict["false_positive"]
-
-        if true_positive + false_positive == 0:
-            return 0
-
-        return true_positive / (true_positive + false_positive)
+        return self.get_metrics().get_class(
+            MetricsSnapshot.PRECISION, class_name
+        )
 
     def get_class_recall(self, class_name: str) -> float:
         """
@@ -224,18 +237,7 @@ class Analytic:
         Returns:
             float: The recall for the class.
         """
-        if class_name not in self.__class_analytics:
-            return 0
-
-        class_dict = self.__class_analytics[class_name]
-
-        true_positive = class_dict["true_positive"]
-        false_negative = class_dict["false_negative"]
-
-        if true_positive + false_negative == 0:
-            return 0
-
-        return true_positive / (true_positive + false_negative)
+        return self.get_metrics().get_class(MetricsSnapshot.RECALL, class_name)
 
     def get_class_f1(self, class_name: str) -> float:
         """
@@ -247,16 +249,7 @@ class Analytic:
         Returns:
             float: The F1 score for the class.
         """
-        if class_name not in self.__class_analytics:
-            return 0
-
-        precision = self.get_class_precision(class_name)
-        recall = self.get_class_recall(class_name)
-
-        if precision + recall == 0:
-            return 0
-
-        return 2 * precision * recall / (precision + recall)
+        return self.get_metrics().get_class(MetricsSnapshot.F1, class_name)
 
     def get_classes(self) -> List[str]:
         """
@@ -285,6 +278,52 @@ class Analytic:
         """
         return self.__predictions.copy()
 
+    def get_prediction(self, index: int) -> Prediction:
+        """
+        Get a prediction by its index in the analytic.
+
+        Args:
+            index (int): The index of the prediction.
+
+        Returns:
+            Prediction: The prediction.
+        """
+        return self.__predictions[index]
+
+    def find_predictions(
+        self,
+        wrong_only: bool = False,
+        class_name: str | None = None,
+        lowest_confidence_first: bool = False,
+    ) -> List[int]:
+        """
+        Find the indices of the predictions matching filters,
+            without copying the predictions.
+
+        Args:
+            wrong_only (bool, optional): Whether to keep only the wrong
+                predictions. Defaults to False.
+            class_name (str | None, optional): The actual class to keep,
+                every class if None. Defaults to None.
+            lowest_confidence_first (bool, optional): Whether to sort the
+                indices by increasing confidence instead of keeping the
+                order of the predictions. Defaults to False.
+
+        Returns:
+            List[int]: The indices of the matching predictions.
+        """
+        indices = [
+            index
+            for index, prediction in enumerate(self.__predictions)
+            if not (wrong_only and prediction.is_correct())
+            and (class_name is None or prediction.get_class() == class_name)
+        ]
+
+        if lowest_confidence_first:
+            indices.sort(key=lambda i: self.__predictions[i].get_confidence())
+
+        return indices
+
     def is_reference(self) -> bool:
         """
         Check if the analytic is a reference.
@@ -311,11 +350,14 @@ class Analytic:
         Args:
             prediction (Prediction): The prediction to add.
         """
-        self.__predictions.append(prediction)
-        self.__update_analytics(prediction)
+        with self.__changed:
+            self.__update_analytics(prediction)
+            self.__predictions.append(prediction)
 
-        if len(self.__predictions) == self.__total_predictions:
-            self.set_done()
+            if len(self.__predictions) == self.__total_predictions:
+                self.__done = True
+
+            self.__notify()
 
     def add_predictions(self, predictions: List[Prediction]) -> None:
         """
@@ -324,13 +366,74 @@ class Analytic:
         Args:
             predictions (List[Prediction]): The predictions to add.
         """
-        self.__predictions += predictions
+        with self.__changed:
+            for prediction in predictions:
+                self.__update_analytics(prediction)
+            self.__predictions += predictions
 
-        for prediction in predictions:
-            self.__update_analytics(prediction)
+            if len(self.__predictions) == self.__total_predictions:
+                self.__done = True
 
-        if len(self.__predictions) == self.__total_predictions:
-            self.set_done()
+            self.__notify()
+
+    def get_entries(self) -> List[Prediction]:
+        """
+        Get the predictions to store in the append-only sidecar file
+            of the database, instead of the pickled analytic.
+
+        Returns:
+            List[Prediction]: The predictions of the analytic.
+        """
+        return self.__predictions.copy()
+
+    def set_entries(self, entries: List[Prediction]) -> None:
+        """
+        Restore the predictions of an analytic loaded from the database.
+
+        The class analytics are part of the pickled analytic,
+            so they are not updated again.
+
+        Args:
+            entries (List[Prediction]): The stored predictions.
+        """
+        self.__predictions = list(entries)
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        Get a summary of the analytic stored in the index of the database,
+            which can be listed without loading the predictions.
+
+        Returns:
+            Dict[str, Any]: The summary of the analytic.
+        """
+        return {
+            "job_id": self.job_id,
+            "key": self.key,
+            "model": self.__model_name,
+            "dataset": self.__dataset_name,
+            "noise": self.__noise_name,
+            "name": self.get_name(),
+            "desc": self.get_desc(),
+            "reference": self.__is_reference,
+            "predictions": len(self.__predictions),
+            "total_predictions": self.__total_predictions,
+            "accuracy": self.get_overall_accuracy(),
+            "precision": self.get_overall_precision(),
+            "recall": self.get_overall_recall(),
+            "f1": self.get_overall_f1(),
+            "created": self.__created,
+            "updated": time.time(),
+        }
+
+    def get_created(self) -> float | None:
+        """
+        Get the time the analytic was created at.
+
+        Returns:
+            float | None: The creation time as a UNIX timestamp,
+                None for analytics stored before it was recorded.
+        """
+        return self.__created
 
     def get_prediction_by_image(self, image: Image) -> Prediction | None:
         """
@@ -357,6 +460,7 @@ class Analytic:
             result (JobResult): The result to set.
         """
         self.__result = result
+        self.__notify()
 
     def get_result(self) -> JobResult | None:
         """
@@ -379,6 +483,50 @@ class Analytic:
 
         return len(self.__predictions) / self.__total_predictions
 
+    def is_finished(self) -> bool:
+        """
+        Check if the job of the analytic is over, i.e. the analytic is done
+            and its result is set.
+
+        Returns:
+            bool: True if the job is over, False otherwise.
+        """
+        return self.__done and self.__result is not None
+
+    def get_version(self) -> int:
+        """
+        Get the version of the analytic, which increases with every change
+            of its predictions, result or done flag.
+
+        Returns:
+            int: The version of the analytic.
+        """
+        return self.__version
+
+    def wait_for_update(
+        self, version: int, timeout: float | None = None
+    ) -> int:
+        """
+        Block until the analytic changed since a version.
+
+        Changes happening while the caller is busy are coalesced: the call
+            returns at once with the latest version if the analytic changed
+            in the meantime.
+
+        Args:
+            version (int): The version the caller has seen.
+            timeout (float | None, optional): The maximal time to wait in
+                seconds, no limit if None. Defaults to None.
+
+        Returns:
+            int: The version of the analytic when the call returns.
+        """
+        with self.__changed:
+            self.__changed.wait_for(
+                lambda: self.__version != version, timeout=timeout
+            )
+            return self.__version
+
     def is_done(self) -> bool:
         """
         Check if the analytic is done.
@@ -393,6 +541,20 @@ class Analytic:
         Set the analytic as done.
         """
         self.__done = True
+        self.__notify()
+
+    def reset(self) -> None:
+        """
+        Clear the predictions, result and done flag of the analytic,
+            so that its job can be started again.
+        """
+        with self.__changed:
+            self.__predictions = []
+            self.__class_analytics = {}
+            self.__metrics = None
+            self.__result = None
+            self.__done = False
+            self.__notify()
 
     def set_name(self, name: str) -> None:
         """
@@ -525,6 +687,51 @@ class Analytic:
 
         self.__class_analytics[predicted_class] = predicted_class_dict
 
+    def __notify(self) -> None:
+        """
+        Bump the version of the analytic and wake up the waiting threads.
+
+        The lock of the condition is reentrant, so the version can be
+            bumped by a method holding it.
+        """
+        with self.__changed:
+            self.__version += 1
+            self.__changed.notify_all()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        Get the state of the analytic to pickle.
+
+        The condition of the waiting threads is left out,
+            as it cannot be pickled.
+
+        Returns:
+            Dict[str, Any]: The state of the analytic.
+        """
+        state = self.__dict__.copy()
+        del state["_Analytic__changed"]
+
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """
+        Restore the state of an unpickled analytic.
+
+        Args:
+            state (Dict[str, Any]): The pickled state of the analytic.
+        """
+        for attribute in (
+            "created",
+            "model_name",
+            "dataset_name",
+            "noise_name",
+            "metrics",
+        ):
+            state.setdefault(f"_Analytic__{attribute}", None)
+        state.setdefault("_Analytic__version", 0)
+        self.__dict__.update(state)
+        self.__changed = threading.Condition()
+
     def __str__(self) -> str:
         """
         Get the string representation of the analytic.
@@ -0,0 +1,227 @@
+"""This module contains the AnalyticRecord class."""
+
+from typing import Any, Dict
+
+
+class AnalyticRecord:
+    """
+    Represents the summary of a saved analytic read from the index of the
+        database, so that the saved analytics can be listed without
+        loading their predictions.
+    """
+
+    def __init__(self, record_name: str, metadata: Dict[str, Any]) -> None:
+        """
+        Initialize an AnalyticRecord object.
+
+        Args:
+            record_name (str): The name of the record of the analytic
+                in the database.
+            metadata (Dict[str, Any]): The metadata of the analytic
+                (see Analytic.get_metadata).
+        """
+        self.__record_name: str = record_name
+        self.__metadata: Dict[str, Any] = dict(metadata)
+
+    def get_record_name(self) -> str:
+        """
+        Get the name of the record in the database.
+
+        Returns:
+            str: The name of the record.
+        """
+        return self.__record_name
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """
+        Get the metadata of the record.
+
+        Returns:
+            Dict[str, Any]: A copy of the metadata.
+        """
+        return self.__metadata.copy()
+
+    def get_job_id(self) -> str | None:
+        """
+        Get the job ID of the analytic.
+
+        Returns:
+            str | None: The job ID, None if it is unknown.
+        """
+        return self.__metadata.get("job_id")
+
+    def get_key(self) -> str:
+        """
+        Get the key of the analytic.
+
+        Returns:
+            str: The key of the analytic.
+        """
+        return self.__metadata.get("key", self.__record_name)
+
+    def get_model_name(self) -> str | None:
+        """
+        Get the file name of the model used for the predictions.
+
+        Returns:
+            str | None: The file name of the model, None if it is unknown.
+        """
+        return self.__metadata.get("model")
+
+    def get_dataset_name(self) -> str | None:
+        """
+        Get the file name of the dataset used for the predictions.
+
+        Returns:
+            str | None: The file name of the dataset, None if it is
+                unknown.
+        """
+        return self.__metadata.get("dataset")
+
+    def get_noise_name(self) -> str | None:
+        """
+        Get the name of the noise applied to the dataset.
+
+        Returns:
+            str | None: The name of the noise, None if no noise was
+                applied or it is unknown.
+        """
+        return self.__metadata.get("noise")
+
+    def get_name(self) -> str:
+        """
+        Get the name of the analytic.
+
+        Returns:
+            str: The name of the analytic.
+        """
+        return self.__metadata.get("name") or self.get_key()
+
+    def set_name(self, name: str) -> None:
+        """
+        Set the name of the analytic.
+
+        Args:
+            name (str): The name to set.
+        """
+        self.__metadata["name"] = name
+
+    def get_desc(self) -> str:
+        """
+        Get the description of the analytic.
+
+        Returns:
+            str: The description of the analytic.
+        """
+        return self.__metadata.get("desc") or "No description."
+
+    def set_desc(self, desc: str) -> None:
+        """
+        Set the description of the analytic.
+
+        Args:
+            desc (str): The description to set.
+        """
+        self.__metadata["desc"] = desc
+
+    def is_reference(self) -> bool:
+        """
+        Check if the analytic is the reference.
+
+        Returns:
+            bool: True if the analytic is the reference, False otherwise.
+        """
+        return bool(self.__metadata.get("reference", False))
+
+    def set_reference(self, is_reference: bool) -> None:
+        """
+        Set whether the analytic is the reference or not.
+
+        Args:
+            is_reference (bool): True if the analytic is the reference,
+                False otherwise.
+        """
+        self.__metadata["reference"] = is_reference
+
+    def get_prediction_count(self) -> int:
+        """
+        Get the number of stored predictions.
+
+        Returns:
+            int: The number of predictions.
+        """
+        return self.__metadata.get("predictions", 0)
+
+    def get_total_predictions(self) -> int:
+        """
+        Get the total number of predictions of the job.
+
+        Returns:
+            int: The total number of predictions.
+        """
+        return self.__metadata.get("total_predictions", 0)
+
+    def get_overall_accuracy(self) -> float:
+        """
+        Get the overall accuracy of the analytic.
+
+        Returns:
+            float: The overall accuracy.
+        """
+        return self.__metadata.get("accuracy", 0)
+
+    def get_overall_precision(self) -> float:
+        """
+        Get the overall precision of the analytic.
+
+        Returns:
+            float: The overall precision.
+        """
+        return self.__metadata.get("precision", 0)
+
+    def get_overall_recall(self) -> float:
+        """
+        Get the overall recall of the analytic.
+
+        Returns:
+            float: The overall recall.
+        """
+        return self.__metadata.get("recall", 0)
+
+    def get_overall_f1(self) -> float:
+        """
+        Get the overall F1 score of the analytic.
+
+        Returns:
+            float: The overall F1 score.
+        """
+        return self.__metadata.get("f1", 0)
+
+    def get_created(self) -> float | None:
+        """
+        Get the time the analytic was created at.
+
+        Returns:
+            float | None: The creation time as a UNIX timestamp,
+                None if it is unknown.
+        """
+        return self.__metadata.get("created")
+
+    def get_updated(self) -> float | None:
+        """
+        Get the time the record was last written at.
+
+        Returns:
+            float | None: The update time as a UNIX timestamp,
+                None if it is unknown.
+        """
+        return self.__metadata.get("updated")
+
+    def __str__(self) -> str:
+        """
+        Get the string representation of the record.
+
+        Returns:
+            str: The string representation of the record.
+        """
+        return self.get_key()
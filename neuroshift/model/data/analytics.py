@@ -1,9 +1,14 @@
 """This module contains the Analytics class."""
 
-from typing_extensions import Self, List
+import itertools
+import warnings
+from typing_extensions import Self, Dict, Iterator, List
 
 from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytic_record import AnalyticRecord
 from neuroshift.model.data.db import Database
+from neuroshift.model.data.hash_index import HashIndex
+from neuroshift.model.data.ordered_index import OrderedIndex
 
 import neuroshift.config as conf
 from neuroshift.model.data.model import Model
@@ -13,6 +18,12 @@ from neuroshift.model.data.dataset import Dataset
 class Analytics:
     """
     A class containing all the Analytics of the Neuroshift Dashboard.
+
+    Only the records of the saved analytics are read at startup, a saved
+        analytic is loaded from the disk when it is opened (see load_saved),
+        except for the reference analytic, which is loaded right away. The
+        records are indexed like the loaded analytics, so that the queries
+        find the saved analytics as well.
     """
 
     __instance: Self | None = None
@@ -27,6 +38,27 @@ class Analytics:
         self.__analytics: Database[Analytic] | None = None
         self.__reference: Analytic | None = None
         self.__saved_analytics: List[Analytic] = []
+        self.__records: Dict[str, AnalyticRecord] = {}
+        self.__record_slots: Dict[str, int] = {}
+        self.__record_counter: Iterator[int] = itertools.count()
+        self.__records_by_key: HashIndex[AnalyticRecord] = HashIndex(
+            lambda record: record.get_key()
+        )
+        self.__records_by_model_dataset: HashIndex[AnalyticRecord] = (
+            HashIndex(
+                lambda record: (
+                    record.get_model_name(),
+                    record.get_dataset_name(),
+                )
+            )
+        )
+        self.__records_by_noise: OrderedIndex[AnalyticRecord] = OrderedIndex(
+            lambda record: (
+                record.get_noise_name() or "",
+                record.get_created() or 0.0,
+            )
+        )
+        self.__unfinished: Dict[str, Analytic] = {}
         self.__load()
 
     @classmethod
@@ -53,7 +85,9 @@ class Analytics:
         self.__analytics.save()
 
         for analytic in self.__analytics.get_items():
-            self.__saved_analytics.append(analytic)
+            if analytic not in self.__saved_analytics:
+                self.__saved_analytics.append(analytic)
+            self.__add_record(analytic)
 
     def save_analytic(self, analytic: Analytic) -> None:
         """
@@ -67,14 +101,12 @@ class Analytics:
             RuntimeError: If it was not able to save the analytic.
         """
         if not self.__analytics:
-            self.__analytics = Database(
-                element=analytic,
-                path=conf.ANALYTICS_PATH,
-                whitelist=conf.ANALYTIC_NAMES,
-            )
+            self.__analytics = Analytics.__create_database(analytic)
 
         self.__analytics.save_element(element=analytic)
+        self.__analytics.reindex(analytic)
         self.__saved_analytics.append(analytic)
+        self.__add_record(analytic)
 
     def delete_analytic(self, analytic: Analytic) -> None:
         """
@@ -87,7 +119,12 @@ class Analytics:
         if self.__reference == analytic:
             self.__reference = None
 
+        self.__unfinished.pop(analytic.job_id, None)
         if self.__analytics and analytic in self.__analytics:
+            record = self.__get_record(analytic)
+            if record is not None:
+                self.__remove_record(record.get_record_name())
+
             self.__analytics.delete(element=analytic)
 
             if len(self.__analytics) == 0:
@@ -102,13 +139,94 @@ class Analytics:
 
     def get_saved(self) -> List[Analytic]:
         """
-        Get a list of saved analytics.
+        Get a list of the saved analytics loaded in memory.
 
         Returns:
             List[Analytic]: The list of saved analytics.
         """
         return self.__saved_analytics.copy()
 
+    def get_saved_records(self) -> List[AnalyticRecord]:
+        """
+        Get the records of every saved analytic, loaded or not.
+
+        Returns:
+            List[AnalyticRecord]: The records in the order they were saved.
+        """
+        return list(self.__records.values())
+
+    def load_saved(self, record: AnalyticRecord) -> Analytic | None:
+        """
+        Get the saved analytic of a record, loading it from the disk
+            if it is not in memory yet.
+
+        Args:
+            record (AnalyticRecord): The record of the analytic.
+
+        Returns:
+            Analytic | None: The analytic, or None if it cannot be loaded.
+        """
+        job_id = record.get_job_id()
+        analytic = self.get_analytic(job_id) if job_id is not None else None
+        if analytic is not None:
+            return analytic
+
+        try:
+            analytic = Database.load_record(
+                conf.ANALYTICS_PATH, record.get_record_name()
+            )
+        except Exception as exc:  # noqa (the possible exceptions are unknown)
+            warnings.warn(f"failed to load the analytic {record}!\n\t{exc}")
+            return None
+
+        analytic.set_name(record.get_name())
+        analytic.set_desc(record.get_desc())
+        analytic.set_reference(False)
+        self.add_analytic(analytic)
+        self.__saved_analytics.append(analytic)
+        if record.is_reference():
+            self.set_reference(analytic.job_id)
+
+        return analytic
+
+    def update_record(self, record: AnalyticRecord) -> None:
+        """
+        Store the name and description of a record in the index and
+            apply them to the analytic if it is loaded.
+
+        Args:
+            record (AnalyticRecord): The changed record.
+
+        Raises:
+            IOError: If it was not able to update the index.
+        """
+        job_id = record.get_job_id()
+        analytic = self.get_analytic(job_id) if job_id is not None else None
+        if analytic is not None:
+            analytic.set_name(record.get_name())
+            analytic.set_desc(record.get_desc())
+
+        Database.write_metadata(
+            conf.ANALYTICS_PATH,
+            record.get_record_name(),
+            record.get_metadata(),
+        )
+
+    def delete_record(self, record: AnalyticRecord) -> None:
+        """
+        Delete a saved analytic by its record, without loading it.
+
+        Args:
+            record (AnalyticRecord): The record of the analytic.
+        """
+        job_id = record.get_job_id()
+        analytic = self.get_analytic(job_id) if job_id is not None else None
+        if analytic is not None:
+            self.delete_analytic(analytic)
+
+        self.__remove_record(record.get_record_name())
+        Database.delete_record(conf.ANALYTICS_PATH, record.get_record_name())
+
     def add_analytic(self, analytic: Analytic) -> None:
         """
         Add a new analytic to the database.
@@ -117,14 +235,13 @@ class Analytics:
             analytic (Analytic): The analytic to be added.
         """
         if self.__analytics is None:
-            self.__analytics = Database(
-                element=analytic,
-                path=conf.ANALYTICS_PATH,
-                whitelist=conf.ANALYTIC_NAMES,
-            )
+            self.__analytics = Analytics.__create_database(analytic)
         else:
             self.__analytics.append(analytic)
 
+        if not analytic.is_done():
+            self.__unfinished[analytic.job_id] = analytic
+
     def set_reference(self, job_id: str) -> None:
         """
         Set the reference analytic.
@@ -138,9 +255,11 @@ class Analytics:
 
         if self.__reference is not None:
             self.__reference.set_reference(False)
+            self.__update_reference_record(self.__reference)
 
         self.__reference = analytic
         self.__reference.set_reference(True)
+        self.__update_reference_record(analytic)
 
     def forget_reference(self) -> None:
         """
@@ -148,6 +267,7 @@ class Analytics:
         """
         if self.__reference is not None:
             self.__reference.set_reference(False)
+            self.__update_reference_record(self.__reference)
 
         self.__reference = None
 
@@ -181,6 +301,8 @@ class Analytics:
         """
         Get analytics based on filters.
 
+        The matching saved analytics are loaded from the disk.
+
         Args:
             model (Model | None): The model to filter by.
             dataset (Dataset | None): The dataset to filter by.
@@ -189,11 +311,110 @@ class Analytics:
         Returns:
             List[Analytic]: The list of analytics matching the filters.
         """
+        key = Analytic.get_key(model, dataset, noise_name)
+        analytics = (
+            self.__analytics["key", key]
+            if self.__analytics is not None
+            else []
+        )
+        return analytics + self.__load_records(
+            self.__records_by_key.find(key), analytics
+        )
+
+    def get_by_model_and_dataset(
+        self, model: Model | None, dataset: Dataset | None
+    ) -> List[Analytic]:
+        """
+        Get the analytics of a model on a dataset, with any noise.
+
+        The matching saved analytics are loaded from the disk. Records saved
+            before their model and dataset were stored are not found.
+
+        Args:
+            model (Model | None): The model to filter by.
+            dataset (Dataset | None): The dataset to filter by.
+
+        Returns:
+            List[Analytic]: The list of analytics matching the filters.
+        """
+        key = (
+            model.get_file_name() if model is not None else None,
+            dataset.get_file_name() if dataset is not None else None,
+        )
+        analytics = (
+            self.__analytics.find("model_dataset", key)
+            if self.__analytics is not None
+            else []
+        )
+        return analytics + self.__load_records(
+            self.__records_by_model_dataset.find(key), analytics
+        )
+
+    def get_by_noise(
+        self,
+        noise_name: str | None,
+        since: float | None = None,
+        until: float | None = None,
+    ) -> List[Analytic]:
+        """
+        Get the analytics of a noise created in a time window.
+
+        The matching saved analytics are loaded from the disk. Records saved
+            before their noise was stored are not found.
+
+        Args:
+            noise_name (str | None): The noise name to filter by,
+                None for the analytics without noise.
+            since (float | None, optional): The earliest creation time as a
+                UNIX timestamp, unbounded if None. Defaults to None.
+            until (float | None, optional): The latest creation time as a
+                UNIX timestamp, unbounded if None. Defaults to None.
+
+        Returns:
+            List[Analytic]: The matching analytics, oldest first.
+        """
+        noise = noise_name or ""
+        low = (noise, since if since is not None else float("-inf"))
+        high = (noise, until if until is not None else float("inf"))
+        analytics = (
+            self.__analytics.find_range("noise_created", low, high)
+            if self.__analytics is not None
+            else []
+        )
+        analytics = analytics + self.__load_records(
+            self.__records_by_noise.find_range(low, high), analytics
+        )
+        analytics.sort(key=lambda analytic: analytic.get_created() or 0.0)
+        return analytics
+
+    def get_by_accuracy(
+        self, low: float | None = None, high: float | None = None
+    ) -> List[Analytic]:
+        """
+        Get the finished analytics whose overall accuracy lies in a range.
+
+        Args:
+            low (float | None, optional): The inclusive lowest accuracy,
+                unbounded if None. Defaults to None.
+            high (float | None, optional): The inclusive highest accuracy,
+                unbounded if None. Defaults to None.
+
+        Returns:
+            List[Analytic]: The matching analytics, least accurate first.
+        """
         if self.__analytics is None:
             return []
 
-        return self.__analytics[
-            "key", Analytic.get_key(model, dataset, noise_name)
+        # the accuracy of an analytic only settles once it is done
+        for job_id, analytic in list(self.__unfinished.items()):
+            if analytic.is_done():
+                self.__analytics.reindex(analytic)
+                del self.__unfinished[job_id]
+
+        return [
+            analytic
+            for analytic in self.__analytics.find_range("accuracy", low, high)
+            if analytic.job_id not in self.__unfinished
         ]
 
     def get_analytic(self, job_id: str) -> Analytic | None:
@@ -231,18 +452,170 @@ class Analytics:
 
     def __load(self) -> None:
         """
-        Load the analytics data from the database.
+        Load the records of the saved analytics and the reference analytic.
+        """
+        self.__analytics = None
+        self.__reference = None
+
+        if Database.has_legacy_files(conf.ANALYTICS_PATH):
+            # migrates the analytics pickled before the index existed
+            Database.from_path(
+                path=conf.ANALYTICS_PATH, whitelist=conf.ANALYTIC_NAMES
+            )
+
+        for name, metadata in Database.read_index(conf.ANALYTICS_PATH):
+            self.__set_record(AnalyticRecord(name, metadata))
+
+        for record in self.get_saved_records():
+            if record.is_reference():
+                self.load_saved(record)
+
+    @staticmethod
+    def __create_database(analytic: Analytic) -> Database[Analytic]:
+        """
+        Create the database of the analytics with its indexes.
+
+        Args:
+            analytic (Analytic): The first analytic of the database.
+
+        Returns:
+            Database[Analytic]: The new database.
         """
-        self.__analytics = Database.from_path(
-            path=conf.ANALYTICS_PATH, whitelist=conf.ANALYTIC_NAMES
+        database = Database(
+            element=analytic,
+            path=conf.ANALYTICS_PATH,
+            whitelist=conf.ANALYTIC_NAMES,
+        )
+        database.add_index(
+            "model_dataset",
+            lambda element: (
+                element.get_model_name(),
+                element.get_dataset_name(),
+            ),
+        )
+        database.add_ordered_index(
+            "noise_created",
+            lambda element: (
+                element.get_noise_name() or "",
+                element.get_created() or 0.0,
+            ),
+        )
+        database.add_ordered_index(
+            "accuracy", lambda element: element.get_overall_accuracy()
         )
 
-        self.__reference = None
+        return database
 
-        if not self.__analytics:
+    def __get_record(self, analytic: Analytic) -> AnalyticRecord | None:
+        """
+        Get the record of a saved analytic.
+
+        Args:
+            analytic (Analytic): The analytic.
+
+        Returns:
+            AnalyticRecord | None: The record of the analytic,
+                or None if the analytic is not saved.
+        """
+        if self.__analytics is None:
+            return None
+
+        record = self.__records.get(self.__analytics.get_record_name(analytic))
+        if record is None or record.get_job_id() != analytic.job_id:
+            return None
+
+        return record
+
+    def __add_record(self, analytic: Analytic) -> None:
+        """
+        Add or replace the record of a saved analytic.
+
+        Args:
+            analytic (Analytic): The saved analytic.
+        """
+        if self.__analytics is None:
             return
 
-        for analytic in self.__analytics:
-            self.__saved_analytics.append(analytic)
-            if analytic.is_reference():
-                self.__reference = analytic
+        name = self.__analytics.get_record_name(analytic)
+        self.__set_record(AnalyticRecord(name, analytic.get_metadata()))
+
+    def __set_record(self, record: AnalyticRecord) -> None:
+        """
+        Add or replace a record and index it.
+
+        Args:
+            record (AnalyticRecord): The record.
+        """
+        name = record.get_record_name()
+        self.__records[name] = record
+        slot = self.__record_slots.setdefault(
+            name, next(self.__record_counter)
+        )
+        self.__records_by_key.remove(slot)
+        self.__records_by_key.add(slot, record)
+        self.__records_by_model_dataset.remove(slot)
+        self.__records_by_model_dataset.add(slot, record)
+        self.__records_by_noise.add(slot, record)
+
+    def __remove_record(self, name: str) -> None:
+        """
+        Remove a record and its index entries.
+
+        Args:
+            name (str): The name of the record.
+        """
+        self.__records.pop(name, None)
+        slot = self.__record_slots.pop(name, None)
+        if slot is not None:
+            self.__records_by_key.remove(slot)
+            self.__records_by_model_dataset.remove(slot)
+            self.__records_by_noise.remove(slot)
+
+    def __load_records(
+        self, records: List[AnalyticRecord], loaded: List[Analytic]
+    ) -> List[Analytic]:
+        """
+        Load the saved analytics of records that are not among the
+            loaded analytics found by a query.
+
+        Args:
+            records (List[AnalyticRecord]): The records found by the query.
+            loaded (List[Analytic]): The loaded analytics found by the
+                query.
+
+        Returns:
+            List[Analytic]: The analytics of the other records.
+        """
+        job_ids = {analytic.job_id for analytic in loaded}
+        analytics: List[Analytic] = []
+        for record in records:
+            if record.get_job_id() in job_ids:
+                continue
+
+            analytic = self.load_saved(record)
+            if analytic is not None and analytic.job_id not in job_ids:
+                job_ids.add(analytic.job_id)
+                analytics.append(analytic)
+
+        return analytics
+
+    def __update_reference_record(self, analytic: Analytic) -> None:
+        """
+        Store the reference flag of a saved analytic in its record.
+
+        Args:
+            analytic (Analytic): The analytic whose flag changed.
+        """
+        record = self.__get_record(analytic)
+        if record is None:
+            return
+
+        record.set_reference(analytic.is_reference())
+        try:
+            Database.write_metadata(
+                conf.ANALYTICS_PATH,
+                record.get_record_name(),
+                record.get_metadata(),
+            )
+        except IOError as exc:
+            warnings.warn(f"failed to store the reference!\n\t{exc}")
@@ -233,6 +233,20 @@ class Dataset:
         """
         return self.__default_shape
 
+    def get_images(self, start: int, stop: int) -> List[Image]:
+        """
+        Get a window of the images of the dataset, without going through
+            the batches.
+
+        Args:
+            start (int): The index of the first image.
+            stop (int): The index after the last image.
+
+        Returns:
+            List[Image]: The images from start to stop.
+        """
+        return self.__images[start:stop]
+
     def __iter__(self) -> Iterator[Tuple[Tensor, List[Image]]]:
         """
         Returns an iterator over the batches in the dataset.
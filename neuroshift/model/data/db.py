@@ -1,11 +1,26 @@
 """This module contains the Database class."""
 
+import copy
+import operator
 import os
 import pickle
 import warnings
-from typing import TypeVar, Generic, List, Iterator
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    TypeVar,
+    Generic,
+    List,
+    Iterator,
+    Tuple,
+)
 
 from neuroshift.model.data.const import Const
+from neuroshift.model.data.hash_index import HashIndex
+from neuroshift.model.data.ordered_index import OrderedIndex
+from neuroshift.model.data.record_store import RecordStore
 
 T = TypeVar("T")
 
@@ -15,6 +30,19 @@ class Database(Generic[T]):
     The Database class, is made to store objects of type T.
     It simplifies the way in way objects can be retrieved.
 
+    The elements are saved one record at a time by a RecordStore.
+    An element can implement get_metadata() to store a JSON serializable
+        summary of itself in the index, which can be listed without
+        loading the element, and get_entries() and set_entries(entries)
+        to keep a growing list of entries in an append-only sidecar file
+        instead of its pickled payload.
+
+    Every element is kept in a numbered slot, so that appending and
+        deleting an element takes constant time. Besides the categories
+        of the @Const attributes, indexes over any key of the elements can
+        be added, either for exact-match lookups (see add_index) or for
+        ordered and range queries (see add_ordered_index).
+
     Args:
         Generic (T): The type of data to store in the database.
     """
@@ -45,8 +73,12 @@ class Database(Generic[T]):
 
         self.__whitelist: List[str] | None = whitelist
         self.__path: str = path
-        self.__items: List[T] = [element]
-        self.__categories: dict[str, dict[object, List[T]]] = {}
+        self.__store: RecordStore = RecordStore(path)
+        self.__items: Dict[int, T] = {}
+        self.__slots: Dict[int, List[int]] = {}
+        self.__next_slot: int = 0
+        self.__categories: Dict[str, HashIndex[T]] = {}
+        self.__indexes: Dict[str, HashIndex[T] | OrderedIndex[T]] = {}
 
         for key, value in vars(element).items():
             if Const.is_constant(element, key):
@@ -57,7 +89,9 @@ class Database(Generic[T]):
                         + "contains non-hashable constants"
                     )
 
-                self.__categories[key] = {value: [element]}
+                self.__categories[key] = HashIndex(operator.attrgetter(key))
+
+        self.append(element)
 
     @staticmethod
     def from_list(
@@ -108,22 +142,131 @@ class Database(Generic[T]):
             Database: The new database stored at path,
                 or None if it cannot get loaded.
         """
+        store = RecordStore(path)
         elements: List[T] = []
+        legacy_elements: List[T] = []
+        legacy_files: List[str] = []
         try:
-            for file_name in [
-                f
-                for f in os.listdir(path)
-                if os.path.isfile(os.path.join(path, f))
-            ]:
-                with open(path + file_name, "rb") as file:
-                    elements.append(pickle.load(file))
+            names = store.get_names()
+            for name in names:
+                elements.append(Database.__load_record(store, name))
+
+            for file_name in Database.__list_legacy_files(path, names):
+                with open(os.path.join(path, file_name), "rb") as file:
+                    legacy_elements.append(pickle.load(file))
+                legacy_files.append(file_name)
         except Exception as exc:  # noqa (the possible exceptions are unknown)
             warnings.warn(
                 "failed to load the database from disk!\n" f"\t{exc}"
             )
             return None
 
-        return Database.from_list(elements, path, whitelist)
+        db = Database.from_list(elements + legacy_elements, path, whitelist)
+        try:
+            for element, file_name in zip(legacy_elements, legacy_files):
+                db.save_element(element)
+                record = (
+                    f"{db.get_record_name(element)}"
+                    f"{RecordStore.PAYLOAD_SUFFIX}"
+                )
+                if file_name != record:
+                    os.remove(os.path.join(path, file_name))
+        except (IOError, OSError) as exc:
+            warnings.warn(f"failed to migrate the database!\n\t{exc}")
+
+        return db
+
+    @staticmethod
+    def read_index(path: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Lists the elements stored at a path without loading them.
+
+        Args:
+            path (str): The path the database is stored at.
+
+        Returns:
+            List[Tuple[str, Dict[str, Any]]]: The record name and the
+                metadata of every indexed element.
+        """
+        try:
+            return [
+                (name, metadata)
+                for name, _, metadata in RecordStore(path).list()
+            ]
+        except Exception as exc:  # noqa (the possible exceptions are unknown)
+            warnings.warn(f"failed to read the database index!\n\t{exc}")
+            return []
+
+    @staticmethod
+    def has_legacy_files(path: str) -> bool:
+        """
+        Checks if elements pickled as a whole before the index existed
+            are stored at a path. They are migrated by from_path.
+
+        Args:
+            path (str): The path the database is stored at.
+
+        Returns:
+            bool: True if there are elements to migrate, False otherwise.
+        """
+        try:
+            names = RecordStore(path).get_names()
+            return bool(Database.__list_legacy_files(path, names))
+        except Exception:  # noqa (the possible exceptions are unknown)
+            return False
+
+    @staticmethod
+    def write_metadata(path: str, name: str, metadata: Dict[str, Any]) -> None:
+        """
+        Replaces the metadata of an element stored at a path
+            without loading it.
+
+        Args:
+            path (str): The path the database is stored at.
+            name (str): The record name of the element.
+            metadata (Dict[str, Any]): The new metadata of the element.
+
+        Raises:
+            IOError: If it was not able to update the index.
+        """
+        try:
+            RecordStore(path).update_metadata(name, metadata)
+        except Exception as exc:
+            raise IOError(
+                f"Was not able to update the index at: {path}"
+            ) from exc
+
+    @staticmethod
+    def delete_record(path: str, name: str) -> None:
+        """
+        Deletes an element stored at a path without loading it.
+
+        If there is no element with this record name, nothing happens.
+
+        Args:
+            path (str): The path the database is stored at.
+            name (str): The record name of the element.
+        """
+        RecordStore(path).delete(name)
+
+    @staticmethod
+    def load_record(path: str, name: str, entries: bool = True) -> Any:
+        """
+        Loads a single element stored at a path.
+
+        Args:
+            path (str): The path the database is stored at.
+            name (str): The record name of the element.
+            entries (bool, optional): Whether to load the entries of the
+                element as well. Defaults to True.
+
+        Raises:
+            OSError: If the element cannot be read.
+
+        Returns:
+            Any: The loaded element.
+        """
+        return Database.__load_record(RecordStore(path), name, entries)
 
     def append_list(self, elements: List[T]) -> None:
         """
@@ -145,17 +288,112 @@ class Database(Generic[T]):
         Raises:
             RuntimeError: If element does not contain certain constants.
         """
-        self.__items.append(element)
-        for key, value in vars(element).items():
-            if not Const.is_constant(element, key):
-                continue
+        slot = self.__next_slot
+        self.__next_slot += 1
+
+        self.__items[slot] = element
+        self.__slots.setdefault(id(element), []).append(slot)
+        for index in self.__get_all_indexes():
+            index.add(slot, element)
+
+    def add_index(self, name: str, key: Callable[[T], Hashable]) -> None:
+        """
+        Adds an index for exact-match lookups over a key of the elements
+            (see find).
 
-            attribute_dict = self.__categories[key]
+        The key can be a tuple, for a composite index
+            such as (model, dataset).
+
+        Args:
+            name (str): The name of the index.
+            key (Callable[[T], Hashable]): The function computing the key
+                of an element.
+
+        Raises:
+            ValueError: If there already is an index with this name.
+        """
+        self.__add_index(name, HashIndex(key))
 
-            if value in attribute_dict:
-                attribute_dict[value].append(element)
-            else:
-                attribute_dict[value] = [element]
+    def add_ordered_index(self, name: str, key: Callable[[T], Any]) -> None:
+        """
+        Adds an index sorted by a key of the elements, for ordered and
+            range queries (see find_range).
+
+        The keys of all elements must be comparable with each other,
+            the key can be a tuple, for a composite index
+            such as (noise, timestamp).
+
+        Args:
+            name (str): The name of the index.
+            key (Callable[[T], Any]): The function computing the key
+                of an element.
+
+        Raises:
+            ValueError: If there already is an index with this name.
+        """
+        self.__add_index(name, OrderedIndex(key))
+
+    def reindex(self, element: T) -> None:
+        """
+        Updates the keys of an element in the indexes,
+            after a value the keys depend on has changed.
+
+        If the element is not in the database, nothing happens.
+
+        Args:
+            element (T): The changed element.
+        """
+        for slot in self.__slots.get(id(element), []):
+            for index in self.__indexes.values():
+                index.remove(slot)
+                index.add(slot, element)
+
+    def find(self, name: str, value: Hashable) -> List[T]:
+        """
+        Finds the elements whose key in an index is equal to a value.
+
+        Args:
+            name (str): The name of the index (see add_index).
+            value (Hashable): The wanted key.
+
+        Raises:
+            KeyError: If there is no index with this name
+                for exact-match lookups.
+
+        Returns:
+            List[T]: The matching elements.
+        """
+        index = self.__indexes[name]
+        if not isinstance(index, HashIndex):
+            raise KeyError(f"{name} is not an exact-match index")
+
+        return index.find(value)
+
+    def find_range(
+        self, name: str, low: Any = None, high: Any = None
+    ) -> List[T]:
+        """
+        Finds the elements whose key in an ordered index lies between
+            two bounds.
+
+        Args:
+            name (str): The name of the index (see add_ordered_index).
+            low (Any, optional): The inclusive lower bound,
+                unbounded if None. Defaults to None.
+            high (Any, optional): The inclusive upper bound,
+                unbounded if None. Defaults to None.
+
+        Raises:
+            KeyError: If there is no ordered index with this name.
+
+        Returns:
+            List[T]: The matching elements sorted by their key.
+        """
+        index = self.__indexes[name]
+        if not isinstance(index, OrderedIndex):
+            raise KeyError(f"{name} is not an ordered index")
+
+        return index.find_range(low, high)
 
     def get(self, category: str, value: object) -> List[T]:
         """
@@ -178,7 +416,7 @@ class Database(Generic[T]):
         Returns:
             List[T]: A list of the items stored in the database.
         """
-        return self.__items
+        return list(self.__items.values())
 
     def __getitem__(self, item: tuple[str, object]) -> List[T]:
         """
@@ -192,10 +430,7 @@ class Database(Generic[T]):
             List[T]: The list of every object in the database
                 whose attribute name/value correspond to item.
         """
-        if item[1] in self.__categories[item[0]]:
-            return self.__categories[item[0]][item[1]]
-
-        return []
+        return self.__categories[item[0]].find(item[1])
 
     def delete(self, element: T) -> None:
         """
@@ -206,19 +441,19 @@ class Database(Generic[T]):
         Args:
             element (T): The element to delete.
         """
-        path: str = os.path.join(self.__path, self.__get_file_name(element))
-        if os.path.exists(path):
-            os.remove(path)
+        self.__store.delete(self.get_record_name(element))
 
-        self.__items.remove(element)
-        for key, value in vars(element).items():
-            if not Const.is_constant(element, key):
-                continue
+        slots = self.__slots.get(id(element))
+        if not slots:
+            return
 
-            attribute_dict = self.__categories[key]
+        slot = slots.pop(0)
+        if not slots:
+            del self.__slots[id(element)]
 
-            if value in attribute_dict and element in attribute_dict[value]:
-                attribute_dict[value].remove(element)
+        del self.__items[slot]
+        for index in self.__get_all_indexes():
+            index.remove(slot)
 
     def save_element(self, element: T) -> None:
         """
@@ -231,13 +466,23 @@ class Database(Generic[T]):
         Raises:
             IOError: If it was not able to save the element.
         """
-        if element not in self.__items:
+        if element not in self:
             self.append(element)
 
         try:
-            name = self.__get_file_name(element=element)
-            with open(os.path.join(self.__path, name), "wb") as file:
-                pickle.dump(element, file)
+            get_entries = getattr(element, "get_entries", None)
+            entries = get_entries() if get_entries is not None else None
+            self.__store.put(
+                name=self.get_record_name(element),
+                element=Database.__get_payload(element),
+                constants={
+                    key: value
+                    for key, value in vars(element).items()
+                    if Const.is_constant(element, key)
+                },
+                metadata=Database.__get_metadata(element),
+                entries=entries,
+            )
         except Exception as exc:
             raise IOError(
                 f"Was not able to save database element to: {self.__path}"
@@ -252,22 +497,43 @@ class Database(Generic[T]):
                 to the specified path.
         """
         try:
-            for item in self.__items:
+            for item in self.get_items():
                 self.save_element(item)
         except Exception as exc:
             raise IOError(
                 f"Was not able to save database to path: {self.__path}"
             ) from exc
 
-    def __get_file_name(self, element: T) -> str:
+    def update_metadata(self, element: T) -> None:
         """
-        Get the file name for an element in the database.
+        Updates the metadata of a saved element in the index
+            without saving the element again.
 
         Args:
-            element (T): The element to get the file name for.
+            element (T): The saved element.
+
+        Raises:
+            IOError: If it was not able to update the index.
+        """
+        try:
+            self.__store.update_metadata(
+                self.get_record_name(element),
+                Database.__get_metadata(element),
+            )
+        except Exception as exc:
+            raise IOError(
+                f"Was not able to update the index at: {self.__path}"
+            ) from exc
+
+    def get_record_name(self, element: T) -> str:
+        """
+        Get the record name for an element in the database.
+
+        Args:
+            element (T): The element to get the record name for.
 
         Returns:
-            str: The file name for the element.
+            str: The record name for the element.
         """
         name = ""
         for key, value in vars(element).items():
@@ -276,7 +542,121 @@ class Database(Generic[T]):
             ) and Const.is_constant(element, key):
                 name += f"{value} "
 
-        return f"{name.strip()}.elem"
+        return name.strip()
+
+    @staticmethod
+    def __get_metadata(element: Any) -> Dict[str, Any]:
+        """
+        Get the metadata of an element stored in the index.
+
+        Args:
+            element (Any): The element.
+
+        Returns:
+            Dict[str, Any]: The metadata of the element,
+                empty if the element does not provide any.
+        """
+        get_metadata = getattr(element, "get_metadata", None)
+
+        return get_metadata() if get_metadata is not None else {}
+
+    def __add_index(
+        self, name: str, index: HashIndex[T] | OrderedIndex[T]
+    ) -> None:
+        """
+        Adds an index and fills it with the elements of the database.
+
+        Args:
+            name (str): The name of the index.
+            index (HashIndex[T] | OrderedIndex[T]): The empty index.
+
+        Raises:
+            ValueError: If there already is an index with this name.
+        """
+        if name in self.__indexes:
+            raise ValueError(f"The index {name} already exists")
+
+        for slot, element in self.__items.items():
+            index.add(slot, element)
+
+        self.__indexes[name] = index
+
+    def __get_all_indexes(self) -> List[HashIndex[T] | OrderedIndex[T]]:
+        """
+        Get the categories and the added indexes of the database.
+
+        Returns:
+            List[HashIndex[T] | OrderedIndex[T]]: Every index to update
+                when an element is appended or deleted.
+        """
+        return [*self.__categories.values(), *self.__indexes.values()]
+
+    @staticmethod
+    def __list_legacy_files(path: str, names: List[str]) -> List[str]:
+        """
+        Lists the elements pickled as a whole before the index existed.
+
+        Args:
+            path (str): The path the database is stored at.
+            names (List[str]): The names of the indexed records.
+
+        Returns:
+            List[str]: The file names of the legacy elements.
+        """
+        indexed = {f"{name}{RecordStore.PAYLOAD_SUFFIX}" for name in names}
+
+        return [
+            file_name
+            for file_name in os.listdir(path)
+            if os.path.isfile(os.path.join(path, file_name))
+            and file_name not in indexed
+            and not RecordStore.is_store_file(file_name)
+        ]
+
+    @staticmethod
+    def __load_record(
+        store: RecordStore, name: str, entries: bool = True
+    ) -> Any:
+        """
+        Loads an element and optionally its entries from a record store.
+
+        Args:
+            store (RecordStore): The store holding the element.
+            name (str): The record name of the element.
+            entries (bool, optional): Whether to load the entries of the
+                element as well. Defaults to True.
+
+        Returns:
+            Any: The loaded element.
+        """
+        element = store.load(name)
+        set_entries = getattr(element, "set_entries", None)
+        if entries and set_entries is not None:
+            set_entries(store.load_entries(name))
+
+        return element
+
+    @staticmethod
+    def __get_payload(element: T) -> T:
+        """
+        Gets the element to pickle as the payload of its record.
+
+        The entries of an element are stored in the sidecar file, so they
+            are left out of a shallow copy of it.
+
+        Args:
+            element (T): The element to save.
+
+        Returns:
+            T: The element without its entries.
+        """
+        set_entries = getattr(element, "set_entries", None)
+        if set_entries is None:
+            return element
+
+        payload = copy.copy(element)
+        payload.set_entries([])
+        return payload
 
     def __len__(self) -> int:
         """
@@ -294,7 +674,7 @@ class Database(Generic[T]):
         Returns:
             Iterator[T]: An iterator over the items in the database.
         """
-        return iter(self.__items)
+        return iter(self.get_items())
 
     def __str__(self) -> str:
         """
@@ -305,7 +685,7 @@ class Database(Generic[T]):
         """
         return (
             f"Database at: {self.__path}\n"
-            f"Containing: {', '.join(str(item) for item in self.__items)}\n"
+            f"Containing: {', '.join(str(item) for item in self)}\n"
         )
 
     def __contains__(self, other: object) -> bool:
@@ -318,4 +698,4 @@ class Database(Generic[T]):
         Returns:
             bool: true iff the Database contains `other`
         """
-        return other in self.__items
+        return id(other) in self.__slots
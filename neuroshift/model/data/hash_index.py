@@ -0,0 +1,73 @@
+"""This module contains the HashIndex class."""
+
+from typing import Callable, Dict, Generic, Hashable, List, TypeVar
+
+T = TypeVar("T")
+
+
+class HashIndex(Generic[T]):
+    """
+    An index of the elements of a Database for exact-match lookups.
+
+    The key of an element can be a single value or a tuple of values,
+        for a composite index. Every element is stored under the slot
+        the Database gave it, so that adding and removing an element
+        takes constant time.
+
+    Args:
+        Generic (T): The type of the indexed elements.
+    """
+
+    def __init__(self, key: Callable[[T], Hashable]) -> None:
+        """
+        Initializes a HashIndex object.
+
+        Args:
+            key (Callable[[T], Hashable]): The function computing the key
+                of an element.
+        """
+        self.__key: Callable[[T], Hashable] = key
+        self.__buckets: Dict[Hashable, Dict[int, T]] = {}
+        self.__keys: Dict[int, Hashable] = {}
+
+    def add(self, slot: int, element: T) -> None:
+        """
+        Adds an element to the index.
+
+        Args:
+            slot (int): The slot of the element in the database.
+            element (T): The element to add.
+        """
+        key = self.__key(element)
+        self.__buckets.setdefault(key, {})[slot] = element
+        self.__keys[slot] = key
+
+    def remove(self, slot: int) -> None:
+        """
+        Removes an element from the index.
+
+        If there is no element in the slot, nothing happens.
+
+        Args:
+            slot (int): The slot of the element in the database.
+        """
+        if slot not in self.__keys:
+            return
+
+        key = self.__keys.pop(slot)
+        bucket = self.__buckets[key]
+        del bucket[slot]
+        if not bucket:
+            del self.__buckets[key]
+
+    def find(self, value: Hashable) -> List[T]:
+        """
+        Finds the elements whose key is equal to a value.
+
+        Args:
+            value (Hashable): The wanted key.
+
+        Returns:
+            List[T]: The matching elements in the order they were added.
+        """
+        return list(self.__buckets.get(value, {}).values())
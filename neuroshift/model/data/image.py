@@ -3,6 +3,7 @@
 import torch
 
 import neuroshift.config as conf
+from neuroshift.model.utils import Utils
 
 
 class Image:
@@ -13,7 +14,7 @@ class Image:
     def __init__(
         self,
         label: str,
-        path: str,
+        path: str | None,
         tensor: torch.Tensor,
         actual_class: str | None = None,
     ) -> None:
@@ -22,14 +23,17 @@ class Image:
 
         Args:
             label (str): The label of the image.
-            path (str): The path to the image file.
+            path (str | None): The path to the image file or its data URL.
+                If None, the data URL is encoded from the tensor the first
+                time it is needed, so that images which are never shown
+                are never encoded.
             tensor (torch.Tensor, optional): The tensor representation
                 of the image. Defaults to None.
             actual_class (str, optional): The actual class of the image.
                 Defaults to None.
         """
         self.__label = label
-        self.__path = path
+        self.__path: str | None = path
         self.__actual_class = actual_class
         self.__tensor = tensor.to(conf.device)
 
@@ -40,6 +44,11 @@ class Image:
         Returns:
             str: The path of the image.
         """
+        if self.__path is None:
+            self.__path = Utils.image_to_url(
+                Utils.tensor_to_image(self.__tensor.cpu())
+            )
+
         return self.__path
 
     def get_class(self) -> str | None:
@@ -84,7 +93,7 @@ class Image:
 
         return (
             self.__label == other.get_label()
-            and self.__path == other.get_path()
+            and self.get_path() == other.get_path()
             and self.__actual_class == other.get_class()
             and torch.equal(self.__tensor, other.get_tensor())
         )
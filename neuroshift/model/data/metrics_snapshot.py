@@ -0,0 +1,179 @@
+"""This module contains the MetricsSnapshot class."""
+
+from typing import Dict, List, Union
+
+import torch
+
+
+class MetricsSnapshot:
+    """
+    Represents the per-class and overall metrics of an analytic at a given
+        version.
+
+    Every metric of every class is computed at once from the confusion
+        counts of the classes, as vectors.
+    """
+
+    ACCURACY: str = "accuracy"
+    PRECISION: str = "precision"
+    RECALL: str = "recall"
+    F1: str = "f1"
+    METRICS: List[str] = [ACCURACY, PRECISION, RECALL, F1]
+
+    def __init__(
+        self,
+        version: int,
+        classes: List[str],
+        class_analytics: Dict[str, Dict[str, Union[int, float]]],
+    ) -> None:
+        """
+        Initializes a MetricsSnapshot object.
+
+        Args:
+            version (int): The version of the analytic the metrics are
+                computed at.
+            classes (List[str]): The classes of the analytic.
+            class_analytics (Dict[str, Dict[str, Union[int, float]]]): The
+                true and false positives and negatives of every class.
+        """
+        self.__version: int = version
+        self.__classes: List[str] = list(classes)
+
+        counts = torch.tensor(
+            [
+                [
+                    class_analytics.get(class_name, {}).get(count, 0)
+                    for count in (
+                        "true_positive",
+                        "true_negative",
+                        "false_positive",
+                        "false_negative",
+                    )
+                ]
+                for class_name in self.__classes
+            ],
+            dtype=torch.float64,
+        ).reshape(-1, 4)
+        true_positive, true_negative, false_positive, false_negative = (
+            counts.T
+        )
+
+        accuracy = MetricsSnapshot.__divide(
+            true_positive + true_negative, counts.sum(dim=1)
+        )
+        precision = MetricsSnapshot.__divide(
+            true_positive, true_positive + false_positive
+        )
+        recall = MetricsSnapshot.__divide(
+            true_positive, true_positive + false_negative
+        )
+        f1 = MetricsSnapshot.__divide(
+            2 * precision * recall, precision + recall
+        )
+
+        self.__class_metrics: Dict[str, Dict[str, float]] = {}
+        self.__overall_metrics: Dict[str, float] = {}
+        for metric, values in zip(
+            MetricsSnapshot.METRICS, (accuracy, precision, recall, f1)
+        ):
+            class_values = values.tolist()
+            self.__class_metrics[metric] = dict(
+                zip(self.__classes, class_values)
+            )
+            self.__overall_metrics[metric] = (
+                sum(class_values) / len(class_values)
+                if class_values
+                else 0.0
+            )
+
+        overall_precision = self.__overall_metrics[MetricsSnapshot.PRECISION]
+        overall_recall = self.__overall_metrics[MetricsSnapshot.RECALL]
+        self.__overall_metrics[MetricsSnapshot.F1] = (
+            2
+            * overall_precision
+            * overall_recall
+            / (overall_precision + overall_recall)
+            if overall_precision + overall_recall != 0
+            else 0.0
+        )
+
+    def get_version(self) -> int:
+        """
+        Get the version of the analytic the metrics are computed at.
+
+        Returns:
+            int: The version of the snapshot.
+        """
+        return self.__version
+
+    def get_classes(self) -> List[str]:
+        """
+        Get the classes of the snapshot.
+
+        Returns:
+            List[str]: The classes.
+        """
+        return self.__classes.copy()
+
+    def get_overall(self, metric: str) -> float:
+        """
+        Get an overall metric, the mean of the metric over the classes
+            (the F1 score is computed from the overall precision and recall).
+
+        Args:
+            metric (str): The name of the metric, one of METRICS.
+
+        Returns:
+            float: The overall metric, 0 if there are no predictions.
+        """
+        return self.__overall_metrics[metric]
+
+    def get_class(self, metric: str, class_name: str) -> float:
+        """
+        Get a metric of a class.
+
+        Args:
+            metric (str): The name of the metric, one of METRICS.
+            class_name (str): The name of the class.
+
+        Returns:
+            float: The metric of the class, 0 if the class is unknown.
+        """
+        return self.__class_metrics[metric].get(class_name, 0.0)
+
+    def get_class_vector(self, metric: str, classes: List[str]) -> List[float]:
+        """
+        Get a metric of several classes.
+
+        Args:
+            metric (str): The name of the metric, one of METRICS.
+            classes (List[str]): The names of the classes.
+
+        Returns:
+            List[float]: The metric of every class, 0 for unknown classes.
+        """
+        class_metrics = self.__class_metrics[metric]
+
+        return [class_metrics.get(class_name, 0.0) for class_name in classes]
+
+    @staticmethod
+    def __divide(
+        dividend: torch.Tensor, divisor: torch.Tensor
+    ) -> torch.Tensor:
+        """
+        Divide two vectors, with 0 where the divisor is 0.
+
+        Args:
+            dividend (torch.Tensor): The dividend.
+            divisor (torch.Tensor): The divisor.
+
+        Returns:
+            torch.Tensor: The quotient.
+        """
+        nonzero = divisor != 0
+
+        return torch.where(
+            nonzero,
+            dividend / torch.where(nonzero, divisor, torch.ones_like(divisor)),
+            torch.zeros_like(dividend),
+        )
@@ -187,8 +187,20 @@ class Model:
             List[Tuple[str, float]]: A list of tuples containing
                 the predicted class and its confidence score.
         """
-        t = self.__model(x)
-        t = t.view(t.shape[0], -1)
+        return self.decode(self.__model(x))
+
+    def decode(self, output: torch.Tensor) -> List[Tuple[str, float]]:
+        """
+        Decode the output of the model into predicted classes.
+
+        Args:
+            output (torch.Tensor): The output of the model for a batch.
+
+        Returns:
+            List[Tuple[str, float]]: A list of tuples containing
+                the predicted class and its confidence score.
+        """
+        t = output.view(output.shape[0], -1)
         if not self.__normalized:
             t = torch.softmax(t, 1)
 
@@ -0,0 +1,160 @@
+"""This module contains the OrderedIndex class."""
+
+import bisect
+import itertools
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterator,
+    List,
+    Tuple,
+    TypeVar,
+)
+
+T = TypeVar("T")
+
+
+class OrderedIndex(Generic[T]):
+    """
+    An index of the elements of a Database sorted by a key,
+        for ordered and range queries.
+
+    The key of an element can be a number or a tuple, for a composite
+        index such as (noise, timestamp), and the keys of all elements must
+        be comparable with each other. Lookups take logarithmic time.
+        Adding an element only buffers its entry, the buffered entries are
+        sorted into the index by the next lookup. Removing an element only
+        marks its entry as deleted, the deleted entries are dropped once
+        they make up half of the entries.
+
+    Args:
+        Generic (T): The type of the indexed elements.
+    """
+
+    def __init__(self, key: Callable[[T], Any]) -> None:
+        """
+        Initializes an OrderedIndex object.
+
+        Args:
+            key (Callable[[T], Any]): The function computing the key
+                of an element.
+        """
+        self.__key: Callable[[T], Any] = key
+        # the key, slot and version of the elements, the deleted ones
+        # included
+        self.__entries: List[Tuple[Any, int, int]] = []
+        self.__pending: List[Tuple[Any, int, int]] = []
+        self.__elements: Dict[int, T] = {}
+        # the version of the live entry of every slot
+        self.__versions: Dict[int, int] = {}
+        self.__counter: Iterator[int] = itertools.count()
+
+    def add(self, slot: int, element: T) -> None:
+        """
+        Adds an element to the index, replacing the element in its slot.
+
+        Args:
+            slot (int): The slot of the element in the database.
+            element (T): The element to add.
+        """
+        self.remove(slot)
+
+        version = next(self.__counter)
+        self.__pending.append((self.__key(element), slot, version))
+        self.__elements[slot] = element
+        self.__versions[slot] = version
+
+    def remove(self, slot: int) -> None:
+        """
+        Removes an element from the index.
+
+        If there is no element in the slot, nothing happens.
+
+        Args:
+            slot (int): The slot of the element in the database.
+        """
+        if slot not in self.__versions:
+            return
+
+        del self.__versions[slot]
+        del self.__elements[slot]
+
+        if 2 * len(self.__versions) < len(self.__entries) + len(
+            self.__pending
+        ):
+            self.__entries = [
+                entry for entry in self.__entries if self.__is_live(entry)
+            ]
+            self.__pending = [
+                entry for entry in self.__pending if self.__is_live(entry)
+            ]
+
+    def find_range(self, low: Any = None, high: Any = None) -> List[T]:
+        """
+        Finds the elements whose key lies between two bounds.
+
+        Args:
+            low (Any, optional): The inclusive lower bound,
+                unbounded if None. Defaults to None.
+            high (Any, optional): The inclusive upper bound,
+                unbounded if None. Defaults to None.
+
+        Returns:
+            List[T]: The matching elements sorted by their key.
+        """
+        if self.__pending:
+            # the sorted entries are a run, so they are merged in linear time
+            self.__entries.extend(self.__pending)
+            self.__entries.sort()
+            self.__pending = []
+
+        start = (
+            0
+            if low is None
+            else bisect.bisect_left(
+                self.__entries, low, key=OrderedIndex.__entry_key
+            )
+        )
+        end = (
+            len(self.__entries)
+            if high is None
+            else bisect.bisect_right(
+                self.__entries, high, key=OrderedIndex.__entry_key
+            )
+        )
+
+        return [
+            self.__elements[entry[1]]
+            for entry in self.__entries[start:end]
+            if self.__is_live(entry)
+        ]
+
+    def __is_live(self, entry: Tuple[Any, int, int]) -> bool:
+        """
+        Checks if an entry belongs to an element of the index, i.e. its
+            element was neither removed nor replaced.
+
+        Args:
+            entry (Tuple[Any, int, int]): The key, slot and version of an
+                element.
+
+        Returns:
+            bool: True if the entry is live, False if it is deleted.
+        """
+        return self.__versions.get(entry[1]) == entry[2]
+
+    @staticmethod
+    def __entry_key(entry: Tuple[Any, int, int]) -> Any:
+        """
+        Get the key of a sorted entry, without its slot and version.
+
+        Args:
+            entry (Tuple[Any, int, int]): The key, slot and version of an
+                element.
+
+        Returns:
+            Any: The key of the element.
+        """
+        return entry[0]
@@ -0,0 +1,334 @@
+"""This module contains the RecordStore class."""
+
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Tuple
+
+
+class RecordStore:
+    """
+    The storage engine of a Database.
+
+    Every element is stored as one record made of
+        - a row in a SQLite index holding the constants and the metadata
+            of the element, so that records can be listed without
+            deserializing them,
+        - a payload file holding the pickled element without its entries,
+        - an append-only sidecar file holding the entries of the element,
+            to which a save only appends the entries added since the
+            previous save.
+    """
+
+    INDEX_FILE: str = "index.sqlite"
+    PAYLOAD_SUFFIX: str = ".elem"
+    ENTRIES_SUFFIX: str = ".entries"
+    TEMPORARY_SUFFIX: str = ".tmp"
+
+    def __init__(self, path: str) -> None:
+        """
+        Initializes a RecordStore object.
+
+        Args:
+            path (str): The folder of the records.
+        """
+        self.__path: str = path
+        self.__lock: threading.Lock = threading.Lock()
+
+    def get_path(self) -> str:
+        """
+        Get the folder of the records.
+
+        Returns:
+            str: The folder of the records.
+        """
+        return self.__path
+
+    @staticmethod
+    def is_store_file(file_name: str) -> bool:
+        """
+        Check if a file of the folder belongs to the index or is a sidecar
+            or temporary file of a record.
+
+        Args:
+            file_name (str): The name of the file.
+
+        Returns:
+            bool: True if the file is managed by the store besides the
+                payload files, False otherwise.
+        """
+        return (
+            file_name.startswith(RecordStore.INDEX_FILE)
+            or file_name.endswith(RecordStore.ENTRIES_SUFFIX)
+            or file_name.endswith(RecordStore.TEMPORARY_SUFFIX)
+        )
+
+    def get_names(self) -> List[str]:
+        """
+        Get the names of the stored records.
+
+        Returns:
+            List[str]: The names of the records in insertion order.
+        """
+        return [name for name, _, _ in self.list()]
+
+    def list(self) -> List[Tuple[str, Dict[str, Any], Dict[str, Any]]]:
+        """
+        List the stored records without loading their payloads.
+
+        Returns:
+            List[Tuple[str, Dict[str, Any], Dict[str, Any]]]: The name,
+                the constants and the metadata of every record.
+        """
+        if not os.path.isfile(self.__index_path()):
+            return []
+
+        with self.__lock, self.__connect() as connection:
+            rows = connection.execute(
+                "SELECT name, constants, metadata FROM records ORDER BY rowid"
+            ).fetchall()
+
+        return [
+            (name, json.loads(constants), json.loads(metadata))
+            for name, constants, metadata in rows
+        ]
+
+    def put(
+        self,
+        name: str,
+        element: Any,
+        constants: Dict[str, Any],
+        metadata: Dict[str, Any],
+        entries: List[Any] | None = None,
+    ) -> None:
+        """
+        Store a record, replacing the previous version of it.
+
+        If the record was stored before for the same element, only the
+            entries added since then are appended to its sidecar file.
+
+        Args:
+            name (str): The name of the record.
+            element (Any): The element to pickle as payload.
+            constants (Dict[str, Any]): The constants of the element.
+            metadata (Dict[str, Any]): The metadata of the element.
+            entries (List[Any] | None, optional): The entries of the element
+                stored in the sidecar file. Defaults to None.
+
+        Raises:
+            OSError: If the record cannot be written.
+        """
+        entries = entries if entries is not None else []
+        serialized_constants = json.dumps(
+            constants, sort_keys=True, default=str
+        )
+
+        with self.__lock, self.__connect() as connection:
+            row = connection.execute(
+                "SELECT constants, entries, size FROM records WHERE name = ?",
+                (name,),
+            ).fetchone()
+
+            appending = (
+                row is not None
+                and row[0] == serialized_constants
+                and row[1] <= len(entries)
+                and os.path.isfile(self.__entries_path(name))
+            )
+            stored, size = (row[1], row[2]) if appending else (0, 0)
+            new_entries = entries[stored:]
+            if new_entries or not appending:
+                with open(
+                    self.__entries_path(name), "r+b" if appending else "wb"
+                ) as file:
+                    # drop the bytes of an interrupted save
+                    file.seek(size)
+                    file.truncate()
+                    pickle.dump(new_entries, file)
+                    size = file.tell()
+
+            temporary_path = (
+                f"{self.__payload_path(name)}{RecordStore.TEMPORARY_SUFFIX}"
+            )
+            with open(temporary_path, "wb") as file:
+                pickle.dump(element, file)
+            os.replace(temporary_path, self.__payload_path(name))
+
+            connection.execute(
+                "INSERT INTO records "
+                "(name, constants, metadata, entries, size, updated) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET "
+                "constants = excluded.constants, "
+                "metadata = excluded.metadata, "
+                "entries = excluded.entries, "
+                "size = excluded.size, "
+                "updated = excluded.updated",
+                (
+                    name,
+                    serialized_constants,
+                    json.dumps(metadata, default=str),
+                    stored + len(new_entries),
+                    size,
+                    time.time(),
+                ),
+            )
+
+    def update_metadata(self, name: str, metadata: Dict[str, Any]) -> None:
+        """
+        Replace the metadata of a record without rewriting its payload.
+
+        Args:
+            name (str): The name of the record.
+            metadata (Dict[str, Any]): The new metadata of the record.
+        """
+        with self.__lock, self.__connect() as connection:
+            connection.execute(
+                "UPDATE records SET metadata = ?, updated = ? WHERE name = ?",
+                (json.dumps(metadata, default=str), time.time(), name),
+            )
+
+    def load(self, name: str) -> Any:
+        """
+        Load the payload of a record without its entries.
+
+        Args:
+            name (str): The name of the record.
+
+        Raises:
+            OSError: If the payload file cannot be read.
+
+        Returns:
+            Any: The unpickled element.
+        """
+        with open(self.__payload_path(name), "rb") as file:
+            return pickle.load(file)
+
+    def load_entries(self, name: str) -> List[Any]:
+        """
+        Load the entries of a record.
+
+        Args:
+            name (str): The name of the record.
+
+        Returns:
+            List[Any]: The stored entries of the record.
+        """
+        with self.__lock, self.__connect() as connection:
+            row = connection.execute(
+                "SELECT size FROM records WHERE name = ?", (name,)
+            ).fetchone()
+
+        if row is None or not os.path.isfile(self.__entries_path(name)):
+            return []
+
+        entries: List[Any] = []
+        for chunk in self.__read_chunks(self.__entries_path(name), row[0]):
+            entries += chunk
+
+        return entries
+
+    def delete(self, name: str) -> None:
+        """
+        Delete a record.
+
+        If there is no record with this name, nothing happens.
+
+        Args:
+            name (str): The name of the record.
+        """
+        for path in (self.__payload_path(name), self.__entries_path(name)):
+            if os.path.exists(path):
+                os.remove(path)
+
+        if not os.path.isfile(self.__index_path()):
+            return
+
+        with self.__lock, self.__connect() as connection:
+            connection.execute("DELETE FROM records WHERE name = ?", (name,))
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Open a connection to the index, creating it if needed.
+
+        The transaction is committed when leaving the context without an
+            exception and rolled back otherwise.
+
+        Yields:
+            sqlite3.Connection: The connection to the index.
+        """
+        connection = sqlite3.connect(self.__index_path())
+        try:
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS records ("
+                    "name TEXT PRIMARY KEY, "
+                    "constants TEXT NOT NULL, "
+                    "metadata TEXT NOT NULL, "
+                    "entries INTEGER NOT NULL, "
+                    "size INTEGER NOT NULL, "
+                    "updated REAL NOT NULL)"
+                )
+                yield connection
+        finally:
+            connection.close()
+
+    def __index_path(self) -> str:
+        """
+        Get the path of the index.
+
+        Returns:
+            str: The path of the index.
+        """
+        return os.path.join(self.__path, RecordStore.INDEX_FILE)
+
+    def __payload_path(self, name: str) -> str:
+        """
+        Get the path of the payload file of a record.
+
+        Args:
+            name (str): The name of the record.
+
+        Returns:
+            str: The path of the payload file.
+        """
+        return os.path.join(
+            self.__path, f"{name}{RecordStore.PAYLOAD_SUFFIX}"
+        )
+
+    def __entries_path(self, name: str) -> str:
+        """
+        Get the path of the sidecar file holding the entries of a record.
+
+        Args:
+            name (str): The name of the record.
+
+        Returns:
+            str: The path of the sidecar file.
+        """
+        return os.path.join(
+            self.__path, f"{name}{RecordStore.ENTRIES_SUFFIX}"
+        )
+
+    @staticmethod
+    def __read_chunks(path: str, size: int) -> Iterator[List[Any]]:
+        """
+        Read the chunks of entries appended to a sidecar file.
+
+        Args:
+            path (str): The path of the sidecar file.
+            size (int): The number of indexed bytes of the file, bytes
+                appended by an interrupted save are ignored.
+
+        Yields:
+            List[Any]: The entries appended by one save.
+        """
+        with open(path, "rb") as file:
+            while file.tell() < size:
+                yield pickle.load(file)
+
@@ -0,0 +1,314 @@
+"""This module contains the DatasetCache class."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List
+from typing_extensions import Self
+
+import torch
+
+import neuroshift.config as conf
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.image import Image
+from neuroshift.model.fingerprint import Fingerprint
+from neuroshift.model.noises.perturbation import Perturbation
+
+
+class DatasetCache:
+    """
+    A content addressed cache of perturbed datasets on disk.
+
+    An entry is keyed by the hash of the dataset folder, the perturbation
+        with its parameters and the seed, which determine the perturbed
+        images. The images are stored as packed tensors in one file per
+        entry. The least recently used entries are evicted once the files
+        take more than conf.DATASET_CACHE_SIZE bytes, a size of 0 disables
+        the cache.
+    """
+
+    __FOLDER_NAME: str = "datasets"
+    __INDEX_NAME: str = "datasets.json"
+    __instance: Self | None = None
+
+    @classmethod
+    def get_instance(cls) -> "DatasetCache":
+        """
+        Returns the singleton instance of the DatasetCache class.
+        If the instance is new, it loads the index of the cache from disk.
+
+        Returns:
+            DatasetCache: The singleton instance of the DatasetCache class.
+        """
+        if cls.__instance is None:
+            cls.__instance = DatasetCache()
+
+        return cls.__instance
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the DatasetCache class.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self.__load()
+
+    def get(
+        self, dataset: Dataset, perturbation: Perturbation, seed: int
+    ) -> Dataset | None:
+        """
+        Look up a perturbed dataset.
+
+        Args:
+            dataset (Dataset): The clean dataset.
+            perturbation (Perturbation): The perturbation applied to it.
+            seed (int): The seed of the perturbation.
+
+        Returns:
+            Dataset | None: The perturbed dataset,
+                or None if it is not cached.
+        """
+        key = DatasetCache.__create_key(dataset, perturbation, seed)
+        if key is None:
+            return None
+
+        with self.__lock:
+            if key not in self.__entries:
+                return None
+
+            try:
+                content = torch.load(self.__get_path(key))
+            except (OSError, RuntimeError, EOFError):
+                self.__remove(key)
+                self.__save()
+                return None
+
+            self.__entries[key]["used"] = time.time()
+            self.__entries.move_to_end(key)
+            self.__save()
+
+        perturbed_dataset = Dataset(
+            name=dataset.get_name(),
+            file_name=dataset.get_file_name(),
+            desc=dataset.get_desc(),
+            classes=dataset.get_classes(),
+            selected=False,
+        )
+        for label, actual_class, tensor in zip(
+            content["labels"], content["classes"], content["tensors"]
+        ):
+            perturbed_dataset.add_image(
+                Image(
+                    label=label,
+                    path=None,
+                    actual_class=actual_class,
+                    tensor=tensor,
+                )
+            )
+
+        return perturbed_dataset
+
+    def put(
+        self,
+        dataset: Dataset,
+        perturbation: Perturbation,
+        seed: int,
+        perturbed_dataset: Dataset,
+    ) -> None:
+        """
+        Store a perturbed dataset in the cache.
+
+        Nothing is stored if the cache is disabled or if the clean dataset
+            is not stored on disk.
+
+        Args:
+            dataset (Dataset): The clean dataset.
+            perturbation (Perturbation): The perturbation applied to it.
+            seed (int): The seed of the perturbation.
+            perturbed_dataset (Dataset): The perturbed dataset.
+        """
+        if conf.DATASET_CACHE_SIZE <= 0:
+            return
+
+        key = DatasetCache.__create_key(dataset, perturbation, seed)
+        if key is None:
+            return
+
+        images = perturbed_dataset.get_images(0, perturbed_dataset.get_size())
+        content = {
+            "labels": [image.get_label() for image in images],
+            "classes": [image.get_class() for image in images],
+            "tensors": DatasetCache.__pack(
+                [image.get_tensor().cpu() for image in images]
+            ),
+        }
+
+        with self.__lock:
+            path = self.__get_path(key)
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                torch.save(content, path)
+                size = os.path.getsize(path)
+            except OSError:
+                return
+
+            self.__entries[key] = {
+                "key": key,
+                "size": size,
+                "used": time.time(),
+            }
+            self.__entries.move_to_end(key)
+            self.__evict()
+            self.__save()
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache.
+        """
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__remove(key)
+            self.__save()
+
+    def get_size(self) -> int:
+        """
+        Get the number of bytes taken by the cached datasets.
+
+        Returns:
+            int: The size of the cache in bytes.
+        """
+        with self.__lock:
+            return sum(entry["size"] for entry in self.__entries.values())
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        Returns:
+            int: The number of entries in the cache.
+        """
+        return len(self.__entries)
+
+    @staticmethod
+    def __create_key(
+        dataset: Dataset, perturbation: Perturbation, seed: int
+    ) -> str | None:
+        """
+        Create the key of a perturbed dataset.
+
+        Args:
+            dataset (Dataset): The clean dataset.
+            perturbation (Perturbation): The perturbation applied to it.
+            seed (int): The seed of the perturbation.
+
+        Returns:
+            str | None: The key, or None if the dataset is not stored on
+                disk.
+        """
+        dataset_hash = Fingerprint.of_dataset(dataset)
+        if dataset_hash is None:
+            return None
+
+        description = {
+            "dataset": dataset_hash,
+            "perturbation": Fingerprint.describe_perturbation(perturbation),
+            "seed": seed,
+        }
+
+        return hashlib.sha256(
+            json.dumps(description, sort_keys=True).encode()
+        ).hexdigest()
+
+    @staticmethod
+    def __pack(tensors: List[torch.Tensor]) -> torch.Tensor | List:
+        """
+        Pack the tensors of the images into a single tensor.
+
+        Args:
+            tensors (List[torch.Tensor]): The tensors of the images.
+
+        Returns:
+            torch.Tensor | List: The stacked tensors, or the tensors
+                themselves if their shapes differ.
+        """
+        if tensors and all(
+            tensor.shape == tensors[0].shape for tensor in tensors
+        ):
+            return torch.stack(tensors)
+
+        return tensors
+
+    @staticmethod
+    def __get_path(key: str) -> str:
+        """
+        Get the path of the file of an entry.
+
+        Args:
+            key (str): The key of the entry.
+
+        Returns:
+            str: The path of the file.
+        """
+        return os.path.join(
+            conf.CACHE_PATH, DatasetCache.__FOLDER_NAME, f"{key}.pt"
+        )
+
+    def __remove(self, key: str) -> None:
+        """
+        Remove an entry and its file.
+
+        Args:
+            key (str): The key of the entry.
+        """
+        del self.__entries[key]
+        try:
+            os.remove(self.__get_path(key))
+        except OSError:
+            pass
+
+    def __evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits into
+            its disk budget.
+        """
+        size = sum(entry["size"] for entry in self.__entries.values())
+        while self.__entries and size > max(conf.DATASET_CACHE_SIZE, 0):
+            key = next(iter(self.__entries))
+            size -= self.__entries[key]["size"]
+            self.__remove(key)
+
+    def __save(self) -> None:
+        """
+        Save the index of the cache to disk.
+        """
+        try:
+            os.makedirs(conf.CACHE_PATH, exist_ok=True)
+            with open(
+                os.path.join(conf.CACHE_PATH, DatasetCache.__INDEX_NAME),
+                "w",
+                encoding="utf8",
+            ) as f:
+                json.dump(list(self.__entries.values()), f)
+        except OSError:
+            pass
+
+    def __load(self) -> None:
+        """
+        Load the index of the cache from disk, dropping the entries whose
+            file is missing.
+        """
+        try:
+            with open(
+                os.path.join(conf.CACHE_PATH, DatasetCache.__INDEX_NAME),
+                encoding="utf8",
+            ) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        for entry in sorted(entries, key=lambda entry: entry["used"]):
+            if os.path.isfile(self.__get_path(entry["key"])):
+                self.__entries[entry["key"]] = entry
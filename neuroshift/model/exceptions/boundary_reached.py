@@ -0,0 +1,17 @@
+"""This module contains the BoundaryReached Exception"""
+
+
+class BoundaryReached(Exception):
+    """
+    An Exception that gets thrown to stop a forward pass once it reaches
+        the layer boundary of an ActivationCache.
+    """
+
+    def __init__(self, boundary: str) -> None:
+        """
+        The constructor of the BoundaryReached Exception.
+
+        Args:
+            boundary (str): The name of the layer that was reached.
+        """
+        super().__init__(f"reached the layer boundary '{boundary}'")
@@ -0,0 +1,17 @@
+"""This module contains the JobCancelled Exception"""
+
+
+class JobCancelled(Exception):
+    """
+    An Exception that gets thrown to stop a job at its next batch once it
+        has been cancelled.
+    """
+
+    def __init__(self, job_id: str) -> None:
+        """
+        The constructor of the JobCancelled Exception.
+
+        Args:
+            job_id (str): The ID of the cancelled job.
+        """
+        super().__init__(f"job '{job_id}' has been cancelled")
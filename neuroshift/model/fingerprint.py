@@ -0,0 +1,158 @@
+"""This module contains the Fingerprint class."""
+
+import hashlib
+import os
+import threading
+from typing import Any, Dict, List, Tuple
+
+import neuroshift.config as conf
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.noises.perturbation import Perturbation
+
+
+class Fingerprint:
+    """
+    Computes content hashes of the files backing models and datasets.
+
+    The hash of a file is only recomputed when its size or modification
+        time changes, so repeated lookups only cost a stat call per file.
+    """
+
+    __CHUNK_SIZE: int = 1 << 20
+    __hashes: Dict[str, Tuple[int, int, str]] = {}
+    __lock: threading.Lock = threading.Lock()
+
+    @staticmethod
+    def of_file(path: str) -> str | None:
+        """
+        Get the content hash of a file.
+
+        Args:
+            path (str): The path of the file.
+
+        Returns:
+            str | None: The hexadecimal SHA-256 hash of the file,
+                or None if the file does not exist.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+
+        with Fingerprint.__lock:
+            cached = Fingerprint.__hashes.get(path)
+
+        signature = (stat.st_size, stat.st_mtime_ns)
+        if cached is not None and cached[:2] == signature:
+            return cached[2]
+
+        digest = hashlib.sha256()
+        try:
+            with open(path, "rb") as file:
+                for chunk in iter(
+                    lambda: file.read(Fingerprint.__CHUNK_SIZE), b""
+                ):
+                    digest.update(chunk)
+        except OSError:
+            return None
+
+        with Fingerprint.__lock:
+            Fingerprint.__hashes[path] = (*signature, digest.hexdigest())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def of_directory(path: str) -> str | None:
+        """
+        Get the content hash of a directory.
+
+        The hash covers the relative path and the content of every file
+            in the directory tree.
+
+        Args:
+            path (str): The path of the directory.
+
+        Returns:
+            str | None: The hexadecimal SHA-256 hash of the directory,
+                or None if the directory does not exist.
+        """
+        if not os.path.isdir(path):
+            return None
+
+        digest = hashlib.sha256()
+        for root, dirs, files in os.walk(path):
+            dirs.sort()
+            for file_name in sorted(files):
+                file_path = os.path.join(root, file_name)
+                file_hash = Fingerprint.of_file(file_path)
+                if file_hash is None:
+                    return None
+
+                digest.update(os.path.relpath(file_path, path).encode())
+                digest.update(file_hash.encode())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def of_model(model: Model) -> str | None:
+        """
+        Get the content hash of the ONNX file of a model.
+
+        Args:
+            model (Model): The model.
+
+        Returns:
+            str | None: The hash of the model file,
+                or None if the model is not stored on disk.
+        """
+        return Fingerprint.of_file(
+            os.path.join(conf.MODEL_PATH, model.get_file_name())
+        )
+
+    @staticmethod
+    def of_dataset(dataset: Dataset) -> str | None:
+        """
+        Get the content hash of the folder of a dataset.
+
+        Args:
+            dataset (Dataset): The dataset.
+
+        Returns:
+            str | None: The hash of the dataset folder,
+                or None if the dataset is not stored on disk.
+        """
+        return Fingerprint.of_directory(
+            os.path.join(conf.DATASET_PATH, dataset.get_file_name())
+        )
+
+    @staticmethod
+    def describe_perturbation(
+        perturbation: Perturbation,
+        parameter_values: List[Tuple[str, float]] | None = None,
+    ) -> Dict[str, Any]:
+        """
+        Get a JSON serializable description of a perturbation and the
+            values of its parameters, to be hashed with the content hashes.
+
+        Args:
+            perturbation (Perturbation): The perturbation.
+            parameter_values (List[Tuple[str, float]] | None, optional):
+                The names and values of the parameters, in order. The
+                current values are taken if None. Defaults to None.
+
+        Returns:
+            Dict[str, Any]: The description of the perturbation.
+        """
+        if parameter_values is None:
+            parameter_values = [
+                (parameter.get_name(), parameter.get_value())
+                for parameter in perturbation.get_parameters()
+            ]
+
+        return {
+            "name": perturbation.get_name(),
+            "target": str(perturbation.get_target()),
+            # a list, as chained perturbations can share parameter names
+            "parameters": [[name, value] for name, value in parameter_values],
+        }
@@ -0,0 +1,160 @@
+"""This module contains the InferenceBatcher class."""
+
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, List, Tuple
+from typing_extensions import Self
+
+import torch
+
+import neuroshift.config as conf
+from neuroshift.model.data.image import Image
+from neuroshift.model.data.model import Model
+from neuroshift.model.utils import Utils
+
+
+class InferenceBatcher:
+    """
+    Runs single image inference requests in batches.
+
+    The requests for a model are collected for conf.BATCH_WINDOW seconds
+        after the first of them arrives, or until conf.BATCH_SIZE of them
+        are pending, and are then run as one batch in a dispatcher thread.
+        Every caller receives a future resolving to its own prediction.
+    """
+
+    __instance: Self | None = None
+
+    @classmethod
+    def get_instance(cls) -> "InferenceBatcher":
+        """
+        Returns the singleton instance of the InferenceBatcher class.
+
+        Returns:
+            InferenceBatcher: The singleton instance of the InferenceBatcher
+                class.
+        """
+        if cls.__instance is None:
+            cls.__instance = InferenceBatcher()
+
+        return cls.__instance
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the InferenceBatcher class.
+        """
+        self.__condition: threading.Condition = threading.Condition()
+        # the pending requests per model, the oldest model first
+        self.__pending: Dict[
+            int, Tuple[Model, List[Tuple[Image, Future, float]]]
+        ] = {}
+        self.__dispatcher: threading.Thread | None = None
+
+    def submit(self, model: Model, image: Image) -> Future:
+        """
+        Requests the prediction of a model on an image.
+
+        Args:
+            model (Model): The model used for inference.
+            image (Image): The image to perform inference on.
+
+        Returns:
+            Future: Resolves to the predicted class and its confidence,
+                or to the exception raised by the forward pass.
+        """
+        future: Future = Future()
+        with self.__condition:
+            _, requests = self.__pending.setdefault(id(model), (model, []))
+            requests.append((image, future, time.monotonic()))
+
+            if self.__dispatcher is None:
+                self.__dispatcher = threading.Thread(
+                    target=self.__dispatch, daemon=True
+                )
+                self.__dispatcher.start()
+            self.__condition.notify()
+
+        return future
+
+    def __dispatch(self) -> None:
+        """
+        Runs the pending requests batch by batch, forever.
+        """
+        while True:
+            model, batch = self.__next_batch()
+            InferenceBatcher.__run_batch(model, batch)
+
+    def __next_batch(
+        self,
+    ) -> Tuple[Model, List[Tuple[Image, Future, float]]]:
+        """
+        Waits for the batch window of the model with the oldest pending
+            request to close and removes its batch from the pending
+            requests.
+
+        Returns:
+            Tuple[Model, List[Tuple[Image, Future, float]]]: The model and
+                its batch of requests.
+        """
+        with self.__condition:
+            while not self.__pending:
+                self.__condition.wait()
+
+            key = next(iter(self.__pending))
+            model, requests = self.__pending[key]
+            deadline = requests[0][2] + conf.BATCH_WINDOW
+            while len(requests) < conf.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                self.__condition.wait(remaining)
+
+            batch = requests[: conf.BATCH_SIZE]
+            del requests[: conf.BATCH_SIZE]
+            if not requests:
+                del self.__pending[key]
+
+        return model, batch
+
+    @staticmethod
+    def __run_batch(
+        model: Model, batch: List[Tuple[Image, Future, float]]
+    ) -> None:
+        """
+        Runs a batch of requests through the model and resolves their
+            futures.
+
+        Args:
+            model (Model): The model used for inference.
+            batch (List[Tuple[Image, Future, float]]): The requests.
+        """
+        batch = [
+            request
+            for request in batch
+            if request[1].set_running_or_notify_cancel()
+        ]
+        if not batch:
+            return
+
+        try:
+            tensor = torch.cat(
+                [
+                    Utils.shape_to(
+                        torch.unsqueeze(image.get_tensor(), dim=0),
+                        height=model.get_input_height(),
+                        width=model.get_input_width(),
+                        channels=model.get_input_channels(),
+                    )
+                    for image, _, _ in batch
+                ]
+            )
+            with torch.no_grad():
+                results = model(tensor)
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            for _, future, _ in batch:
+                future.set_exception(err)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            future.set_result(result)
@@ -2,9 +2,15 @@
 
 import queue
 import threading
-from typing import List
+import time
+from typing import List, Tuple
 from typing_extensions import Self
 
+import neuroshift.config as conf
+from neuroshift.model.checkpoint_store import CheckpointStore
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.jobs.dead_letter import DeadLetter
+from neuroshift.model.jobs.inference_job import InferenceJob
 from neuroshift.model.jobs.job import Job
 from neuroshift.model.jobs.job_result import JobResult
 
@@ -15,8 +21,17 @@ class JobQueue:
 
     This class manages a queue of jobs and worker threads that process the
     jobs.
+
+    A job that runs longer than its timeout is cancelled, so that its
+    worker takes the next job while the job stops at its next batch. A
+    cancelled job keeps its thread until then, a hung job never frees it.
+    A job that raises a transient error or returns a retryable result is
+    queued again after a backoff that doubles with every attempt, up to
+    conf.MAX_RETRIES times. The jobs that fail for good are kept in a
+    dead-letter list.
     """
 
+    __CANCEL_GRACE: float = 1.0
     __instance: Self | None = None
 
     @classmethod
@@ -39,18 +54,76 @@ class JobQueue:
         self.__queue: queue.Queue = queue.Queue()
         self.__workers: List[threading.Thread] = []
         self.__is_running: bool = True
+        self.__dead_letters: List[DeadLetter] = []
+        self.__dead_letters_lock: threading.Lock = threading.Lock()
 
-    def add_job(self, job: Job) -> None:
+    def add_job(self, job: Job, timeout: float | None = None) -> None:
         """
         Adds a job to the job queue.
 
         Args:
             job (Job): The job to be added to the queue.
+            timeout (float | None, optional): The number of seconds an
+                attempt of the job may run, 0 disables the timeout.
+                conf.JOB_TIMEOUT, which disables it by default, is used if
+                None. Defaults to None.
         """
-        job_entry: Job = job
+        if timeout is None:
+            timeout = conf.JOB_TIMEOUT
+
+        # the job, its timeout, the number of attempts and the queue time
+        job_entry: Tuple[Job, float, int, float] = (
+            job,
+            timeout,
+            0,
+            time.time(),
+        )
         self.__queue.put(job_entry)
         print(f"JobQueue | job has been received: {job.get_job_id()}")
 
+    def resume_jobs(self) -> List[str]:
+        """
+        Queues the inference jobs that were interrupted, to continue from
+            their last checkpoint.
+
+        The checkpoints of the jobs that cannot be resumed are deleted.
+
+        Returns:
+            List[str]: The IDs of the resumed jobs.
+        """
+        checkpoint_store = CheckpointStore.get_instance()
+        analytics = Analytics.get_instance()
+        job_ids: List[str] = []
+        for job_id in checkpoint_store.get_job_ids():
+            job = InferenceJob.resume(job_id)
+            if job is None:
+                checkpoint_store.delete(job_id)
+                continue
+
+            if analytics.get_analytic(job_id) is None:
+                analytics.add_analytic(job.get_analytic())
+            self.add_job(job)
+            job_ids.append(job_id)
+
+        return job_ids
+
+    def get_dead_letters(self) -> List[DeadLetter]:
+        """
+        Returns the jobs that failed for good, the oldest first.
+
+        Returns:
+            List[DeadLetter]: The failed jobs.
+        """
+        with self.__dead_letters_lock:
+            return self.__dead_letters.copy()
+
+    def clear_dead_letters(self) -> None:
+        """
+        Forgets the jobs that failed for good.
+        """
+        with self.__dead_letters_lock:
+            self.__dead_letters = []
+
     def worker(self, worker_id: int) -> None:
         """
         Worker function that processes jobs from the job queue.
@@ -59,22 +132,160 @@ class JobQueue:
             worker_id (int): The ID of the worker thread.
         """
         while self.__is_running:
-            job: Job = self.__queue.get()
-            if job is None:
+            job_entry: Tuple[Job, float, int, float] | None = (
+                self.__queue.get()
+            )
+            if job_entry is None:
                 print(f"Worker {worker_id} | stopping")
                 break
 
+            job, timeout, attempts, queued_at = job_entry
+            attempts += 1
+
             print(f"Worker {worker_id} | Received task: {job.get_job_id()}")
-            result: JobResult = job.start()
+            started_at = time.time()
+            result: JobResult = JobQueue.__run(job, timeout)
             if result.is_success():
                 print(
                     f"Worker {worker_id} | Completed task: {job.get_job_id()}"
                 )
+            elif result.is_retryable() and attempts <= conf.MAX_RETRIES:
+                print(
+                    f"Worker {worker_id} | Error: {result.get_error_msg()}, "
+                    f"retrying ({attempts}/{conf.MAX_RETRIES})"
+                )
+                self.__retry((job, timeout, attempts, queued_at))
+                continue
             else:
                 print(f"Worker {worker_id} | Error: {result.get_error_msg()}")
+                self.__add_dead_letter(
+                    job, result, attempts, queued_at, started_at
+                )
 
             self.__queue.task_done()
 
+    @staticmethod
+    def __run(job: Job, timeout: float) -> JobResult:
+        """
+        Runs an attempt of a job.
+
+        An attempt that runs out of time is cancelled: it stops at its
+            next batch and no longer writes to its analytics. The error of
+            the result tells if the attempt did not stop within a grace
+            period, its thread is left running then.
+
+        Args:
+            job (Job): The job.
+            timeout (float): The number of seconds the attempt may run,
+                0 disables the timeout.
+
+        Returns:
+            JobResult: The result of the attempt.
+        """
+        if timeout <= 0:
+            return JobQueue.__start(job)
+
+        results: List[JobResult] = []
+        runner = threading.Thread(
+            target=lambda: results.append(JobQueue.__start(job)), daemon=True
+        )
+        runner.start()
+        runner.join(timeout)
+
+        if not results:
+            job.cancel()
+            runner.join(JobQueue.__CANCEL_GRACE)
+            error_msg = f"Timed out after {timeout:g} seconds"
+            if runner.is_alive():
+                error_msg += ", the attempt did not stop"
+
+            return JobResult(error_msg=error_msg)
+
+        return results[0]
+
+    @staticmethod
+    def __start(job: Job) -> JobResult:
+        """
+        Starts a job, turning the exceptions it raises into failed
+            results, retryable if the error is transient.
+
+        Args:
+            job (Job): The job.
+
+        Returns:
+            JobResult: The result of the job.
+        """
+        try:
+            return job.start()
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            return job.finish(Job.create_error_result(err))
+
+    def __retry(self, job_entry: Tuple[Job, float, int, float]) -> None:
+        """
+        Queues a job again once its backoff is over.
+
+        The job stays unfinished for wait_completion during the backoff.
+
+        Args:
+            job_entry (Tuple[Job, float, int, float]): The job, its
+                timeout, the number of attempts and the queue time.
+        """
+        job_queue = self.__queue
+
+        def requeue() -> None:
+            job_queue.put(job_entry)
+            job_queue.task_done()
+
+        backoff = threading.Timer(
+            conf.RETRY_BACKOFF * 2 ** (job_entry[2] - 1), requeue
+        )
+        backoff.daemon = True
+        backoff.start()
+
+    def __add_dead_letter(
+        self,
+        job: Job,
+        result: JobResult,
+        attempts: int,
+        queued_at: float,
+        started_at: float,
+    ) -> None:
+        """
+        Adds a failed job to the dead-letter list, marks its analytics
+            as failed if the job did not and deletes its checkpoint.
+
+        Args:
+            job (Job): The job.
+            result (JobResult): The result of the last attempt.
+            attempts (int): The number of attempts.
+            queued_at (float): The time the job was first queued at.
+            started_at (float): The time the last attempt started at.
+        """
+        failed_at = time.time()
+        with self.__dead_letters_lock:
+            self.__dead_letters.append(
+                DeadLetter(
+                    job_id=job.get_job_id(),
+                    job_type=type(job).__name__,
+                    error_msg=str(result.get_error_msg()),
+                    attempts=attempts,
+                    queued_at=queued_at,
+                    failed_at=failed_at,
+                    duration=failed_at - started_at,
+                )
+            )
+
+        analytics = job.get_analytics()
+        if not analytics:
+            analytic = Analytics.get_instance().get_analytic(job.get_job_id())
+            analytics = [analytic] if analytic is not None else []
+        for analytic in analytics:
+            if not analytic.is_finished():
+                analytic.set_result(result)
+                analytic.set_done()
+
+        CheckpointStore.get_instance().delete(job.get_job_id())
+
     def start_workers(self, worker_count: int) -> None:
         """
         Starts the specified number of worker threads.
@@ -1,6 +1,6 @@
 """This module contains the AttackJob class."""
 
-import time
+from typing import List
 
 import torch
 
@@ -48,6 +48,24 @@ class AttackJob(Job):
             noise_name=attack.get_name(),
         )
 
+    def get_analytic(self) -> Analytic:
+        """
+        Returns the analytic holding the result of the attack job.
+
+        Returns:
+            Analytic: The analytic of the attack job.
+        """
+        return self.__analytic
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics the job writes its results to.
+
+        Returns:
+            List[Analytic]: The analytic of the attack job.
+        """
+        return [self.__analytic]
+
     def start(self) -> JobResult:
         """
         Starts the attack job.
@@ -56,7 +74,9 @@ class AttackJob(Job):
             JobResult: The result of the attack job.
         """
         try:
-            Analytics.get_instance().add_analytic(self.__analytic)
+            analytics = Analytics.get_instance()
+            if analytics.get_analytic(self.get_job_id()) is None:
+                analytics.add_analytic(self.__analytic)
 
             height = self.__model.get_input_height()
             width = self.__model.get_input_width()
@@ -72,6 +92,7 @@ class AttackJob(Job):
             attacked_tensor: torch.Tensor = self.__attack.apply_to_tensor(
                 model=self.__model.get_model(),
                 image=converted_tensor,
+                generator=self.create_generator(converted_tensor.device),
             )
 
             result: tuple[str, float] = self.__model(attacked_tensor)[0]
@@ -85,33 +106,27 @@ class AttackJob(Job):
                 tensor=attacked_tensor,
             )
 
-            prediction: Prediction = Prediction(
+            adversarial_prediction: Prediction = Prediction(
                 image=image,
                 perturbed_image=image,
                 predicted_class=result[0],
                 confidence=result[1],
             )
-            self.__analytic.add_predictions(predictions=[prediction])
 
             result = self.__model(converted_tensor)[0]
 
-            prediction = Prediction(
+            prediction: Prediction = Prediction(
                 image=self.__image,
                 perturbed_image=image,
                 predicted_class=result[0],
                 confidence=result[1],
             )
 
-            self.__analytic.add_predictions(predictions=[prediction])
-
-            result = JobResult()
-            self.__analytic.set_result(result)
-
-            time.sleep(5)
+            self.check_cancelled()
+            self.__analytic.add_predictions(
+                predictions=[adversarial_prediction, prediction]
+            )
 
-            return result
+            return self.finish(JobResult())
         except Exception as err:  # noqa (the possible exceptions are unknown)
-            result = JobResult(error_msg=str(err))
-            self.__analytic.set_result(result)
-            self.__analytic.set_done()
-            return result
+            return self.finish(self.create_error_result(err))
@@ -0,0 +1,162 @@
+"""This module contains the DatasetAttackJob class."""
+
+import uuid
+from typing import List
+
+import torch
+
+from neuroshift.model.jobs.job import Job
+from neuroshift.model.jobs.job_result import JobResult
+from neuroshift.model.data.image import Image
+from neuroshift.model.data.model import Model
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.prediction import Prediction
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.noises.adversarial_attack.attack import Attack
+from neuroshift.model.utils import Utils
+
+
+class DatasetAttackJob(Job):
+    """
+    Represents a job for performing an adversarial attack on every image
+        of a dataset, one batch at a time.
+
+    The job fills two analytics, one with the predictions on the clean
+        images and one with the predictions on the adversarial images,
+        so that the clean and adversarial accuracy can be compared.
+    """
+
+    def __init__(self, model: Model, dataset: Dataset, attack: Attack) -> None:
+        """
+        Initializes a DatasetAttackJob instance.
+
+        Args:
+            model (Model): The model to be attacked.
+            dataset (Dataset): The dataset whose images are attacked.
+            attack (Attack): The attack method to be applied.
+        """
+        super().__init__()
+
+        self.__model: Model = model
+        self.__dataset: Dataset = dataset
+        self.__attack: Attack = attack
+        self.__clean_analytic: Analytic = Analytic(
+            job_id=str(uuid.uuid4()),
+            total_predictions=dataset.get_size(),
+            model=model,
+            dataset=dataset,
+        )
+        self.__analytic: Analytic = Analytic(
+            job_id=self.get_job_id(),
+            total_predictions=dataset.get_size(),
+            model=model,
+            dataset=dataset,
+            noise_name=attack.get_name(),
+        )
+
+    def get_analytic(self) -> Analytic:
+        """
+        Returns the analytic of the predictions on the adversarial images.
+
+        Returns:
+            Analytic: The analytic of the adversarial images.
+        """
+        return self.__analytic
+
+    def get_clean_analytic(self) -> Analytic:
+        """
+        Returns the analytic of the predictions on the clean images.
+
+        Returns:
+            Analytic: The analytic of the clean images.
+        """
+        return self.__clean_analytic
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics the job writes its results to.
+
+        Returns:
+            List[Analytic]: The analytics of the clean and the
+                adversarial images.
+        """
+        return [self.__clean_analytic, self.__analytic]
+
+    def start(self) -> JobResult:
+        """
+        Starts the attack job.
+
+        Every batch of the dataset is attacked with a single backward pass.
+
+        Returns:
+            JobResult: The result of the attack job.
+        """
+        analytics = Analytics.get_instance()
+        for analytic in (self.__clean_analytic, self.__analytic):
+            if analytics.get_analytic(analytic.job_id) is None:
+                analytics.add_analytic(analytic)
+
+        try:
+            generator: torch.Generator | None = None
+            for tensor, images in self.__dataset:
+                self.check_cancelled()
+                tensor = Utils.shape_to(
+                    tensor,
+                    height=self.__model.get_input_height(),
+                    width=self.__model.get_input_width(),
+                    channels=self.__model.get_input_channels(),
+                )
+
+                if generator is None:
+                    generator = self.create_generator(tensor.device)
+
+                attacked_tensor: torch.Tensor = self.__attack.apply_to_tensor(
+                    model=self.__model.get_model(),
+                    image=tensor,
+                    generator=generator,
+                ).detach()
+
+                with torch.no_grad():
+                    clean_results = self.__model(tensor)
+                    attacked_results = self.__model(attacked_tensor)
+
+                clean_predictions: List[Prediction] = []
+                attacked_predictions: List[Prediction] = []
+                for image, attacked, clean_result, attacked_result in zip(
+                    images,
+                    attacked_tensor.cpu(),
+                    clean_results,
+                    attacked_results,
+                ):
+                    attacked_image = Image(
+                        label=image.get_label(),
+                        path=None,
+                        actual_class=image.get_class(),
+                        tensor=attacked,
+                    )
+                    clean_predictions.append(
+                        Prediction(
+                            image=image,
+                            perturbed_image=image,
+                            predicted_class=clean_result[0],
+                            confidence=clean_result[1],
+                        )
+                    )
+                    attacked_predictions.append(
+                        Prediction(
+                            image=image,
+                            perturbed_image=attacked_image,
+                            predicted_class=attacked_result[0],
+                            confidence=attacked_result[1],
+                        )
+                    )
+
+                self.__clean_analytic.add_predictions(clean_predictions)
+                self.__analytic.add_predictions(attacked_predictions)
+
+            result = JobResult()
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            result = self.create_error_result(err)
+
+        return self.finish(result)
@@ -0,0 +1,102 @@
+"""This module contains the DeadLetter class."""
+
+
+class DeadLetter:
+    """
+    Represents a job that failed for good, with its error and timing.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        job_type: str,
+        error_msg: str,
+        attempts: int,
+        queued_at: float,
+        failed_at: float,
+        duration: float,
+    ) -> None:
+        """
+        Initializes a new instance of the DeadLetter class.
+
+        Args:
+            job_id (str): The ID of the job.
+            job_type (str): The name of the class of the job.
+            error_msg (str): The error message of the last attempt.
+            attempts (int): The number of attempts.
+            queued_at (float): The time the job was first queued at,
+                in seconds since the epoch.
+            failed_at (float): The time the last attempt failed at,
+                in seconds since the epoch.
+            duration (float): The duration of the last attempt in seconds.
+        """
+        self.__job_id: str = job_id
+        self.__job_type: str = job_type
+        self.__error_msg: str = error_msg
+        self.__attempts: int = attempts
+        self.__queued_at: float = queued_at
+        self.__failed_at: float = failed_at
+        self.__duration: float = duration
+
+    def get_job_id(self) -> str:
+        """
+        Gets the ID of the job.
+
+        Returns:
+            str: The ID of the job.
+        """
+        return self.__job_id
+
+    def get_job_type(self) -> str:
+        """
+        Gets the name of the class of the job.
+
+        Returns:
+            str: The name of the class of the job.
+        """
+        return self.__job_type
+
+    def get_error_msg(self) -> str:
+        """
+        Gets the error message of the last attempt.
+
+        Returns:
+            str: The error message.
+        """
+        return self.__error_msg
+
+    def get_attempts(self) -> int:
+        """
+        Gets the number of attempts.
+
+        Returns:
+            int: The number of attempts.
+        """
+        return self.__attempts
+
+    def get_queued_at(self) -> float:
+        """
+        Gets the time the job was first queued at.
+
+        Returns:
+            float: The time in seconds since the epoch.
+        """
+        return self.__queued_at
+
+    def get_failed_at(self) -> float:
+        """
+        Gets the time the last attempt failed at.
+
+        Returns:
+            float: The time in seconds since the epoch.
+        """
+        return self.__failed_at
+
+    def get_duration(self) -> float:
+        """
+        Gets the duration of the last attempt.
+
+        Returns:
+            float: The duration in seconds.
+        """
+        return self.__duration
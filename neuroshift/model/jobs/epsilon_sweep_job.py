@@ -0,0 +1,180 @@
+"""This module contains the EpsilonSweepJob class."""
+
+import uuid
+from typing import List, Tuple
+
+import torch
+
+from neuroshift.model.jobs.job import Job
+from neuroshift.model.jobs.job_result import JobResult
+from neuroshift.model.data.image import Image
+from neuroshift.model.data.model import Model
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.prediction import Prediction
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.noises.adversarial_attack import FastGradientSignMethod
+from neuroshift.model.utils import Utils
+
+
+class EpsilonSweepJob(Job):
+    """
+    Represents a job for attacking every image of a dataset with the Fast
+        Gradient Sign Method for several epsilons.
+
+    The sign of the gradient does not depend on epsilon, so it is computed
+        once per batch with a single backward pass, and every epsilon only
+        costs one more forward pass. The job fills one analytic per
+        epsilon, the first of which has the ID of the job.
+    """
+
+    def __init__(
+        self, model: Model, dataset: Dataset, epsilons: List[float]
+    ) -> None:
+        """
+        Initializes an EpsilonSweepJob instance.
+
+        Args:
+            model (Model): The model to be attacked.
+            dataset (Dataset): The dataset whose images are attacked.
+            epsilons (List[float]): The epsilons of the attack.
+
+        Raises:
+            ValueError: If no epsilon is given.
+        """
+        super().__init__()
+
+        if not epsilons:
+            raise ValueError("At least one epsilon must be given.")
+
+        self.__model: Model = model
+        self.__dataset: Dataset = dataset
+        self.__attack: FastGradientSignMethod = (
+            FastGradientSignMethod.get_instance()
+        )
+        self.__epsilons: List[float] = list(epsilons)
+        self.__analytics: List[Analytic] = [
+            Analytic(
+                job_id=self.get_job_id() if index == 0 else str(uuid.uuid4()),
+                total_predictions=dataset.get_size(),
+                model=model,
+                dataset=dataset,
+                noise_name=(
+                    f"{self.__attack.get_name()} (epsilon {epsilon:g})"
+                ),
+            )
+            for index, epsilon in enumerate(self.__epsilons)
+        ]
+
+    def get_epsilons(self) -> List[float]:
+        """
+        Returns the epsilons of the attack.
+
+        Returns:
+            List[float]: The epsilons.
+        """
+        return self.__epsilons.copy()
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics of the predictions on the adversarial images,
+            one per epsilon in the order of the epsilons.
+
+        Returns:
+            List[Analytic]: The analytics of the adversarial images.
+        """
+        return self.__analytics.copy()
+
+    def get_accuracies(self) -> List[Tuple[float, float]]:
+        """
+        Returns the overall accuracy of the model for every epsilon.
+
+        Returns:
+            List[Tuple[float, float]]: The epsilons and their accuracies.
+        """
+        return [
+            (epsilon, analytic.get_overall_accuracy())
+            for epsilon, analytic in zip(self.__epsilons, self.__analytics)
+        ]
+
+    def start(self) -> JobResult:
+        """
+        Starts the epsilon sweep job.
+
+        Returns:
+            JobResult: The result of the epsilon sweep job.
+        """
+        analytics = Analytics.get_instance()
+        for analytic in self.__analytics:
+            if analytics.get_analytic(analytic.job_id) is None:
+                analytics.add_analytic(analytic)
+
+        try:
+            for tensor, images in self.__dataset:
+                self.check_cancelled()
+                tensor = Utils.shape_to(
+                    tensor,
+                    height=self.__model.get_input_height(),
+                    width=self.__model.get_input_width(),
+                    channels=self.__model.get_input_channels(),
+                )
+
+                sign = self.__attack.gradient_sign(
+                    model=self.__model.get_model(), image=tensor
+                )
+
+                for epsilon, analytic in zip(
+                    self.__epsilons, self.__analytics
+                ):
+                    attacked_tensor = self.__attack.fsgm_attack(
+                        tensor, sign, epsilon=epsilon
+                    )
+                    with torch.no_grad():
+                        results = self.__model(attacked_tensor)
+
+                    analytic.add_predictions(
+                        self.__create_predictions(
+                            images, attacked_tensor.cpu(), results
+                        )
+                    )
+
+            result = JobResult()
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            result = self.create_error_result(err)
+
+        return self.finish(result)
+
+    @staticmethod
+    def __create_predictions(
+        images: List[Image],
+        attacked_tensor: torch.Tensor,
+        results: List[Tuple[str, float]],
+    ) -> List[Prediction]:
+        """
+        Creates the predictions on a batch of adversarial images.
+
+        Args:
+            images (List[Image]): The clean images of the batch.
+            attacked_tensor (torch.Tensor): The adversarial images.
+            results (List[Tuple[str, float]]): The predicted classes and
+                confidences of the adversarial images.
+
+        Returns:
+            List[Prediction]: The predictions.
+        """
+        return [
+            Prediction(
+                image=image,
+                perturbed_image=Image(
+                    label=image.get_label(),
+                    path=None,
+                    actual_class=image.get_class(),
+                    tensor=attacked,
+                ),
+                predicted_class=result[0],
+                confidence=result[1],
+            )
+            for image, attacked, result in zip(
+                images, attacked_tensor, results
+            )
+        ]
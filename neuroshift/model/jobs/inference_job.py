@@ -1,23 +1,46 @@
 """This module contains the Inference class."""
 
-from typing import Tuple, List
+import itertools
+from typing import Any, Dict, Tuple, List
+
+import torch
 
 from neuroshift.model.data.analytic import Analytic
 from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.image import Image
 from neuroshift.model.data.model import Model
+from neuroshift.model.data.models import Models
+from neuroshift.model.data.datasets import Datasets
+from neuroshift.model.checkpoint_store import CheckpointStore
+from neuroshift.model.dataset_cache import DatasetCache
 from neuroshift.model.data.prediction import Prediction
 from neuroshift.model.jobs.job import Job
 from neuroshift.model.jobs.job_result import JobResult
+from neuroshift.model.jobs.pipeline import Pipeline
 from neuroshift.model.jobs.perturbation_job import PerturbationJob
+from neuroshift.model.noises.composite_perturbation import (
+    CompositePerturbation,
+)
+from neuroshift.model.noises.perturbation import Perturbation
 from neuroshift.model.noises.targets.target import Target
 from neuroshift.model.utils import Utils
+import neuroshift.config as conf
 
 
 class InferenceJob(Job):
     """
     Represents a job for performing inference using a model on a dataset.
 
+    Every conf.CHECKPOINT_INTERVAL batches, the progress of the job is
+        checkpointed to disk: the number of finished batches, the
+        predicted classes and confidences, from which the class analytics
+        are rebuilt, the seed, which determines the perturbed model and
+        the perturbed dataset, and the state of the generator drawing the
+        noise of the forward passes. An interrupted job can be resumed
+        from its last checkpoint (see resume), and an attempt that
+        failed with a transient error is retried from it.
+
     Args:
         model (Model): The model to use for inference.
         dataset (Dataset): The dataset to perform inference on.
@@ -31,6 +54,8 @@ class InferenceJob(Job):
         model: Model,
         dataset: Dataset,
         perturbation_job: PerturbationJob | None = None,
+        seed: int | None = None,
+        job_id: str | None = None,
     ) -> None:
         """
         Initializes an InferenceJob object.
@@ -40,14 +65,28 @@ class InferenceJob(Job):
             dataset (Dataset): The dataset used for inference.
             perturbation (Perturbation | None, optional):
                 The perturbation applied to the dataset. Defaults to None.
+            seed (int | None, optional): The seed of the perturbation,
+                two jobs with the same seed and inputs yield identical
+                results. A random seed is drawn if None. Defaults to None.
+            job_id (str | None, optional): The ID of the job, to resume a
+                job. A new ID is generated if None. Defaults to None.
         """
-        super().__init__()
+        super().__init__(seed=seed, job_id=job_id)
 
         self.__model: Model = model
         self.__dataset: Dataset = dataset
         self.__perturbed_dataset: Dataset = dataset
         self.__perturbed_model: Model = model
         self.__perturbation: PerturbationJob | None = perturbation_job
+        # only explicitly seeded results can be requested again
+        self.__is_seeded: bool = seed is not None
+        self.__generator: torch.Generator | None = None
+        self.__perturbed_images: List[Image] = []
+        # draws the noise of the forward passes of a perturbed model
+        self.__noise_generator: torch.Generator | None = None
+        self.__checkpoint: Dict[str, Any] | None = None
+        self.__cursor: int = 0
+        self.__forwarded: int = 0
 
         self.__analytic: Analytic = Analytic(
             job_id=self.get_job_id(),
@@ -59,6 +98,128 @@ class InferenceJob(Job):
             ),
         )
 
+    def get_analytic(self) -> Analytic:
+        """
+        Returns the analytic holding the result of the inference job.
+
+        Returns:
+            Analytic: The analytic of the inference job.
+        """
+        return self.__analytic
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics the job writes its results to.
+
+        Returns:
+            List[Analytic]: The analytic of the inference job.
+        """
+        return [self.__analytic]
+
+    @classmethod
+    def resume(cls, job_id: str) -> "InferenceJob | None":
+        """
+        Recreates an interrupted job from its last checkpoint.
+
+        The job keeps its ID, and continues after the last checkpointed
+            batch when it is started.
+
+        Args:
+            job_id (str): The ID of the interrupted job.
+
+        Returns:
+            InferenceJob | None: The job, or None if there is no
+                checkpoint, its model or dataset no longer exists or the
+                checkpointed parameter values cannot be applied to the
+                perturbation.
+        """
+        checkpoint = CheckpointStore.get_instance().load(job_id)
+        if checkpoint is None:
+            return None
+
+        model = next(
+            (
+                model
+                for model in Models.get_instance().get_models()
+                if model.get_file_name() == checkpoint["model"]
+            ),
+            None,
+        )
+        dataset = Datasets.get_instance().get(checkpoint["dataset"])
+        if model is None or dataset is None:
+            return None
+
+        perturbation_job: PerturbationJob | None = None
+        if checkpoint["perturbation"] is not None:
+            perturbation = InferenceJob.__resolve_perturbation(
+                checkpoint["perturbation"]
+            )
+            if perturbation is None:
+                return None
+
+            is_model = perturbation.get_target() != Target.DATASET
+            try:
+                perturbation_job = PerturbationJob(
+                    entity=model if is_model else dataset,
+                    perturbation=perturbation,
+                    is_model=is_model,
+                    seed=checkpoint["seed"],
+                    activation_boundary=checkpoint["activation_boundary"],
+                    layers=checkpoint["layers"],
+                    parameter_values=checkpoint["parameter_values"],
+                )
+            except ValueError:
+                return None
+
+        job = InferenceJob(
+            model=model,
+            dataset=dataset,
+            perturbation_job=perturbation_job,
+            seed=checkpoint["seed"],
+            job_id=job_id,
+        )
+        job.__is_seeded = checkpoint["seeded"]
+        job.__checkpoint = checkpoint
+
+        return job
+
+    @staticmethod
+    def __resolve_perturbation(
+        perturbation: Perturbation,
+    ) -> Perturbation | None:
+        """
+        Gets the perturbation in use for an unpickled perturbation.
+
+        The noises read their parameters from their class, so the values
+            of an unpickled noise are only applied through the instance
+            in use.
+
+        Args:
+            perturbation (Perturbation): The unpickled perturbation.
+
+        Returns:
+            Perturbation | None: The perturbation in use with the target
+                of the unpickled one, or None if it cannot be found.
+        """
+        resolved: Perturbation
+        if isinstance(perturbation, CompositePerturbation):
+            perturbations = [
+                InferenceJob.__resolve_perturbation(component)
+                for component in perturbation.get_perturbations()
+            ]
+            if None in perturbations:
+                return None
+            resolved = CompositePerturbation(perturbations)
+        else:
+            get_instance = getattr(type(perturbation), "get_instance", None)
+            if get_instance is None:
+                return None
+            resolved = get_instance()
+
+        resolved.set_target(perturbation.get_target())
+
+        return resolved
+
     def start(self) -> JobResult:
         """
         Starts the inference job.
@@ -66,13 +227,29 @@ class InferenceJob(Job):
         Returns:
             JobResult: The result of the inference job.
         """
+        self.__reset_attempt()
         if self.__perturbation is not None:
-            if self.__perturbation.get_target() == Target.DATASET:
-                self.__perturbed_dataset = (
-                    self.__perturbation.apply_to_dataset()
-                )
-            else:
-                self.__perturbed_model = self.__perturbation.apply_to_model()
+            self.__register_analytic()
+            self.__perturbation.apply_parameter_values()
+            generator = self.create_generator(
+                self.__perturbation.get_device()
+            )
+            try:
+                if self.__perturbation.get_target() == Target.DATASET:
+                    cached_dataset = self.__load_perturbed_dataset()
+                    if cached_dataset is not None:
+                        self.__perturbed_dataset = cached_dataset
+                    else:
+                        # the batches are perturbed while others are in the
+                        # forward pass
+                        self.__generator = generator
+                else:
+                    self.__perturbed_model = (
+                        self.__perturbation.apply_to_model(generator)
+                    )
+                    self.__noise_generator = generator
+            except Exception as err:  # noqa (the exceptions are unknown)
+                return self.finish(self.create_error_result(err))
 
         return self.start_inference()
 
@@ -80,6 +257,10 @@ class InferenceJob(Job):
         """
         Starts the inference process.
 
+        The batches go through a pipeline: the next batches are perturbed
+            and reshaped and the predictions of the previous batches are
+            added to the analytic while a batch is in the forward pass.
+
         Raises:
             ConversionError: Tf the Dataset format cannot be
                 converted to the Model format.
@@ -88,39 +269,337 @@ class InferenceJob(Job):
             JobResult: The result of the inference process.
         """
         try:
-            Analytics.get_instance().add_analytic(self.__analytic)
-            for (_, images), (perturbed_tensor, perturbed_images) in zip(
-                self.__dataset, self.__perturbed_dataset
-            ):
-                perturbed_tensor = Utils.shape_to(
-                    perturbed_tensor,
-                    height=self.__model.get_input_height(),
-                    width=self.__model.get_input_width(),
-                    channels=self.__model.get_input_channels(),
-                )
+            self.__register_analytic()
+            self.__restore_checkpoint()
+            Pipeline(conf.PREFETCH_DEPTH).run(
+                source=itertools.islice(
+                    zip(self.__dataset, self.__perturbed_dataset),
+                    self.__cursor,
+                    None,
+                ),
+                prepare=self.__prepare_batch,
+                forward=self.__forward_batch,
+                ingest=self.__ingest_batch,
+            )
+            self.__store_perturbed_dataset()
 
-                results: List[Tuple[str, float]] = self.__perturbed_model(
-                    perturbed_tensor
-                )
+            result = JobResult()
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            result = self.create_error_result(err)
+
+        # a retried attempt continues from the last checkpoint
+        if not result.is_retryable():
+            CheckpointStore.get_instance().delete(self.get_job_id())
+
+        return self.finish(result)
+
+    def __reset_attempt(self) -> None:
+        """
+        Resets the progress of a previous attempt of the job, and loads
+            its last checkpoint if there is one.
+        """
+        self.__perturbed_dataset = self.__dataset
+        self.__perturbed_model = self.__model
+        self.__generator = None
+        self.__noise_generator = None
+        self.__perturbed_images = []
+        self.__cursor = 0
+        self.__forwarded = 0
+        if self.__checkpoint is None:
+            self.__checkpoint = CheckpointStore.get_instance().load(
+                self.get_job_id()
+            )
 
-                for image, perturbed_image, result in zip(
-                    images, perturbed_images, results
-                ):
-                    prediction: Prediction = Prediction(
-                        image=image,
-                        perturbed_image=perturbed_image,
-                        predicted_class=result[0],
-                        confidence=result[1],
+    def __prepare_batch(
+        self,
+        batches: Tuple[
+            Tuple[torch.Tensor, List[Image]], Tuple[torch.Tensor, List[Image]]
+        ],
+    ) -> Tuple[List[Image], List[Image], torch.Tensor]:
+        """
+        Perturbs a batch if the dataset is perturbed batch by batch and
+            reshapes it to the input of the model.
+
+        Args:
+            batches (Tuple[Tuple[torch.Tensor, List[Image]],
+                Tuple[torch.Tensor, List[Image]]]): The clean batch and
+                the perturbed batch.
+
+        Raises:
+            JobCancelled: If the job has been cancelled.
+
+        Returns:
+            Tuple[List[Image], List[Image], torch.Tensor]: The clean
+                images, the perturbed images and the input of the model.
+        """
+        self.check_cancelled()
+        (tensor, images), (perturbed_tensor, perturbed_images) = batches
+
+        if self.__generator is not None:
+            perturbed_images = self.__perturb_images(images)
+            perturbed_tensor = torch.cat(
+                [
+                    Utils.shape_to(
+                        torch.unsqueeze(image.get_tensor(), dim=0),
+                        height=tensor.shape[2],
+                        width=tensor.shape[3],
+                        channels=tensor.shape[1],
                     )
+                    for image in perturbed_images
+                ]
+            )
 
-                    self.__analytic.add_prediction(prediction)
+        perturbed_tensor = Utils.shape_to(
+            perturbed_tensor,
+            height=self.__model.get_input_height(),
+            width=self.__model.get_input_width(),
+            channels=self.__model.get_input_channels(),
+        )
 
-            result = JobResult()
-            self.__analytic.set_result(result)
+        return images, perturbed_images, perturbed_tensor
 
-            return result
-        except Exception as err:  # noqa (the possible exceptions are unknown)
-            result = JobResult(error_msg=str(err))
-            self.__analytic.set_result(result)
-            self.__analytic.set_done()
-            return result
+    def __perturb_images(self, images: List[Image]) -> List[Image]:
+        """
+        Perturbs the images of the next batch of the dataset.
+
+        Args:
+            images (List[Image]): The clean images of the batch.
+
+        Returns:
+            List[Image]: The perturbed images.
+        """
+        perturbed_images = self.__perturbation.perturb_images(
+            images, self.__generator
+        )
+        if self.__is_seeded:
+            self.__perturbed_images.extend(perturbed_images)
+
+        return perturbed_images
+
+    def __forward_batch(
+        self, prepared: Tuple[List[Image], List[Image], torch.Tensor]
+    ) -> Tuple[List[Tuple[str, float]], torch.Tensor | None]:
+        """
+        Runs the forward pass of the model on a prepared batch.
+
+        Args:
+            prepared (Tuple[List[Image], List[Image], torch.Tensor]): The
+                clean images, the perturbed images and the input of the
+                model.
+
+        Returns:
+            Tuple[List[Tuple[str, float]], torch.Tensor | None]: The
+                predicted classes and confidences, and the state of the
+                noise generator if the batch is checkpointed.
+        """
+        results = self.__perturbed_model(prepared[2])
+
+        # the forward pass runs ahead of the ingestion, so the state of the
+        # generator is taken here
+        self.__forwarded += 1
+        generator_state: torch.Tensor | None = None
+        if (
+            self.__noise_generator is not None
+            and self.__is_checkpointed(self.__forwarded)
+        ):
+            generator_state = self.__noise_generator.get_state()
+
+        return results, generator_state
+
+    def __ingest_batch(
+        self,
+        prepared: Tuple[List[Image], List[Image], torch.Tensor],
+        output: Tuple[List[Tuple[str, float]], torch.Tensor | None],
+    ) -> None:
+        """
+        Adds the predictions on a batch to the analytic and checkpoints
+            the job if it is due.
+
+        Args:
+            prepared (Tuple[List[Image], List[Image], torch.Tensor]): The
+                clean images, the perturbed images and the input of the
+                model.
+            output (Tuple[List[Tuple[str, float]], torch.Tensor | None]):
+                The predicted classes and confidences, and the state of
+                the noise generator if the batch is checkpointed.
+
+        Raises:
+            JobCancelled: If the job has been cancelled.
+        """
+        self.check_cancelled()
+        images, perturbed_images, _ = prepared
+        results, generator_state = output
+        self.__add_predictions(images, perturbed_images, results)
+
+        self.__cursor += 1
+        if self.__is_checkpointed(self.__cursor):
+            self.__save_checkpoint(generator_state)
+
+    def __add_predictions(
+        self,
+        images: List[Image],
+        perturbed_images: List[Image],
+        results: List[Tuple[str, float]],
+    ) -> None:
+        """
+        Adds the predictions on a batch to the analytic.
+
+        Args:
+            images (List[Image]): The clean images of the batch.
+            perturbed_images (List[Image]): The perturbed images.
+            results (List[Tuple[str, float]]): The predicted classes and
+                confidences.
+        """
+        predictions: List[Prediction] = [
+            Prediction(
+                image=image,
+                perturbed_image=perturbed_image,
+                predicted_class=result[0],
+                confidence=result[1],
+            )
+            for image, perturbed_image, result in zip(
+                images, perturbed_images, results
+            )
+        ]
+
+        # one update of the analytic per batch
+        self.__analytic.add_predictions(predictions)
+
+    def __is_checkpointed(self, batch_count: int) -> bool:
+        """
+        Checks if the job is checkpointed after a number of batches.
+
+        Args:
+            batch_count (int): The number of finished batches.
+
+        Returns:
+            bool: True if a checkpoint is due, False otherwise.
+        """
+        return (
+            conf.CHECKPOINT_INTERVAL > 0
+            and batch_count % conf.CHECKPOINT_INTERVAL == 0
+        )
+
+    def __save_checkpoint(self, generator_state: torch.Tensor | None) -> None:
+        """
+        Checkpoints the progress of the job, unless it is done.
+
+        Args:
+            generator_state (torch.Tensor | None): The state of the noise
+                generator after the last finished batch.
+        """
+        if self.__analytic.is_done():
+            return
+
+        perturbation = self.__perturbation
+        CheckpointStore.get_instance().save(
+            self.get_job_id(),
+            {
+                "model": self.__model.get_file_name(),
+                "dataset": self.__dataset.get_file_name(),
+                "perturbation": (
+                    perturbation.get_perturbation() if perturbation else None
+                ),
+                "activation_boundary": (
+                    perturbation.get_activation_boundary()
+                    if perturbation
+                    else None
+                ),
+                "layers": perturbation.get_layers() if perturbation else None,
+                "parameter_values": (
+                    perturbation.get_parameter_values()
+                    if perturbation
+                    else None
+                ),
+                "seed": self.get_seed(),
+                "seeded": self.__is_seeded,
+                "cursor": self.__cursor,
+                "results": [
+                    (
+                        prediction.get_predicted_class(),
+                        prediction.get_confidence(),
+                    )
+                    for prediction in self.__analytic.get_predictions()
+                ],
+                "generator_state": generator_state,
+            },
+        )
+
+    def __restore_checkpoint(self) -> None:
+        """
+        Restores the predictions of the checkpointed batches of a resumed
+            job and the state of its noise generator.
+
+        The checkpointed batches of a dataset perturbed batch by batch are
+            perturbed again, which draws the same noise as before and
+            moves the generator to the first unfinished batch.
+        """
+        if self.__checkpoint is None:
+            return
+
+        checkpoint = self.__checkpoint
+        self.__checkpoint = None
+
+        results = iter(checkpoint["results"])
+        for (_, images), (_, perturbed_images) in itertools.islice(
+            zip(self.__dataset, self.__perturbed_dataset),
+            checkpoint["cursor"],
+        ):
+            if self.__generator is not None:
+                perturbed_images = self.__perturb_images(images)
+            self.__add_predictions(
+                images,
+                perturbed_images,
+                list(itertools.islice(results, len(images))),
+            )
+
+        if (
+            self.__noise_generator is not None
+            and checkpoint["generator_state"] is not None
+        ):
+            self.__noise_generator.set_state(checkpoint["generator_state"])
+
+        self.__cursor = checkpoint["cursor"]
+        self.__forwarded = checkpoint["cursor"]
+
+    def __load_perturbed_dataset(self) -> Dataset | None:
+        """
+        Loads the perturbed dataset from the dataset cache if it was
+            already perturbed with the same seed.
+
+        Returns:
+            Dataset | None: The perturbed dataset, or None if it is not
+                cached.
+        """
+        if not self.__is_seeded:
+            return None
+
+        return DatasetCache.get_instance().get(
+            self.__dataset,
+            self.__perturbation.get_perturbation(),
+            self.get_seed(),
+        )
+
+    def __store_perturbed_dataset(self) -> None:
+        """
+        Stores the dataset perturbed batch by batch in the dataset cache.
+        """
+        if self.__generator is None or not self.__is_seeded:
+            return
+
+        DatasetCache.get_instance().put(
+            self.__dataset,
+            self.__perturbation.get_perturbation(),
+            self.get_seed(),
+            self.__perturbation.create_dataset(self.__perturbed_images),
+        )
+        self.__perturbed_images = []
+
+    def __register_analytic(self) -> None:
+        """
+        Adds the analytic of the job to the Analytics,
+            unless it was already registered when the job was enqueued.
+        """
+        analytics = Analytics.get_instance()
+        if analytics.get_analytic(self.get_job_id()) is None:
+            analytics.add_analytic(self.__analytic)
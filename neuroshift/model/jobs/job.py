@@ -1,7 +1,14 @@
 """This module contains the Job class."""
 
+import random
+import threading
 import uuid
+from typing import List
 
+import torch
+
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.exceptions.job_cancelled import JobCancelled
 from neuroshift.model.jobs.job_result import JobResult
 
 
@@ -10,13 +17,28 @@ class Job:
     Represents a job in the NeuroShift system.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, seed: int | None = None, job_id: str | None = None
+    ) -> None:
         """
         Initializes a new instance of the Job class.
 
         The job ID is generated using the uuid module.
+
+        Args:
+            seed (int | None, optional): The seed of the random number
+                streams of the job. A random seed is drawn if None.
+                Defaults to None.
+            job_id (str | None, optional): The ID of the job, to resume a
+                job. A new ID is generated if None. Defaults to None.
         """
-        self.__job_id: str = str(uuid.uuid4())
+        self.__job_id: str = (
+            job_id if job_id is not None else str(uuid.uuid4())
+        )
+        self.__seed: int = seed if seed is not None else random.getrandbits(63)
+        self.__cancelled: threading.Event = threading.Event()
+        # serializes cancel with the final writes of finish
+        self.__finish_lock: threading.Lock = threading.Lock()
 
     def get_job_id(self) -> str:
         """
@@ -27,6 +49,136 @@ class Job:
         """
         return self.__job_id
 
+    def get_seed(self) -> int:
+        """
+        Returns the seed of the random number streams of the job.
+
+        Returns:
+            int: The seed of the job.
+        """
+        return self.__seed
+
+    def create_generator(
+        self, device: torch.device | str = "cpu"
+    ) -> torch.Generator:
+        """
+        Creates a new random number generator seeded with the job seed.
+
+        Every call returns a generator at the start of the stream,
+        so that running the same job twice yields identical results.
+
+        Args:
+            device (torch.device | str, optional): The device of the
+                generator. Defaults to "cpu".
+
+        Returns:
+            torch.Generator: The seeded generator.
+        """
+        generator = torch.Generator(device=device)
+        generator.manual_seed(self.__seed)
+
+        return generator
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics the job writes its results to.
+
+        This method should be overridden in derived classes.
+
+        Returns:
+            List[Analytic]: The analytics of the job.
+        """
+        return []
+
+    def cancel(self) -> None:
+        """
+        Cancels the job.
+
+        The job stops at its next batch, and its analytics are no longer
+            written to, so that they can be marked as failed.
+        """
+        with self.__finish_lock:
+            self.__cancelled.set()
+
+    def is_cancelled(self) -> bool:
+        """
+        Checks if the job has been cancelled.
+
+        Returns:
+            bool: True if the job has been cancelled, False otherwise.
+        """
+        return self.__cancelled.is_set()
+
+    def check_cancelled(self) -> None:
+        """
+        Stops the job if it has been cancelled, called between batches.
+
+        Raises:
+            JobCancelled: If the job has been cancelled.
+        """
+        if self.__cancelled.is_set():
+            raise JobCancelled(self.__job_id)
+
+    @staticmethod
+    def is_transient_error(err: Exception) -> bool:
+        """
+        Checks if an error may not happen again when the job is retried,
+            i.e. the GPU ran out of memory or an I/O operation failed.
+
+        Args:
+            err (Exception): The error raised by the job.
+
+        Returns:
+            bool: True if the error is transient, False otherwise.
+        """
+        if isinstance(err, (OSError, torch.cuda.OutOfMemoryError)):
+            return True
+
+        return isinstance(err, RuntimeError) and "out of memory" in str(err)
+
+    @staticmethod
+    def create_error_result(err: Exception) -> JobResult:
+        """
+        Creates the result of a job that raised an error.
+
+        Args:
+            err (Exception): The error raised by the job.
+
+        Returns:
+            JobResult: The failed result, retryable if the error is
+                transient.
+        """
+        return JobResult(
+            error_msg=str(err), retryable=Job.is_transient_error(err)
+        )
+
+    def finish(self, result: JobResult) -> JobResult:
+        """
+        Writes the result of the job to its analytics.
+
+        Nothing is written if the job has been cancelled. The analytics of
+            a retryable result are reset instead, so that the next attempt
+            starts from scratch.
+
+        Args:
+            result (JobResult): The result of the job.
+
+        Returns:
+            JobResult: The result of the job.
+        """
+        with self.__finish_lock:
+            if self.__cancelled.is_set():
+                return result
+
+            for analytic in self.get_analytics():
+                if result.is_retryable():
+                    analytic.reset()
+                else:
+                    analytic.set_result(result)
+                    analytic.set_done()
+
+        return result
+
     def start(self) -> JobResult:
         """
         Starts the job and returns the result.
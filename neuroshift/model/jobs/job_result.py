@@ -8,17 +8,24 @@ class JobResult:
     Attributes:
         __error_msg (str | None): The error message associated with the
             job result. None if the job was successful.
+        __retryable (bool): Whether the job may succeed if it is started
+            again.
     """
 
-    def __init__(self, error_msg: str | None = None) -> None:
+    def __init__(
+        self, error_msg: str | None = None, retryable: bool = False
+    ) -> None:
         """
         Initializes a new instance of the JobResult class.
 
         Args:
             error_msg (str | None, optional): The error message associated with
                 the job result. Defaults to None.
+            retryable (bool, optional): Whether the job may succeed if it is
+                started again. Defaults to False.
         """
         self.__error_msg: None | str = error_msg
+        self.__retryable: bool = retryable
 
     def is_success(self) -> bool:
         """
@@ -37,3 +44,12 @@ class JobResult:
             str | None: The error message if present, None otherwise.
         """
         return self.__error_msg
+
+    def is_retryable(self) -> bool:
+        """
+        Checks if the job may succeed if it is started again.
+
+        Returns:
+            bool: True if the job failed and may be retried, False otherwise.
+        """
+        return not self.is_success() and self.__retryable
@@ -0,0 +1,177 @@
+"""This module contains the MultiModelInferenceJob class."""
+
+import uuid
+from typing import List, Tuple
+
+import torch
+
+from neuroshift.model.jobs.job import Job
+from neuroshift.model.jobs.job_result import JobResult
+from neuroshift.model.jobs.perturbation_job import PerturbationJob
+from neuroshift.model.data.image import Image
+from neuroshift.model.data.model import Model
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.prediction import Prediction
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.noises.targets.target import Target
+from neuroshift.model.utils import Utils
+
+
+class MultiModelInferenceJob(Job):
+    """
+    Represents a job for performing inference on a perturbed dataset using
+        several models.
+
+    Every batch of the dataset is perturbed once and fed to every model,
+        so that all models are compared on the same noise. The noise is
+        the same as the one of an InferenceJob with the same seed. The job
+        fills one analytic per model, the first of which has the ID of the
+        job.
+    """
+
+    def __init__(
+        self,
+        models: List[Model],
+        dataset: Dataset,
+        perturbation_job: PerturbationJob,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initializes a MultiModelInferenceJob instance.
+
+        Args:
+            models (List[Model]): The models used for inference.
+            dataset (Dataset): The dataset used for inference.
+            perturbation_job (PerturbationJob): The perturbation applied
+                to the dataset.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
+
+        Raises:
+            ValueError: If no model is given or if the perturbation does
+                not target the dataset.
+        """
+        super().__init__(seed=seed)
+
+        if not models:
+            raise ValueError("At least one model must be given.")
+        if perturbation_job.get_target() != Target.DATASET:
+            raise ValueError("Only perturbations of the dataset can be used.")
+
+        self.__models: List[Model] = list(models)
+        self.__dataset: Dataset = dataset
+        self.__perturbation: PerturbationJob = perturbation_job
+        self.__analytics: List[Analytic] = [
+            Analytic(
+                job_id=self.get_job_id() if index == 0 else str(uuid.uuid4()),
+                total_predictions=dataset.get_size(),
+                model=model,
+                dataset=dataset,
+                noise_name=perturbation_job.get_name(),
+            )
+            for index, model in enumerate(self.__models)
+        ]
+
+    def get_models(self) -> List[Model]:
+        """
+        Returns the models used for inference.
+
+        Returns:
+            List[Model]: The models.
+        """
+        return self.__models.copy()
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics of the models, in the order of the models.
+
+        Returns:
+            List[Analytic]: The analytics of the models.
+        """
+        return self.__analytics.copy()
+
+    def start(self) -> JobResult:
+        """
+        Starts the multi-model inference job.
+
+        Returns:
+            JobResult: The result of the multi-model inference job.
+        """
+        analytics = Analytics.get_instance()
+        for analytic in self.__analytics:
+            if analytics.get_analytic(analytic.job_id) is None:
+                analytics.add_analytic(analytic)
+
+        self.__perturbation.apply_parameter_values()
+        generator = self.create_generator(self.__perturbation.get_device())
+        try:
+            for tensor, images in self.__dataset:
+                self.check_cancelled()
+                perturbed_images = self.__perturbation.perturb_images(
+                    images, generator
+                )
+                perturbed_tensor = torch.cat(
+                    [
+                        Utils.shape_to(
+                            torch.unsqueeze(image.get_tensor(), dim=0),
+                            height=tensor.shape[2],
+                            width=tensor.shape[3],
+                            channels=tensor.shape[1],
+                        )
+                        for image in perturbed_images
+                    ]
+                )
+
+                for model, analytic in zip(self.__models, self.__analytics):
+                    with torch.no_grad():
+                        results = model(
+                            Utils.shape_to(
+                                perturbed_tensor,
+                                height=model.get_input_height(),
+                                width=model.get_input_width(),
+                                channels=model.get_input_channels(),
+                            )
+                        )
+
+                    analytic.add_predictions(
+                        MultiModelInferenceJob.__create_predictions(
+                            images, perturbed_images, results
+                        )
+                    )
+
+            result = JobResult()
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            result = self.create_error_result(err)
+
+        return self.finish(result)
+
+    @staticmethod
+    def __create_predictions(
+        images: List[Image],
+        perturbed_images: List[Image],
+        results: List[Tuple[str, float]],
+    ) -> List[Prediction]:
+        """
+        Creates the predictions of a model on a batch of perturbed images.
+
+        Args:
+            images (List[Image]): The clean images of the batch.
+            perturbed_images (List[Image]): The perturbed images.
+            results (List[Tuple[str, float]]): The predicted classes and
+                confidences.
+
+        Returns:
+            List[Prediction]: The predictions.
+        """
+        return [
+            Prediction(
+                image=image,
+                perturbed_image=perturbed_image,
+                predicted_class=result[0],
+                confidence=result[1],
+            )
+            for image, perturbed_image, result in zip(
+                images, perturbed_images, results
+            )
+        ]
@@ -1,6 +1,9 @@
 """This module contains the PerturbationJob class."""
 
 import copy
+from typing import List, Tuple
+
+import torch
 
 from neuroshift.model.jobs.job import Job
 from neuroshift.model.data.image import Image
@@ -9,9 +12,13 @@ from neuroshift.model.data.dataset import Dataset
 from neuroshift.model.noises.perturbation import (
     Perturbation,
 )
+from neuroshift.model.noises.targets.activation_cache import (
+    ActivationCache,
+)
+from neuroshift.model.noises.targets.layer_index import LayerIndex
+from neuroshift.model.noises.targets.layer_selection import LayerSelection
 from neuroshift.model.noises.targets.module_perturb import ModulePerturb
 from neuroshift.model.noises.targets.target import Target
-from neuroshift.model.utils import Utils
 import neuroshift.config as conf
 
 
@@ -25,6 +32,10 @@ class PerturbationJob(Job):
         entity: Dataset | Model,
         perturbation: Perturbation,
         is_model: bool = False,
+        seed: int | None = None,
+        activation_boundary: str | None = None,
+        layers: LayerSelection | None = None,
+        parameter_values: List[Tuple[str, float]] | None = None,
     ) -> None:
         """
         Initializes a PerturbationJob object.
@@ -34,9 +45,45 @@ class PerturbationJob(Job):
             perturbation (Perturbation): The perturbation to be applied.
             is_model (bool, optional): Indicates whether the entity is a model.
                 Defaults to False.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
+            activation_boundary (str | None, optional): The name of the
+                layer from which on activations are perturbed. The clean
+                activations before it are cached and reused across runs.
+                Only used for activation perturbations. Defaults to None.
+            layers (LayerSelection | None, optional): The activations to
+                perturb. Every activation is perturbed if None.
+                Only used for activation perturbations. Defaults to None.
+            parameter_values (List[Tuple[str, float]] | None, optional):
+                The names and values of the parameters of the
+                perturbation, in order. The current values are taken if
+                None. Defaults to None.
+
+        Raises:
+            ValueError: If the parameter values do not match the
+                parameters of the perturbation.
         """
-        super().__init__()
+        super().__init__(seed=seed)
         self.__perturbation: Perturbation = perturbation
+        # the perturbations read their parameters when they are applied,
+        # so the values the job was created with are kept
+        self.__parameter_values: List[Tuple[str, float]] = [
+            (parameter.get_name(), parameter.get_value())
+            for parameter in perturbation.get_parameters()
+        ]
+        if parameter_values is not None:
+            if [name for name, _ in parameter_values] != [
+                name for name, _ in self.__parameter_values
+            ]:
+                raise ValueError(
+                    "The parameter values do not match the parameters "
+                    f"of {perturbation.get_name()}."
+                )
+            self.__parameter_values = [
+                (name, value) for name, value in parameter_values
+            ]
+        self.__activation_boundary: str | None = activation_boundary
+        self.__layers: LayerSelection | None = layers
 
         self.__dataset: Dataset | None = None
         self.__model: Model | None = None
@@ -57,6 +104,46 @@ class PerturbationJob(Job):
         """
         return self.__perturbation
 
+    def get_parameter_values(self) -> List[Tuple[str, float]]:
+        """
+        Returns the values of the parameters the job was created with.
+
+        Returns:
+            List[Tuple[str, float]]: The names and values of the
+                parameters of the perturbation, in order.
+        """
+        return self.__parameter_values.copy()
+
+    def apply_parameter_values(self) -> None:
+        """
+        Sets the parameters of the perturbation to the values the job was
+            created with, as they may have changed since.
+        """
+        for parameter, (_, value) in zip(
+            self.__perturbation.get_parameters(), self.__parameter_values
+        ):
+            parameter.set_value(value)
+
+    def get_activation_boundary(self) -> str | None:
+        """
+        Returns the name of the layer from which on activations are
+            perturbed.
+
+        Returns:
+            str | None: The name of the layer, or None if there is none.
+        """
+        return self.__activation_boundary
+
+    def get_layers(self) -> LayerSelection | None:
+        """
+        Returns the selection of the perturbed activations.
+
+        Returns:
+            LayerSelection | None: The selection of the activations,
+                or None if every activation is perturbed.
+        """
+        return self.__layers
+
     def get_name(self) -> str:
         """
         Returns the name of the perturbation job.
@@ -79,6 +166,21 @@ class PerturbationJob(Job):
         """
         return self.__perturbation.get_target()
 
+    def get_device(self) -> torch.device | str:
+        """
+        Returns the device the perturbation is computed on.
+
+        Activations are perturbed on the device of the model,
+            datasets and parameters on the cpu.
+
+        Returns:
+            torch.device | str: The device of the perturbation.
+        """
+        if self.__perturbation.get_target() == Target.MODEL_ACTIVATION:
+            return conf.device
+
+        return "cpu"
+
     def start(self) -> None:
         """
         Starts the perturbation job.
@@ -90,16 +192,47 @@ class PerturbationJob(Job):
         else:
             self.apply_to_dataset()
 
-    def apply_to_dataset(self) -> Dataset | None:
+    def apply_to_dataset(
+        self, generator: torch.Generator | None = None
+    ) -> Dataset | None:
         """
         Applies the perturbation to the dataset.
 
+        Args:
+            generator (torch.Generator | None, optional): The random number
+                generator to draw the noise from. A generator seeded with
+                the job seed is created if None. Defaults to None.
+
         Returns:
             Dataset: The perturbed dataset.
         """
         if self.__dataset is None:
             return None
 
+        if generator is None:
+            generator = self.create_generator()
+
+        perturbed_images: List[Image] = []
+        for _, images in self.__dataset:
+            perturbed_images.extend(self.perturb_images(images, generator))
+
+        return self.create_dataset(perturbed_images)
+
+    def create_dataset(self, perturbed_images: List[Image]) -> Dataset | None:
+        """
+        Creates the perturbed dataset from its perturbed images.
+
+        Args:
+            perturbed_images (List[Image]): The perturbed images, in the
+                order of the images of the dataset.
+
+        Returns:
+            Dataset | None: The perturbed dataset,
+                or None if the entity is not a dataset.
+        """
+        if self.__dataset is None:
+            return None
+
         perturbed_dataset = Dataset(
             name=self.__dataset.get_name(),
             file_name=self.__dataset.get_file_name(),
@@ -107,30 +240,62 @@ class PerturbationJob(Job):
             classes=self.__dataset.get_classes(),
             selected=False,
         )
+        for perturbed_image in perturbed_images:
+            perturbed_dataset.add_image(perturbed_image)
 
-        for _, images in self.__dataset:
-            for image in images:
-                perturbed_tensor = self.__perturbation.apply_to_tensor(
-                    image.get_tensor().to("cpu")
-                )
-                image.get_tensor().to(conf.device)
+        return perturbed_dataset
+
+    def perturb_images(
+        self, images: List[Image], generator: torch.Generator
+    ) -> List[Image]:
+        """
+        Applies the perturbation to images, one after the other.
+
+        Perturbing the batches of a dataset in order draws the same noise
+            as perturbing the whole dataset with the same generator.
+
+        Args:
+            images (List[Image]): The images to perturb.
+            generator (torch.Generator): The random number generator to
+                draw the noise from.
+
+        Returns:
+            List[Image]: The perturbed images.
+        """
+        perturbed_images: List[Image] = []
+        for image in images:
+            perturbed_tensor = self.__perturbation.apply_to_tensor(
+                image.get_tensor().to("cpu"), generator=generator
+            )
 
-                perturbed_image: Image = Image(
+            perturbed_images.append(
+                Image(
                     label=image.get_label(),
-                    path=Utils.image_to_url(
-                        Utils.tensor_to_image(perturbed_tensor)
-                    ),
+                    path=None,
                     actual_class=image.get_class(),
                     tensor=perturbed_tensor,
                 )
-                perturbed_dataset.add_image(perturbed_image)
+            )
 
-        return perturbed_dataset
+        return perturbed_images
 
-    def apply_to_model(self) -> Model | None:
+    def apply_to_model(
+        self, generator: torch.Generator | None = None
+    ) -> Model | None:
         """
         Applies the perturbation to the model.
 
+        Args:
+            generator (torch.Generator | None, optional): The random number
+                generator to draw the noise from, on the device returned by
+                get_device. A generator seeded with the job seed is created
+                if None. Defaults to None.
+
+        Raises:
+            ValueError: If the model has no layer named like the
+                activation boundary or no activation named like a
+                selected layer.
+
         Returns:
             Model | None: The perturbed model,
                 or None if the model does not exist.
@@ -138,31 +303,71 @@ class PerturbationJob(Job):
         if self.__model is None:
             return None
 
-        self.__model.get_model().to("cpu")
+        if generator is None:
+            generator = self.create_generator(self.get_device())
+
+        activation_cache: ActivationCache | None = None
+        if (
+            self.__activation_boundary is not None
+            and self.__perturbation.get_target() == Target.MODEL_ACTIVATION
+        ):
+            activation_cache = ActivationCache.get_instance(
+                model=self.__model,
+                boundary=self.__activation_boundary,
+                on_disk=conf.ACTIVATION_CACHE_ON_DISK,
+            )
+
         perturbed_model: Model
         if self.__perturbation.get_target() == Target.MODEL_PARAMETER:
+            self.__model.get_model().to("cpu")
             perturbed_model = copy.deepcopy(self.__model)
 
             model_parameters = perturbed_model.get_model().parameters()
             for param in model_parameters:
                 perturbed_data = self.__perturbation.apply_to_tensor(
-                    param.data
+                    param.data, generator=generator
                 )
                 param.data.copy_(perturbed_data)
+            self.__model.get_model().to(conf.device)
         else:
             perturbed_model = Model(
                 name=self.__model.get_name(),
                 file_name=self.__model.get_file_name(),
                 desc=self.__model.get_desc(),
                 model=ModulePerturb(
-                    self.__model.get_model(), self.__perturbation
+                    self.__model.get_model(),
+                    self.__perturbation,
+                    generator=generator,
+                    activation_cache=activation_cache,
+                    layers=self.__select_layers(),
                 ).run(),
                 order=self.__model.get_order(),
                 channels=self.__model.get_input_channels(),
                 width=self.__model.get_input_width(),
                 height=self.__model.get_input_height(),
             )
-        self.__model.get_model().to(conf.device)
         perturbed_model.get_model().to(conf.device)
 
         return perturbed_model
+
+    def __select_layers(self) -> List[str] | None:
+        """
+        Resolves the layer selection against the layer index of the model.
+
+        Returns:
+            List[str] | None: The names of the selected activations,
+                or None if every activation is perturbed.
+        """
+        if self.__model is None or self.__layers is None:
+            return None
+
+        index = LayerIndex.get_instance(
+            self.__model.get_model(),
+            (
+                self.__model.get_input_channels(),
+                self.__model.get_input_height(),
+                self.__model.get_input_width(),
+            ),
+        )
+
+        return [site.get_name() for site in self.__layers.select(index)]
@@ -0,0 +1,161 @@
+"""This module contains the Pipeline class."""
+
+import queue
+import threading
+from typing import Any, Callable, Iterable, List
+
+
+class Pipeline:
+    """
+    Runs batches through three stages at once: preparation, forward pass
+        and ingestion.
+
+    The preparation and the ingestion run in their own threads, connected
+        to the forward pass in the calling thread by bounded queues. While
+        a batch is in the forward pass, the next batches are prepared and
+        the previous results are ingested, so the throughput approaches
+        the one of the slowest stage. The order of the batches is kept.
+    """
+
+    __END: object = object()
+    __POLL_INTERVAL: float = 0.1
+
+    def __init__(self, depth: int) -> None:
+        """
+        Initializes a Pipeline object.
+
+        Args:
+            depth (int): The number of prepared batches waiting for the
+                forward pass and of results waiting for the ingestion.
+                The stages run one after the other in the calling thread
+                if it is smaller than 1.
+        """
+        self.__depth: int = depth
+
+    def run(
+        self,
+        source: Iterable[Any],
+        prepare: Callable[[Any], Any],
+        forward: Callable[[Any], Any],
+        ingest: Callable[[Any, Any], None],
+    ) -> None:
+        """
+        Runs every batch of the source through the stages.
+
+        Args:
+            source (Iterable[Any]): The batches.
+            prepare (Callable[[Any], Any]): Prepares a batch.
+            forward (Callable[[Any], Any]): Computes the results of a
+                prepared batch.
+            ingest (Callable[[Any, Any], None]): Ingests a prepared batch
+                and its results.
+
+        Raises:
+            Exception: The first exception raised by a stage, after the
+                other stages stopped.
+        """
+        if self.__depth < 1:
+            for batch in source:
+                prepared = prepare(batch)
+                ingest(prepared, forward(prepared))
+            return
+
+        prepared_batches: queue.Queue = queue.Queue(maxsize=self.__depth)
+        results: queue.Queue = queue.Queue(maxsize=self.__depth)
+        stop = threading.Event()
+        errors: List[BaseException] = []
+
+        def run_prepare() -> None:
+            try:
+                for batch in source:
+                    if not self.__put(prepared_batches, prepare(batch), stop):
+                        return
+            except BaseException as err:  # noqa (re-raised by run)
+                errors.append(err)
+                stop.set()
+            self.__put(prepared_batches, Pipeline.__END, stop)
+
+        def run_ingest() -> None:
+            while True:
+                item = self.__get(results, stop)
+                if item is Pipeline.__END:
+                    return
+                try:
+                    ingest(*item)
+                except BaseException as err:  # noqa (re-raised by run)
+                    errors.append(err)
+                    stop.set()
+                    return
+
+        threads = [
+            threading.Thread(target=run_prepare, daemon=True),
+            threading.Thread(target=run_ingest, daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        try:
+            while True:
+                prepared = self.__get(prepared_batches, stop)
+                if prepared is Pipeline.__END:
+                    break
+                if not self.__put(
+                    results, (prepared, forward(prepared)), stop
+                ):
+                    break
+        except BaseException as err:  # noqa (re-raised below)
+            errors.append(err)
+            stop.set()
+        finally:
+            self.__put(results, Pipeline.__END, stop)
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+    @staticmethod
+    def __put(
+        target: queue.Queue, item: Any, stop: threading.Event
+    ) -> bool:
+        """
+        Puts an item into a queue, waiting for a free slot unless the
+            pipeline is stopped.
+
+        Args:
+            target (queue.Queue): The queue.
+            item (Any): The item.
+            stop (threading.Event): Set when the pipeline is stopped.
+
+        Returns:
+            bool: True if the item was put, False if the pipeline stopped.
+        """
+        while not stop.is_set():
+            try:
+                target.put(item, timeout=Pipeline.__POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+
+        return False
+
+    @staticmethod
+    def __get(source: queue.Queue, stop: threading.Event) -> Any:
+        """
+        Gets an item from a queue, waiting for one unless the pipeline is
+            stopped.
+
+        Args:
+            source (queue.Queue): The queue.
+            stop (threading.Event): Set when the pipeline is stopped.
+
+        Returns:
+            Any: The item, or the end marker if the pipeline stopped.
+        """
+        while not stop.is_set():
+            try:
+                return source.get(timeout=Pipeline.__POLL_INTERVAL)
+            except queue.Empty:
+                continue
+
+        return Pipeline.__END
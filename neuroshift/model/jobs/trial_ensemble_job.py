@@ -0,0 +1,250 @@
+"""This module contains the TrialEnsembleJob class."""
+
+import copy
+import statistics
+import uuid
+from typing import Callable, Dict, List
+
+import torch
+from torch.func import functional_call, vmap
+
+from neuroshift.model.jobs.job import Job
+from neuroshift.model.jobs.job_result import JobResult
+from neuroshift.model.data.model import Model
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.prediction import Prediction
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.noises.perturbation import Perturbation
+from neuroshift.model.noises.targets.target import Target
+from neuroshift.model.utils import Utils
+import neuroshift.config as conf
+
+
+class TrialEnsembleJob(Job):
+    """
+    Represents a job for running several Monte Carlo trials of a parameter
+        perturbation on a model at once.
+
+    Every trial is a differently perturbed set of parameters of the model.
+        The parameter sets are stacked and every batch of the dataset is
+        evaluated by all of them in one vectorized forward pass, instead
+        of copying the model and running the dataset once per trial.
+        The trials run on a single private copy of the model, so the
+        shared model is never modified, with the parameter values the
+        perturbation had when the job was created.
+        The job fills one analytic per trial, the first of which has the
+        ID of the job.
+    """
+
+    def __init__(
+        self,
+        model: Model,
+        dataset: Dataset,
+        perturbation: Perturbation,
+        trials: int,
+        seed: int | None = None,
+    ) -> None:
+        """
+        Initializes a TrialEnsembleJob instance.
+
+        Args:
+            model (Model): The model to be perturbed.
+            dataset (Dataset): The dataset used for inference.
+            perturbation (Perturbation): The perturbation applied to the
+                parameters of the model.
+            trials (int): The number of perturbed parameter sets.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
+
+        Raises:
+            ValueError: If the perturbation does not target the parameters
+                of the model or if there is no trial.
+        """
+        super().__init__(seed=seed)
+
+        if perturbation.get_target() != Target.MODEL_PARAMETER:
+            raise ValueError(
+                "Only perturbations of the model parameters can be run "
+                "as trials."
+            )
+        if trials < 1:
+            raise ValueError("At least one trial must be run.")
+
+        self.__model: Model = model
+        self.__dataset: Dataset = dataset
+        self.__perturbation: Perturbation = perturbation
+        # the perturbations read their parameters when they are applied,
+        # so the values the job was created with are kept
+        self.__parameter_values: List[float] = [
+            parameter.get_value()
+            for parameter in perturbation.get_parameters()
+        ]
+        self.__analytics: List[Analytic] = [
+            Analytic(
+                job_id=self.get_job_id() if trial == 0 else str(uuid.uuid4()),
+                total_predictions=dataset.get_size(),
+                model=model,
+                dataset=dataset,
+                noise_name=(
+                    f"{perturbation.get_name()}-{perturbation.get_target()} "
+                    f"(trial {trial + 1}/{trials})"
+                ),
+            )
+            for trial in range(trials)
+        ]
+
+    def get_analytics(self) -> List[Analytic]:
+        """
+        Returns the analytics of the trials, in the order of the trials.
+
+        Returns:
+            List[Analytic]: The analytics of the trials.
+        """
+        return self.__analytics.copy()
+
+    def get_accuracies(self) -> List[float]:
+        """
+        Returns the overall accuracy of every trial.
+
+        Returns:
+            List[float]: The accuracies of the trials.
+        """
+        return [
+            analytic.get_overall_accuracy() for analytic in self.__analytics
+        ]
+
+    def get_accuracy_mean(self) -> float:
+        """
+        Returns the mean of the overall accuracies of the trials.
+
+        Returns:
+            float: The mean accuracy.
+        """
+        return statistics.mean(self.get_accuracies())
+
+    def get_accuracy_variance(self) -> float:
+        """
+        Returns the sample variance of the overall accuracies of the trials.
+
+        Returns:
+            float: The variance of the accuracy, 0 for a single trial.
+        """
+        accuracies = self.get_accuracies()
+        if len(accuracies) < 2:
+            return 0.0
+
+        return statistics.variance(accuracies)
+
+    def start(self) -> JobResult:
+        """
+        Starts the trial ensemble job.
+
+        Returns:
+            JobResult: The result of the trial ensemble job.
+        """
+        analytics = Analytics.get_instance()
+        for analytic in self.__analytics:
+            if analytics.get_analytic(analytic.job_id) is None:
+                analytics.add_analytic(analytic)
+
+        try:
+            forward = self.__create_forward()
+
+            for tensor, images in self.__dataset:
+                self.check_cancelled()
+                tensor = Utils.shape_to(
+                    tensor,
+                    height=self.__model.get_input_height(),
+                    width=self.__model.get_input_width(),
+                    channels=self.__model.get_input_channels(),
+                )
+
+                with torch.no_grad():
+                    outputs = forward(tensor)
+
+                for output, analytic in zip(outputs, self.__analytics):
+                    analytic.add_predictions(
+                        [
+                            Prediction(
+                                image=image,
+                                perturbed_image=image,
+                                predicted_class=result[0],
+                                confidence=result[1],
+                            )
+                            for image, result in zip(
+                                images, self.__model.decode(output)
+                            )
+                        ]
+                    )
+
+            result = JobResult()
+        except Exception as err:  # noqa (the possible exceptions are unknown)
+            result = self.create_error_result(err)
+
+        return self.finish(result)
+
+    def __create_forward(self) -> Callable[[torch.Tensor], torch.Tensor]:
+        """
+        Perturbs the parameters of the model once per trial and creates the
+            forward pass of all the trials.
+
+        Returns:
+            Callable[[torch.Tensor], torch.Tensor]: A function mapping a
+                batch to the stacked outputs of every trial.
+        """
+        # functional_call swaps the trial parameters into the module while
+        # it runs, so the trials run on a private copy of the model that
+        # no other thread uses
+        module = copy.deepcopy(self.__model.get_model())
+        generator = self.create_generator()
+        for parameter, value in zip(
+            self.__perturbation.get_parameters(), self.__parameter_values
+        ):
+            parameter.set_value(value)
+        trials = len(self.__analytics)
+
+        parameters: Dict[str, torch.Tensor] = {
+            name: torch.stack(
+                [
+                    self.__perturbation.apply_to_tensor(
+                        parameter.detach().cpu(), generator=generator
+                    )
+                    for _ in range(trials)
+                ]
+            ).to(conf.device)
+            for name, parameter in module.named_parameters()
+        }
+        buffers: Dict[str, torch.Tensor] = {
+            name: buffer.detach() for name, buffer in module.named_buffers()
+        }
+
+        def forward_trial(
+            trial_parameters: Dict[str, torch.Tensor], tensor: torch.Tensor
+        ) -> torch.Tensor:
+            return functional_call(
+                module, (trial_parameters, buffers), (tensor,)
+            )
+
+        def forward(tensor: torch.Tensor) -> torch.Tensor:
+            try:
+                return vmap(forward_trial, in_dims=(0, None))(
+                    parameters, tensor
+                )
+            except RuntimeError:
+                # some converted models use operations vmap cannot batch,
+                # their trials are evaluated one after the other instead
+                return torch.stack(
+                    [
+                        forward_trial(
+                            {
+                                name: parameter[trial]
+                                for name, parameter in parameters.items()
+                            },
+                            tensor,
+                        )
+                        for trial in range(trials)
+                    ]
+                )
+
+        return forward
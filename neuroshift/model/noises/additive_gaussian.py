@@ -48,25 +48,34 @@ class AdditiveGaussian(Perturbation):
             cls.__instance = AdditiveGaussian()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the perturbation to a given tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor to apply
                 the perturbation to.
+            generator (torch.Generator | None, optional): The generator to
+                draw the noise from, it has to be on the device of the
+                tensor. Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor.
         """
         std = AdditiveGaussian.__PARAMETERS[0].get_value()
-        noise = torch.normal(
-            mean=AdditiveGaussian.__MEAN, std=std, size=tensor.size()
+        if not tensor.is_floating_point():
+            tensor = tensor.to(torch.get_default_dtype())
+
+        # the noise buffer is allocated on the device of the tensor
+        # and turned into the perturbed tensor in place
+        perturbed_tensor = torch.empty_like(tensor).normal_(
+            mean=AdditiveGaussian.__MEAN, std=std, generator=generator
         )
-        perturbed_tensor = tensor.clone() + noise
+        perturbed_tensor.add_(tensor)
         if self.get_target() == Target.DATASET:
-            perturbed_tensor = torch.clamp(
-                perturbed_tensor,
+            perturbed_tensor.clamp_(
                 min=AdditiveGaussian.__PARAMETERS[0].get_min_value(),
                 max=AdditiveGaussian.__PARAMETERS[0].get_max_value(),
             )
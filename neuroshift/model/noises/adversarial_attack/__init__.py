@@ -1,3 +1,5 @@
 """This module contains the classes used for generating Adversarial Attacks."""
 
 from .fast_gradient_sign_method import FastGradientSignMethod
+from .basic_iterative_method import BasicIterativeMethod
+from .projected_gradient_descent import ProjectedGradientDescent
@@ -46,6 +46,7 @@ class Attack:
         self,
         model: nn.Module,
         image: torch.Tensor,
+        generator: torch.Generator | None = None,
     ) -> torch.Tensor:
         """
         Applies the attack to the input image using the provided model.
@@ -54,7 +55,8 @@ class Attack:
         Args:
             model (nn.Module): The neural network model to apply the attack on.
             image (torch.Tensor): The input image to be attacked.
-            dataset (Dataset): The Dataset the image is comming from.
+            generator (torch.Generator | None, optional): The generator to
+                draw the random parts of the attack from. Defaults to None.
 
         Returns:
             torch.Tensor: The attacked image.
@@ -0,0 +1,65 @@
+"""This modules contains the BasicIterativeMethod class."""
+
+from typing import List
+from typing_extensions import Self
+
+from neuroshift.model.noises.parameter import Parameter
+from neuroshift.model.noises.adversarial_attack.iterative_attack import (
+    IterativeAttack,
+)
+
+
+class BasicIterativeMethod(IterativeAttack):
+    """
+    The Basic Iterative Method (BIM) is an adversarial attack method
+    that applies the Fast Gradient Sign Method several times with a small
+    step size, clipping the result to the epsilon ball around the input
+    image after every step.
+    """
+
+    __NAME: str = "Basic Iterative Method"
+    __PARAMETERS: List[Parameter] = [
+        Parameter(
+            name="Epsilon",
+            min_value=0,
+            max_value=1,
+            default_value=0.1,
+            step=0.001,
+        ),
+        Parameter(
+            name="Step size",
+            min_value=0,
+            max_value=1,
+            default_value=0.01,
+            step=0.001,
+        ),
+        Parameter(
+            name="Steps",
+            min_value=1,
+            max_value=100,
+            default_value=10.0,
+            step=1,
+        ),
+    ]
+    __instance: Self | None = None
+
+    def __init__(self) -> None:
+        """
+        Initializes the BasicIterativeMethod attack.
+        """
+        super().__init__(
+            name=BasicIterativeMethod.__NAME,
+            parameters=BasicIterativeMethod.__PARAMETERS,
+        )
+
+    @classmethod
+    def get_instance(cls) -> "BasicIterativeMethod":
+        """
+        Returns the singleton instance of the BasicIterativeMethod attack.
+
+        Returns:
+            Self: The singleton instance of the BasicIterativeMethod attack.
+        """
+        if cls.__instance is None:
+            cls.__instance = BasicIterativeMethod()
+        return cls.__instance
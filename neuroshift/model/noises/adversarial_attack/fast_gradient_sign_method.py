@@ -55,7 +55,10 @@ class FastGradientSignMethod(Attack):
         return cls.__instance
 
     def fsgm_attack(
-        self, image: torch.Tensor, data_gradient: torch.Tensor
+        self,
+        image: torch.Tensor,
+        data_gradient: torch.Tensor,
+        epsilon: float | None = None,
     ) -> torch.Tensor:
         """
         Applies the Fast Gradient Sign Method attack to the input image.
@@ -63,50 +66,75 @@ class FastGradientSignMethod(Attack):
         Args:
             image (torch.Tensor): The input image tensor.
             data_gradient (torch.Tensor): The gradient of the loss function
-                with respect to the input image.
+                with respect to the input image, or its sign.
+            epsilon (float | None, optional): The size of the perturbation.
+                The value of the epsilon parameter is used if None.
+                Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed image tensor after applying the attack.
         """
-        eps = FastGradientSignMethod.__PARAMETERS[0].get_value()
+        if epsilon is None:
+            epsilon = FastGradientSignMethod.__PARAMETERS[0].get_value()
         sign_grad = data_gradient.sign()
-        return torch.clamp(image + eps * sign_grad, 0, 1)
+        return torch.clamp(image + epsilon * sign_grad, 0, 1)
 
-    def apply_to_tensor(
+    def gradient_sign(
         self, model: nn.Module, image: torch.Tensor
     ) -> torch.Tensor:
         """
-        Applies the Fast Gradient Sign Method attack to the input image tensor.
+        Computes the sign of the gradient of the loss function with respect
+            to the input image tensor.
+
+        The sign does not depend on epsilon, so it can be computed once
+            and reused to attack the image with several epsilons.
 
         Args:
             model (nn.Module): The neural network model.
             image (torch.Tensor): The input image tensor.
-                (it should be a 4 dimentional tensor)
+                (it should be a 4 dimentional tensor, the sign of every
+                image of the batch is computed with the same backward pass)
 
         Returns:
-            torch.Tensor: The perturbed image tensor after applying the attack.
+            torch.Tensor: The sign of the gradient, detached from the graph.
         """
-        image = image.clone()
-        # the tensor needs to calculate the gradient for the attack
-        image.requires_grad = True
+        # only the input requires a gradient, the model is left untouched
+        image = image.detach().requires_grad_(True)
 
         # forward pass
-        model.train()
         output = model(image)
-        model.eval()
-
-        predicted = output.max(1, keepdim=True)[1]
-        loss = F.nll_loss(output, predicted[0])
+        output = output.view(output.shape[0], -1)
+        predicted = output.argmax(dim=1)
+        loss = F.nll_loss(output, predicted)
 
         # backward pass
-        model.zero_grad()
-        loss.backward()
-        data_gradient = image.grad.data
+        (data_gradient,) = torch.autograd.grad(loss, image)
+
+        return data_gradient.sign()
+
+    def apply_to_tensor(
+        self,
+        model: nn.Module,
+        image: torch.Tensor,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """
+        Applies the Fast Gradient Sign Method attack to the input image tensor.
 
-        # apply the attack
-        image = self.fsgm_attack(image, data_gradient)
+        Args:
+            model (nn.Module): The neural network model.
+            image (torch.Tensor): The input image tensor.
+                (it should be a 4 dimentional tensor, every image of the
+                batch is attacked with the same backward pass)
+            generator (torch.Generator | None, optional): Unused, the attack
+                is deterministic. Defaults to None.
 
-        return image
+        Returns:
+            torch.Tensor: The perturbed image tensor after applying the attack.
+        """
+        return self.fsgm_attack(
+            image.detach(), self.gradient_sign(model, image)
+        )
 
     def __str__(self) -> str:
         return self.get_name()
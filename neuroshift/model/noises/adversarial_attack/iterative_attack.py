@@ -0,0 +1,116 @@
+"""This module contains the IterativeAttack class."""
+
+import torch
+from torch import nn
+import torch.nn.functional as F
+
+from neuroshift.model.noises.adversarial_attack.attack import Attack
+
+
+class IterativeAttack(Attack):
+    """
+    Represents an attack taking several signed gradient steps, each followed
+    by a projection onto the epsilon ball around the clean image.
+
+    Every image of a batch is attacked at once. Images whose prediction
+    already flipped are dropped from the later steps, and all steps share
+    one preallocated gradient buffer.
+
+    The parameters of the attack must be the epsilon, the step size and the
+    number of steps, in this order.
+    """
+
+    def _initialize(
+        self,
+        image: torch.Tensor,
+        epsilon: float,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """
+        Returns the starting point of the attack inside the epsilon ball.
+        (this method can be overridden by child classes)
+
+        Args:
+            image (torch.Tensor): The clean image batch.
+            epsilon (float): The radius of the epsilon ball.
+            generator (torch.Generator | None, optional): The generator to
+                draw a random starting point from. Defaults to None.
+
+        Returns:
+            torch.Tensor: The starting point, a new tensor.
+        """
+        return image.clone()
+
+    def apply_to_tensor(
+        self,
+        model: nn.Module,
+        image: torch.Tensor,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """
+        Applies the iterative attack to the input image tensor.
+
+        Args:
+            model (nn.Module): The neural network model.
+            image (torch.Tensor): The input image tensor.
+                (it should be a 4 dimentional tensor)
+            generator (torch.Generator | None, optional): The generator to
+                draw the starting point from. Defaults to None.
+
+        Returns:
+            torch.Tensor: The perturbed image tensor after applying the attack.
+        """
+        epsilon, step_size, steps = (
+            parameter.get_value() for parameter in self.get_parameters()
+        )
+
+        image = image.detach()
+        adversarial = image.clone()
+        gradient_buffer = torch.empty_like(image)
+
+        origin = image
+        current = self._initialize(image, epsilon, generator)
+        current.sub_(origin).clamp_(-epsilon, epsilon).add_(origin)
+        current.clamp_(0, 1)
+        indices = torch.arange(image.shape[0], device=image.device)
+        with torch.no_grad():
+            labels = model(image).view(image.shape[0], -1).argmax(dim=1)
+
+        for _ in range(int(steps)):
+            current.requires_grad_(True)
+            # a plain forward pass, the gradient is only taken with respect
+            # to the input, so the shared model is left untouched
+            output = model(current)
+            output = output.view(current.shape[0], -1)
+
+            unchanged = output.argmax(dim=1) == labels
+            if not unchanged.any():
+                current = current.detach()
+                break
+
+            loss = F.nll_loss(
+                output[unchanged], labels[unchanged], reduction="sum"
+            )
+            (gradient,) = torch.autograd.grad(loss, current)
+            current = current.detach()
+
+            if not unchanged.all():
+                adversarial[indices[~unchanged]] = current[~unchanged]
+                current = current[unchanged]
+                origin = origin[unchanged]
+                labels = labels[unchanged]
+                indices = indices[unchanged]
+                gradient = gradient[unchanged]
+
+            step = gradient_buffer[: current.shape[0]]
+            torch.sign(gradient, out=step)
+            current.add_(step.mul_(step_size))
+            current.sub_(origin).clamp_(-epsilon, epsilon).add_(origin)
+            current.clamp_(0, 1)
+
+        adversarial[indices] = current
+
+        return adversarial
+
+    def __str__(self) -> str:
+        return self.get_name()
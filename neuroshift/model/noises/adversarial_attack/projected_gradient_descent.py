@@ -0,0 +1,95 @@
+"""This modules contains the ProjectedGradientDescent class."""
+
+from typing import List
+from typing_extensions import Self
+
+import torch
+
+from neuroshift.model.noises.parameter import Parameter
+from neuroshift.model.noises.adversarial_attack.iterative_attack import (
+    IterativeAttack,
+)
+
+
+class ProjectedGradientDescent(IterativeAttack):
+    """
+    Projected Gradient Descent (PGD) is an adversarial attack method
+    that starts at a random point in the epsilon ball around the input
+    image and repeatedly takes a step in the direction of the sign of the
+    gradient of the loss function, projecting the result back onto the
+    epsilon ball after every step.
+    """
+
+    __NAME: str = "Projected Gradient Descent"
+    __PARAMETERS: List[Parameter] = [
+        Parameter(
+            name="Epsilon",
+            min_value=0,
+            max_value=1,
+            default_value=0.1,
+            step=0.001,
+        ),
+        Parameter(
+            name="Step size",
+            min_value=0,
+            max_value=1,
+            default_value=0.01,
+            step=0.001,
+        ),
+        Parameter(
+            name="Steps",
+            min_value=1,
+            max_value=100,
+            default_value=10.0,
+            step=1,
+        ),
+    ]
+    __instance: Self | None = None
+
+    def __init__(self) -> None:
+        """
+        Initializes the ProjectedGradientDescent attack.
+        """
+        super().__init__(
+            name=ProjectedGradientDescent.__NAME,
+            parameters=ProjectedGradientDescent.__PARAMETERS,
+        )
+
+    @classmethod
+    def get_instance(cls) -> "ProjectedGradientDescent":
+        """
+        Returns the singleton instance of the ProjectedGradientDescent attack.
+
+        Returns:
+            Self: The singleton instance of the ProjectedGradientDescent
+                attack.
+        """
+        if cls.__instance is None:
+            cls.__instance = ProjectedGradientDescent()
+        return cls.__instance
+
+    def _initialize(
+        self,
+        image: torch.Tensor,
+        epsilon: float,
+        generator: torch.Generator | None = None,
+    ) -> torch.Tensor:
+        """
+        Returns a random point in the epsilon ball around the image.
+
+        Args:
+            image (torch.Tensor): The clean image batch.
+            epsilon (float): The radius of the epsilon ball.
+            generator (torch.Generator | None, optional): The generator to
+                draw the point from. Defaults to None.
+
+        Returns:
+            torch.Tensor: The starting point of the attack.
+        """
+        uniform = torch.rand(
+            image.size(),
+            generator=generator,
+            dtype=image.dtype,
+            device=image.device,
+        )
+        return uniform.mul_(2 * epsilon).sub_(epsilon).add_(image)
@@ -0,0 +1,98 @@
+"""This module contains the CompositePerturbation class."""
+
+from typing import List
+
+import torch
+
+from neuroshift.model.noises.perturbation import Perturbation
+from neuroshift.model.noises.parameter import Parameter
+from neuroshift.model.noises.targets.target import Target
+
+
+class CompositePerturbation(Perturbation):
+    """
+    A perturbation that chains several perturbations.
+
+    Every tensor goes through all the perturbations in order before the
+        next tensor is perturbed, so the intermediate results are never
+        kept. All the perturbations share the target of the composite.
+    """
+
+    __SEPARATOR: str = " + "
+
+    def __init__(self, perturbations: List[Perturbation]) -> None:
+        """
+        Initializes a CompositePerturbation.
+
+        The composite takes the target of the first perturbation.
+
+        Args:
+            perturbations (List[Perturbation]): The perturbations to apply,
+                in order.
+
+        Raises:
+            ValueError: If no perturbation is given.
+        """
+        if not perturbations:
+            raise ValueError("At least one perturbation must be given.")
+
+        self.__perturbations: List[Perturbation] = list(perturbations)
+        parameters: List[Parameter] = [
+            parameter
+            for perturbation in self.__perturbations
+            for parameter in perturbation.get_parameters()
+        ]
+
+        super().__init__(
+            name=CompositePerturbation.__SEPARATOR.join(
+                perturbation.get_name()
+                for perturbation in self.__perturbations
+            ),
+            parameters=parameters,
+            target=self.__perturbations[0].get_target(),
+        )
+        self.set_target(self.get_target())
+
+    def get_perturbations(self) -> List[Perturbation]:
+        """
+        Returns the chained perturbations.
+
+        Returns:
+            List[Perturbation]: The perturbations, in order.
+        """
+        return self.__perturbations.copy()
+
+    def set_target(self, target: Target) -> None:
+        """
+        Sets the target of the composite and of every chained perturbation.
+
+        Args:
+            target (Target): The target object to which the
+                perturbation is applied.
+        """
+        super().set_target(target)
+        for perturbation in self.__perturbations:
+            perturbation.set_target(target)
+
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
+        """
+        Applies every chained perturbation to the tensor, in order.
+
+        Args:
+            tensor (torch.Tensor): The tensor to perturb.
+            generator (torch.Generator | None, optional): The random number
+                generator every perturbation draws its noise from.
+                The global generator is used if None. Defaults to None.
+
+        Returns:
+            torch.Tensor: The perturbed tensor.
+        """
+        for perturbation in self.__perturbations:
+            tensor = perturbation.apply_to_tensor(tensor, generator=generator)
+
+        return tensor
+
+    def __str__(self) -> str:
+        return self.get_name()
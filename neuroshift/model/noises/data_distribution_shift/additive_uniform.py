@@ -48,12 +48,16 @@ class AdditiveUniform(Perturbation):
             cls.__instance = AdditiveUniform()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the AdditiveUniform perturbation to the given tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor.
+            generator (torch.Generator | None, optional): The generator to
+                draw the noise from. Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor.
@@ -61,7 +65,13 @@ class AdditiveUniform(Perturbation):
         strength = AdditiveUniform.__PARAMETERS[0].get_value()
         min_val = (-1) * strength
         max_val = strength
-        noise = (torch.rand_like(tensor) * (max_val - min_val)) + min_val
+        uniform = torch.rand(
+            tensor.size(),
+            generator=generator,
+            dtype=tensor.dtype,
+            device=tensor.device,
+        )
+        noise = (uniform * (max_val - min_val)) + min_val
         perturbed_tensor = tensor.clone() + noise
         perturbed_tensor = torch.clamp(
             perturbed_tensor,
@@ -50,20 +50,35 @@ class MultiplicativeUniform(Perturbation):
             cls.__instance = MultiplicativeUniform()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the MultiplicativeUniform perturbation to a tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor to be perturbed.
+            generator (torch.Generator | None, optional): The generator to
+                draw the noise from. Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor.
         """
         strength = MultiplicativeUniform.__PARAMETERS[0].get_value()
-        noise = strength * torch.rand_like(tensor) + (1 - strength)
+        uniform = torch.rand(
+            tensor.size(),
+            generator=generator,
+            dtype=tensor.dtype,
+            device=tensor.device,
+        )
+        noise = strength * uniform + (1 - strength)
 
-        mask = torch.rand_like(tensor)
+        mask = torch.rand(
+            tensor.size(),
+            generator=generator,
+            dtype=tensor.dtype,
+            device=tensor.device,
+        )
         divide_mask = mask < 0.5
         noise = torch.where(
             divide_mask & (noise == 0), torch.tensor(float("inf")), noise
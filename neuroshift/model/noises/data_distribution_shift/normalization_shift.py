@@ -59,12 +59,16 @@ class NormalizationShift(Perturbation):
             cls.__instance = NormalizationShift()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the normalization shift to the input tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor.
+            generator (torch.Generator | None, optional): Unused, the
+                perturbation is deterministic. Defaults to None.
 
         Returns:
             torch.Tensor: The tensor with the applied normalization shift.
@@ -51,12 +51,16 @@ class Rotation(Perturbation):
             cls.__instance = Rotation()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies rotation to the input tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor to apply rotation to.
+            generator (torch.Generator | None, optional): Unused, the
+                perturbation is deterministic. Defaults to None.
 
         Returns:
             torch.Tensor: The rotated tensor.
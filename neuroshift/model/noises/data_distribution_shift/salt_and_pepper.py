@@ -47,18 +47,27 @@ class SaltAndPepper(Perturbation):
             cls.__instance = SaltAndPepper()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the perturbation to the input tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor.
+            generator (torch.Generator | None, optional): The generator to
+                draw the noise from. Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor.
         """
         strength = SaltAndPepper.__PARAMETERS[0].get_value()
-        mask = torch.rand_like(tensor)
+        mask = torch.rand(
+            tensor.size(),
+            generator=generator,
+            dtype=tensor.dtype,
+            device=tensor.device,
+        )
         salt = mask < (strength / 2.0)
         pepper = (mask >= (strength / 2.0)) & (mask < strength)
 
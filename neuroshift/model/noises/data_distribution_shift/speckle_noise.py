@@ -48,13 +48,17 @@ class SpeckleNoise(Perturbation):
             cls.__instance = SpeckleNoise()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the speckle noise perturbation to the input tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor to apply the perturbation
                 to.
+            generator (torch.Generator | None, optional): The generator to
+                draw the noise from. Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor with speckle noise applied.
@@ -62,7 +66,9 @@ class SpeckleNoise(Perturbation):
         strength = SpeckleNoise.__PARAMETERS[0].get_value()
         min_val = (-1) * strength
         max_val = strength
-        noise = (torch.normal(tensor) * (max_val - min_val)) + min_val
+        noise = (
+            torch.normal(tensor, generator=generator) * (max_val - min_val)
+        ) + min_val
         perturbed_tensor = tensor.clone() + noise
         perturbed_tensor = torch.clamp(
             perturbed_tensor,
@@ -1,8 +1,6 @@
 """This module contains the Bitflip class."""
 
-import struct
-import random
-from typing import List
+from typing import Dict, List
 from typing_extensions import Self
 
 import torch
@@ -25,6 +23,12 @@ class Bitflip(Perturbation):
             name="Strength", min_value=0, max_value=1, value=0.1, step=0.001
         )
     ]
+    __INTEGER_TYPES: Dict[int, torch.dtype] = {
+        1: torch.int8,
+        2: torch.int16,
+        4: torch.int32,
+        8: torch.int64,
+    }
     __instance: Self | None = None
 
     def __init__(self) -> None:
@@ -49,12 +53,17 @@ class Bitflip(Perturbation):
             cls.__instance = Bitflip()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the bitflip perturbation to a tensor.
 
         Args:
             tensor: The input tensor.
+            generator: The random number generator to draw the flipped
+                bits from, it has to be on the device of the tensor.
+                The global generator is used if None.
 
         Returns:
             The perturbed tensor with randomly flipped bits.
@@ -63,32 +72,48 @@ class Bitflip(Perturbation):
 
         strength = Bitflip.__PARAMETERS[0].get_value()
         num_flips = int(limit_num_flips * strength)
-        tensor_1d = tensor.clone().view(-1)
-
-        for _ in range(num_flips):
-            index = random.randrange(tensor_1d.numel())
-            value = float(tensor_1d[index])
-            tensor_1d[index] = self.__flip_random_bit(value)
-
-        perturbed_tensor = tensor_1d.reshape_as(tensor)
-        return perturbed_tensor
+        perturbed_tensor = tensor.detach().clone(
+            memory_format=torch.contiguous_format
+        )
+        if num_flips == 0:
+            return perturbed_tensor
 
-    def __flip_random_bit(self, float_value: float) -> float:
-        """
-        Flips a random bit in a floating-point value.
+        # flip the bits on the device of the tensor through an integer view
+        # of its memory, instead of packing every value on the host
+        bits = perturbed_tensor.view(-1).view(
+            Bitflip.__INTEGER_TYPES[perturbed_tensor.element_size()]
+        )
+        indices = torch.randint(
+            bits.numel(),
+            (num_flips,),
+            generator=generator,
+            device=bits.device,
+        )
+        bits_per_value = perturbed_tensor.element_size() * 8
+        positions = torch.randint(
+            bits_per_value,
+            (num_flips,),
+            generator=generator,
+            device=bits.device,
+            dtype=bits.dtype,
+        )
 
-        Args:
-            float_value: The input floating-point value.
+        # a value drawn several times gets all of its flips: a bit flipped
+        # twice keeps its value, and the masks of the other bits are summed
+        # per value, which is exact and deterministic unlike a scatter
+        flips, counts = (indices * bits_per_value + positions.long()).unique(
+            return_counts=True
+        )
+        flips = flips[counts % 2 == 1]
+        targets, inverse = (flips // bits_per_value).unique(
+            return_inverse=True
+        )
+        masks = torch.ones_like(flips, dtype=bits.dtype) << (
+            flips % bits_per_value
+        ).to(bits.dtype)
+        combined = torch.zeros_like(targets, dtype=bits.dtype).index_put_(
+            (inverse,), masks, accumulate=True
+        )
+        bits[targets] ^= combined
 
-        Returns:
-            The modified floating-point value with a randomly flipped bit.
-        """
-        packed = struct.pack("f", float_value)
-        value: int = int.from_bytes(packed, byteorder="big")
-        index_to_flip = random.randrange(32)
-        value ^= 1 << index_to_flip
-        modified_float = struct.unpack(
-            "f", value.to_bytes(4, byteorder="big")
-        )[0]
-
-        return modified_float
+        return perturbed_tensor
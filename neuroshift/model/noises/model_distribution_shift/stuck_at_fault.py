@@ -48,22 +48,89 @@ class StuckAtFault(Perturbation):
             cls.__instance = StuckAtFault()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the StuckAtFault perturbation to a tensor.
 
         Args:
             tensor (torch.Tensor): The tensor to apply the perturbation to.
+            generator (torch.Generator | None, optional): The random number
+                generator to draw the faults from, it has to be on the device
+                of the tensor. The global generator is used if None.
+                Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor.
         """
-        stuck_at_mask = torch.randint(-1, 2, size=tensor.size())
         strength = StuckAtFault.__PARAMETERS[0].get_value()
+        size = tensor.numel()
+        perturbed = tensor.clone()
+        if size == 0 or strength <= 0:
+            return perturbed
 
-        random_tensor = torch.bernoulli(torch.full(tensor.shape, strength / 6))
-        perturbed_tensor = torch.where(
-            random_tensor == 1, stuck_at_mask, tensor
+        # only the faults are sampled: their number is drawn from the
+        # binomial distribution of a full-size bernoulli mask, then their
+        # positions and stuck-at values are drawn and scattered in
+        count = int(
+            torch.binomial(
+                torch.tensor(
+                    float(size), dtype=torch.float64, device=tensor.device
+                ),
+                torch.tensor(
+                    strength / 6, dtype=torch.float64, device=tensor.device
+                ),
+                generator=generator,
+            ).item()
         )
+        indices = StuckAtFault.__sample_indices(
+            size, count, generator=generator, device=tensor.device
+        )
+        stuck_at_values = torch.randint(
+            -1,
+            2,
+            size=(count,),
+            generator=generator,
+            dtype=tensor.dtype,
+            device=tensor.device,
+        )
+
+        return perturbed.put_(indices, stuck_at_values)
+
+    @staticmethod
+    def __sample_indices(
+        size: int,
+        count: int,
+        generator: torch.Generator | None,
+        device: torch.device,
+    ) -> torch.Tensor:
+        """
+        Draws distinct flat indices uniformly at random.
+
+        The indices are drawn with replacement and the duplicates drawn
+            again, so that the cost grows with the number of indices and
+            not with the size of the tensor.
+
+        Args:
+            size (int): The number of elements to draw the indices from.
+            count (int): The number of distinct indices to draw.
+            generator (torch.Generator | None): The random number generator
+                to draw the indices from. The global generator is used if
+                None.
+            device (torch.device): The device of the indices.
+
+        Returns:
+            torch.Tensor: The distinct indices.
+        """
+        indices = torch.empty(0, dtype=torch.long, device=device)
+        while indices.numel() < count:
+            drawn = torch.randint(
+                size,
+                size=(count - indices.numel(),),
+                generator=generator,
+                device=device,
+            )
+            indices = torch.cat((indices, drawn)).unique()
 
-        return perturbed_tensor
+        return indices
@@ -48,24 +48,33 @@ class MultiplicativeGaussian(Perturbation):
             cls.__instance = MultiplicativeGaussian()
         return cls.__instance
 
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the perturbation to the given tensor.
 
         Args:
             tensor (torch.Tensor): The input tensor.
+            generator (torch.Generator | None, optional): The generator to
+                draw the noise from, it has to be on the device of the
+                tensor. Defaults to None.
 
         Returns:
             torch.Tensor: The perturbed tensor.
         """
         std = MultiplicativeGaussian.__PARAMETERS[0].get_value()
-        noise = torch.normal(
-            mean=MultiplicativeGaussian.__MEAN, std=std, size=tensor.size()
+        if not tensor.is_floating_point():
+            tensor = tensor.to(torch.get_default_dtype())
+
+        # the noise buffer is allocated on the device of the tensor
+        # and turned into the perturbed tensor in place
+        perturbed_tensor = torch.empty_like(tensor).normal_(
+            mean=MultiplicativeGaussian.__MEAN, std=std, generator=generator
         )
-        perturbed_tensor = tensor.clone() * noise
+        perturbed_tensor.mul_(tensor)
         if self.get_target() == Target.DATASET:
-            perturbed_tensor = torch.clamp(
-                perturbed_tensor,
+            perturbed_tensor.clamp_(
                 min=MultiplicativeGaussian.__PARAMETERS[0].get_min_value(),
                 max=MultiplicativeGaussian.__PARAMETERS[0].get_max_value(),
             )
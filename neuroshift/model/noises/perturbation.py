@@ -72,13 +72,18 @@ class Perturbation:
         self.__target = target
 
     @abstractmethod
-    def apply_to_tensor(self, tensor: torch.Tensor) -> torch.Tensor:
+    def apply_to_tensor(
+        self, tensor: torch.Tensor, generator: torch.Generator | None = None
+    ) -> torch.Tensor:
         """
         Applies the perturbation to the given tensor.
 
         Args:
             tensor (torch.Tensor): The tensor to which the
                 perturbation is applied.
+            generator (torch.Generator | None, optional): The random number
+                generator to draw the noise from. The global generator is
+                used if None. Defaults to None.
 
         Returns:
             torch.Tensor: The tensor with the perturbation applied.
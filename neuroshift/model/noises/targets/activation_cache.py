@@ -0,0 +1,649 @@
+"""This module contains the ActivationCache class."""
+
+import copy
+import hashlib
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+import torch
+from torch import nn
+
+import neuroshift.config as conf
+from neuroshift.model.data.model import Model
+from neuroshift.model.exceptions.boundary_reached import BoundaryReached
+from neuroshift.model.fingerprint import Fingerprint
+
+
+class ActivationCache:
+    """
+    Caches the clean outputs of the layers that are executed before
+        a layer boundary.
+
+    A perturbed module replaces these upstream layers with ReplayLayers,
+        so the forward pass of repeated activation runs resumes at the
+        boundary instead of recomputing the clean part of the model.
+        Only the outputs consumed at or after the boundary are stored,
+        for a sequential model the input of the boundary. The other
+        upstream layers replay an uninitialized tensor of the shape of
+        their output, which is only fed to other ReplayLayers.
+
+    The outputs are recorded once per input batch, either in RAM or on
+        disk. The least recently used batches of all caches are evicted
+        once they take more than conf.ACTIVATION_CACHE_SIZE bytes, a size
+        of 0 disables the cache.
+    """
+
+    __MAX_INSTANCES: int = 8
+    __instances: OrderedDict[Tuple[str, str, bool], "ActivationCache"] = (
+        OrderedDict()
+    )
+    __instances_lock: threading.Lock = threading.Lock()
+    # the cached batches of every cache by the ID of the cache and the key
+    # of the batch, with the cache and the size of the batch in bytes
+    __entries: OrderedDict[Tuple[int, str], Tuple["ActivationCache", int]] = (
+        OrderedDict()
+    )
+    __entries_lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get_instance(
+        cls, model: Model, boundary: str, on_disk: bool = False
+    ) -> "ActivationCache":
+        """
+        Returns the activation cache of a model at a layer boundary.
+
+        The cache is shared by every run on the same model file. Only the
+            most recently used caches are kept, the batches of the others
+            are removed.
+
+        Args:
+            model (Model): The clean model.
+            boundary (str): The name of the first layer not to be cached.
+            on_disk (bool, optional): Whether the activations are stored
+                on disk instead of RAM. Defaults to False.
+
+        Raises:
+            ValueError: If the model has no layer named boundary.
+
+        Returns:
+            ActivationCache: The activation cache.
+        """
+        model_hash = Fingerprint.of_model(model)
+        if model_hash is None:
+            model_hash = str(id(model.get_model()))
+
+        key = (model_hash, boundary, on_disk)
+        with cls.__instances_lock:
+            cache = cls.__instances.get(key)
+            if cache is None:
+                cache = ActivationCache(
+                    model=model,
+                    boundary=boundary,
+                    on_disk=on_disk,
+                    name=f"{model_hash} {boundary}",
+                )
+                cls.__instances[key] = cache
+            cls.__instances.move_to_end(key)
+
+            while len(cls.__instances) > cls.__MAX_INSTANCES:
+                _, evicted = cls.__instances.popitem(last=False)
+                evicted.clear()
+
+            return cache
+
+    def __init__(
+        self,
+        model: Model,
+        boundary: str,
+        on_disk: bool = False,
+        name: str | None = None,
+    ) -> None:
+        """
+        Initializes an ActivationCache object.
+
+        The layers upstream of the boundary, and the ones among them
+            whose outputs are consumed at or after the boundary, are found
+            by tracing the model once with an empty input. The batches
+            of a cache on disk that are left from a previous session are
+            added to the budget.
+
+        Args:
+            model (Model): The clean model.
+            boundary (str): The name of the first layer not to be cached.
+            on_disk (bool, optional): Whether the activations are stored
+                on disk instead of RAM. Defaults to False.
+            name (str | None, optional): The name of the cache on disk.
+                Defaults to the boundary.
+
+        Raises:
+            ValueError: If the model has no layer named boundary.
+        """
+        self.__module: nn.Module = copy.deepcopy(model.get_model())
+        self.__module.to(conf.device)
+        modules: Dict[str, nn.Module] = dict(self.__module.named_modules())
+        if boundary == "" or boundary not in modules:
+            raise ValueError(f"The model has no layer named '{boundary}'")
+
+        self.__boundary: str = boundary
+        self.__on_disk: bool = on_disk
+        self.__path: str = os.path.join(
+            conf.CACHE_PATH,
+            "activations",
+            hashlib.sha256((name or boundary).encode()).hexdigest(),
+        )
+        self.__lock: threading.Lock = threading.Lock()
+        self.__batches: Dict[str, Dict[str, List[Any]]] = {}
+        self.__recording: Dict[str, List[Any]] = {}
+        self.__replay_state: threading.local = threading.local()
+
+        empty_input = torch.zeros(
+            1,
+            model.get_input_channels(),
+            model.get_input_height(),
+            model.get_input_width(),
+            device=conf.device,
+        )
+        self.__upstream: List[str]
+        self.__stored: Set[str]
+        self.__upstream, self.__stored = self.__trace(modules, empty_input)
+
+        for layer_name in self.__upstream:
+            modules[layer_name].register_forward_hook(
+                self.__record_hook(layer_name)
+            )
+        modules[boundary].register_forward_pre_hook(self.__stop_hook)
+
+        if on_disk:
+            self.__index_files()
+
+    def get_boundary(self) -> str:
+        """
+        Get the name of the layer boundary.
+
+        Returns:
+            str: The name of the first layer not to be cached.
+        """
+        return self.__boundary
+
+    def get_upstream(self) -> List[str]:
+        """
+        Get the names of the layers executed before the boundary.
+
+        Returns:
+            List[str]: The names of the upstream layers in execution order.
+        """
+        return self.__upstream.copy()
+
+    def get_stored(self) -> List[str]:
+        """
+        Get the names of the upstream layers whose outputs are stored,
+            since they are consumed at or after the boundary.
+
+        Returns:
+            List[str]: The names of the layers in execution order.
+        """
+        return [name for name in self.__upstream if name in self.__stored]
+
+    def get_size(self) -> int:
+        """
+        Get the number of bytes taken by the cached batches.
+
+        Returns:
+            int: The size of the cache in bytes.
+        """
+        with ActivationCache.__entries_lock:
+            return sum(
+                size
+                for cache, size in ActivationCache.__entries.values()
+                if cache is self
+            )
+
+    def __len__(self) -> int:
+        """
+        Get the number of cached batches.
+
+        Returns:
+            int: The number of cached batches.
+        """
+        with ActivationCache.__entries_lock:
+            return sum(
+                1
+                for cache, _ in ActivationCache.__entries.values()
+                if cache is self
+            )
+
+    def attach(self, module: nn.Module) -> None:
+        """
+        Makes a module load the clean activations of its input batch
+            before every forward pass.
+
+        Args:
+            module (nn.Module): The root of the perturbed module tree.
+        """
+        module.register_forward_pre_hook(self.__prepare_hook)
+
+    def prepare(self, tensor: torch.Tensor) -> None:
+        """
+        Loads the clean activations of an input batch,
+            recording them first if they are not cached yet.
+
+        Args:
+            tensor (torch.Tensor): The input batch.
+        """
+        key = ActivationCache.__get_key(tensor)
+
+        with self.__lock:
+            outputs = self.__load(key)
+            if outputs is None:
+                outputs = self.__record(tensor)
+                self.__store(key, outputs)
+
+        self.__replay_state.outputs = outputs
+        self.__replay_state.calls = {}
+
+    def replay(self, name: str) -> Any:
+        """
+        Get the clean output of an upstream layer for the batch last
+            prepared by the calling thread.
+
+        Args:
+            name (str): The name of the upstream layer.
+
+        Returns:
+            Any: A copy of the clean output of the layer, or an
+                uninitialized tensor if its output is not stored.
+        """
+        calls: Dict[str, int] = self.__replay_state.calls
+        call = calls.get(name, 0)
+        calls[name] = call + 1
+
+        return ActivationCache.__map(
+            self.__replay_state.outputs[name][call],
+            lambda t: (
+                torch.empty_like(t, device=conf.device)
+                if t.is_meta
+                else t.clone()
+            ),
+        )
+
+    def clear(self) -> None:
+        """
+        Remove every cached activation.
+        """
+        with self.__lock, ActivationCache.__entries_lock:
+            for entry_key in [
+                entry_key
+                for entry_key, (cache, _) in ActivationCache.__entries.items()
+                if cache is self
+            ]:
+                del ActivationCache.__entries[entry_key]
+            self.__batches.clear()
+            if os.path.isdir(self.__path):
+                for file_name in os.listdir(self.__path):
+                    os.remove(os.path.join(self.__path, file_name))
+
+    def __trace(
+        self, modules: Dict[str, nn.Module], tensor: torch.Tensor
+    ) -> Tuple[List[str], Set[str]]:
+        """
+        Runs the whole clean module once to find the upstream layers and
+            the ones whose outputs are consumed at or after the boundary.
+
+        The tensors are followed by their storage, and the outputs are
+            kept alive during the pass so that no storage is reused. If a
+            layer at or after the boundary consumes a tensor that was not
+            computed by a layer, e.g. by a functional call, the outputs of
+            every upstream layer are considered consumed.
+
+        Args:
+            modules (Dict[str, nn.Module]): The modules by their name.
+            tensor (torch.Tensor): The input batch.
+
+        Returns:
+            Tuple[List[str], Set[str]]: The names of the upstream layers
+                in execution order and the names of the consumed ones.
+        """
+        upstream: List[str] = []
+        consumed: Set[str] = set()
+        # the upstream layers by the storage of their outputs
+        producers: Dict[int, List[str]] = {}
+        known: Set[int] = set(ActivationCache.__get_storages(tensor))
+        known.update(
+            storage
+            for value in itertools.chain(
+                self.__module.parameters(), self.__module.buffers()
+            )
+            for storage in ActivationCache.__get_storages(value)
+        )
+        outputs: List[Any] = []
+        is_downstream = False
+        consumes_unknown = False
+
+        def record_hook(name: str) -> Callable[[nn.Module, Any, Any], None]:
+            def hook(_: nn.Module, __: Any, output: Any) -> None:
+                outputs.append(output)
+                storages = ActivationCache.__get_storages(output)
+                if is_downstream:
+                    known.update(storages)
+                    return
+
+                for storage in storages:
+                    producers.setdefault(storage, []).append(name)
+                if name not in upstream:
+                    upstream.append(name)
+
+            return hook
+
+        def stop_hook(_: nn.Module, __: Any) -> None:
+            nonlocal is_downstream
+            is_downstream = True
+
+        def consume_hook(_: nn.Module | None, args: Any) -> None:
+            nonlocal consumes_unknown
+            if not is_downstream:
+                return
+
+            for storage in ActivationCache.__get_storages(args):
+                if storage in producers:
+                    consumed.update(producers[storage])
+                elif storage not in known:
+                    consumes_unknown = True
+
+        leaves = [
+            name
+            for name, module in modules.items()
+            if len(module._modules) == 0  # noqa
+        ]
+        handles = [
+            modules[self.__boundary].register_forward_pre_hook(stop_hook)
+        ]
+        for name in dict.fromkeys([self.__boundary] + leaves):
+            handles.append(
+                modules[name].register_forward_pre_hook(consume_hook)
+            )
+        for name in leaves:
+            handles.append(
+                modules[name].register_forward_hook(record_hook(name))
+            )
+
+        try:
+            with torch.no_grad():
+                consume_hook(None, self.__module(tensor))
+        finally:
+            for handle in handles:
+                handle.remove()
+
+        if consumes_unknown:
+            consumed = set(upstream)
+
+        return upstream, consumed
+
+    def __record(self, tensor: torch.Tensor) -> Dict[str, List[Any]]:
+        """
+        Runs the clean module up to the boundary and records the outputs
+            of the upstream layers.
+
+        Args:
+            tensor (torch.Tensor): The input batch.
+
+        Returns:
+            Dict[str, List[Any]]: The outputs of every upstream layer.
+        """
+        self.__recording = {}
+        try:
+            with torch.no_grad():
+                self.__module(tensor)
+        except BoundaryReached:
+            pass
+
+        outputs, self.__recording = self.__recording, {}
+
+        return outputs
+
+    def __record_hook(
+        self, name: str
+    ) -> Callable[[nn.Module, Any, Any], None]:
+        """
+        Creates the forward hook recording the output of a layer.
+
+        Args:
+            name (str): The name of the layer.
+
+        Returns:
+            Callable[[nn.Module, Any, Any], None]: The forward hook.
+        """
+
+        def hook(_: nn.Module, __: Any, output: Any) -> None:
+            self.__recording.setdefault(name, []).append(
+                ActivationCache.__map(
+                    output,
+                    (
+                        (lambda t: t.detach())
+                        if name in self.__stored
+                        # only the shape is kept, on the meta device
+                        else (lambda t: torch.empty_like(t, device="meta"))
+                    ),
+                )
+            )
+
+        return hook
+
+    def __stop_hook(self, _: nn.Module, __: Any) -> None:
+        """
+        The forward pre hook stopping the clean pass at the boundary.
+
+        Raises:
+            BoundaryReached: Always.
+        """
+        raise BoundaryReached(self.__boundary)
+
+    def __prepare_hook(self, _: nn.Module, args: Tuple[Any, ...]) -> None:
+        """
+        The forward pre hook preparing the perturbed pass of a batch.
+
+        Args:
+            args (Tuple[Any, ...]): The inputs of the perturbed module.
+        """
+        self.prepare(args[0])
+
+    def __load(self, key: str) -> Dict[str, List[Any]] | None:
+        """
+        Load the cached activations of a batch and mark them as the most
+            recently used.
+
+        Args:
+            key (str): The key of the batch.
+
+        Returns:
+            Dict[str, List[Any]] | None: The cached activations,
+                or None if the batch is not cached.
+        """
+        with ActivationCache.__entries_lock:
+            if (id(self), key) not in ActivationCache.__entries:
+                return None
+
+            ActivationCache.__entries.move_to_end((id(self), key))
+            if not self.__on_disk:
+                return self.__batches.get(key)
+
+        try:
+            return torch.load(
+                os.path.join(self.__path, f"{key}.pt"),
+                map_location=conf.device,
+            )
+        except (OSError, RuntimeError, EOFError):
+            return None
+
+    def __store(self, key: str, outputs: Dict[str, List[Any]]) -> None:
+        """
+        Store the activations of a batch and evict the least recently
+            used batches of all caches beyond the budget.
+
+        Nothing is stored if the cache is disabled.
+
+        Args:
+            key (str): The key of the batch.
+            outputs (Dict[str, List[Any]]): The activations to store.
+        """
+        if conf.ACTIVATION_CACHE_SIZE <= 0:
+            return
+
+        if self.__on_disk:
+            path = os.path.join(self.__path, f"{key}.pt")
+            try:
+                os.makedirs(self.__path, exist_ok=True)
+                torch.save(outputs, path)
+                size = os.path.getsize(path)
+            except OSError:
+                return
+        else:
+            size = sum(
+                tensor.element_size() * tensor.nelement()
+                for tensor in ActivationCache.__get_tensors(outputs)
+                if not tensor.is_meta
+            )
+
+        with ActivationCache.__entries_lock:
+            if not self.__on_disk:
+                self.__batches[key] = outputs
+            ActivationCache.__entries[(id(self), key)] = (self, size)
+            ActivationCache.__entries.move_to_end((id(self), key))
+            ActivationCache.__evict()
+
+    def __discard(self, key: str) -> None:
+        """
+        Remove the activations of a batch, without its entry.
+
+        Args:
+            key (str): The key of the batch.
+        """
+        if not self.__on_disk:
+            self.__batches.pop(key, None)
+            return
+
+        try:
+            os.remove(os.path.join(self.__path, f"{key}.pt"))
+        except OSError:
+            pass
+
+    def __index_files(self) -> None:
+        """
+        Add the batches stored on disk by a previous session to the
+            entries, the least recently modified first.
+        """
+        try:
+            paths = [
+                os.path.join(self.__path, file_name)
+                for file_name in os.listdir(self.__path)
+                if file_name.endswith(".pt")
+            ]
+            paths.sort(key=os.path.getmtime)
+            files = [(path, os.path.getsize(path)) for path in paths]
+        except OSError:
+            return
+
+        with ActivationCache.__entries_lock:
+            for path, size in files:
+                key = os.path.basename(path)[: -len(".pt")]
+                ActivationCache.__entries[(id(self), key)] = (self, size)
+            ActivationCache.__evict()
+
+    @staticmethod
+    def __evict() -> None:
+        """
+        Remove the least recently used batches of all caches until they
+            fit into the budget. The lock of the entries must be held.
+        """
+        size = sum(size for _, size in ActivationCache.__entries.values())
+        while ActivationCache.__entries and size > max(
+            conf.ACTIVATION_CACHE_SIZE, 0
+        ):
+            (_, key), (cache, entry_size) = ActivationCache.__entries.popitem(
+                last=False
+            )
+            size -= entry_size
+            cache.__discard(key)
+
+    @staticmethod
+    def __get_key(tensor: torch.Tensor) -> str:
+        """
+        Get the key of an input batch from its content.
+
+        Args:
+            tensor (torch.Tensor): The input batch.
+
+        Returns:
+            str: The key of the batch.
+        """
+        data = tensor.detach().to("cpu").contiguous()
+        digest = hashlib.blake2b(str(tuple(data.shape)).encode())
+        digest.update(data.numpy().tobytes())
+
+        return digest.hexdigest()
+
+    @staticmethod
+    def __get_tensors(output: Any) -> List[torch.Tensor]:
+        """
+        Get every tensor of a layer output or of the activations of a
+            batch.
+
+        Args:
+            output (Any): The output or the activations.
+
+        Returns:
+            List[torch.Tensor]: The tensors.
+        """
+        if isinstance(output, torch.Tensor):
+            return [output]
+        if isinstance(output, dict):
+            output = list(output.values())
+        if isinstance(output, (tuple, list)):
+            return [
+                tensor
+                for item in output
+                for tensor in ActivationCache.__get_tensors(item)
+            ]
+
+        return []
+
+    @staticmethod
+    def __get_storages(output: Any) -> List[int]:
+        """
+        Get the addresses of the storages of the tensors of a layer
+            output, leaving out the empty tensors.
+
+        Args:
+            output (Any): The output of a layer.
+
+        Returns:
+            List[int]: The addresses of the storages.
+        """
+        return [
+            tensor.untyped_storage().data_ptr()
+            for tensor in ActivationCache.__get_tensors(output)
+            if tensor.nelement() > 0
+        ]
+
+    @staticmethod
+    def __map(output: Any, function: Callable[[torch.Tensor], Any]) -> Any:
+        """
+        Apply a function to every tensor of a layer output.
+
+        Args:
+            output (Any): The output of a layer.
+            function (Callable[[torch.Tensor], Any]): The function to apply.
+
+        Returns:
+            Any: The output with the function applied to its tensors.
+        """
+        if isinstance(output, torch.Tensor):
+            return function(output)
+        if isinstance(output, (tuple, list)):
+            return type(output)(
+                ActivationCache.__map(item, function) for item in output
+            )
+
+        return output
@@ -0,0 +1,90 @@
+"""This module contains the ActivationSite class."""
+
+from typing import Tuple
+
+
+class ActivationSite:
+    """
+    Describes an activation layer of a module tree.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        index: int,
+        depth: int,
+        layer_type: str,
+        output_shape: Tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Initializes an ActivationSite object.
+
+        Args:
+            name (str): The name of the layer in the module tree.
+            index (int): The position of the layer in execution order.
+            depth (int): The depth of the layer in the module tree.
+            layer_type (str): The class name of the activation.
+            output_shape (Tuple[int, ...] | None, optional): The shape of
+                the output of the layer without the batch dimension,
+                or None if it is unknown. Defaults to None.
+        """
+        self.__name: str = name
+        self.__index: int = index
+        self.__depth: int = depth
+        self.__layer_type: str = layer_type
+        self.__output_shape: Tuple[int, ...] | None = output_shape
+
+    def get_name(self) -> str:
+        """
+        Get the name of the layer in the module tree.
+
+        Returns:
+            str: The name of the layer.
+        """
+        return self.__name
+
+    def get_index(self) -> int:
+        """
+        Get the position of the layer in execution order.
+
+        Returns:
+            int: The index of the layer.
+        """
+        return self.__index
+
+    def get_depth(self) -> int:
+        """
+        Get the depth of the layer in the module tree.
+
+        Returns:
+            int: The depth of the layer, 1 for children of the root.
+        """
+        return self.__depth
+
+    def get_layer_type(self) -> str:
+        """
+        Get the class name of the activation.
+
+        Returns:
+            str: The class name of the activation.
+        """
+        return self.__layer_type
+
+    def get_output_shape(self) -> Tuple[int, ...] | None:
+        """
+        Get the shape of the output of the layer.
+
+        Returns:
+            Tuple[int, ...] | None: The shape without the batch dimension,
+                or None if it is unknown.
+        """
+        return self.__output_shape
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the activation site.
+
+        Returns:
+            str: A string representation of the activation site.
+        """
+        return f"{self.__index}: {self.__name} ({self.__layer_type})"
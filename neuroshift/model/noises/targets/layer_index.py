@@ -0,0 +1,235 @@
+"""This module contains the LayerIndex class."""
+
+import threading
+import weakref
+from typing import Any, Dict, List, Tuple
+
+import torch
+from torch import nn
+
+from neuroshift.model.noises.targets.activation_site import ActivationSite
+
+
+class LayerIndex:
+    """
+    An index of the activation layers of a module tree.
+
+    The index is built once per module and records the name, depth,
+        execution order and output shape of every activation, so that
+        perturbations can target activations without walking the module
+        tree again.
+    """
+
+    __ACTIVATIONS: Tuple[type, ...] = (
+        nn.ELU,
+        nn.Hardshrink,
+        nn.Hardsigmoid,
+        nn.Hardtanh,
+        nn.Hardswish,
+        nn.LeakyReLU,
+        nn.LogSigmoid,
+        nn.PReLU,
+        nn.ReLU,
+        nn.ReLU6,
+        nn.RReLU,
+        nn.SELU,
+        nn.CELU,
+        nn.GELU,
+        nn.Sigmoid,
+        nn.SiLU,
+        nn.Mish,
+        nn.Softplus,
+        nn.Softshrink,
+        nn.Softsign,
+        nn.Tanh,
+        nn.Tanhshrink,
+        nn.Threshold,
+        nn.GLU,
+    )
+    __instances: "weakref.WeakKeyDictionary[nn.Module, LayerIndex]" = (
+        weakref.WeakKeyDictionary()
+    )
+    __lock: threading.Lock = threading.Lock()
+
+    @classmethod
+    def get_instance(
+        cls,
+        module: nn.Module,
+        input_shape: Tuple[int, ...] | None = None,
+    ) -> "LayerIndex":
+        """
+        Returns the layer index of a module, building it on first use.
+
+        Args:
+            module (nn.Module): The root of the module tree.
+            input_shape (Tuple[int, ...] | None, optional): The shape of
+                an input of the module without the batch dimension, used to
+                trace the execution order and output shapes of the
+                activations. Defaults to None.
+
+        Returns:
+            LayerIndex: The layer index of the module.
+        """
+        with cls.__lock:
+            index = cls.__instances.get(module)
+            if index is None or (
+                input_shape is not None and not index.is_traced()
+            ):
+                index = LayerIndex(module, input_shape)
+                cls.__instances[module] = index
+
+            return index
+
+    @staticmethod
+    def is_activation(module: nn.Module) -> bool:
+        """
+        Checks if the given module is an activation function.
+
+        Args:
+            module (nn.Module): The module to check.
+
+        Returns:
+            bool: True if the module is an activation function,
+                False otherwise.
+        """
+        return isinstance(module, LayerIndex.__ACTIVATIONS)
+
+    def __init__(
+        self,
+        module: nn.Module,
+        input_shape: Tuple[int, ...] | None = None,
+    ) -> None:
+        """
+        Initializes a LayerIndex object.
+
+        Args:
+            module (nn.Module): The root of the module tree.
+            input_shape (Tuple[int, ...] | None, optional): The shape of
+                an input of the module without the batch dimension, used to
+                trace the execution order and output shapes of the
+                activations. Defaults to None.
+        """
+        layers: Dict[str, nn.Module] = {}
+        for name, layer in module.named_modules():
+            if any(name.startswith(f"{site}.") for site in layers):
+                continue
+            if LayerIndex.is_activation(layer):
+                layers[name] = layer
+
+        order: List[str] = list(layers)
+        shapes: Dict[str, Tuple[int, ...]] = {}
+        if input_shape is not None:
+            executed = LayerIndex.__trace(module, layers, input_shape, shapes)
+            order = executed + [name for name in order if name not in shapes]
+
+        self.__traced: bool = input_shape is not None
+        self.__sites: List[ActivationSite] = [
+            ActivationSite(
+                name=name,
+                index=index,
+                depth=name.count(".") + 1,
+                layer_type=type(layers[name]).__name__,
+                output_shape=shapes.get(name),
+            )
+            for index, name in enumerate(order)
+        ]
+        self.__by_name: Dict[str, ActivationSite] = {
+            site.get_name(): site for site in self.__sites
+        }
+
+    def is_traced(self) -> bool:
+        """
+        Check if the execution order and output shapes are known.
+
+        Returns:
+            bool: True if the module was traced with an input,
+                False otherwise.
+        """
+        return self.__traced
+
+    def get_sites(self) -> List[ActivationSite]:
+        """
+        Get the activation sites in execution order.
+
+        Returns:
+            List[ActivationSite]: The activation sites.
+        """
+        return self.__sites.copy()
+
+    def get_site(self, name: str) -> ActivationSite | None:
+        """
+        Get an activation site by its name.
+
+        Args:
+            name (str): The name of the activation in the module tree.
+
+        Returns:
+            ActivationSite | None: The activation site,
+                or None if there is no activation with this name.
+        """
+        return self.__by_name.get(name)
+
+    def get_names(self) -> List[str]:
+        """
+        Get the names of the activations in execution order.
+
+        Returns:
+            List[str]: The names of the activations.
+        """
+        return [site.get_name() for site in self.__sites]
+
+    def __len__(self) -> int:
+        """
+        Get the number of activations in the module tree.
+
+        Returns:
+            int: The number of activations.
+        """
+        return len(self.__sites)
+
+    @staticmethod
+    def __trace(
+        module: nn.Module,
+        layers: Dict[str, nn.Module],
+        input_shape: Tuple[int, ...],
+        shapes: Dict[str, Tuple[int, ...]],
+    ) -> List[str]:
+        """
+        Run an empty input through the module and record the order
+            in which the activations are executed and their output shapes.
+
+        Args:
+            module (nn.Module): The root of the module tree.
+            layers (Dict[str, nn.Module]): The activations by name.
+            input_shape (Tuple[int, ...]): The shape of an input without
+                the batch dimension.
+            shapes (Dict[str, Tuple[int, ...]]): The dictionary to store
+                the output shapes in.
+
+        Returns:
+            List[str]: The names of the executed activations in order.
+        """
+        executed: List[str] = []
+
+        def record(name: str) -> Any:
+            def hook(_: nn.Module, __: Any, output: Any) -> None:
+                if name not in shapes and isinstance(output, torch.Tensor):
+                    shapes[name] = tuple(output.shape[1:])
+                    executed.append(name)
+
+            return hook
+
+        handles = [
+            layer.register_forward_hook(record(name))
+            for name, layer in layers.items()
+        ]
+        try:
+            parameter = next(module.parameters(), None)
+            device = parameter.device if parameter is not None else "cpu"
+            with torch.no_grad():
+                module(torch.zeros(1, *input_shape, device=device))
+        finally:
+            for handle in handles:
+                handle.remove()
+
+        return executed
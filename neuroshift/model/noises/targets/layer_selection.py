@@ -0,0 +1,142 @@
+"""This module contains the LayerSelection class."""
+
+from typing import List
+
+from neuroshift.model.noises.targets.activation_site import ActivationSite
+from neuroshift.model.noises.targets.layer_index import LayerIndex
+
+
+class LayerSelection:
+    """
+    Selects the activations of a model an activation perturbation targets,
+        either by name, by a range of execution indices or as the last
+        activations of the model.
+    """
+
+    def __init__(
+        self,
+        names: List[str] | None = None,
+        start: int | None = None,
+        stop: int | None = None,
+        last: int | None = None,
+    ) -> None:
+        """
+        Initializes a LayerSelection object.
+
+        Use by_names, by_range or last to create a selection.
+
+        Args:
+            names (List[str] | None, optional): The names of the selected
+                activations. Defaults to None.
+            start (int | None, optional): The first selected index in
+                execution order. Defaults to None.
+            stop (int | None, optional): The index after the last selected
+                index in execution order. Defaults to None.
+            last (int | None, optional): The number of selected activations
+                at the end of the model. Defaults to None.
+        """
+        self.__names: List[str] | None = (
+            list(names) if names is not None else None
+        )
+        self.__start: int | None = start
+        self.__stop: int | None = stop
+        self.__last: int | None = last
+
+    @staticmethod
+    def by_names(names: List[str]) -> "LayerSelection":
+        """
+        Select activations by their names in the module tree.
+
+        Args:
+            names (List[str]): The names of the activations.
+
+        Returns:
+            LayerSelection: The selection.
+        """
+        return LayerSelection(names=names)
+
+    @staticmethod
+    def by_range(
+        start: int | None = None, stop: int | None = None
+    ) -> "LayerSelection":
+        """
+        Select activations by a range of indices in execution order.
+
+        Args:
+            start (int | None, optional): The first selected index.
+                Defaults to None.
+            stop (int | None, optional): The index after the last selected
+                index. Defaults to None.
+
+        Returns:
+            LayerSelection: The selection.
+        """
+        return LayerSelection(start=start, stop=stop)
+
+    @staticmethod
+    def last(count: int) -> "LayerSelection":
+        """
+        Select the last activations in execution order.
+
+        Args:
+            count (int): The number of activations.
+
+        Returns:
+            LayerSelection: The selection.
+        """
+        return LayerSelection(last=count)
+
+    def select(self, index: LayerIndex) -> List[ActivationSite]:
+        """
+        Resolve the selection against the layer index of a model.
+
+        Args:
+            index (LayerIndex): The layer index of the model.
+
+        Raises:
+            ValueError: If a selected name is not an activation of the
+                model or if the number of last activations is negative.
+
+        Returns:
+            List[ActivationSite]: The selected activation sites
+                in execution order.
+        """
+        sites = index.get_sites()
+        if self.__names is not None:
+            unknown = [
+                name for name in self.__names if index.get_site(name) is None
+            ]
+            if unknown:
+                raise ValueError(
+                    f"The model has no activations named {', '.join(unknown)}"
+                )
+
+            return [site for site in sites if site.get_name() in self.__names]
+
+        if self.__last is not None:
+            if self.__last < 0:
+                raise ValueError(
+                    "The number of last activations must not be negative"
+                )
+
+            return sites[max(len(sites) - self.__last, 0) :]
+
+        return sites[self.__start : self.__stop]
+
+    def __str__(self) -> str:
+        """
+        Get a string representation of the selection.
+
+        Returns:
+            str: A string representation of the selection.
+        """
+        if self.__names is not None:
+            return f"layers {', '.join(self.__names)}"
+
+        if self.__last is not None:
+            return f"last {self.__last} layers"
+
+        start = self.__start if self.__start is not None else ""
+        stop = self.__stop if self.__stop is not None else ""
+
+        return f"layers {start}:{stop}"
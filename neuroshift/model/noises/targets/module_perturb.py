@@ -1,48 +1,39 @@
 """This module contains the ModulePerturb class."""
 
 import copy
+from typing import Dict, List, Set
 
+import torch
 from torch import nn
 
+from neuroshift.model.noises.targets.activation_cache import (
+    ActivationCache,
+)
+from neuroshift.model.noises.targets.layer_index import LayerIndex
 from neuroshift.model.noises.targets.perturbation_layer import (
     PerturbationLayer,
 )
+from neuroshift.model.noises.targets.replay_layer import ReplayLayer
 from neuroshift.model.noises.perturbation import Perturbation
 
 
 class ModulePerturb:
     """
     Perturbs a PyTorch module by replacing activations with PerturbationLayers.
+
+    Only the modules on the path from the root to a replaced layer are
+        copied, every other module and all parameters are shared with the
+        initial module, which is left unchanged.
     """
 
-    __ACTIVATIONS = [
-        nn.ELU,
-        nn.Hardshrink,
-        nn.Hardsigmoid,
-        nn.Hardtanh,
-        nn.Hardswish,
-        nn.LeakyReLU,
-        nn.LogSigmoid,
-        nn.PReLU,
-        nn.ReLU,
-        nn.ReLU6,
-        nn.RReLU,
-        nn.SELU,
-        nn.CELU,
-        nn.GELU,
-        nn.Sigmoid,
-        nn.SiLU,
-        nn.Mish,
-        nn.Softplus,
-        nn.Softshrink,
-        nn.Softsign,
-        nn.Tanh,
-        nn.Tanhshrink,
-        nn.Threshold,
-        nn.GLU,
-    ]
-
-    def __init__(self, module: nn.Module, perturbation: Perturbation):
+    def __init__(
+        self,
+        module: nn.Module,
+        perturbation: Perturbation,
+        generator: torch.Generator | None = None,
+        activation_cache: ActivationCache | None = None,
+        layers: List[str] | None = None,
+    ):
         """
         Initializes a ModulePerturb object.
 
@@ -50,10 +41,26 @@ class ModulePerturb:
             module (nn.Module): The initial module to be perturbed.
             perturbation (Perturbation): The perturbation to be applied
                 to the module.
+            generator (torch.Generator | None, optional): The random number
+                generator shared by every PerturbationLayer.
+                Defaults to None.
+            activation_cache (ActivationCache | None, optional): The cache
+                of the clean activations upstream of a layer boundary.
+                The upstream layers are replayed from the cache instead of
+                being computed and perturbed. Defaults to None.
+            layers (List[str] | None, optional): The names of the
+                activations to perturb. Every activation is perturbed
+                if None. Defaults to None.
         """
         self.__initial_module: nn.Module = module
-        self.__new_module: nn.Module = copy.deepcopy(module)
         self.__perturbation: Perturbation = perturbation
+        self.__generator: torch.Generator | None = generator
+        self.__activation_cache: ActivationCache | None = activation_cache
+        self.__layers: List[str] = (
+            list(layers)
+            if layers is not None
+            else LayerIndex.get_instance(module).get_names()
+        )
 
     def run(self) -> nn.Module:
         """
@@ -63,63 +70,90 @@ class ModulePerturb:
         Returns:
             nn.Module: The perturbed module.
         """
-        self.__go(
-            module_to_change=self.__new_module, original=self.__initial_module
+        replacements: Dict[str, nn.Module] = {}
+        for name in self.__layers:
+            replacements[name] = PerturbationLayer(
+                layer=self.__initial_module.get_submodule(name),
+                perturbation=self.__perturbation,
+                generator=self.__generator,
+            )
+
+        if self.__activation_cache is not None:
+            for name in self.__activation_cache.get_upstream():
+                replacements[name] = ReplayLayer(
+                    name=name, cache=self.__activation_cache
+                )
+
+        ancestors: Set[str] = {
+            name[:position]
+            for name in replacements
+            for position, char in enumerate(name)
+            if char == "."
+        }
+        new_module = ModulePerturb.__replace(
+            self.__initial_module, replacements, ancestors
         )
 
-        return self.__new_module
+        if self.__activation_cache is not None:
+            self.__activation_cache.attach(new_module)
+
+        return new_module
 
     @staticmethod
-    def __check_base_case(module: nn.Module) -> bool:
+    def __shallow_copy(module: nn.Module) -> nn.Module:
         """
-        Checks if the given module is one of the base case activation
-        functions.
+        Copies a module without copying its children or parameters.
+
+        The dictionaries of children and hooks are copied, so that
+            replacing a child or registering a hook on the copy does not
+            change the original module.
 
         Args:
-            module (nn.Module): The module to check.
+            module (nn.Module): The module to copy.
 
         Returns:
-            bool: True if the module is one of the activation functions,
-                False otherwise.
+            nn.Module: The copy of the module.
         """
-        for act in ModulePerturb.__ACTIVATIONS:
-            if isinstance(module, act):
-                return True
+        module_copy = copy.copy(module)
+        for key, value in vars(module).items():
+            if isinstance(value, dict) and (
+                key == "_modules" or "hooks" in key
+            ):
+                setattr(module_copy, key, value.copy())
 
-        return False
+        return module_copy
 
-    def __base_case(self, module_to_change: nn.Module, key: str) -> None:
+    @staticmethod
+    def __replace(
+        module: nn.Module,
+        replacements: Dict[str, nn.Module],
+        ancestors: Set[str],
+        prefix: str = "",
+    ) -> nn.Module:
         """
-        Replaces the module at the given key in module_to_change with a
-        PerturbationLayer.
+        Recursively copies the modules on the path to the replaced layers
+            and swaps the replaced layers in.
 
         Args:
-            module_to_change (nn.Module): The module
-                in which to replace the layer.
-            key (str): The key corresponding to the layer to be replaced.
-        """
-        new_module = PerturbationLayer(
-            layer=module_to_change._modules[key],  # noqa
-            perturbation=self.__perturbation,
-        )
-
-        module_to_change._modules[key] = new_module  # noqa
-
-    def __go(self, module_to_change: nn.Module, original: nn.Module) -> None:
-        """
-        Recursively traverses the original module and replaces activation
-        functions with PerturbationLayers.
+            module (nn.Module): The module to traverse.
+            replacements (Dict[str, nn.Module]): The new layers by the name
+                of the layer they replace.
+            ancestors (Set[str]): The names of the modules containing
+                a replaced layer.
+            prefix (str, optional): The name of the module in the module
+                tree. Defaults to "".
 
-        Args:
-            module_to_change (nn.Module): The module in which
-                to replace the layers.
-            original (nn.Module): The original module to be traversed.
+        Returns:
+            nn.Module: The copy of the module with the layers replaced.
         """
-        for i, (name, module) in enumerate(original._modules.items()):  # noqa
-            if ModulePerturb.__check_base_case(module):
-                self.__base_case(module_to_change, name)
-            else:
-                self.__go(
-                    module_to_change=module_to_change._modules[name],  # noqa
-                    original=module,
+        new_module = ModulePerturb.__shallow_copy(module)
+        for name, child in module._modules.items():  # noqa
+            full_name = f"{prefix}.{name}" if prefix else name
+            if full_name in replacements:
+                new_module._modules[name] = replacements[full_name]  # noqa
+            elif full_name in ancestors:
+                new_module._modules[name] = ModulePerturb.__replace(  # noqa
+                    child, replacements, ancestors, full_name
                 )
+
+        return new_module
@@ -3,16 +3,22 @@
 import torch
 from torch import nn
 
-import neuroshift.config as conf
 from neuroshift.model.noises.perturbation import Perturbation
 
 
 class PerturbationLayer(nn.Module):
     """
     A module that applies perturbation to the output of a given layer.
+
+    The perturbation runs on the device and in the dtype of the output.
     """
 
-    def __init__(self, layer: nn.Module, perturbation: Perturbation):
+    def __init__(
+        self,
+        layer: nn.Module,
+        perturbation: Perturbation,
+        generator: torch.Generator | None = None,
+    ):
         """
         Initializes a PerturbationLayer object.
 
@@ -20,10 +26,15 @@ class PerturbationLayer(nn.Module):
             layer (nn.Module): The layer to be perturbed.
             perturbation (Perturbation): The perturbation to be applied to
                 the layer.
+            generator (torch.Generator | None, optional): The random number
+                generator to draw the noise from, it has to be on the device
+                of the layer. The global generator is used if None.
+                Defaults to None.
         """
         super().__init__()
         self.__layer: nn.Module = layer
         self.__perturbation: Perturbation = perturbation
+        self.__generator: torch.Generator | None = generator
 
     def forward(self, tensor: torch.Tensor) -> torch.Tensor:
         """
@@ -35,8 +46,6 @@ class PerturbationLayer(nn.Module):
         Returns:
             torch.Tensor: The output tensor after applying perturbation.
         """
-        tensor = self.__layer(tensor)
-
-        return self.__perturbation.apply_to_tensor(tensor.to("cpu")).to(
-            conf.device
+        return self.__perturbation.apply_to_tensor(
+            self.__layer(tensor), generator=self.__generator
         )
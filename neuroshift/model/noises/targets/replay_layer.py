@@ -0,0 +1,41 @@
+"""This module contains the ReplayLayer class."""
+
+from typing import Any, TYPE_CHECKING
+
+from torch import nn
+
+if TYPE_CHECKING:
+    from neuroshift.model.noises.targets.activation_cache import (
+        ActivationCache,
+    )
+
+
+class ReplayLayer(nn.Module):
+    """
+    A module that replaces a layer upstream of the perturbed layers
+        and returns its cached clean output instead of computing it.
+    """
+
+    def __init__(self, name: str, cache: "ActivationCache"):
+        """
+        Initializes a ReplayLayer object.
+
+        Args:
+            name (str): The name of the replaced layer in the module tree.
+            cache (ActivationCache): The cache holding the clean outputs.
+        """
+        super().__init__()
+        self.__name: str = name
+        self.__cache: "ActivationCache" = cache
+
+    def forward(self, *args: Any, **kwargs: Any) -> Any:
+        """
+        Forward pass of the replay layer.
+
+        The inputs are ignored, the cached output of the replaced layer
+            for the current batch is returned.
+
+        Returns:
+            Any: The clean output of the replaced layer.
+        """
+        return self.__cache.replay(self.__name)
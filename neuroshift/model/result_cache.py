@@ -0,0 +1,338 @@
+"""This module contains the ResultCache class."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+from typing_extensions import Self
+
+import neuroshift.config as conf
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.fingerprint import Fingerprint
+from neuroshift.model.noises.perturbation import Perturbation
+
+
+class ResultCache:
+    """
+    A content addressed cache of the results of inference jobs.
+
+    An entry is keyed by the hash of the model file, the hash of the
+        dataset folder, the perturbation with its parameters and the seed,
+        and points to the job ID of the Analytic holding the result.
+        Entries are evicted once the cache grows beyond
+        conf.RESULT_CACHE_SIZE or once they are older than
+        conf.RESULT_CACHE_AGE seconds.
+    """
+
+    __FILE_NAME: str = "results.json"
+    __instance: Self | None = None
+
+    @classmethod
+    def get_instance(cls) -> "ResultCache":
+        """
+        Returns the singleton instance of the ResultCache class.
+        If the instance is new, it loads the cache from the disk.
+
+        Returns:
+            ResultCache: The singleton instance of the ResultCache class.
+        """
+        if cls.__instance is None:
+            cls.__instance = ResultCache()
+
+        return cls.__instance
+
+    def __init__(self) -> None:
+        """
+        Initializes a new instance of the ResultCache class.
+        """
+        self.__lock: threading.Lock = threading.Lock()
+        self.__entries: OrderedDict[str, Dict[str, Any]] = OrderedDict()
+        self.__load()
+
+    def get(
+        self,
+        model: Model,
+        dataset: Dataset,
+        perturbation: Perturbation | None = None,
+        seed: int | None = None,
+        variant: str | None = None,
+        parameter_values: List[Tuple[str, float]] | None = None,
+    ) -> str | None:
+        """
+        Look up the result of an inference job.
+
+        Args:
+            model (Model): The model used for inference.
+            dataset (Dataset): The dataset used for inference.
+            perturbation (Perturbation | None, optional): The perturbation
+                applied during inference. Defaults to None.
+            seed (int | None, optional): The seed of the perturbation.
+                Defaults to None.
+            variant (str | None, optional): A description of the options
+                of the job changing its result. Defaults to None.
+            parameter_values (List[Tuple[str, float]] | None, optional):
+                The values of the parameters of the perturbation the job
+                was created with. The current values are taken if None.
+                Defaults to None.
+
+        Returns:
+            str | None: The job ID of the Analytic holding the result,
+                or None if there is no valid result cached.
+        """
+        entry = self.__create_entry(
+            model, dataset, perturbation, seed, variant, parameter_values
+        )
+        if entry is None:
+            return None
+
+        key = entry["key"]
+        with self.__lock:
+            self.__evict()
+            self.__invalidate(entry)
+            cached = self.__entries.get(key)
+            if cached is None:
+                return None
+
+            analytic = ResultCache.__find_analytic(cached["job_id"])
+            result = analytic.get_result() if analytic is not None else None
+            if analytic is None or (
+                result is not None and not result.is_success()
+            ):
+                del self.__entries[key]
+                self.__save()
+                return None
+
+            self.__entries.move_to_end(key)
+
+            return cached["job_id"]
+
+    def put(
+        self,
+        job_id: str,
+        model: Model,
+        dataset: Dataset,
+        perturbation: Perturbation | None = None,
+        seed: int | None = None,
+        variant: str | None = None,
+        parameter_values: List[Tuple[str, float]] | None = None,
+    ) -> None:
+        """
+        Store the job ID of an inference job in the cache.
+
+        Nothing is stored if the result is not reproducible, i.e. if the
+            model or dataset are not stored on disk or if a perturbation
+            is applied without a seed.
+
+        Args:
+            job_id (str): The job ID of the inference job.
+            model (Model): The model used for inference.
+            dataset (Dataset): The dataset used for inference.
+            perturbation (Perturbation | None, optional): The perturbation
+                applied during inference. Defaults to None.
+            seed (int | None, optional): The seed of the perturbation.
+                Defaults to None.
+            variant (str | None, optional): A description of the options
+                of the job changing its result. Defaults to None.
+            parameter_values (List[Tuple[str, float]] | None, optional):
+                The values of the parameters of the perturbation the job
+                was created with. The current values are taken if None.
+                Defaults to None.
+        """
+        entry = self.__create_entry(
+            model, dataset, perturbation, seed, variant, parameter_values
+        )
+        if entry is None:
+            return
+
+        entry["job_id"] = job_id
+        entry["created"] = time.time()
+        with self.__lock:
+            self.__invalidate(entry)
+            self.__entries[entry["key"]] = entry
+            self.__entries.move_to_end(entry["key"])
+            self.__evict()
+            self.__save()
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__save()
+
+    def __len__(self) -> int:
+        """
+        Get the number of entries in the cache.
+
+        Returns:
+            int: The number of entries in the cache.
+        """
+        return len(self.__entries)
+
+    @staticmethod
+    def __find_analytic(job_id: str) -> Analytic | None:
+        """
+        Find the analytic of a job, loading it from the disk if it is
+            saved but not loaded yet.
+
+        Args:
+            job_id (str): The job ID of the analytic.
+
+        Returns:
+            Analytic | None: The analytic, or None if it is neither in
+                memory nor saved.
+        """
+        analytics = Analytics.get_instance()
+        analytic = analytics.get_analytic(job_id)
+        if analytic is not None:
+            return analytic
+
+        for record in analytics.get_saved_records():
+            if record.get_job_id() == job_id:
+                return analytics.load_saved(record)
+
+        return None
+
+    @staticmethod
+    def __create_entry(
+        model: Model,
+        dataset: Dataset,
+        perturbation: Perturbation | None,
+        seed: int | None,
+        variant: str | None,
+        parameter_values: List[Tuple[str, float]] | None,
+    ) -> Dict[str, Any] | None:
+        """
+        Create the cache entry describing an inference job.
+
+        Args:
+            model (Model): The model used for inference.
+            dataset (Dataset): The dataset used for inference.
+            perturbation (Perturbation | None): The perturbation
+                applied during inference.
+            seed (int | None): The seed of the perturbation.
+            variant (str | None): A description of the options of the job
+                changing its result.
+            parameter_values (List[Tuple[str, float]] | None): The values
+                of the parameters of the perturbation, or None for the
+                current values.
+
+        Returns:
+            Dict[str, Any] | None: The entry without job ID,
+                or None if the job cannot be cached.
+        """
+        if perturbation is not None and seed is None:
+            return None
+
+        model_hash = Fingerprint.of_model(model)
+        dataset_hash = Fingerprint.of_dataset(dataset)
+        if model_hash is None or dataset_hash is None:
+            return None
+
+        description: Dict[str, Any] = {
+            "model": model_hash,
+            "dataset": dataset_hash,
+            "perturbation": None,
+            "seed": None,
+            "variant": variant,
+        }
+        if perturbation is not None:
+            description["perturbation"] = Fingerprint.describe_perturbation(
+                perturbation, parameter_values
+            )
+            description["seed"] = seed
+
+        key = hashlib.sha256(
+            json.dumps(description, sort_keys=True).encode()
+        ).hexdigest()
+
+        return {
+            "key": key,
+            "model_file": model.get_file_name(),
+            "model_hash": model_hash,
+            "dataset_file": dataset.get_file_name(),
+            "dataset_hash": dataset_hash,
+        }
+
+    def __invalidate(self, entry: Dict[str, Any]) -> None:
+        """
+        Remove the entries made with an older version of the model file
+            or dataset folder of entry.
+
+        Args:
+            entry (Dict[str, Any]): The entry holding the current hashes.
+        """
+        stale = [
+            key
+            for key, cached in self.__entries.items()
+            if (
+                cached["model_file"] == entry["model_file"]
+                and cached["model_hash"] != entry["model_hash"]
+            )
+            or (
+                cached["dataset_file"] == entry["dataset_file"]
+                and cached["dataset_hash"] != entry["dataset_hash"]
+            )
+        ]
+
+        for key in stale:
+            del self.__entries[key]
+
+        if stale:
+            self.__save()
+
+    def __evict(self) -> None:
+        """
+        Remove the expired entries and the least recently used entries
+            exceeding the size of the cache.
+        """
+        expiry = time.time() - conf.RESULT_CACHE_AGE
+        expired = [
+            key
+            for key, cached in self.__entries.items()
+            if cached["created"] < expiry
+        ]
+
+        for key in expired:
+            del self.__entries[key]
+
+        while len(self.__entries) > max(conf.RESULT_CACHE_SIZE, 0):
+            self.__entries.popitem(last=False)
+
+    def __save(self) -> None:
+        """
+        Save the cache to disk.
+        """
+        try:
+            os.makedirs(conf.CACHE_PATH, exist_ok=True)
+            with open(
+                os.path.join(conf.CACHE_PATH, ResultCache.__FILE_NAME),
+                "w",
+                encoding="utf8",
+            ) as f:
+                json.dump(list(self.__entries.values()), f)
+        except OSError:
+            pass
+
+    def __load(self) -> None:
+        """
+        Load the cache from disk.
+        """
+        try:
+            with open(
+                os.path.join(conf.CACHE_PATH, ResultCache.__FILE_NAME),
+                encoding="utf8",
+            ) as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+
+        for entry in entries:
+            self.__entries[entry["key"]] = entry
@@ -35,6 +35,25 @@ class Utils:
         base64_bytes = base64.b64encode(buffer.getvalue())
         return f"data:image/png;base64, {base64_bytes.decode('utf-8')}"
 
+    @staticmethod
+    def image_to_thumbnail_url(image: Image, size: int) -> str:
+        """
+        Converts an image to the base64-encoded URL of a thumbnail
+            fitting in a square.
+
+        Args:
+            image (Image): The input image.
+            size (int): The side of the square in pixels,
+                smaller images are not enlarged.
+
+        Returns:
+            str: The base64-encoded URL of the thumbnail.
+        """
+        thumbnail = image.copy()
+        thumbnail.thumbnail((size, size))
+
+        return Utils.image_to_url(thumbnail)
+
     @staticmethod
     def tensor_to_image(tensor: torch.Tensor) -> Image:
         """
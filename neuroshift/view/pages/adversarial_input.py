@@ -1,8 +1,8 @@
 """This module contains the AdversarialInput class."""
 
-import time
-from typing import List
+from typing import List, Tuple
 
+import pandas as pd
 import streamlit as st
 
 from neuroshift.controller.analytics_controller import AnalyticsController
@@ -15,13 +15,21 @@ from neuroshift.model.data.dataset import Image
 from neuroshift.view.pages.abstract_page import AbstractPage
 from neuroshift.view.pages.components.gallery_component import GalleryComponent
 from neuroshift.model.noises.adversarial_attack.attack import Attack
-from neuroshift.model.noises.adversarial_attack import FastGradientSignMethod
+from neuroshift.model.noises.adversarial_attack import (
+    BasicIterativeMethod,
+    FastGradientSignMethod,
+    ProjectedGradientDescent,
+)
 
 
 class AdversarialInput(AbstractPage):
     """A class representing the Adversarial Input page."""
 
-    __ATTACKS: List[Attack] = [FastGradientSignMethod.get_instance()]
+    __ATTACKS: List[Attack] = [
+        FastGradientSignMethod.get_instance(),
+        BasicIterativeMethod.get_instance(),
+        ProjectedGradientDescent.get_instance(),
+    ]
 
     def __init__(self) -> None:
         """
@@ -32,7 +40,18 @@ class AdversarialInput(AbstractPage):
         )
 
         self.__gallery_component: GalleryComponent = GalleryComponent()
-        self.__selected_attack: Attack = FastGradientSignMethod.get_instance()
+        self.__selected_attack: Attack = self._session.get_add(
+            key="selected_attack",
+            default=FastGradientSignMethod.get_instance(),
+        )
+        self.__dataset_attack: Tuple[str, str] | None = self._session.get_add(
+            key="dataset_attack_adversarial", default=None
+        )
+        self.__epsilon_sweep: List[Tuple[float, str]] | None = (
+            self._session.get_add(
+                key="epsilon_sweep_adversarial", default=None
+            )
+        )
 
     def render(self) -> None:
         """
@@ -43,7 +62,9 @@ class AdversarialInput(AbstractPage):
         super().render()
         self._render_header()
 
-        gallery_tab, comparison_tab = st.tabs(tabs=["Gallery", "Comparison"])
+        gallery_tab, comparison_tab, dataset_tab, sweep_tab = st.tabs(
+            tabs=["Gallery", "Comparison", "Dataset", "Epsilon Sweep"]
+        )
 
         with gallery_tab:
             self.__gallery_component.render()
@@ -51,6 +72,12 @@ class AdversarialInput(AbstractPage):
         with comparison_tab:
             self.__render_comparison()
 
+        with dataset_tab:
+            self.__render_dataset_attack()
+
+        with sweep_tab:
+            self.__render_epsilon_sweep()
+
         self.__render_sidebar()
 
     def __render_sidebar(self) -> None:
@@ -61,11 +88,13 @@ class AdversarialInput(AbstractPage):
             image=self.__gallery_component.get_preview_image().get_path(),
             width=200,
         )
-        st.sidebar.selectbox(
+        self.__selected_attack = st.sidebar.selectbox(
             label="Select Attack",
             options=AdversarialInput.__ATTACKS,
+            index=AdversarialInput.__ATTACKS.index(self.__selected_attack),
             format_func=lambda attack: attack.get_name(),
         )
+        self._session["selected_attack"] = self.__selected_attack
 
         for parameter in self.__selected_attack.get_parameters():
             st.sidebar.slider(
@@ -74,9 +103,11 @@ class AdversarialInput(AbstractPage):
                 max_value=parameter.get_max_value(),
                 value=parameter.get_value(),
                 step=parameter.get_step(),
-                key=f"slider-{parameter.get_name()}",
+                key=f"slider-{self.__selected_attack}-{parameter.get_name()}",
                 on_change=lambda param: param.set_value(
-                    self._session[f"slider-{param.get_name()}"]
+                    self._session[
+                        f"slider-{self.__selected_attack}-{param.get_name()}"
+                    ]
                 ),
                 args=(parameter,),
             )
@@ -90,6 +121,36 @@ class AdversarialInput(AbstractPage):
             key="adversarial_input_apply_button",
         )
 
+        st.sidebar.button(
+            label="Apply to Dataset",
+            use_container_width=True,
+            on_click=self.__invoke_dataset_attack,
+            key="adversarial_input_apply_dataset_button",
+        )
+
+        if isinstance(self.__selected_attack, FastGradientSignMethod):
+            st.sidebar.slider(
+                label="Sweep epsilons",
+                min_value=0.0,
+                max_value=1.0,
+                value=(0.0, 0.3),
+                step=0.01,
+                key="adversarial_input_sweep_range",
+            )
+            st.sidebar.number_input(
+                label="Sweep steps",
+                min_value=2,
+                max_value=50,
+                value=7,
+                key="adversarial_input_sweep_steps",
+            )
+            st.sidebar.button(
+                label="Sweep Epsilon on Dataset",
+                use_container_width=True,
+                on_click=self.__invoke_epsilon_sweep,
+                key="adversarial_input_sweep_button",
+            )
+
     def __render_comparison(self) -> None:
         """
         Renders the comparison section of the page.
@@ -148,6 +209,129 @@ class AdversarialInput(AbstractPage):
                     "first."
                 )
 
+    def __render_dataset_attack(self) -> None:
+        """
+        Renders the accuracy on the clean and the adversarial images of the
+        last attack on the whole dataset.
+        """
+        if self.__dataset_attack is None:
+            st.info(
+                "No attack on the dataset given. Please apply the attack "
+                "to the dataset first."
+            )
+            return
+
+        clean_job_id, attack_job_id = self.__dataset_attack
+        clean = AnalyticsController.get_analytics(clean_job_id)
+        adversarial = AnalyticsController.get_analytics(attack_job_id)
+        if clean is None or adversarial is None:
+            return
+
+        clean_accuracy = 100 * clean.get_overall_accuracy()
+        adversarial_accuracy = 100 * adversarial.get_overall_accuracy()
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric(label="Clean accuracy", value=f"{clean_accuracy:.2f}%")
+
+        with col2:
+            st.metric(
+                label="Adversarial accuracy",
+                value=f"{adversarial_accuracy:.2f}%",
+                delta=f"{adversarial_accuracy - clean_accuracy:.2f}%",
+            )
+
+    def __render_epsilon_sweep(self) -> None:
+        """
+        Renders the accuracy on the adversarial images against epsilon of
+        the last epsilon sweep on the whole dataset.
+        """
+        if self.__epsilon_sweep is None:
+            st.info(
+                "No epsilon sweep given. Please sweep epsilon on the dataset "
+                "first."
+            )
+            return
+
+        accuracies = []
+        for epsilon, job_id in self.__epsilon_sweep:
+            analytic = AnalyticsController.get_analytics(job_id)
+            if analytic is None:
+                return
+            accuracies.append((epsilon, 100 * analytic.get_overall_accuracy()))
+
+        st.line_chart(
+            data=pd.DataFrame(accuracies, columns=["Epsilon", "Accuracy (%)"]),
+            x="Epsilon",
+            y="Accuracy (%)",
+        )
+
+    def __invoke_epsilon_sweep(self) -> None:
+        """
+        Invokes the Fast Gradient Sign Method on every image of the selected
+        dataset for evenly spaced epsilons.
+        """
+        low, high = self._session["adversarial_input_sweep_range"]
+        steps = int(self._session["adversarial_input_sweep_steps"])
+        epsilons = [
+            low + (high - low) * step / (steps - 1) for step in range(steps)
+        ]
+
+        self.__epsilon_sweep = PerturbationController.start_epsilon_sweep(
+            epsilons=epsilons
+        )
+        self._session["epsilon_sweep_adversarial"] = self.__epsilon_sweep
+
+        analytic: Analytic | None = None
+        for analytic in AnalyticsController.follow_progress(
+            self.__epsilon_sweep[0][1]
+        ):
+            pass
+
+        if analytic is None:
+            st.toast(
+                body="Error: the epsilon sweep job is unknown.", icon="❌"
+            )
+            return
+
+        result: JobResult = analytic.get_result()
+        if not result.is_success():
+            st.toast(body=f"Error: {result.get_error_msg()}", icon="❌")
+        else:
+            st.toast(
+                body="Successfully swept epsilon on the dataset!",
+                icon="✅",
+            )
+
+    def __invoke_dataset_attack(self) -> None:
+        """
+        Invokes the adversarial attack on every image of the selected dataset.
+        """
+        clean_job_id, attack_job_id = (
+            PerturbationController.start_dataset_attack(
+                attack=self.__selected_attack
+            )
+        )
+        self.__dataset_attack = (clean_job_id, attack_job_id)
+        self._session["dataset_attack_adversarial"] = self.__dataset_attack
+
+        analytic: Analytic | None = None
+        for analytic in AnalyticsController.follow_progress(attack_job_id):
+            pass
+
+        if analytic is None:
+            st.toast(body="Error: the attack job is unknown.", icon="❌")
+            return
+
+        result: JobResult = analytic.get_result()
+        if not result.is_success():
+            st.toast(body=f"Error: {result.get_error_msg()}", icon="❌")
+        else:
+            st.toast(
+                body="Successfully attacked the dataset!",
+                icon="✅",
+            )
+
     def __invoke_inference(self, image: Image) -> None:
         """
         Invokes the adversarial attack inference.
@@ -160,10 +344,13 @@ class AdversarialInput(AbstractPage):
             attack=self.__selected_attack,
         )
 
-        analytic: Analytic | None = AnalyticsController.get_analytics(job_id)
-        while analytic is None or not analytic.is_done():
-            time.sleep(0.1)
-            analytic = AnalyticsController.get_analytics(job_id)
+        analytic: Analytic | None = None
+        for analytic in AnalyticsController.follow_progress(job_id):
+            pass
+
+        if analytic is None:
+            st.toast(body="Error: the attack job is unknown.", icon="❌")
+            return
 
         result: JobResult = analytic.get_result()
         if not result.is_success():
@@ -6,6 +6,7 @@ import streamlit as st
 
 from neuroshift.controller.analytics_controller import AnalyticsController
 from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.metrics_snapshot import MetricsSnapshot
 from neuroshift.view.pages.components.analytics_container import (
     AnalyticsContainer,
 )
@@ -70,10 +71,10 @@ class AnalyticsComponent(AnalyticsContainer):
             self.__reference_analytics is not None
             and self.__show_reference_analytics
         ):
-            self.__render_accuracy()
-            self.__render_precision()
-            self.__render_recall()
-            self.__render_f1()
+            self.__render_metric("Accuracy", MetricsSnapshot.ACCURACY)
+            self.__render_metric("Precision", MetricsSnapshot.PRECISION)
+            self.__render_metric("Recall", MetricsSnapshot.RECALL)
+            self.__render_metric("F1-score", MetricsSnapshot.F1)
 
     def set_analytics(self, analytics: Analytic) -> None:
         """
@@ -84,149 +85,112 @@ class AnalyticsComponent(AnalyticsContainer):
         """
         self._analytics = analytics
 
-    def __render_accuracy(self) -> None:
+    def __render_metric(self, title: str, metric: str) -> None:
         """
-        Render the accuracy metric.
+        Render a metric.
 
-        This method renders the accuracy metric by displaying the overall
-        accuracy and the overall reference accuracy if applicable.
-        """
-        st.markdown("### Accuracy")
-
-        if self._analytics is not None:
-            st.write(
-                f"Overall accuracy: "
-                f"{100 * self._analytics.get_overall_accuracy():.2f}%"
-            )
-        if (
-            self.__reference_analytics is not None
-            and self.__show_reference_analytics
-        ):
-            overall_reference_accuracy = (
-                100 * self.__reference_analytics.get_overall_accuracy()
-            )
-            st.write(
-                f"Overall reference accuracy: "
-                f"{overall_reference_accuracy:.2f}%"
-            )
-
-        barchart_accuracy_fig: px.bar = self.__create_plotly_figure(
-            method_name="get_class_accuracy"
-        )
-        st.plotly_chart(figure_or_data=barchart_accuracy_fig)
-
-    def __render_precision(self) -> None:
-        """
-        Render the precision metric.
+        This method renders the overall metric, the overall reference metric
+        if applicable and a bar chart of the metric of every class.
 
-        This method renders the precision metric by displaying the overall
-        precision and the overall reference precision if applicable.
+        Args:
+            title (str): The displayed name of the metric.
+            metric (str): The name of the metric in the metrics snapshot.
         """
-        st.markdown("### Precision")
+        st.markdown(f"### {title}")
 
         if self._analytics is not None:
-            st.write(
-                f"Overall precision: "
-                f"{100 * self._analytics.get_overall_precision():.2f}%"
-            )
-        if (
-            self.__reference_analytics is not None
-            and self.__show_reference_analytics
-        ):
-            overall_reference_precision = (
-                100 * self.__reference_analytics.get_overall_precision()
+            overall = 100 * self._analytics.get_metrics().get_overall(metric)
+            st.write(f"Overall {title.lower()}: {overall:.2f}%")
+        if self.__is_reference_shown():
+            overall_reference = (
+                100
+                * self.__reference_analytics.get_metrics().get_overall(metric)
             )
             st.write(
-                f"Overall reference precision: "
-                f"{overall_reference_precision:.2f}%"
+                f"Overall reference {title.lower()}: "
+                f"{overall_reference:.2f}%"
             )
 
-        barchart_precision_fig: px.bar = self.__create_plotly_figure(
-            method_name="get_class_precision"
-        )
-        st.plotly_chart(figure_or_data=barchart_precision_fig)
+        st.plotly_chart(figure_or_data=self.__get_plotly_figure(metric))
 
-    def __render_recall(self) -> None:
+    def __is_reference_shown(self) -> bool:
         """
-        Render the recall metric.
+        Check if the reference analytic is shown.
 
-        This method renders the recall metric by displaying the overall
-        recall and the overall reference recall if applicable.
+        Returns:
+            bool: True if there is a reference analytic and it is shown,
+                False otherwise.
         """
-        st.markdown("### Recall")
-
-        if self._analytics is not None:
-            st.write(
-                f"Overall recall: "
-                f"{100 * self._analytics.get_overall_recall():.2f}%"
-            )
-        if (
+        return (
             self.__reference_analytics is not None
             and self.__show_reference_analytics
-        ):
-            overall_reference_recall = (
-                100 * self.__reference_analytics.get_overall_precision()
-            )
-            st.write(
-                f"Overall reference recall: "
-                f"{overall_reference_recall:.2f}%"
-            )
-
-        barchart_recall_fig: px.bar = self.__create_plotly_figure(
-            method_name="get_class_recall"
         )
-        st.plotly_chart(figure_or_data=barchart_recall_fig)
 
-    def __render_f1(self) -> None:
+    def __get_plotly_figure(self, metric: str) -> px.bar:
         """
-        Render the F1-score metric.
+        Get the bar chart of a metric, which is only built again when the
+            analytic or the reference analytic got new predictions.
 
-        This method renders the F1-score metric by displaying the overall
-        F1-score and the overall reference F1-score if applicable.
-        """
-        st.markdown("### F1-score")
+        Args:
+            metric (str): The name of the metric in the metrics snapshot.
 
-        if self._analytics is not None:
-            st.write(
-                f"Overall F1-score: "
-                f"{100 * self._analytics.get_overall_f1():.2f}%"
-            )
-        if (
-            self.__reference_analytics is not None
-            and self.__show_reference_analytics
-        ):
-            overall_reference_f1 = (
-                100 * self.__reference_analytics.get_overall_precision()
+        Returns:
+            px.bar: A plotly bar chart that displays the metric.
+        """
+        snapshot = (
+            None if self._analytics is None else self._analytics.get_metrics()
+        )
+        reference_snapshot = (
+            self.__reference_analytics.get_metrics()
+            if self.__is_reference_shown()
+            else None
+        )
+        signature = tuple(
+            (analytic.job_id, metrics.get_version())
+            for analytic, metrics in (
+                (self._analytics, snapshot),
+                (self.__reference_analytics, reference_snapshot),
             )
+            if metrics is not None
+        )
 
-            st.write(
-                f"Overall reference F1-score: " f"{overall_reference_f1:.2f}%"
-            )
+        figures = self._session.get_add(
+            key=f"{self.page_name}_figures", default={}
+        )
+        if metric in figures and figures[metric][0] == signature:
+            return figures[metric][1]
 
-        barchart_recall_fig: px.bar = self.__create_plotly_figure(
-            method_name="get_class_f1"
+        figure = self.__create_plotly_figure(
+            metric, snapshot, reference_snapshot
         )
-        st.plotly_chart(figure_or_data=barchart_recall_fig)
+        figures[metric] = (signature, figure)
 
-    def __create_plotly_figure(self, method_name: str) -> px.bar:
+        return figure
+
+    @staticmethod
+    def __create_plotly_figure(
+        metric: str,
+        snapshot: MetricsSnapshot | None,
+        reference_snapshot: MetricsSnapshot | None,
+    ) -> px.bar:
         """
-        Create a plotly figure that displays the analytics for this sub-page.
+        Create a plotly figure that displays a metric for this sub-page.
 
         Args:
-            method_name (str): The name of the method to retrieve the metric.
+            metric (str): The name of the metric in the metrics snapshot.
+            snapshot (MetricsSnapshot | None): The metrics of the analytic.
+            reference_snapshot (MetricsSnapshot | None): The metrics of the
+                reference analytic, if it is shown.
 
         Returns:
             px.bar: A plotly bar chart that displays the analytics for this
                 sub-page.
         """
-        analytics_classes = (
-            [] if self._analytics is None else self._analytics.get_classes()
-        )
+        analytics_classes = [] if snapshot is None else snapshot.get_classes()
         reference_classes = (
             []
-            if self.__reference_analytics is None
-            or not self.__show_reference_analytics
-            else self.__reference_analytics.get_classes()
+            if reference_snapshot is None
+            else reference_snapshot.get_classes()
         )
         classes = analytics_classes + [
             name for name in reference_classes if name not in analytics_classes
@@ -234,28 +198,15 @@ class AnalyticsComponent(AnalyticsContainer):
         columns = ["State"] + classes
 
         data = []
-        if self._analytics is not None:
-            analytics_data = ["Selected"]
-            for class_name in classes:
-                method = getattr(self._analytics, method_name)
-                metric = method(class_name)
-                class_metric = metric if metric is not None else 0
-                analytics_data.append(class_metric)
-
-            data.append(analytics_data)
-
-        if (
-            self.__reference_analytics is not None
-            and self.__show_reference_analytics
-        ):
-            reference_data = ["Reference"]
-            for class_name in classes:
-                method = getattr(self.__reference_analytics, method_name)
-                metric = method(class_name)
-                class_metric = metric if metric is not None else 0
-                reference_data.append(class_metric)
-
-            data.append(reference_data)
+        if snapshot is not None:
+            data.append(
+                ["Selected"] + snapshot.get_class_vector(metric, classes)
+            )
+        if reference_snapshot is not None:
+            data.append(
+                ["Reference"]
+                + reference_snapshot.get_class_vector(metric, classes)
+            )
 
         df = pd.DataFrame(data, columns=columns)
 
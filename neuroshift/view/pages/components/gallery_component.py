@@ -10,6 +10,7 @@ from neuroshift.controller.database_controller import DatabaseController
 from neuroshift.model.data.dataset import Dataset
 from neuroshift.model.data.image import Image
 from neuroshift.model.data.prediction import Prediction
+from neuroshift.model.utils import Utils
 from neuroshift.view.session import Session
 
 
@@ -17,8 +18,14 @@ class GalleryComponent:
     """
     The GalleryComponent class represents a sub-page component for displaying a
     gallery of images.
+
+    Only the visible window of the dataset is fetched, and the thumbnails
+    of the images are cached in the session, so that loading more images
+    only encodes the new ones.
     """
 
+    THUMBNAIL_SIZE: int = 100
+
     def __init__(self) -> None:
         """
         Construct the gallery sub-page component.
@@ -40,7 +47,11 @@ class GalleryComponent:
             )
             self.__dataset = DatabaseController.get_selected_dataset()
             self.__session["preview_image"] = self.__dataset[0]
+            self.__session["gallery_thumbnails"] = []
 
+        self.__thumbnails: List[Tuple[str, str]] = self.__session.get_add(
+            key="gallery_thumbnails", default=[]
+        )
         self.__preview_image: Image = self.__session.get_add(
             key="preview_image", default=self.__dataset[0]
         )
@@ -171,21 +182,33 @@ class GalleryComponent:
 
     def __get_image_batch(self) -> Tuple[List[str], List[str]]:
         """
-        Get the first batch of images and titles.
+        Get the thumbnails and titles of the visible window of images.
+
+        Only the images of the window which are not cached yet are encoded.
 
         Returns:
-            Tuple[List[str], List[str]]: A tuple containing a list of image
-                paths and a list of image titles.
-        """
-        images: List[str] = []
-        titles: List[str] = []
+            Tuple[List[str], List[str]]: A tuple containing a list of
+                thumbnail URLs and a list of image titles.
+        """
+        window = min(self.__batch_size, len(self.__dataset))
+
+        for image in self.__dataset.get_images(len(self.__thumbnails), window):
+            self.__thumbnails.append(
+                (
+                    Utils.image_to_thumbnail_url(
+                        Utils.tensor_to_image(image.get_tensor().cpu()),
+                        self.THUMBNAIL_SIZE,
+                    ),
+                    image.get_label(),
+                )
+            )
 
-        for _, image_list in self.__dataset:
-            for image in image_list:
-                images.append(image.get_path())
-                titles.append(image.get_label())
+        visible = self.__thumbnails[:window]
 
-        return images[: self.__batch_size], titles[: self.__batch_size]
+        return (
+            [thumbnail for thumbnail, _ in visible],
+            [title for _, title in visible],
+        )
 
     def __increase_batch_size(self) -> None:
         """
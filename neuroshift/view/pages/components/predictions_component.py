@@ -16,7 +16,7 @@ class PredictionsComponent(AnalyticsContainer):
 
     This component displays the predictions made by the analytics module.
     It renders the predicted images along with the confidence and the predicted
-    class.
+    class, one page at a time, optionally filtered and sorted.
     """
 
     SUCCESS_IMAGE_STYLE = """
@@ -35,6 +35,12 @@ class PredictionsComponent(AnalyticsContainer):
     border: 5px solid #B8293D;
     """
 
+    PAGE_SIZE: int = 20
+    COLUMN_COUNT: int = 4
+    ALL_CLASSES: str = "All classes"
+    DATASET_ORDER: str = "Dataset order"
+    LOWEST_CONFIDENCE: str = "Lowest confidence first"
+
     def __init__(self, page_name: str) -> None:
         """
         Construct the predictions sub-page component.
@@ -43,15 +49,17 @@ class PredictionsComponent(AnalyticsContainer):
             page_name (str): The name of the page.
         """
         super().__init__(page_name)
-        self.__predictions: List[Prediction] = (
-            []
-            if self._analytics is None
-            else self._analytics.get_predictions()
+        self.__page: int = self._session.get_add(
+            key=f"{page_name}_predictions_page", default=1
         )
 
     def render(self) -> None:
         """
         Renders the predictions component.
+
+        Only the predictions of the selected page are rendered, the filters
+            and the pagination are applied to the indices of the
+            predictions of the analytic.
         """
         if self._analytics is None:
             st.info(
@@ -59,11 +67,67 @@ class PredictionsComponent(AnalyticsContainer):
             )
             return
 
-        column_count = 4
-        columns = st.columns(column_count, gap="large")
+        indices = self.__render_filters()
+        page_count = max(
+            (len(indices) + self.PAGE_SIZE - 1) // self.PAGE_SIZE, 1
+        )
+        self.__page = min(self.__page, page_count)
+
+        page = st.number_input(
+            label=f"Page (of {page_count}, {len(indices)} predictions)",
+            min_value=1,
+            max_value=page_count,
+            value=self.__page,
+            step=1,
+        )
+        self.__page = int(page)
+        self._session[f"{self.page_name}_predictions_page"] = self.__page
+
+        first = (self.__page - 1) * self.PAGE_SIZE
+        self.__render_predictions(indices[first : first + self.PAGE_SIZE])
+
+    def __render_filters(self) -> List[int]:
+        """
+        Renders the filters of the predictions.
+
+        Returns:
+            List[int]: The indices of the predictions matching the filters.
+        """
+        wrong_column, class_column, order_column = st.columns(3)
+
+        wrong_only = wrong_column.checkbox(
+            label="Only wrong predictions",
+            key=f"{self.page_name}_predictions_wrong_only",
+        )
+        class_name = class_column.selectbox(
+            label="Class",
+            options=[self.ALL_CLASSES, *self._analytics.get_classes()],
+            key=f"{self.page_name}_predictions_class",
+        )
+        order = order_column.selectbox(
+            label="Order",
+            options=[self.DATASET_ORDER, self.LOWEST_CONFIDENCE],
+            key=f"{self.page_name}_predictions_order",
+        )
+
+        return self._analytics.find_predictions(
+            wrong_only=wrong_only,
+            class_name=None if class_name == self.ALL_CLASSES else class_name,
+            lowest_confidence_first=order == self.LOWEST_CONFIDENCE,
+        )
+
+    def __render_predictions(self, indices: List[int]) -> None:
+        """
+        Renders the predictions of a page.
+
+        Args:
+            indices (List[int]): The indices of the predictions to render.
+        """
+        columns = st.columns(self.COLUMN_COUNT, gap="large")
 
-        for index, prediction in enumerate(self.__predictions):
-            column = columns[index % column_count]
+        for position, index in enumerate(indices):
+            prediction: Prediction = self._analytics.get_prediction(index)
+            column = columns[position % self.COLUMN_COUNT]
             if prediction.is_correct():
                 style = self.SUCCESS_IMAGE_STYLE
             else:
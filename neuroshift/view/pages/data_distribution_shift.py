@@ -1,18 +1,23 @@
 """This module contains the DataDistributionShift class."""
 
-import time
-from typing import List
+from typing import List, Tuple
 
+import pandas as pd
 import streamlit as st
 from streamlit.elements.empty import EmptyMixin
 
 from neuroshift.controller.analytics_controller import AnalyticsController
+from neuroshift.controller.database_controller import DatabaseController
 from neuroshift.controller.perturbation_controller import (
     PerturbationController,
 )
 from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.model import Model
 from neuroshift.model.jobs.job_result import JobResult
 from neuroshift.model.noises.perturbation import Perturbation
+from neuroshift.model.noises.composite_perturbation import (
+    CompositePerturbation,
+)
 from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
 from neuroshift.model.noises.multiplicative_gaussian import (
     MultiplicativeGaussian,
@@ -82,6 +87,9 @@ class DataDistributionShift(AbstractPage):
         self.__selected_noise: Perturbation = self._session.get_add(
             key="selected_noise_dds", default=AdditiveGaussian.get_instance()
         )
+        self.__model_comparison: List[Tuple[str, str]] | None = (
+            self._session.get_add(key="model_comparison_dds", default=None)
+        )
 
     def render(self) -> None:
         """
@@ -93,8 +101,8 @@ class DataDistributionShift(AbstractPage):
         super().render()
         self._render_header(save_button=True)
 
-        gallery_tab, analytics_tab, predictions_tab = st.tabs(
-            ["Gallery", "Analytics", "Predictions"]
+        gallery_tab, analytics_tab, predictions_tab, models_tab = st.tabs(
+            ["Gallery", "Analytics", "Predictions", "Models"]
         )
 
         with gallery_tab:
@@ -106,6 +114,9 @@ class DataDistributionShift(AbstractPage):
         with predictions_tab:
             self.__predictions_component.render()
 
+        with models_tab:
+            self.__render_model_comparison()
+
         self.__render_sidebar()
 
     def __render_sidebar(self) -> None:
@@ -114,13 +125,7 @@ class DataDistributionShift(AbstractPage):
         """
         st.sidebar.text("Selected Image")
 
-        st.sidebar.image(
-            image=PerturbationController.apply_perturbation_to_image(
-                image=self.__gallery_component.get_preview_image(),
-                perturbation=self.__selected_noise,
-            ),
-            width=200,
-        )
+        preview_placeholder = st.sidebar.empty()
 
         selectbox_value = st.sidebar.selectbox(
             label="Select Noise",
@@ -148,6 +153,76 @@ class DataDistributionShift(AbstractPage):
                 args=(parameter,),
             )
 
+        chained_noises: List[Perturbation] = st.sidebar.multiselect(
+            label="Chain noises",
+            options=[
+                noise
+                for noise in DataDistributionShift.NOISES
+                if not isinstance(noise, type(self.__selected_noise))
+            ],
+            format_func=lambda noise: noise.get_name(),
+            help="The noises are applied in order after the selected noise.",
+            key="chained_noises_dds",
+        )
+        for noise in chained_noises:
+            noise.set_target(Target.DATASET)
+            for parameter in noise.get_parameters():
+                key = f"slider-{noise.get_name()}-{parameter.get_name()}"
+                st.sidebar.slider(
+                    label=f"{noise.get_name()}: {parameter.get_name()}",
+                    min_value=parameter.get_min_value(),
+                    max_value=parameter.get_max_value(),
+                    value=parameter.get_value(),
+                    step=parameter.get_step(),
+                    key=key,
+                    on_change=lambda param, key: param.set_value(
+                        self._session[key]
+                    ),
+                    args=(parameter, key),
+                )
+
+        perturbation: Perturbation = self.__selected_noise
+        if chained_noises:
+            perturbation = CompositePerturbation(
+                [self.__selected_noise] + chained_noises
+            )
+
+        preview_placeholder.image(
+            image=PerturbationController.apply_perturbation_to_image(
+                image=self.__gallery_component.get_preview_image(),
+                perturbation=perturbation,
+            ),
+            width=200,
+        )
+
+        compared_models = st.sidebar.multiselect(
+            label="Compare with models",
+            options=[
+                model
+                for model in DatabaseController.get_models()
+                if not model.is_selected()
+            ],
+            format_func=lambda model: model.get_name(),
+            help="The models are evaluated on the same perturbed images.",
+            key="compared_models_dds",
+        )
+
+        fixed_seed = st.sidebar.checkbox(
+            label="Fixed seed",
+            value=False,
+            help="A new random noise is drawn for every run otherwise.",
+            key="fixed_seed_dds",
+        )
+
+        seed = st.sidebar.number_input(
+            label="Seed",
+            min_value=0,
+            value=0,
+            disabled=not fixed_seed,
+            help="Runs with the same seed and settings reuse their result.",
+            key="seed_dds",
+        )
+
         placeholder = st.sidebar.empty()
 
         st.sidebar.button(
@@ -156,13 +231,46 @@ class DataDistributionShift(AbstractPage):
             use_container_width=True,
             on_click=self.__invoke_inference,
             args=(
-                self.__selected_noise,
+                perturbation,
                 placeholder,
+                compared_models,
+                int(seed) if fixed_seed else None,
             ),
         )
 
+    def __render_model_comparison(self) -> None:
+        """
+        Renders the accuracy of every model of the last comparison of
+        models on the same perturbed dataset.
+        """
+        if self.__model_comparison is None:
+            st.info(
+                "No comparison given. Please select models to compare with "
+                "and apply the noise to the dataset first."
+            )
+            return
+
+        accuracies = []
+        for model_name, job_id in self.__model_comparison:
+            analytic = AnalyticsController.get_analytics(job_id)
+            if analytic is None:
+                return
+            accuracies.append(
+                (model_name, 100 * analytic.get_overall_accuracy())
+            )
+
+        st.bar_chart(
+            data=pd.DataFrame(accuracies, columns=["Model", "Accuracy (%)"]),
+            x="Model",
+            y="Accuracy (%)",
+        )
+
     def __invoke_inference(
-        self, noise: Perturbation, placeholder: EmptyMixin
+        self,
+        noise: Perturbation,
+        placeholder: EmptyMixin,
+        compared_models: List[Model] | None = None,
+        seed: int | None = None,
     ) -> None:
         """
         Invokes the inference process for data distribution shift.
@@ -172,31 +280,47 @@ class DataDistributionShift(AbstractPage):
                 shift.
             placeholder (EmptyMixin): Placeholder element for displaying
                 progress.
+            compared_models (List[Model] | None, optional): The models
+                evaluated on the same perturbed images as the selected
+                model. Defaults to None.
+            seed (int | None, optional): The seed of the noise.
+                A random seed is drawn if None. Defaults to None.
         """
-        job_id = PerturbationController.start_dds(perturbation=noise)
-
-        analytic: Analytic | None = AnalyticsController.get_analytics(job_id)
+        if compared_models:
+            models = [DatabaseController.get_selected_model()]
+            models.extend(compared_models)
+            job_ids = PerturbationController.start_dds_comparison(
+                models=models, perturbation=noise, seed=seed
+            )
+            self.__model_comparison = [
+                (model.get_name(), job_id)
+                for model, job_id in zip(models, job_ids)
+            ]
+            self._session["model_comparison_dds"] = self.__model_comparison
+            job_id = job_ids[0]
+        else:
+            job_id = PerturbationController.start_dds(
+                perturbation=noise, seed=seed
+            )
 
         progress_bar = placeholder.progress(
             value=0.0, text="Running inference..."
         )
 
-        while analytic is None or not analytic.is_done():
-            if analytic is None:
-                analytic = AnalyticsController.get_analytics(job_id)
-            else:
-                self.__analytics_component.update_analytics(job_id)
-                self.__predictions_component.update_analytics(job_id)
-
-                progress_bar.progress(
-                    value=analytic.get_progress(), text="Running inference..."
-                )
-            time.sleep(0.1)
+        analytic: Analytic | None = None
+        for analytic in AnalyticsController.follow_progress(job_id):
+            progress_bar.progress(
+                value=analytic.get_progress(), text="Running inference..."
+            )
 
         progress_bar.empty()
         self.__analytics_component.update_analytics(job_id)
         self.__predictions_component.update_analytics(job_id)
 
+        if analytic is None:
+            st.toast(body=f"Error: the job {job_id} is unknown.", icon="❌")
+            return
+
         result: JobResult = analytic.get_result()
         if not result.is_success():
             st.toast(body=f"Error: {result.get_error_msg()}", icon="❌")
@@ -7,6 +7,7 @@ import streamlit as st
 
 from neuroshift.view.pages.abstract_page import AbstractPage
 from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytic_record import AnalyticRecord
 from neuroshift.view.pages.components.analytics_component import (
     AnalyticsComponent,
 )
@@ -36,10 +37,13 @@ class History(AbstractPage):
     def __render_history_table(self) -> None:
         """
         Renders the history table on the History page.
+
+        The table is built from the records of the saved analytics,
+            an analytic is only loaded when its tab is opened.
         """
-        saved_analytics = AnalyticsController.get_saved_analytics()
+        saved_records = AnalyticsController.get_saved_records()
 
-        if len(saved_analytics) == 0:
+        if len(saved_records) == 0:
             st.info(
                 "No analytics saved yet. To save analytics, click on the save "
                 "button on the perturbation pages."
@@ -49,35 +53,65 @@ class History(AbstractPage):
         data = {
             "open": [
                 self._session.get_add(
-                    key="History#Opened#" + analytic.job_id, default=False
+                    key="History#Opened#" + record.get_record_name(),
+                    default=False,
                 )
-                for analytic in saved_analytics
+                for record in saved_records
+            ],
+            "reference": [record.is_reference() for record in saved_records],
+            "name": [record.get_name() for record in saved_records],
+            "desc": [record.get_desc() for record in saved_records],
+            "predictions": [
+                record.get_prediction_count() for record in saved_records
             ],
-            "reference": [
-                analytic.is_reference() for analytic in saved_analytics
+            "accuracy": [
+                record.get_overall_accuracy() for record in saved_records
+            ],
+            "created": [
+                (
+                    pd.to_datetime(record.get_created(), unit="s")
+                    if record.get_created() is not None
+                    else None
+                )
+                for record in saved_records
             ],
-            "name": [analytic.get_name() for analytic in saved_analytics],
-            "desc": [analytic.get_desc() for analytic in saved_analytics],
-            "delete": [False for _ in saved_analytics],
+            "delete": [False for _ in saved_records],
         }
 
         tab_names = ["History"]
-        tab_analytics = [None]
-        for analytic in saved_analytics:
-            if self._session["History#Opened#" + analytic.job_id]:
-                tab_names.append(analytic.get_name())
-                tab_analytics.append(analytic)
+        tab_analytics: List[Analytic | None] = [None]
+        for record in saved_records:
+            if not self._session["History#Opened#" + record.get_record_name()]:
+                continue
+
+            analytic = AnalyticsController.open_saved_analytics(record)
+            if analytic is None:
+                st.error(f"The analytic {record.get_name()} cannot be loaded.")
+                continue
+
+            tab_names.append(record.get_name())
+            tab_analytics.append(analytic)
 
         tabs = st.tabs(tab_names)
 
         with tabs[0]:
             st.data_editor(
                 data=pd.DataFrame(data),
-                column_order=("open", "reference", "name", "desc", "delete"),
+                column_order=(
+                    "open",
+                    "reference",
+                    "name",
+                    "desc",
+                    "predictions",
+                    "accuracy",
+                    "created",
+                    "delete",
+                ),
+                disabled=("predictions", "accuracy", "created"),
                 num_rows="fixed",
                 key="history_table",
                 on_change=self.__update_history_table,
-                args=(saved_analytics,),
+                args=(saved_records,),
                 column_config={
                     "open": st.column_config.CheckboxColumn(
                         label="Open", width="small", default=False
@@ -91,6 +125,18 @@ class History(AbstractPage):
                     "desc": st.column_config.Column(
                         label="Description", width="large", required=True
                     ),
+                    "predictions": st.column_config.NumberColumn(
+                        label="Predictions", width="small"
+                    ),
+                    "accuracy": st.column_config.ProgressColumn(
+                        label="Accuracy",
+                        width="small",
+                        min_value=0,
+                        max_value=1,
+                    ),
+                    "created": st.column_config.DatetimeColumn(
+                        label="Created", width="medium"
+                    ),
                     "delete": st.column_config.CheckboxColumn(
                         label="Delete", width="small", default=False
                     ),
@@ -107,48 +153,46 @@ class History(AbstractPage):
 
         self._session["history_table"]["edited_rows"] = {}
 
-    def __update_history_table(self, saved_analytics: List[Analytic]) -> None:
+    def __update_history_table(
+        self, saved_records: List[AnalyticRecord]
+    ) -> None:
         """
         Updates the history table based on the user's changes.
 
         Args:
-            saved_analytics (List[Analytic]): The list of saved analytics.
+            saved_records (List[AnalyticRecord]): The records of the
+                saved analytics.
         """
         for index, changed_data in self._session["history_table"][
             "edited_rows"
         ].items():
             key = list(changed_data)[0]
             value = changed_data[key]
+            record = saved_records[index]
 
             if key == "open":
                 self._session[
-                    "History#Opened#" + saved_analytics[index].job_id
+                    "History#Opened#" + record.get_record_name()
                 ] = value
             elif key == "reference":
-                saved_analytics[index].set_reference(value)
-                last_changed_reference = self._session.get_add(
-                    key="History#last_changed_reference", default=None
-                )
-                if last_changed_reference is not None:
-                    last_changed_reference.set_reference(False)
-
-                self._session["History#last_changed_reference"] = (
-                    saved_analytics[index]
-                )
                 if value:
-                    AnalyticsController.update_reference_analytics(
-                        saved_analytics[index]
+                    analytic = AnalyticsController.open_saved_analytics(
+                        record
                     )
-                else:
+                    if analytic is not None:
+                        AnalyticsController.update_reference_analytics(
+                            analytic
+                        )
+                elif record.is_reference():
                     AnalyticsController.forget_reference_analytics()
             elif key == "name":
-                saved_analytics[index].set_name(value)
+                record.set_name(value)
+                AnalyticsController.update_saved_record(record)
             elif key == "desc":
-                saved_analytics[index].set_desc(value)
+                record.set_desc(value)
+                AnalyticsController.update_saved_record(record)
             elif key == "delete":
-                if saved_analytics[index].is_reference():
+                if record.is_reference():
                     AnalyticsController.forget_reference_analytics()
 
-                AnalyticsController.delete_analytics(
-                    saved_analytics[index].job_id
-                )
+                AnalyticsController.delete_saved_record(record)
@@ -1,8 +1,9 @@
 """This module contains the ModelDistributionShift class."""
 
-import time
+import statistics
 from typing import List
 
+import pandas as pd
 import streamlit as st
 from streamlit.elements.empty import EmptyMixin
 
@@ -67,6 +68,9 @@ class ModelDistributionShift(AbstractPage):
         self.__selected_target: Target = self._session.get_add(
             key="target_mds", default=Target.MODEL_PARAMETER
         )
+        self.__trials: List[str] | None = self._session.get_add(
+            key="trials_mds", default=None
+        )
 
     def render(self) -> None:
         """
@@ -77,7 +81,9 @@ class ModelDistributionShift(AbstractPage):
         super().render()
         self._render_header(save_button=True)
 
-        analytics_tab, predictions_tab = st.tabs(["Analytics", "Predictions"])
+        analytics_tab, predictions_tab, trials_tab = st.tabs(
+            ["Analytics", "Predictions", "Trials"]
+        )
 
         with analytics_tab:
             self.__analytics_component.render()
@@ -85,6 +91,9 @@ class ModelDistributionShift(AbstractPage):
         with predictions_tab:
             self.__predictions_component.render()
 
+        with trials_tab:
+            self.__render_trials()
+
         self.__render_sidebar()
 
     def __render_sidebar(self) -> None:
@@ -126,6 +135,32 @@ class ModelDistributionShift(AbstractPage):
             self.__selected_perturbation.set_target(target=target)
             self._session["target_mds"] = self.__selected_target
 
+        trials = st.sidebar.number_input(
+            label="Trials",
+            min_value=1,
+            max_value=64,
+            value=1,
+            disabled=target != Target.MODEL_PARAMETER,
+            help="Parameter perturbations can be run as several trials.",
+            key="trial_count_mds",
+        )
+
+        fixed_seed = st.sidebar.checkbox(
+            label="Fixed seed",
+            value=False,
+            help="A new random noise is drawn for every run otherwise.",
+            key="fixed_seed_mds",
+        )
+
+        seed = st.sidebar.number_input(
+            label="Seed",
+            min_value=0,
+            value=0,
+            disabled=not fixed_seed,
+            help="Runs with the same seed and settings reuse their result.",
+            key="seed_mds",
+        )
+
         placeholder = st.sidebar.empty()
 
         st.sidebar.button(
@@ -136,11 +171,61 @@ class ModelDistributionShift(AbstractPage):
             args=(
                 self.__selected_perturbation,
                 placeholder,
+                int(trials) if target == Target.MODEL_PARAMETER else 1,
+                int(seed) if fixed_seed else None,
+            ),
+        )
+
+    def __render_trials(self) -> None:
+        """
+        Render the accuracy of every trial of the last run of several
+        trials, with their mean and variance.
+        """
+        if self.__trials is None:
+            st.info(
+                "No trials given. Please apply a parameter perturbation "
+                "with several trials first."
+            )
+            return
+
+        accuracies = []
+        for job_id in self.__trials:
+            analytic = AnalyticsController.get_analytics(job_id)
+            if analytic is None:
+                return
+            accuracies.append(100 * analytic.get_overall_accuracy())
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.metric(
+                label="Mean accuracy",
+                value=f"{statistics.mean(accuracies):.2f}%",
+            )
+
+        with col2:
+            st.metric(
+                label="Accuracy variance",
+                value=f"{statistics.variance(accuracies):.2f}",
+            )
+
+        st.bar_chart(
+            data=pd.DataFrame(
+                {
+                    "Trial": range(1, len(accuracies) + 1),
+                    "Accuracy (%)": accuracies,
+                }
             ),
+            x="Trial",
+            y="Accuracy (%)",
         )
 
     def __invoke_inference(
-        self, perturbation: Perturbation, placeholder: EmptyMixin
+        self,
+        perturbation: Perturbation,
+        placeholder: EmptyMixin,
+        trials: int = 1,
+        seed: int | None = None,
     ) -> None:
         """
         Invoke the inference process with the selected perturbation.
@@ -149,31 +234,38 @@ class ModelDistributionShift(AbstractPage):
             perturbation (Perturbation): The selected perturbation.
             placeholder (EmptyMixin): Placeholder element for displaying
                 progress.
+            trials (int, optional): The number of trials of the
+                perturbation. Defaults to 1.
+            seed (int | None, optional): The seed of the perturbation.
+                A random seed is drawn if None. Defaults to None.
         """
-        job_id = PerturbationController.start_mds(perturbation)
-
-        analytic: Analytic | None = AnalyticsController.get_analytics(job_id)
+        if trials > 1:
+            self.__trials = PerturbationController.start_trial_ensemble(
+                perturbation, trials=trials, seed=seed
+            )
+            self._session["trials_mds"] = self.__trials
+            job_id = self.__trials[0]
+        else:
+            job_id = PerturbationController.start_mds(perturbation, seed=seed)
 
         progress_bar = placeholder.progress(
             value=0.0, text="Running inference..."
         )
 
-        while analytic is None or not analytic.is_done():
-            if analytic is None:
-                analytic = AnalyticsController.get_analytics(job_id)
-            else:
-                self.__analytics_component.update_analytics(job_id)
-                self.__predictions_component.update_analytics(job_id)
-
-                progress_bar.progress(
-                    value=analytic.get_progress(), text="Running inference..."
-                )
-            time.sleep(0.1)
+        analytic: Analytic | None = None
+        for analytic in AnalyticsController.follow_progress(job_id):
+            progress_bar.progress(
+                value=analytic.get_progress(), text="Running inference..."
+            )
 
         progress_bar.empty()
         self.__analytics_component.update_analytics(job_id)
         self.__predictions_component.update_analytics(job_id)
 
+        if analytic is None:
+            st.toast(body=f"Error: the job {job_id} is unknown.", icon="❌")
+            return
+
         result: JobResult = analytic.get_result()
         if not result.is_success():
             st.toast(body=f"Error: {result.get_error_msg()}", icon="❌")
@@ -0,0 +1,2 @@
+@echo off
+python -m benchmarks.perturbation_layer
\ No newline at end of file
@@ -5,6 +5,8 @@ from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.data.analytic import Analytic
 from neuroshift.model.data.dataset import Dataset
 from neuroshift.model.data.model import Model
+from neuroshift.model.data.prediction import Prediction
+from neuroshift.model.jobs.job_result import JobResult
 from neuroshift.controller.analytics_controller import AnalyticsController
 
 
@@ -143,3 +145,23 @@ def test_export_as_csv(mnist_analytic: Analytic) -> None:
 
     text_wrapper.close()
     bytes_buffer.close()
+
+
+def test_follow_progress(
+    empty_analytics: Analytics,
+    empty_analytic: Analytic,
+    mnist_correct_prediction: Prediction,
+) -> None:
+    assert not list(AnalyticsController.follow_progress("unknown"))
+
+    empty_analytics.add_analytic(empty_analytic)
+    updates = AnalyticsController.follow_progress(empty_analytic.job_id)
+    assert next(updates) is empty_analytic
+
+    empty_analytic.add_prediction(mnist_correct_prediction)
+    assert next(updates).get_prediction_count() == 1
+
+    empty_analytic.set_result(JobResult())
+    empty_analytic.add_prediction(mnist_correct_prediction)
+    assert next(updates).is_finished()
+    assert not list(updates)
@@ -0,0 +1,28 @@
+import pytest
+
+from neuroshift.controller.job_controller import JobController
+from neuroshift.model.job_queue import JobQueue
+from neuroshift.model.jobs.job import Job
+from neuroshift.model.jobs.job_result import JobResult
+
+
+class FailingJob(Job):
+    def start(self) -> JobResult:
+        return JobResult("error message")
+
+
+@pytest.mark.timeout(10)
+def test_dead_letters() -> None:
+    JobController.clear_dead_letters()
+    job = FailingJob()
+    JobQueue.get_instance().add_job(job)
+    JobQueue.get_instance().wait_completion()
+
+    assert len(JobController.get_dead_letters()) == 1
+    dead_letter = JobController.get_dead_letter(job.get_job_id())
+    assert dead_letter is not None
+    assert dead_letter.get_error_msg() == "error message"
+    assert JobController.get_dead_letter("unknown") is None
+
+    JobController.clear_dead_letters()
+    assert not JobController.get_dead_letters()
@@ -25,12 +25,18 @@ def test_apply_perturbation_to_image(mnist_images: List[Image]) -> None:
 
 
 @pytest.mark.timeout(10)
-def test_single_image_inference(mnist_images: List[Image]) -> None:
-    job_id = PerturbationController.single_image_inference(mnist_images[0])
-    analytics = Analytics.get_instance()
-    while analytics.get_analytic(job_id) is None:
-        time.sleep(0.1)
-    assert analytics.get_analytic(job_id) is not None
+def test_single_image_inference(
+    mocker: MockerFixture, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    mocker.patch.object(
+        DatabaseController, "get_selected_model", return_value=mnist_model
+    )
+
+    predicted_class, confidence = (
+        PerturbationController.single_image_inference(mnist_images[0])
+    )
+    assert predicted_class in mnist_model.get_order()
+    assert 0 <= confidence <= 1
 
 
 @pytest.mark.timeout(10)
@@ -80,6 +86,36 @@ def test_start_dds(
     assert Analytics.get_instance().get_analytic(job_id) is not None
 
 
+@pytest.mark.timeout(10)
+def test_start_dds_seeded(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    mocker.patch.object(
+        DatabaseController, "get_selected_model", return_value=mnist_model
+    )
+    mocker.patch.object(
+        DatabaseController, "get_selected_dataset", return_value=mnist_dataset
+    )
+    perturbation = AdditiveGaussian.get_instance()
+    parameter = perturbation.get_parameters()[0]
+    value = parameter.get_value()
+
+    try:
+        job_id = PerturbationController.start_dds(perturbation, seed=1)
+
+        assert PerturbationController.start_dds(perturbation, seed=1) == (
+            job_id
+        )
+
+        parameter.set_value(value / 2)
+
+        assert PerturbationController.start_dds(perturbation, seed=1) != (
+            job_id
+        )
+    finally:
+        parameter.set_value(value)
+
+
 @pytest.mark.timeout(10)
 def test_start_mds(
     mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
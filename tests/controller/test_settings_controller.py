@@ -10,8 +10,11 @@ from streamlit.runtime.uploaded_file_manager import (
 from pytest_mock.plugin import MockerFixture
 
 import neuroshift.config as conf
+from neuroshift.controller.analytics_controller import AnalyticsController
 from neuroshift.controller.settings_controller import SettingsController
 from neuroshift.controller.database_controller import DatabaseController
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.data.model import Model
 from neuroshift.model.data.dataset import Dataset
 from neuroshift.model.data.datasets import Datasets
@@ -129,6 +132,39 @@ def test_update_reference_succeeds() -> None:
     assert result
 
 
+def test_update_reference_saved(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    analytic = Analytic(
+        job_id="saved_reference",
+        total_predictions=1,
+        model=mnist_model,
+        dataset=mnist_dataset,
+    )
+    Analytics.get_instance().save_analytic(analytic)
+
+    # the saved analytics are not loaded by a new instance
+    restarted = Analytics()
+    mocker.patch.object(Analytics, "_Analytics__instance", restarted)
+    mocker.patch.object(
+        AnalyticsController, "_AnalyticsController__analytics", restarted
+    )
+    mocker.patch.object(
+        DatabaseController, "get_selected_model", return_value=mnist_model
+    )
+    mocker.patch.object(
+        DatabaseController, "get_selected_dataset", return_value=mnist_dataset
+    )
+    assert restarted.get_analytic(analytic.job_id) is None
+
+    assert SettingsController.update_reference()
+    reference = restarted.get_reference()
+    assert reference is not None
+    assert reference.key == analytic.key
+
+    restarted.delete_analytic(restarted.get_analytic(analytic.job_id))
+
+
 @pytest.mark.timeout(10)
 def test_create_reference(
     mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
@@ -1,5 +1,8 @@
 import io
 import csv
+import pickle
+import threading
+from copy import deepcopy
 from typing import List
 
 from neuroshift.model.data.analytic import Analytic
@@ -8,6 +11,7 @@ from neuroshift.model.data.model import Model
 from neuroshift.model.data.dataset import Dataset
 from neuroshift.model.data.prediction import Prediction
 from neuroshift.model.data.image import Image
+from neuroshift.model.data.db import Database
 
 
 def test_analytic_init(mnist_model: Model, mnist_dataset: Dataset) -> None:
@@ -424,3 +428,75 @@ def test_analytic_export(mnist_analytic: Analytic) -> None:
 
     text_wrapper.close()
     bytes_buffer.close()
+
+
+def test_analytic_stored_with_entries(mnist_analytic: Analytic) -> None:
+    path = "./tests/save/records/"
+    db = Database[Analytic](element=mnist_analytic, path=path)
+    db.save_element(mnist_analytic)
+    name = db.get_record_name(mnist_analytic)
+
+    header = Database.load_record(path, name, entries=False)
+    loaded = Database.load_record(path, name)
+    metadata = dict(Database.read_index(path))[name]
+    db.delete(mnist_analytic)
+
+    assert header.get_prediction_count() == 0
+    assert loaded.get_prediction_count() == 2
+    assert loaded.get_overall_accuracy() == (
+        mnist_analytic.get_overall_accuracy()
+    )
+    assert metadata["predictions"] == 2
+    assert metadata["key"] == mnist_analytic.key
+    assert mnist_analytic.get_prediction_count() == 2
+
+
+def test_analytic_pickle(mnist_analytic: Analytic) -> None:
+    copy = pickle.loads(pickle.dumps(mnist_analytic))
+
+    assert copy.get_prediction_count() == 2
+    assert copy.get_overall_accuracy() == (
+        mnist_analytic.get_overall_accuracy()
+    )
+    assert deepcopy(mnist_analytic).get_prediction_count() == 2
+
+
+def test_analytic_wait_for_update(
+    empty_analytic: Analytic, mnist_correct_prediction: Prediction
+) -> None:
+    version = empty_analytic.get_version()
+    assert empty_analytic.wait_for_update(version, timeout=0) == version
+
+    thread = threading.Thread(
+        target=empty_analytic.add_predictions,
+        args=([mnist_correct_prediction, mnist_correct_prediction],),
+    )
+    thread.start()
+    new_version = empty_analytic.wait_for_update(version, timeout=10)
+    thread.join()
+
+    assert new_version > version
+    assert empty_analytic.is_done()
+    assert not empty_analytic.is_finished()
+
+    empty_analytic.set_result(JobResult())
+    assert empty_analytic.is_finished()
+    assert empty_analytic.wait_for_update(new_version) > new_version
+
+    copy = pickle.loads(pickle.dumps(empty_analytic))
+    version = copy.get_version()
+    assert copy.wait_for_update(version, timeout=0) == version
+
+
+def test_analytic_find_predictions(
+    mnist_analytic: Analytic, mnist_incorrect_prediction: Prediction
+) -> None:
+    assert mnist_analytic.find_predictions() == [0, 1]
+    assert mnist_analytic.find_predictions(wrong_only=True) == [1]
+    assert mnist_analytic.find_predictions(class_name="1") == [0, 1]
+    assert mnist_analytic.find_predictions(class_name="2") == []
+    assert mnist_analytic.find_predictions(lowest_confidence_first=True) == [
+        1,
+        0,
+    ]
+    assert mnist_analytic.get_prediction(1) is mnist_incorrect_prediction
@@ -0,0 +1,42 @@
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytic_record import AnalyticRecord
+
+
+def test_analytic_record(mnist_analytic: Analytic) -> None:
+    mnist_analytic.set_name("name")
+    record = AnalyticRecord("record", mnist_analytic.get_metadata())
+
+    assert record.get_record_name() == "record"
+    assert record.get_job_id() == mnist_analytic.job_id
+    assert record.get_key() == mnist_analytic.key
+    assert record.get_name() == "name"
+    assert record.get_desc() == mnist_analytic.get_desc()
+    assert not record.is_reference()
+    assert record.get_prediction_count() == 2
+    assert record.get_total_predictions() == 2
+    assert (
+        record.get_overall_accuracy() == mnist_analytic.get_overall_accuracy()
+    )
+    assert record.get_overall_f1() == mnist_analytic.get_overall_f1()
+    assert record.get_created() == mnist_analytic.get_created()
+    assert record.get_updated() is not None
+
+
+def test_analytic_record_defaults() -> None:
+    record = AnalyticRecord("record", {})
+
+    assert record.get_job_id() is None
+    assert record.get_name() == "record"
+    assert record.get_desc() == "No description."
+    assert record.get_prediction_count() == 0
+    assert record.get_created() is None
+
+    record.set_name("name")
+    record.set_desc("desc")
+    record.set_reference(True)
+
+    assert record.get_metadata() == {
+        "name": "name",
+        "desc": "desc",
+        "reference": True,
+    }
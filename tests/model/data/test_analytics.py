@@ -1,6 +1,8 @@
 import neuroshift.config as conf
 from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.model import Model
+from neuroshift.model.data.dataset import Dataset
 
 OLD_CONF: str | None = None
 TEST_CONF: str = "./tests/model/data/dataconf.toml"
@@ -125,3 +127,90 @@ def test_analytics_load(
 
     analytics = Analytics()
     assert analytics.get_reference() is not None
+
+
+def test_analytics_load_saved(
+    empty_analytics: Analytics, empty_analytic: Analytic
+) -> None:
+    empty_analytic.set_name("lazy")
+    empty_analytics.save_analytic(empty_analytic)
+
+    analytics = Analytics()
+    assert not analytics.get_analytics()
+
+    records = analytics.get_saved_records()
+    assert len(records) == 1
+    assert records[0].get_job_id() == empty_analytic.job_id
+    assert records[0].get_name() == "lazy"
+
+    records[0].set_name("renamed")
+    analytics.update_record(records[0])
+    analytic = analytics.load_saved(records[0])
+
+    assert analytic is not None
+    assert analytic.job_id == empty_analytic.job_id
+    assert analytic.get_name() == "renamed"
+    assert analytics.get_analytic(empty_analytic.job_id) is analytic
+    assert analytics.load_saved(records[0]) is analytic
+
+    analytics.delete_record(records[0])
+    assert not analytics.get_saved_records()
+    assert not Analytics().get_saved_records()
+
+
+def test_analytics_indexes(
+    empty_analytics: Analytics,
+    mnist_analytic: Analytic,
+    mnist_model: Model,
+    mnist_dataset: Dataset,
+) -> None:
+    noisy_analytic = Analytic(
+        job_id="noisy",
+        total_predictions=1,
+        model=mnist_model,
+        dataset=mnist_dataset,
+        noise_name="Noise",
+    )
+    empty_analytics.add_analytic(mnist_analytic)
+    empty_analytics.add_analytic(noisy_analytic)
+
+    assert empty_analytics.get_by_model_and_dataset(
+        mnist_model, mnist_dataset
+    ) == [mnist_analytic, noisy_analytic]
+    assert empty_analytics.get_by_noise("Noise") == [noisy_analytic]
+    assert not empty_analytics.get_by_noise(
+        "Noise", until=noisy_analytic.get_created() - 1
+    )
+    assert empty_analytics.get_by_accuracy() == [mnist_analytic]
+
+    noisy_analytic.set_done()
+    assert empty_analytics.get_by_accuracy(0, 1) == [
+        noisy_analytic,
+        mnist_analytic,
+    ]
+
+
+def test_analytics_indexes_saved(
+    empty_analytics: Analytics,
+    mnist_model: Model,
+    mnist_dataset: Dataset,
+) -> None:
+    noisy_analytic = Analytic(
+        job_id="saved_noisy",
+        total_predictions=1,
+        model=mnist_model,
+        dataset=mnist_dataset,
+        noise_name="Noise",
+    )
+    empty_analytics.save_analytic(noisy_analytic)
+
+    analytics = Analytics()
+    assert not analytics.get_analytics()
+
+    found = analytics.get_by_model_and_dataset(mnist_model, mnist_dataset)
+    assert [analytic.job_id for analytic in found] == ["saved_noisy"]
+    assert analytics.get_by_noise("Noise") == found
+    assert not analytics.get_by_noise(None)
+
+    analytics.delete_record(analytics.get_saved_records()[0])
+    assert not analytics.get_by_noise("Noise")
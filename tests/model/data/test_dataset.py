@@ -178,6 +178,14 @@ def test_dataset_get_item(
         assert mnist_dataset[i] == image, "Dataset returned incorrect image"
 
 
+def test_dataset_get_images(
+    mnist_dataset: Dataset, mnist_images: List[Image]
+) -> None:
+    assert mnist_dataset.get_images(2, 5) == mnist_images[2:5]
+    assert mnist_dataset.get_images(8, 100) == mnist_images[8:]
+    assert mnist_dataset.get_images(100, 200) == []
+
+
 def test_dataset_set_item(
     mnist_dataset: Dataset, mnist_images: List[Image]
 ) -> None:
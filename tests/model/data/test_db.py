@@ -148,3 +148,77 @@ def test_to_string(default_db: Database[OtherClass]) -> None:
         f"Database at: {DB_PATH}\n"
         f"Containing: {', '.join(str(item) for item in default_db)}\n"
     )
+
+
+def test_read_index(default_items: List[OtherClass]) -> None:
+    path = "./tests/save/records/"
+    db = Database[OtherClass].from_list(default_items, path)
+    db.save()
+
+    names = [name for name, _ in Database.read_index(path)]
+    loaded = Database.load_record(path, names[0])
+
+    assert names == [db.get_record_name(item) for item in default_items]
+    assert vars(loaded) == vars(default_items[0])
+
+    for item in default_items:
+        db.delete(item)
+
+    assert Database.read_index(path) == []
+
+
+def test_composite_index(default_db: Database[OtherClass]) -> None:
+    default_db.add_index(
+        "surname_birthday", lambda item: (item.surname, item.birthday)
+    )
+
+    assert len(default_db.find("surname_birthday", ("c", 1))) == 1
+    assert len(default_db.find("surname_birthday", ("c", 2))) == 0
+
+    default_db.append(OtherClass("d", "c", 1))
+    assert len(default_db.find("surname_birthday", ("c", 1))) == 2
+
+    with pytest.raises(ValueError):
+        default_db.add_index("surname_birthday", lambda item: item.name)
+
+
+def test_ordered_index(mixed_items: List[FirstClass]) -> None:
+    db = Database[FirstClass].from_list(mixed_items, DB_PATH)
+    for age, item in zip([30, 10, 20], mixed_items):
+        item.age = age
+    db.add_ordered_index("age", lambda item: item.age)
+
+    assert db.find_range("age") == [
+        mixed_items[1],
+        mixed_items[2],
+        mixed_items[0],
+    ]
+    assert db.find_range("age", 15, 30) == [mixed_items[2], mixed_items[0]]
+    assert db.find_range("age", high=10) == [mixed_items[1]]
+
+    mixed_items[0].age = 0
+    db.reindex(mixed_items[0])
+    assert db.find_range("age", high=10) == mixed_items[:2]
+
+    db.delete(mixed_items[0])
+    assert db.find_range("age", high=10) == [mixed_items[1]]
+
+    with pytest.raises(KeyError):
+        db.find("age", 20)
+
+
+def test_delete_duplicate(default_items: List[OtherClass]) -> None:
+    db = Database[OtherClass].from_list(default_items, DB_PATH)
+    db.append(default_items[0])
+    assert len(db["name", "a"]) == 2
+
+    db.delete(default_items[0])
+    assert default_items[0] in db
+    assert len(db["name", "a"]) == 1
+
+    db.delete(default_items[0])
+    assert default_items[0] not in db
+    assert db.get_items() == default_items[1:]
+
+    db.delete(default_items[0])
+    assert len(db) == 2
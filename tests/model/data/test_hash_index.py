@@ -0,0 +1,19 @@
+from neuroshift.model.data.hash_index import HashIndex
+
+
+def test_hash_index() -> None:
+    index = HashIndex[str](lambda element: (element[0], len(element)))
+    index.add(0, "ab")
+    index.add(1, "ac")
+    index.add(2, "abc")
+
+    assert index.find(("a", 2)) == ["ab", "ac"]
+    assert index.find(("b", 2)) == []
+
+    index.remove(0)
+    index.remove(0)
+    assert index.find(("a", 2)) == ["ac"]
+
+    index.remove(1)
+    assert index.find(("a", 2)) == []
+    assert index.find(("a", 3)) == ["abc"]
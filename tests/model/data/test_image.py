@@ -70,3 +70,13 @@ def test_image_equal() -> None:
     assert (
         default_image != "Test"
     ), "The image should not be equal to a completely different class"
+
+
+def test_image_lazy_path() -> None:
+    tensor = torch.rand(1, 20, 20).to(conf.device)
+    image = Image(label="label", path=None, tensor=tensor)
+
+    path = image.get_path()
+
+    assert path.startswith("data:image/png;base64,")
+    assert image.get_path() is path
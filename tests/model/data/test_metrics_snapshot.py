@@ -0,0 +1,71 @@
+import pytest
+
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.metrics_snapshot import MetricsSnapshot
+from neuroshift.model.data.prediction import Prediction
+
+
+def test_metrics_snapshot() -> None:
+    snapshot = MetricsSnapshot(
+        version=2,
+        classes=["1", "2", "3"],
+        class_analytics={
+            "1": {
+                "true_positive": 1,
+                "true_negative": 0,
+                "false_positive": 0,
+                "false_negative": 1,
+            },
+            "2": {
+                "true_positive": 0,
+                "true_negative": 1,
+                "false_positive": 1,
+                "false_negative": 0,
+            },
+        },
+    )
+
+    assert snapshot.get_version() == 2
+    assert snapshot.get_classes() == ["1", "2", "3"]
+    assert snapshot.get_class(MetricsSnapshot.ACCURACY, "1") == 0.5
+    assert snapshot.get_class(MetricsSnapshot.PRECISION, "1") == 1
+    assert snapshot.get_class(MetricsSnapshot.RECALL, "1") == 0.5
+    assert snapshot.get_class(MetricsSnapshot.F1, "1") == pytest.approx(2 / 3)
+    assert snapshot.get_class(MetricsSnapshot.PRECISION, "2") == 0
+    assert snapshot.get_class(MetricsSnapshot.ACCURACY, "3") == 0
+    assert snapshot.get_class(MetricsSnapshot.ACCURACY, "unknown") == 0
+    assert snapshot.get_class_vector(
+        MetricsSnapshot.RECALL, ["unknown", "1", "2"]
+    ) == [0, 0.5, 0]
+    assert snapshot.get_overall(MetricsSnapshot.ACCURACY) == pytest.approx(
+        1 / 3
+    )
+    assert snapshot.get_overall(MetricsSnapshot.F1) == pytest.approx(
+        2 * (1 / 3) * (1 / 6) / (1 / 3 + 1 / 6)
+    )
+
+
+def test_metrics_snapshot_empty() -> None:
+    snapshot = MetricsSnapshot(version=0, classes=[], class_analytics={})
+
+    for metric in MetricsSnapshot.METRICS:
+        assert snapshot.get_overall(metric) == 0
+        assert snapshot.get_class_vector(metric, ["1"]) == [0]
+
+
+def test_analytic_metrics_memoized(
+    mnist_analytic: Analytic, mnist_correct_prediction: Prediction
+) -> None:
+    metrics = mnist_analytic.get_metrics()
+
+    assert metrics.get_version() == mnist_analytic.get_version()
+    assert mnist_analytic.get_metrics() is metrics
+
+    mnist_analytic.add_prediction(mnist_correct_prediction)
+    updated_metrics = mnist_analytic.get_metrics()
+
+    assert updated_metrics is not metrics
+    assert updated_metrics.get_version() == mnist_analytic.get_version()
+    assert updated_metrics.get_overall(
+        MetricsSnapshot.ACCURACY
+    ) == mnist_analytic.get_overall_accuracy()
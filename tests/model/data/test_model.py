@@ -1,8 +1,11 @@
+from typing import List
+
 import torch
 import onnx
 from onnx2pytorch import ConvertModel  # type: ignore
 
 import neuroshift.config as conf
+from neuroshift.model.data.image import Image
 from neuroshift.model.data.model import Model
 
 
@@ -112,3 +115,11 @@ def test_model_string_representation(mnist_model: Model) -> None:
     assert str(mnist_model) == str(
         mnist_model.get_model()
     ), "The model string representation of the model is incorrect"
+
+
+def test_model_decode(mnist_model: Model, mnist_images: List[Image]) -> None:
+    batch = torch.stack([image.get_tensor() for image in mnist_images[:4]])
+
+    with torch.no_grad():
+        output = mnist_model.get_model()(batch)
+        assert mnist_model.decode(output) == mnist_model(batch)
@@ -0,0 +1,34 @@
+from neuroshift.model.data.ordered_index import OrderedIndex
+
+
+def test_ordered_index() -> None:
+    index = OrderedIndex[str](len)
+    index.add(0, "abc")
+    index.add(1, "a")
+    index.add(2, "ab")
+    index.add(3, "xy")
+
+    assert index.find_range() == ["a", "ab", "xy", "abc"]
+    assert index.find_range(2, 2) == ["ab", "xy"]
+    assert index.find_range(low=2) == ["ab", "xy", "abc"]
+    assert index.find_range(high=1) == ["a"]
+    assert index.find_range(4) == []
+
+    index.remove(2)
+    index.remove(2)
+    assert index.find_range(2, 3) == ["xy", "abc"]
+
+
+def test_ordered_index_replace() -> None:
+    index = OrderedIndex[str](len)
+    for slot in range(8):
+        index.add(slot, "a" * (slot + 1))
+
+    index.add(0, "abcdefghij")
+    index.remove(3)
+    index.add(3, "abcd")
+    for slot in range(4, 8):
+        index.remove(slot)
+
+    assert index.find_range() == ["aa", "aaa", "abcd", "abcdefghij"]
+    assert index.find_range(4, 4) == ["abcd"]
@@ -0,0 +1,84 @@
+import os
+from typing import Generator
+
+import pytest
+
+from neuroshift.model.data.record_store import RecordStore
+
+STORE_PATH = "./tests/save/records/"
+
+
+@pytest.fixture
+def store() -> Generator[RecordStore, None, None]:
+    record_store = RecordStore(STORE_PATH)
+
+    yield record_store
+
+    for name in record_store.get_names():
+        record_store.delete(name)
+
+
+def test_put_and_load(store: RecordStore) -> None:
+    store.put(
+        name="a",
+        element={"value": 1},
+        constants={"id": "a"},
+        metadata={"name": "first"},
+        entries=[1, 2, 3],
+    )
+
+    assert store.list() == [("a", {"id": "a"}, {"name": "first"})]
+    assert store.load("a") == {"value": 1}
+    assert store.load_entries("a") == [1, 2, 3]
+
+
+def test_put_appends_entries(store: RecordStore) -> None:
+    store.put("a", None, {"id": "a"}, {}, entries=[1, 2])
+    size = os.path.getsize(os.path.join(STORE_PATH, "a.entries"))
+
+    store.put("a", None, {"id": "a"}, {}, entries=[1, 2, 3, 4])
+
+    assert store.load_entries("a") == [1, 2, 3, 4]
+    assert os.path.getsize(os.path.join(STORE_PATH, "a.entries")) > size
+
+
+def test_put_rewrites_other_element(store: RecordStore) -> None:
+    store.put("a", None, {"id": "a"}, {}, entries=[1, 2])
+    store.put("a", None, {"id": "b"}, {}, entries=[3])
+
+    assert store.load_entries("a") == [3]
+
+
+def test_interrupted_save_is_ignored(store: RecordStore) -> None:
+    store.put("a", None, {"id": "a"}, {}, entries=[1])
+    with open(os.path.join(STORE_PATH, "a.entries"), "ab") as file:
+        file.write(b"garbage")
+
+    assert store.load_entries("a") == [1]
+
+    store.put("a", None, {"id": "a"}, {}, entries=[1, 2])
+
+    assert store.load_entries("a") == [1, 2]
+
+
+def test_update_metadata(store: RecordStore) -> None:
+    store.put("a", None, {"id": "a"}, {"name": "first"})
+    store.update_metadata("a", {"name": "second"})
+
+    assert store.list()[0][2] == {"name": "second"}
+
+
+def test_delete(store: RecordStore) -> None:
+    store.put("a", None, {"id": "a"}, {}, entries=[1])
+    store.delete("a")
+    store.delete("not a record")
+
+    assert store.list() == []
+    assert not os.path.exists(os.path.join(STORE_PATH, "a.elem"))
+    assert not os.path.exists(os.path.join(STORE_PATH, "a.entries"))
+
+
+def test_is_store_file() -> None:
+    assert RecordStore.is_store_file(RecordStore.INDEX_FILE)
+    assert RecordStore.is_store_file("a.entries")
+    assert not RecordStore.is_store_file("a.elem")
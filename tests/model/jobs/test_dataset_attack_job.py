@@ -0,0 +1,52 @@
+import pytest
+
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.jobs.dataset_attack_job import DatasetAttackJob
+from neuroshift.model.noises.adversarial_attack.fast_gradient_sign_method import (
+    FastGradientSignMethod,
+)
+from tests.model.noises.adversarial_attack.test_fgsm import fgsm  # noqa
+
+
+@pytest.fixture
+def dataset_attack_job(
+    mnist_model: Model, mnist_dataset: Dataset, fgsm: FastGradientSignMethod
+) -> DatasetAttackJob:
+    return DatasetAttackJob(
+        model=mnist_model, dataset=mnist_dataset, attack=fgsm
+    )
+
+
+@pytest.mark.timeout(30)
+def test_start(
+    dataset_attack_job: DatasetAttackJob, mnist_dataset: Dataset
+) -> None:
+    result = dataset_attack_job.start()
+    analytics = Analytics.get_instance()
+    clean = dataset_attack_job.get_clean_analytic()
+    adversarial = dataset_attack_job.get_analytic()
+
+    assert result.is_success()
+    assert analytics.get_analytic(clean.job_id) is clean
+    assert analytics.get_analytic(dataset_attack_job.get_job_id()) is (
+        adversarial
+    )
+    assert clean.is_done() and adversarial.is_done()
+    assert clean.get_prediction_count() == mnist_dataset.get_size()
+    assert adversarial.get_prediction_count() == mnist_dataset.get_size()
+    for prediction in adversarial.get_predictions():
+        assert prediction.get_perturbed_image() is not prediction.get_image()
+
+
+def test_start_fail(
+    mnist_dataset: Dataset, fgsm: FastGradientSignMethod
+) -> None:
+    job = DatasetAttackJob(model=None, dataset=mnist_dataset, attack=fgsm)
+
+    result = job.start()
+
+    assert not result.is_success()
+    assert job.get_analytic().is_done()
+    assert job.get_clean_analytic().is_done()
@@ -0,0 +1,45 @@
+import pytest
+import torch
+
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.jobs.epsilon_sweep_job import EpsilonSweepJob
+
+
+@pytest.mark.timeout(30)
+def test_start(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    job = EpsilonSweepJob(
+        model=mnist_model, dataset=mnist_dataset, epsilons=[0, 0.1, 0.5]
+    )
+
+    result = job.start()
+    analytics = Analytics.get_instance()
+
+    assert result.is_success()
+    assert job.get_epsilons() == [0, 0.1, 0.5]
+    assert job.get_analytics()[0].job_id == job.get_job_id()
+    for analytic in job.get_analytics():
+        assert analytics.get_analytic(analytic.job_id) is analytic
+        assert analytic.is_finished()
+        assert analytic.get_prediction_count() == mnist_dataset.get_size()
+    assert [epsilon for epsilon, _ in job.get_accuracies()] == [0, 0.1, 0.5]
+    for prediction in job.get_analytics()[0].get_predictions():
+        assert torch.allclose(
+            prediction.get_perturbed_image().get_tensor(),
+            prediction.get_image().get_tensor(),
+        )
+
+
+def test_start_fail(mnist_dataset: Dataset) -> None:
+    job = EpsilonSweepJob(model=None, dataset=mnist_dataset, epsilons=[0.1])
+
+    result = job.start()
+
+    assert not result.is_success()
+    assert job.get_analytics()[0].is_done()
+
+
+def test_no_epsilon(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    with pytest.raises(ValueError):
+        EpsilonSweepJob(model=mnist_model, dataset=mnist_dataset, epsilons=[])
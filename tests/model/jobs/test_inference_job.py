@@ -1,14 +1,23 @@
 import time
+from typing import List
 
 import pytest
+import torch
+from pytest_mock import MockerFixture
 
 from neuroshift.model.jobs.inference_job import InferenceJob
 from neuroshift.model.jobs.perturbation_job import PerturbationJob
 from neuroshift.model.data.analytics import Analytics
 from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
 from neuroshift.model.noises.model_distribution_shift.bitflip import Bitflip
+from neuroshift.model.checkpoint_store import CheckpointStore
 from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.datasets import Datasets
+from neuroshift.model.data.image import Image
 from neuroshift.model.data.model import Model
+from neuroshift.model.data.models import Models
+from neuroshift.model.noises.targets.target import Target
+import neuroshift.config as conf
 
 
 @pytest.fixture
@@ -71,3 +80,138 @@ def test_start(
 ) -> None:
     ag_inference_job.start()
     bitflip_inference_job.start()
+
+
+def test_start_prefetch_depth(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.DATASET)
+
+    predictions = []
+    for depth in (0, 2):
+        mocker.patch.object(conf, "PREFETCH_DEPTH", depth)
+        mocker.patch.object(conf, "DATASET_CACHE_SIZE", 0)
+        job = InferenceJob(
+            model=mnist_model,
+            dataset=mnist_dataset,
+            perturbation_job=PerturbationJob(mnist_dataset, perturbation),
+            seed=5,
+        )
+        assert job.start().is_success()
+        predictions.append(
+            [
+                (
+                    prediction.get_predicted_class(),
+                    prediction.get_perturbed_image().get_tensor(),
+                )
+                for prediction in job.get_analytic().get_predictions()
+            ]
+        )
+
+    assert len(predictions[0]) == mnist_dataset.get_size()
+    assert len(predictions[0]) == len(predictions[1])
+    for sequential, pipelined in zip(*predictions):
+        assert sequential[0] == pipelined[0]
+        assert torch.equal(sequential[1], pipelined[1])
+
+
+@pytest.mark.timeout(30)
+def test_resume(
+    mocker: MockerFixture, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    mocker.patch.object(conf, "BATCH_SIZE", 1)
+    mocker.patch.object(conf, "CHECKPOINT_INTERVAL", 1)
+    mocker.patch.object(conf, "DATASET_CACHE_SIZE", 0)
+    dataset = Dataset(
+        name="MNIST",
+        file_name="mnist",
+        desc="Sample desc",
+        classes=["1", "2", "3", "4", "5", "6", "7", "8", "9", "0"],
+        selected=False,
+        images=mnist_images,
+    )
+    mocker.patch.object(Models, "get_models", return_value=[mnist_model])
+    mocker.patch.object(Datasets, "get", return_value=dataset)
+    # keeps the last checkpoint, as if the job was interrupted
+    delete = mocker.patch.object(CheckpointStore, "delete")
+
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.DATASET)
+    job = InferenceJob(
+        model=mnist_model,
+        dataset=dataset,
+        perturbation_job=PerturbationJob(dataset, perturbation),
+    )
+    assert job.start().is_success()
+    delete.assert_called_with(job.get_job_id())
+
+    # the slider of the noise moves before the job is resumed
+    parameter = perturbation.get_parameters()[0]
+    value = parameter.get_value()
+    parameter.set_value(value / 2)
+    try:
+        spy = mocker.spy(mnist_model, "decode")
+        resumed_job = InferenceJob.resume(job.get_job_id())
+        assert resumed_job is not None
+        assert resumed_job.get_job_id() == job.get_job_id()
+        assert resumed_job.start().is_success()
+        assert parameter.get_value() == value
+    finally:
+        parameter.set_value(value)
+
+    # only the batch after the last checkpoint is run again
+    assert spy.call_count == 1
+    predictions = job.get_analytic().get_predictions()
+    resumed_predictions = resumed_job.get_analytic().get_predictions()
+    assert len(resumed_predictions) == len(predictions)
+    for prediction, resumed_prediction in zip(
+        predictions, resumed_predictions
+    ):
+        assert (
+            prediction.get_predicted_class()
+            == resumed_prediction.get_predicted_class()
+        )
+        assert torch.equal(
+            prediction.get_perturbed_image().get_tensor(),
+            resumed_prediction.get_perturbed_image().get_tensor(),
+        )
+    assert (
+        resumed_job.get_analytic().get_overall_accuracy()
+        == job.get_analytic().get_overall_accuracy()
+    )
+
+
+def test_resume_without_checkpoint() -> None:
+    assert InferenceJob.resume("unknown") is None
+
+
+def test_resume_mismatched_parameters(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    mocker.patch.object(Models, "get_models", return_value=[mnist_model])
+    mocker.patch.object(Datasets, "get", return_value=mnist_dataset)
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.DATASET)
+    store = CheckpointStore.get_instance()
+    store.save(
+        "mismatched",
+        {
+            "model": mnist_model.get_file_name(),
+            "dataset": mnist_dataset.get_file_name(),
+            "perturbation": perturbation,
+            "activation_boundary": None,
+            "layers": None,
+            "parameter_values": [("Unknown", 1.0)],
+            "seed": 0,
+            "seeded": True,
+            "cursor": 0,
+            "results": [],
+            "generator_state": None,
+        },
+    )
+
+    try:
+        assert InferenceJob.resume("mismatched") is None
+    finally:
+        store.delete("mismatched")
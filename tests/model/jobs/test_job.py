@@ -1,3 +1,5 @@
+import torch
+
 from neuroshift.model.jobs.job import Job
 
 
@@ -5,3 +7,19 @@ def test_job_init() -> None:
     job1 = Job()
     job2 = Job()
     assert job1.get_job_id() != job2.get_job_id()
+
+
+def test_job_seed() -> None:
+    job = Job(seed=42)
+
+    assert job.get_seed() == 42
+    assert Job().get_seed() != Job().get_seed()
+
+
+def test_create_generator() -> None:
+    job = Job(seed=42)
+
+    first = torch.rand(8, generator=job.create_generator())
+    second = torch.rand(8, generator=job.create_generator())
+
+    assert torch.equal(first, second)
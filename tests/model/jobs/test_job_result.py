@@ -12,3 +12,9 @@ def test_is_success() -> None:
     assert job_result.is_success()
     job_result = JobResult("test")
     assert not job_result.is_success()
+
+
+def test_is_retryable() -> None:
+    assert not JobResult("test").is_retryable()
+    assert JobResult("test", retryable=True).is_retryable()
+    assert not JobResult(retryable=True).is_retryable()
@@ -0,0 +1,92 @@
+import pytest
+
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.jobs.inference_job import InferenceJob
+from neuroshift.model.jobs.multi_model_inference_job import (
+    MultiModelInferenceJob,
+)
+from neuroshift.model.jobs.perturbation_job import PerturbationJob
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.noises.targets.target import Target
+
+
+@pytest.fixture
+def perturbation_job(mnist_dataset: Dataset) -> PerturbationJob:
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.DATASET)
+
+    return PerturbationJob(entity=mnist_dataset, perturbation=perturbation)
+
+
+@pytest.mark.timeout(30)
+def test_start(
+    mnist_model: Model,
+    mnist_dataset: Dataset,
+    perturbation_job: PerturbationJob,
+) -> None:
+    job = MultiModelInferenceJob(
+        models=[mnist_model, mnist_model],
+        dataset=mnist_dataset,
+        perturbation_job=perturbation_job,
+        seed=0,
+    )
+    inference_job = InferenceJob(
+        model=mnist_model,
+        dataset=mnist_dataset,
+        perturbation_job=perturbation_job,
+        seed=0,
+    )
+
+    result = job.start()
+    inference_job.start()
+    analytics = Analytics.get_instance()
+    first, second = job.get_analytics()
+
+    assert result.is_success()
+    assert first.job_id == job.get_job_id()
+    for analytic in (first, second):
+        assert analytics.get_analytic(analytic.job_id) is analytic
+        assert analytic.is_finished()
+        assert analytic.get_prediction_count() == mnist_dataset.get_size()
+    for prediction, other, reference in zip(
+        first.get_predictions(),
+        second.get_predictions(),
+        inference_job.get_analytic().get_predictions(),
+    ):
+        assert prediction.get_perturbed_image() is (
+            other.get_perturbed_image()
+        )
+        assert prediction.get_predicted_class() == (
+            reference.get_predicted_class()
+        )
+        assert prediction.get_perturbed_image() == (
+            reference.get_perturbed_image()
+        )
+
+
+def test_start_fail(
+    mnist_dataset: Dataset, perturbation_job: PerturbationJob
+) -> None:
+    job = MultiModelInferenceJob(
+        models=[None],
+        dataset=mnist_dataset,
+        perturbation_job=perturbation_job,
+    )
+
+    result = job.start()
+
+    assert not result.is_success()
+    assert job.get_analytics()[0].is_done()
+
+
+def test_no_model(
+    mnist_dataset: Dataset, perturbation_job: PerturbationJob
+) -> None:
+    with pytest.raises(ValueError):
+        MultiModelInferenceJob(
+            models=[],
+            dataset=mnist_dataset,
+            perturbation_job=perturbation_job,
+        )
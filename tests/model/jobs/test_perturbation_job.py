@@ -1,3 +1,4 @@
+import torch
 import pytest
 
 from neuroshift.model.jobs.perturbation_job import PerturbationJob
@@ -68,3 +69,55 @@ def test_start(
         is_model=True,
     )
     perturbation_job.start()
+
+
+def test_apply_to_dataset_seeded(mnist_dataset: Dataset) -> None:
+    first = PerturbationJob(
+        entity=mnist_dataset,
+        perturbation=AdditiveGaussian.get_instance(),
+        seed=42,
+    ).apply_to_dataset()
+    second = PerturbationJob(
+        entity=mnist_dataset,
+        perturbation=AdditiveGaussian.get_instance(),
+        seed=42,
+    ).apply_to_dataset()
+
+    for (first_tensor, _), (second_tensor, _) in zip(first, second):
+        assert torch.equal(first_tensor, second_tensor)
+
+
+def test_apply_to_model_seeded(mnist_model: Model) -> None:
+    bitflip = Bitflip.get_instance()
+    bitflip.set_target(Target.MODEL_PARAMETER)
+    first = PerturbationJob(
+        entity=mnist_model, perturbation=bitflip, is_model=True, seed=42
+    ).apply_to_model()
+    second = PerturbationJob(
+        entity=mnist_model, perturbation=bitflip, is_model=True, seed=42
+    ).apply_to_model()
+
+    for first_param, second_param in zip(
+        first.get_model().parameters(), second.get_model().parameters()
+    ):
+        assert torch.equal(first_param, second_param)
+
+
+def test_parameter_values(mnist_dataset: Dataset) -> None:
+    perturbation = AdditiveGaussian.get_instance()
+    parameter = perturbation.get_parameters()[0]
+    value = parameter.get_value()
+    job = PerturbationJob(mnist_dataset, perturbation)
+
+    parameter.set_value(value / 2)
+    try:
+        assert job.get_parameter_values() == [(parameter.get_name(), value)]
+        job.apply_parameter_values()
+        assert parameter.get_value() == value
+
+        with pytest.raises(ValueError):
+            PerturbationJob(
+                mnist_dataset, perturbation, parameter_values=[("x", 1.0)]
+            )
+    finally:
+        parameter.set_value(value)
@@ -0,0 +1,52 @@
+import pytest
+
+from neuroshift.model.jobs.pipeline import Pipeline
+
+
+@pytest.mark.parametrize("depth", [0, 1, 3])
+def test_run(depth: int) -> None:
+    ingested = []
+    Pipeline(depth).run(
+        source=range(20),
+        prepare=lambda batch: batch * 2,
+        forward=lambda prepared: prepared + 1,
+        ingest=lambda prepared, result: ingested.append((prepared, result)),
+    )
+
+    assert ingested == [(batch * 2, batch * 2 + 1) for batch in range(20)]
+
+
+def test_run_empty() -> None:
+    ingested = []
+    Pipeline(2).run(
+        source=[],
+        prepare=lambda batch: batch,
+        forward=lambda prepared: prepared,
+        ingest=lambda prepared, result: ingested.append(result),
+    )
+
+    assert not ingested
+
+
+def fail(batch: int) -> int:
+    if batch == 5:
+        raise ValueError("failed")
+    return batch
+
+
+@pytest.mark.timeout(10)
+@pytest.mark.parametrize("stage", ["prepare", "forward", "ingest"])
+@pytest.mark.parametrize("depth", [0, 2])
+def test_run_fail(stage: str, depth: int) -> None:
+    stages = {
+        "prepare": lambda batch: batch,
+        "forward": lambda prepared: prepared,
+        "ingest": lambda prepared, result: None,
+    }
+    if stage == "ingest":
+        stages[stage] = lambda prepared, result: fail(result)
+    else:
+        stages[stage] = fail
+
+    with pytest.raises(ValueError, match="failed"):
+        Pipeline(depth).run(source=range(100), **stages)
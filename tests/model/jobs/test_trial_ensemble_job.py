@@ -0,0 +1,143 @@
+import copy
+
+import pytest
+import torch
+from pytest_mock import MockerFixture
+
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.jobs.trial_ensemble_job import TrialEnsembleJob
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.noises.model_distribution_shift.stuck_at_fault import (
+    StuckAtFault,
+)
+from neuroshift.model.noises.targets.target import Target
+
+
+@pytest.mark.timeout(60)
+def test_start(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    perturbation = StuckAtFault.get_instance()
+    perturbation.set_target(Target.MODEL_PARAMETER)
+    job = TrialEnsembleJob(
+        model=mnist_model,
+        dataset=mnist_dataset,
+        perturbation=perturbation,
+        trials=3,
+        seed=0,
+    )
+
+    result = job.start()
+    analytics = Analytics.get_instance()
+
+    assert result.is_success()
+    assert len(job.get_analytics()) == 3
+    assert job.get_analytics()[0].job_id == job.get_job_id()
+    for analytic in job.get_analytics():
+        assert analytics.get_analytic(analytic.job_id) is analytic
+        assert analytic.is_finished()
+        assert analytic.get_prediction_count() == mnist_dataset.get_size()
+    accuracies = job.get_accuracies()
+    assert job.get_accuracy_mean() == pytest.approx(sum(accuracies) / 3)
+    assert job.get_accuracy_variance() >= 0
+
+
+@pytest.mark.timeout(60)
+def test_start_seeded(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.MODEL_PARAMETER)
+    first, second = (
+        TrialEnsembleJob(
+            model=mnist_model,
+            dataset=mnist_dataset,
+            perturbation=perturbation,
+            trials=2,
+            seed=1,
+        )
+        for _ in range(2)
+    )
+
+    first.start()
+    second.start()
+
+    assert first.get_accuracies() == second.get_accuracies()
+
+
+def test_activation_perturbation(
+    mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.MODEL_ACTIVATION)
+
+    with pytest.raises(ValueError):
+        TrialEnsembleJob(
+            model=mnist_model,
+            dataset=mnist_dataset,
+            perturbation=perturbation,
+            trials=2,
+        )
+
+    perturbation.set_target(Target.MODEL_PARAMETER)
+
+
+@pytest.mark.timeout(60)
+def test_start_private_module(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    perturbation = StuckAtFault.get_instance()
+    perturbation.set_target(Target.MODEL_PARAMETER)
+    module = mnist_model.get_model()
+    parameters = {
+        name: parameter.detach().clone()
+        for name, parameter in module.named_parameters()
+    }
+    spy = mocker.spy(copy, "deepcopy")
+
+    result = TrialEnsembleJob(
+        model=mnist_model,
+        dataset=mnist_dataset,
+        perturbation=perturbation,
+        trials=2,
+        seed=0,
+    ).start()
+
+    assert result.is_success()
+    assert sum(call.args[0] is module for call in spy.call_args_list) == 1
+    for name, parameter in module.named_parameters():
+        assert torch.equal(parameter, parameters[name])
+
+
+@pytest.mark.timeout(60)
+def test_start_parameter_snapshot(
+    mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    perturbation = StuckAtFault.get_instance()
+    perturbation.set_target(Target.MODEL_PARAMETER)
+    fault_rate = perturbation.get_parameters()[0]
+    value = fault_rate.get_value()
+
+    try:
+        fault_rate.set_value(0)
+        expected = TrialEnsembleJob(
+            model=mnist_model,
+            dataset=mnist_dataset,
+            perturbation=perturbation,
+            trials=2,
+            seed=0,
+        )
+        job = TrialEnsembleJob(
+            model=mnist_model,
+            dataset=mnist_dataset,
+            perturbation=perturbation,
+            trials=2,
+            seed=0,
+        )
+        expected.start()
+
+        # the slider moves while the job is queued
+        fault_rate.set_value(1.0)
+        job.start()
+    finally:
+        fault_rate.set_value(value)
+
+    assert job.get_accuracies() == expected.get_accuracies()
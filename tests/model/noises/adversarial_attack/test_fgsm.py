@@ -1,4 +1,4 @@
-from typing import List
+from typing import Generator, List
 
 import pytest
 import torch
@@ -11,8 +11,14 @@ from neuroshift.model.noises.adversarial_attack.fast_gradient_sign_method import
 
 
 @pytest.fixture
-def fgsm() -> FastGradientSignMethod:
-    return FastGradientSignMethod.get_instance()
+def fgsm() -> Generator[FastGradientSignMethod, None, None]:
+    instance = FastGradientSignMethod.get_instance()
+    values = [parameter.get_value() for parameter in instance.get_parameters()]
+
+    yield instance
+
+    for parameter, value in zip(instance.get_parameters(), values):
+        parameter.set_value(value)
 
 
 def test_constructor(fgsm: FastGradientSignMethod) -> None:
@@ -79,3 +85,47 @@ def test_attack_apply_to_tensor(
 
 def test__str__(fgsm: FastGradientSignMethod) -> None:
     assert str(fgsm) == "Fast Gradient Sign Method"
+
+
+def test_attack_apply_to_batch(
+    fgsm: FastGradientSignMethod, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    model = mnist_model.get_model()
+    batch = torch.stack([image.get_tensor() for image in mnist_images[:4]])
+
+    attacked_batch = fgsm.apply_to_tensor(model=model, image=batch)
+
+    assert attacked_batch.shape == batch.shape
+
+
+def test_attack_leaves_model_untouched(
+    fgsm: FastGradientSignMethod, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    model = mnist_model.get_model()
+    model.eval()
+    image_tensor = mnist_images[0].get_tensor().unsqueeze(0)
+
+    fgsm.apply_to_tensor(model=model, image=image_tensor)
+
+    assert not model.training
+    assert not image_tensor.requires_grad
+    assert all(parameter.grad is None for parameter in model.parameters())
+
+
+def test_gradient_sign_reused_for_epsilons(
+    fgsm: FastGradientSignMethod, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    fgsm.get_parameters()[0].set_value(0.2)
+    model = mnist_model.get_model()
+    batch = torch.stack([image.get_tensor() for image in mnist_images[:4]])
+
+    sign = fgsm.gradient_sign(model=model, image=batch)
+
+    assert not sign.requires_grad
+    assert torch.equal(
+        fgsm.fsgm_attack(batch, sign), fgsm.apply_to_tensor(model, batch)
+    )
+    assert torch.equal(
+        fgsm.fsgm_attack(batch, sign, epsilon=0.5),
+        torch.clamp(batch + 0.5 * sign, 0, 1),
+    )
@@ -0,0 +1,84 @@
+from typing import List
+
+import pytest
+import torch
+
+from neuroshift.model.data.image import Image
+from neuroshift.model.data.model import Model
+from neuroshift.model.noises.adversarial_attack.basic_iterative_method import (
+    BasicIterativeMethod,
+)
+from neuroshift.model.noises.adversarial_attack.iterative_attack import (
+    IterativeAttack,
+)
+from neuroshift.model.noises.adversarial_attack.projected_gradient_descent import (
+    ProjectedGradientDescent,
+)
+
+
+@pytest.fixture(
+    params=[BasicIterativeMethod, ProjectedGradientDescent],
+    ids=["bim", "pgd"],
+)
+def iterative_attack(request: pytest.FixtureRequest) -> IterativeAttack:
+    return request.param.get_instance()
+
+
+def test_get_instance(iterative_attack: IterativeAttack) -> None:
+    assert type(iterative_attack).get_instance() is iterative_attack
+    assert len(iterative_attack.get_parameters()) == 3
+
+
+def test_apply_to_tensor(
+    iterative_attack: IterativeAttack,
+    mnist_model: Model,
+    mnist_images: List[Image],
+) -> None:
+    epsilon = iterative_attack.get_parameters()[0].get_value()
+    batch = torch.stack([image.get_tensor() for image in mnist_images])
+
+    attacked_batch = iterative_attack.apply_to_tensor(
+        model=mnist_model.get_model(), image=batch
+    )
+
+    assert attacked_batch.shape == batch.shape
+    assert not attacked_batch.requires_grad
+    assert torch.all((attacked_batch - batch).abs() <= epsilon + 1e-6)
+    assert torch.all((attacked_batch >= 0) & (attacked_batch <= 1))
+
+
+def test_apply_to_tensor_no_steps(
+    mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    bim = BasicIterativeMethod.get_instance()
+    steps = bim.get_parameters()[2]
+    value = steps.get_value()
+    steps.set_value(0)
+    batch = mnist_images[0].get_tensor().unsqueeze(0)
+
+    try:
+        attacked_batch = bim.apply_to_tensor(
+            model=mnist_model.get_model(), image=batch
+        )
+    finally:
+        steps.set_value(value)
+
+    assert torch.equal(attacked_batch, batch)
+
+
+def test_apply_to_tensor_seeded(
+    mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    pgd = ProjectedGradientDescent.get_instance()
+    batch = torch.stack([image.get_tensor() for image in mnist_images])
+
+    first, second = (
+        pgd.apply_to_tensor(
+            model=mnist_model.get_model(),
+            image=batch,
+            generator=torch.Generator().manual_seed(0),
+        )
+        for _ in range(2)
+    )
+
+    assert torch.equal(first, second)
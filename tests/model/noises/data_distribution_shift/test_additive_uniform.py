@@ -58,3 +58,16 @@ def test_clamp_tensor_values(additive_uniform: AdditiveUniform) -> None:
 
     assert torch.all(torch.ge(perturbed_tensor, 0))
     assert torch.all(torch.le(perturbed_tensor, 1))
+
+
+def test_apply_to_tensor_seeded(additive_uniform: AdditiveUniform) -> None:
+    tensor = torch.rand(16, 16)
+
+    first = additive_uniform.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+    second = additive_uniform.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+
+    assert torch.equal(first, second)
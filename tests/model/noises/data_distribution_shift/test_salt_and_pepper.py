@@ -46,3 +46,16 @@ def test_clamp_tensor_values(salt_and_pepper: SaltAndPepper) -> None:
 
     assert torch.all(torch.ge(perturbed_tensor, 0))
     assert torch.all(torch.le(perturbed_tensor, 1))
+
+
+def test_apply_to_tensor_seeded(salt_and_pepper: SaltAndPepper) -> None:
+    tensor = torch.rand(16, 16)
+
+    first = salt_and_pepper.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+    second = salt_and_pepper.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+
+    assert torch.equal(first, second)
@@ -1,3 +1,5 @@
+from typing import Generator
+
 import torch
 import pytest
 from neuroshift.model.noises.model_distribution_shift.bitflip import (
@@ -6,8 +8,14 @@ from neuroshift.model.noises.model_distribution_shift.bitflip import (
 
 
 @pytest.fixture
-def bitflip() -> Bitflip:
-    return Bitflip.get_instance()
+def bitflip() -> Generator[Bitflip, None, None]:
+    instance = Bitflip.get_instance()
+    values = [parameter.get_value() for parameter in instance.get_parameters()]
+
+    yield instance
+
+    for parameter, value in zip(instance.get_parameters(), values):
+        parameter.set_value(value)
 
 
 def test_constructor(bitflip: Bitflip) -> None:
@@ -51,3 +59,55 @@ def test_apply_to_tensor_with_noise(bitflip: Bitflip) -> None:
 
     assert perturbed_tensor.shape == tensor.shape
     assert not torch.all(torch.eq(tensor, perturbed_tensor))
+
+
+def test_apply_to_tensor_seeded(bitflip: Bitflip) -> None:
+    bitflip.get_parameters()[0].set_value(1.0)
+    tensor = torch.rand(64, 64, dtype=torch.float32)
+
+    first = bitflip.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+    second = bitflip.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+
+    assert torch.equal(first, second)
+
+
+def test_apply_to_tensor_keeps_dtype(bitflip: Bitflip) -> None:
+    bitflip.get_parameters()[0].set_value(1.0)
+
+    for dtype in [torch.float16, torch.float32, torch.float64]:
+        tensor = torch.rand(64, 64, dtype=dtype)
+
+        perturbed_tensor = bitflip.apply_to_tensor(tensor)
+
+        assert perturbed_tensor.dtype == dtype
+        assert not torch.equal(perturbed_tensor, tensor)
+
+
+def test_apply_to_tensor_collisions(bitflip: Bitflip) -> None:
+    bitflip.get_parameters()[0].set_value(1.0)
+    tensor = torch.rand(64, 64, dtype=torch.float32)
+
+    perturbed_tensor = bitflip.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+
+    # the same flips applied one after the other, a few hundred flips of
+    # 4096 values draw some values several times
+    generator = torch.Generator().manual_seed(0)
+    num_flips = int(tensor.numel() / 10.0)
+    indices = torch.randint(tensor.numel(), (num_flips,), generator=generator)
+    positions = torch.randint(
+        32, (num_flips,), generator=generator, dtype=torch.int32
+    )
+    assert indices.unique().numel() < num_flips
+
+    expected = tensor.clone()
+    bits = expected.view(-1).view(torch.int32)
+    for index, position in zip(indices.tolist(), positions.tolist()):
+        bits[index] ^= torch.tensor(1, dtype=torch.int32) << position
+
+    assert torch.equal(perturbed_tensor.view(torch.int32), bits.view(64, 64))
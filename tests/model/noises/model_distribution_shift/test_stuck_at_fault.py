@@ -1,3 +1,5 @@
+from typing import Generator
+
 import torch
 import pytest
 from neuroshift.model.noises.model_distribution_shift.stuck_at_fault import (
@@ -6,8 +8,14 @@ from neuroshift.model.noises.model_distribution_shift.stuck_at_fault import (
 
 
 @pytest.fixture
-def stuck_at_fault() -> None:
-    return StuckAtFault.get_instance()
+def stuck_at_fault() -> Generator[StuckAtFault, None, None]:
+    instance = StuckAtFault.get_instance()
+    values = [parameter.get_value() for parameter in instance.get_parameters()]
+
+    yield instance
+
+    for parameter, value in zip(instance.get_parameters(), values):
+        parameter.set_value(value)
 
 
 def test_constructor(stuck_at_fault: StuckAtFault) -> None:
@@ -38,3 +46,31 @@ def test_apply_to_tensor_with_no_noise(stuck_at_fault: StuckAtFault) -> None:
 
     assert tensor.shape == perturbed_tensor.shape
     assert torch.all(torch.eq(tensor, perturbed_tensor))
+
+
+def test_apply_to_tensor_seeded(stuck_at_fault: StuckAtFault) -> None:
+    stuck_at_fault.get_parameters()[0].set_value(1.0)
+    tensor = torch.rand(64, 64, dtype=torch.float32)
+
+    first = stuck_at_fault.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+    second = stuck_at_fault.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+
+    assert torch.equal(first, second)
+
+
+def test_apply_to_tensor_fault_rate(stuck_at_fault: StuckAtFault) -> None:
+    stuck_at_fault.get_parameters()[0].set_value(0.6)
+    tensor = torch.full((512, 512), 0.5)
+
+    perturbed_tensor = stuck_at_fault.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+    faults = perturbed_tensor != tensor
+
+    assert faults.float().mean().item() == pytest.approx(0.1, abs=0.005)
+    assert set(perturbed_tensor[faults].tolist()) <= {-1.0, 0.0, 1.0}
+    assert torch.equal(tensor, torch.full((512, 512), 0.5))
@@ -0,0 +1,143 @@
+from typing import Generator, List
+
+import pytest
+import torch
+from pytest_mock import MockerFixture
+from torch import nn
+
+import neuroshift.config as conf
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.noises.targets.activation_cache import (
+    ActivationCache,
+)
+from neuroshift.model.noises.targets.module_perturb import ModulePerturb
+from neuroshift.model.noises.targets.target import Target
+
+
+@pytest.fixture
+def noiseless_gaussian() -> Generator[AdditiveGaussian, None, None]:
+    additive_gaussian = AdditiveGaussian()
+    strength = additive_gaussian.get_parameters()[0]
+    value = strength.get_value()
+    additive_gaussian.set_target(Target.MODEL_ACTIVATION)
+    strength.set_value(0)
+
+    yield additive_gaussian
+
+    strength.set_value(value)
+
+
+@pytest.fixture
+def boundary(mnist_model: Model) -> str:
+    leaves: List[str] = [
+        name
+        for name, module in mnist_model.get_model().named_modules()
+        if len(list(module.children())) == 0
+    ]
+
+    return leaves[-1]
+
+
+def test_constructor(mnist_model: Model, boundary: str) -> None:
+    cache = ActivationCache(model=mnist_model, boundary=boundary)
+
+    assert cache.get_boundary() == boundary
+    assert len(cache.get_upstream()) > 0
+    assert boundary not in cache.get_upstream()
+
+
+def test_constructor_fail(mnist_model: Model) -> None:
+    with pytest.raises(ValueError):
+        ActivationCache(model=mnist_model, boundary="not a layer")
+
+
+def test_get_instance(mnist_model: Model, boundary: str) -> None:
+    cache = ActivationCache.get_instance(mnist_model, boundary)
+
+    assert ActivationCache.get_instance(mnist_model, boundary) is cache
+    assert ActivationCache.get_instance(mnist_model, boundary, True) is not (
+        cache
+    )
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_replay(
+    mnist_model: Model,
+    mnist_dataset: Dataset,
+    noiseless_gaussian: AdditiveGaussian,
+    boundary: str,
+    on_disk: bool,
+) -> None:
+    cache = ActivationCache(
+        model=mnist_model, boundary=boundary, on_disk=on_disk
+    )
+    cache.clear()
+    module = ModulePerturb(
+        module=mnist_model.get_model(),
+        perturbation=noiseless_gaussian,
+        activation_cache=cache,
+    ).run()
+    tensor = next(iter(mnist_dataset))[0].to(conf.device)
+
+    with torch.no_grad():
+        expected = mnist_model.get_model()(tensor)
+        first = module(tensor)
+        second = module(tensor)
+
+    assert torch.allclose(first, expected)
+    assert torch.allclose(second, expected)
+
+
+def test_stored() -> None:
+    model = Model(
+        name="sequential",
+        file_name="sequential.onnx",
+        desc="",
+        model=nn.Sequential(
+            nn.Conv2d(1, 2, 3),
+            nn.ReLU(),
+            nn.Flatten(),
+            nn.Linear(2 * 26 * 26, 10),
+            nn.Softmax(dim=1),
+        ),
+        order=[str(index) for index in range(10)],
+        channels=1,
+        width=28,
+        height=28,
+    )
+    cache = ActivationCache(model=model, boundary="3")
+
+    assert cache.get_upstream() == ["0", "1", "2"]
+    assert "0" not in cache.get_stored()
+    assert "2" in cache.get_stored()
+
+
+def test_eviction(
+    mocker: MockerFixture,
+    mnist_model: Model,
+    mnist_dataset: Dataset,
+    noiseless_gaussian: AdditiveGaussian,
+    boundary: str,
+) -> None:
+    cache = ActivationCache(model=mnist_model, boundary=boundary)
+    module = ModulePerturb(
+        module=mnist_model.get_model(),
+        perturbation=noiseless_gaussian,
+        activation_cache=cache,
+    ).run()
+    tensor = next(iter(mnist_dataset))[0].to(conf.device)
+
+    with torch.no_grad():
+        module(tensor)
+    assert len(cache) == 1
+
+    mocker.patch.object(conf, "ACTIVATION_CACHE_SIZE", cache.get_size())
+    with torch.no_grad():
+        expected = mnist_model.get_model()(tensor + 0.5)
+        result = module(tensor + 0.5)
+
+    assert len(cache) == 1
+    assert cache.get_size() <= conf.ACTIVATION_CACHE_SIZE
+    assert torch.allclose(result, expected)
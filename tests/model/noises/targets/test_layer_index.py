@@ -0,0 +1,31 @@
+from neuroshift.model.data.model import Model
+from neuroshift.model.noises.targets.layer_index import LayerIndex
+
+
+def test_get_instance(mnist_model: Model) -> None:
+    index = LayerIndex.get_instance(mnist_model.get_model())
+
+    assert LayerIndex.get_instance(mnist_model.get_model()) is index
+    assert len(index) > 0
+
+
+def test_sites(mnist_model: Model) -> None:
+    module = mnist_model.get_model()
+    index = LayerIndex.get_instance(
+        module,
+        (
+            mnist_model.get_input_channels(),
+            mnist_model.get_input_height(),
+            mnist_model.get_input_width(),
+        ),
+    )
+
+    assert index.is_traced()
+    for position, site in enumerate(index.get_sites()):
+        assert site.get_index() == position
+        assert site.get_depth() == site.get_name().count(".") + 1
+        assert site.get_output_shape() is not None
+        assert LayerIndex.is_activation(module.get_submodule(site.get_name()))
+        assert index.get_site(site.get_name()) is site
+
+    assert index.get_site("not a layer") is None
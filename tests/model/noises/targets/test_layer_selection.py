@@ -0,0 +1,44 @@
+import pytest
+
+from neuroshift.model.data.model import Model
+from neuroshift.model.noises.targets.layer_index import LayerIndex
+from neuroshift.model.noises.targets.layer_selection import LayerSelection
+
+
+@pytest.fixture
+def index(mnist_model: Model) -> LayerIndex:
+    return LayerIndex.get_instance(mnist_model.get_model())
+
+
+def test_by_names(index: LayerIndex) -> None:
+    name = index.get_names()[0]
+    sites = LayerSelection.by_names([name]).select(index)
+
+    assert [site.get_name() for site in sites] == [name]
+
+
+def test_by_names_fail(index: LayerIndex) -> None:
+    with pytest.raises(ValueError):
+        LayerSelection.by_names(["not a layer"]).select(index)
+
+
+def test_by_range(index: LayerIndex) -> None:
+    sites = LayerSelection.by_range(1).select(index)
+
+    assert [site.get_name() for site in sites] == index.get_names()[1:]
+
+
+def test_last(index: LayerIndex) -> None:
+    sites = LayerSelection.last(1).select(index)
+
+    assert [site.get_name() for site in sites] == index.get_names()[-1:]
+    assert LayerSelection.last(0).select(index) == []
+    assert len(LayerSelection.last(len(index) + 1).select(index)) == len(
+        index
+    )
+
+
+def test_str() -> None:
+    assert str(LayerSelection.by_names(["a", "b"])) == "layers a, b"
+    assert str(LayerSelection.by_range(1, 3)) == "layers 1:3"
+    assert str(LayerSelection.last(2)) == "last 2 layers"
@@ -2,7 +2,11 @@ import pytest
 
 from neuroshift.model.noises.perturbation import Perturbation
 from neuroshift.model.data.model import Model
+from neuroshift.model.noises.targets.layer_index import LayerIndex
 from neuroshift.model.noises.targets.module_perturb import ModulePerturb
+from neuroshift.model.noises.targets.perturbation_layer import (
+    PerturbationLayer,
+)
 from tests.model.noises.test_perturbation import perturbation  # noqa
 
 
@@ -25,3 +29,25 @@ def test_module_perturb_run(
     perturbed_module = module_perturb.run()
 
     assert perturbed_module is not mnist_model.get_model()
+    assert not any(
+        isinstance(module, PerturbationLayer)
+        for module in mnist_model.get_model().modules()
+    )
+
+
+def test_module_perturb_layers(
+    mnist_model: Model, perturbation: Perturbation
+) -> None:
+    name = LayerIndex.get_instance(mnist_model.get_model()).get_names()[-1]
+    perturbed_module = ModulePerturb(
+        module=mnist_model.get_model(),
+        perturbation=perturbation,
+        layers=[name],
+    ).run()
+
+    perturbed = [
+        module_name
+        for module_name, module in perturbed_module.named_modules()
+        if isinstance(module, PerturbationLayer)
+    ]
+    assert perturbed == [name]
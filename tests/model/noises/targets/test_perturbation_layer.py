@@ -34,3 +34,17 @@ def test_forward(
 
     assert perturbed_image.shape == image.shape
     assert not torch.all(torch.eq(perturbed_image, image))
+
+
+def test_forward_on_device(additive_gaussian: AdditiveGaussian) -> None:
+    layer = PerturbationLayer(
+        layer=torch.nn.ReLU(),
+        perturbation=additive_gaussian,
+        generator=torch.Generator(device=conf.device),
+    )
+    tensor = torch.rand(2, 3, 8, 8, device=conf.device, dtype=torch.float64)
+
+    perturbed_tensor = layer.forward(tensor)
+
+    assert perturbed_tensor.device == tensor.device
+    assert perturbed_tensor.dtype == tensor.dtype
@@ -33,3 +33,16 @@ def test_clamp_tensor_values(additive_gaussian: AdditiveGaussian) -> None:
 
     assert torch.all(torch.ge(perturbed_tensor, 0))
     assert torch.all(torch.le(perturbed_tensor, 1))
+
+
+def test_apply_to_tensor_seeded(additive_gaussian: AdditiveGaussian) -> None:
+    tensor = torch.rand(4, 4)
+
+    first = additive_gaussian.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+    second = additive_gaussian.apply_to_tensor(
+        tensor, generator=torch.Generator().manual_seed(0)
+    )
+
+    assert torch.equal(first, second)
@@ -0,0 +1,101 @@
+from typing import List
+
+import pytest
+import torch
+
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.jobs.inference_job import InferenceJob
+from neuroshift.model.jobs.perturbation_job import PerturbationJob
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.noises.composite_perturbation import (
+    CompositePerturbation,
+)
+from neuroshift.model.noises.data_distribution_shift.rotation import Rotation
+from neuroshift.model.noises.data_distribution_shift.speckle_noise import (
+    SpeckleNoise,
+)
+from neuroshift.model.noises.perturbation import Perturbation
+from neuroshift.model.noises.targets.target import Target
+
+
+@pytest.fixture
+def noises() -> List[Perturbation]:
+    noises = [
+        Rotation.get_instance(),
+        SpeckleNoise.get_instance(),
+        AdditiveGaussian.get_instance(),
+    ]
+    for noise in noises:
+        noise.set_target(Target.DATASET)
+
+    return noises
+
+
+def test_composite_name_and_parameters(noises: List[Perturbation]) -> None:
+    composite = CompositePerturbation(noises)
+
+    assert composite.get_name() == (
+        "Rotation + Speckle Noise + Additive Gaussian"
+    )
+    assert composite.get_perturbations() == noises
+    assert composite.get_parameters() == [
+        parameter
+        for noise in noises
+        for parameter in noise.get_parameters()
+    ]
+    assert composite.get_target() == Target.DATASET
+
+
+def test_composite_set_target(noises: List[Perturbation]) -> None:
+    composite = CompositePerturbation(noises[1:])
+
+    composite.set_target(Target.MODEL_PARAMETER)
+
+    assert all(
+        noise.get_target() == Target.MODEL_PARAMETER for noise in noises[1:]
+    )
+    composite.set_target(Target.DATASET)
+
+
+def test_composite_apply_to_tensor(noises: List[Perturbation]) -> None:
+    composite = CompositePerturbation(noises)
+    tensor = torch.rand(1, 28, 28)
+
+    expected = tensor
+    generator = torch.Generator().manual_seed(0)
+    for noise in noises:
+        expected = noise.apply_to_tensor(expected, generator=generator)
+
+    assert torch.equal(
+        composite.apply_to_tensor(
+            tensor, generator=torch.Generator().manual_seed(0)
+        ),
+        expected,
+    )
+
+
+def test_composite_empty() -> None:
+    with pytest.raises(ValueError):
+        CompositePerturbation([])
+
+
+@pytest.mark.timeout(30)
+def test_composite_inference(
+    noises: List[Perturbation], mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    composite = CompositePerturbation(noises)
+    job = InferenceJob(
+        model=mnist_model,
+        dataset=mnist_dataset,
+        perturbation_job=PerturbationJob(mnist_dataset, composite),
+        seed=0,
+    )
+
+    result = job.start()
+
+    assert result.is_success()
+    assert job.get_analytic().key == Analytic.get_key(
+        mnist_model, mnist_dataset, f"{composite.get_name()}-{Target.DATASET}"
+    )
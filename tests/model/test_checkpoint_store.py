@@ -0,0 +1,47 @@
+import os
+
+import neuroshift.config as conf
+from neuroshift.model.checkpoint_store import CheckpointStore
+
+
+def test_save_load_delete() -> None:
+    store = CheckpointStore.get_instance()
+    for job_id in store.get_job_ids():
+        store.delete(job_id)
+
+    assert store.load("first") is None
+
+    store.save("first", {"cursor": 1, "results": [("1", 0.5)]})
+    store.save("second", {"cursor": 2})
+    store.save("first", {"cursor": 3, "results": [("1", 0.5), ("2", 1.0)]})
+
+    assert store.load("first") == {
+        "cursor": 3,
+        "results": [("1", 0.5), ("2", 1.0)],
+    }
+    assert sorted(store.get_job_ids()) == ["first", "second"]
+    assert not any(
+        name.endswith(".tmp")
+        for name in os.listdir(os.path.join(conf.CACHE_PATH, "checkpoints"))
+    )
+
+    store.delete("first")
+    store.delete("unknown")
+
+    assert store.load("first") is None
+    assert store.get_job_ids() == ["second"]
+
+    store.delete("second")
+    assert not store.get_job_ids()
+
+
+def test_load_corrupted() -> None:
+    store = CheckpointStore.get_instance()
+    store.save("corrupted", {"cursor": 1})
+    with open(
+        os.path.join(conf.CACHE_PATH, "checkpoints", "corrupted.ckpt"), "wb"
+    ) as f:
+        f.write(b"not a checkpoint")
+
+    assert store.load("corrupted") is None
+    store.delete("corrupted")
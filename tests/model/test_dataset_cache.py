@@ -0,0 +1,91 @@
+import os
+
+import torch
+from pytest_mock.plugin import MockerFixture
+
+import neuroshift.config as conf
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.dataset_cache import DatasetCache
+from neuroshift.model.jobs.inference_job import InferenceJob
+from neuroshift.model.jobs.perturbation_job import PerturbationJob
+from neuroshift.model.data.model import Model
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.noises.targets.target import Target
+
+
+def perturb(dataset: Dataset, seed: int) -> Dataset:
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.DATASET)
+    job = PerturbationJob(entity=dataset, perturbation=perturbation)
+
+    return job.apply_to_dataset(torch.Generator().manual_seed(seed))
+
+
+def test_get_put(mnist_dataset: Dataset) -> None:
+    cache = DatasetCache.get_instance()
+    cache.clear()
+    perturbation = AdditiveGaussian.get_instance()
+    perturbed_dataset = perturb(mnist_dataset, 0)
+
+    assert cache.get(mnist_dataset, perturbation, 0) is None
+
+    cache.put(mnist_dataset, perturbation, 0, perturbed_dataset)
+    cached_dataset = cache.get(mnist_dataset, perturbation, 0)
+
+    assert len(cache) == 1
+    assert cache.get(mnist_dataset, perturbation, 1) is None
+    assert cached_dataset is not None
+    assert cached_dataset.get_size() == perturbed_dataset.get_size()
+    for (tensor, images), (cached_tensor, cached_images) in zip(
+        perturbed_dataset, cached_dataset
+    ):
+        assert torch.equal(tensor, cached_tensor)
+        assert [image.get_label() for image in images] == [
+            image.get_label() for image in cached_images
+        ]
+        assert [image.get_class() for image in images] == [
+            image.get_class() for image in cached_images
+        ]
+
+
+def test_eviction(mocker: MockerFixture, mnist_dataset: Dataset) -> None:
+    cache = DatasetCache.get_instance()
+    cache.clear()
+    perturbation = AdditiveGaussian.get_instance()
+
+    cache.put(mnist_dataset, perturbation, 0, perturb(mnist_dataset, 0))
+    mocker.patch.object(conf, "DATASET_CACHE_SIZE", cache.get_size() + 1)
+    cache.put(mnist_dataset, perturbation, 1, perturb(mnist_dataset, 1))
+
+    assert len(cache) == 1
+    assert cache.get(mnist_dataset, perturbation, 0) is None
+    assert cache.get(mnist_dataset, perturbation, 1) is not None
+    assert len(os.listdir(os.path.join(conf.CACHE_PATH, "datasets"))) == 1
+
+    mocker.patch.object(conf, "DATASET_CACHE_SIZE", 0)
+    cache.put(mnist_dataset, perturbation, 2, perturb(mnist_dataset, 2))
+
+    assert cache.get(mnist_dataset, perturbation, 2) is None
+
+
+def test_inference_job_uses_cache(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    DatasetCache.get_instance().clear()
+    perturbation = AdditiveGaussian.get_instance()
+    perturbation.set_target(Target.DATASET)
+    perturbation_job = PerturbationJob(mnist_dataset, perturbation)
+    spy = mocker.spy(perturbation_job, "perturb_images")
+
+    call_counts = []
+    for _ in range(2):
+        InferenceJob(
+            model=mnist_model,
+            dataset=mnist_dataset,
+            perturbation_job=perturbation_job,
+            seed=3,
+        ).start()
+        call_counts.append(spy.call_count)
+
+    assert call_counts[0] > 0
+    assert call_counts[1] == call_counts[0]
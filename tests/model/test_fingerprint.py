@@ -0,0 +1,36 @@
+import os
+
+import neuroshift.config as conf
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.fingerprint import Fingerprint
+
+
+def test_of_file() -> None:
+    path = os.path.join(conf.CACHE_PATH, "fingerprint.bin")
+    with open(path, "wb") as file:
+        file.write(b"neuroshift")
+
+    first = Fingerprint.of_file(path)
+
+    assert first is not None
+    assert Fingerprint.of_file(path) == first
+
+    with open(path, "ab") as file:
+        file.write(b"changed")
+
+    assert Fingerprint.of_file(path) != first
+    assert Fingerprint.of_file(path + ".missing") is None
+
+
+def test_of_model_and_dataset(
+    mnist_model: Model, mnist_dataset: Dataset, empty_dataset: Dataset
+) -> None:
+    assert Fingerprint.of_model(mnist_model) is not None
+    assert Fingerprint.of_dataset(mnist_dataset) is not None
+    assert Fingerprint.of_dataset(
+        mnist_dataset
+    ) == Fingerprint.of_directory(
+        os.path.join(conf.DATASET_PATH, mnist_dataset.get_file_name())
+    )
+    assert Fingerprint.of_dataset(empty_dataset) is None
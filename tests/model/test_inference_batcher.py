@@ -0,0 +1,78 @@
+from typing import List
+
+import pytest
+import torch
+from pytest_mock import MockerFixture
+
+from neuroshift.model.data.image import Image
+from neuroshift.model.data.model import Model
+from neuroshift.model.inference_batcher import InferenceBatcher
+from neuroshift.model.utils import Utils
+import neuroshift.config as conf
+
+
+@pytest.mark.timeout(10)
+def test_submit(
+    mocker: MockerFixture, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    mocker.patch.object(conf, "BATCH_WINDOW", 0.5)
+    spy = mocker.spy(mnist_model, "decode")
+    images = mnist_images[:4]
+
+    futures = [
+        InferenceBatcher.get_instance().submit(mnist_model, image)
+        for image in images
+    ]
+    results = [future.result() for future in futures]
+
+    assert spy.call_count == 1
+    tensor = torch.cat(
+        [
+            Utils.shape_to(
+                torch.unsqueeze(image.get_tensor(), dim=0),
+                height=mnist_model.get_input_height(),
+                width=mnist_model.get_input_width(),
+                channels=mnist_model.get_input_channels(),
+            )
+            for image in images
+        ]
+    )
+    with torch.no_grad():
+        expected = mnist_model(tensor)
+    assert [result[0] for result in results] == [
+        result[0] for result in expected
+    ]
+
+
+@pytest.mark.timeout(10)
+def test_submit_batch_size(
+    mocker: MockerFixture, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    mocker.patch.object(conf, "BATCH_WINDOW", 0.5)
+    mocker.patch.object(conf, "BATCH_SIZE", 2)
+    spy = mocker.spy(mnist_model, "decode")
+
+    futures = [
+        InferenceBatcher.get_instance().submit(mnist_model, image)
+        for image in mnist_images[:4]
+    ]
+    for future in futures:
+        future.result()
+
+    assert spy.call_count == 2
+
+
+@pytest.mark.timeout(10)
+def test_submit_fail(
+    mocker: MockerFixture, mnist_model: Model, mnist_images: List[Image]
+) -> None:
+    mocker.patch.object(
+        mnist_model, "decode", side_effect=RuntimeError("failed")
+    )
+
+    future = InferenceBatcher.get_instance().submit(
+        mnist_model, mnist_images[0]
+    )
+
+    with pytest.raises(RuntimeError, match="failed"):
+        future.result()
@@ -1,8 +1,14 @@
+import time
+from typing import List
+
+import pytest
 from pytest_mock.plugin import MockerFixture
 
+from neuroshift.model.data.analytic import Analytic
 from neuroshift.model.job_queue import JobQueue
 from neuroshift.model.jobs.job import Job
 from neuroshift.model.jobs.job_result import JobResult
+import neuroshift.config as conf
 
 
 def test_jobqueue(mocker: MockerFixture) -> None:
@@ -29,3 +35,151 @@ def test_jobqueue(mocker: MockerFixture) -> None:
     job_queue.add_job(job)
 
     job_queue.wait_completion()
+
+
+class FlakyJob(Job):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+
+    def start(self) -> JobResult:
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise OSError("flaky")
+        return JobResult()
+
+
+class TransientJob(Job):
+    def __init__(self, failures: int) -> None:
+        super().__init__()
+        self.failures = failures
+        self.attempts = 0
+        self.analytic = Analytic(job_id=self.get_job_id(), total_predictions=1)
+
+    def get_analytics(self) -> List[Analytic]:
+        return [self.analytic]
+
+    def start(self) -> JobResult:
+        self.attempts += 1
+        try:
+            if self.attempts <= self.failures:
+                raise OSError("disk unavailable")
+            result = JobResult()
+        except Exception as err:
+            result = self.create_error_result(err)
+        return self.finish(result)
+
+
+class SlowJob(Job):
+    def __init__(self) -> None:
+        super().__init__()
+        self.batches = 0
+        self.analytic = Analytic(job_id=self.get_job_id(), total_predictions=1)
+
+    def get_analytics(self) -> List[Analytic]:
+        return [self.analytic]
+
+    def start(self) -> JobResult:
+        try:
+            for _ in range(10):
+                self.check_cancelled()
+                self.batches += 1
+                time.sleep(0.1)
+            result = JobResult()
+        except Exception as err:
+            result = self.create_error_result(err)
+        return self.finish(result)
+
+
+@pytest.mark.timeout(10)
+def test_jobqueue_retry(mocker: MockerFixture) -> None:
+    mocker.patch.object(conf, "RETRY_BACKOFF", 0.01)
+    job_queue = JobQueue.get_instance()
+    job_queue.clear_dead_letters()
+
+    job = FlakyJob(failures=conf.MAX_RETRIES)
+    job_queue.add_job(job)
+    job_queue.wait_completion()
+
+    assert job.attempts == conf.MAX_RETRIES + 1
+    assert not job_queue.get_dead_letters()
+
+    job = FlakyJob(failures=conf.MAX_RETRIES + 1)
+    job_queue.add_job(job)
+    job_queue.wait_completion()
+
+    dead_letters = job_queue.get_dead_letters()
+    assert len(dead_letters) == 1
+    assert dead_letters[0].get_job_id() == job.get_job_id()
+    assert dead_letters[0].get_job_type() == "FlakyJob"
+    assert dead_letters[0].get_error_msg() == "flaky"
+    assert dead_letters[0].get_attempts() == conf.MAX_RETRIES + 1
+    assert dead_letters[0].get_queued_at() <= dead_letters[0].get_failed_at()
+
+
+@pytest.mark.timeout(10)
+def test_jobqueue_timeout() -> None:
+    job_queue = JobQueue.get_instance()
+    job_queue.clear_dead_letters()
+
+    job = SlowJob()
+    job_queue.add_job(job, timeout=0.1)
+    job_queue.wait_completion()
+
+    dead_letters = job_queue.get_dead_letters()
+    assert len(dead_letters) == 1
+    assert dead_letters[0].get_job_id() == job.get_job_id()
+    assert dead_letters[0].get_attempts() == 1
+    assert "Timed out" in dead_letters[0].get_error_msg()
+    assert dead_letters[0].get_duration() < 1
+
+    # the cancelled attempt stops at its next batch, leaving the analytic
+    # failed
+    time.sleep(0.5)
+    assert job.is_cancelled()
+    assert job.batches < 10
+    assert job.analytic.is_finished()
+    assert not job.analytic.get_result().is_success()
+
+
+@pytest.mark.timeout(10)
+def test_jobqueue_deterministic_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(conf, "RETRY_BACKOFF", 0.01)
+    mocker.patch.object(
+        FlakyJob, "start", side_effect=ValueError("shape"), autospec=True
+    )
+    job_queue = JobQueue.get_instance()
+    job_queue.clear_dead_letters()
+
+    job = FlakyJob(failures=0)
+    job_queue.add_job(job)
+    job_queue.wait_completion()
+
+    dead_letters = job_queue.get_dead_letters()
+    assert len(dead_letters) == 1
+    assert dead_letters[0].get_attempts() == 1
+    assert dead_letters[0].get_error_msg() == "shape"
+
+
+@pytest.mark.timeout(10)
+def test_jobqueue_transient_error(mocker: MockerFixture) -> None:
+    mocker.patch.object(conf, "RETRY_BACKOFF", 0.01)
+    job_queue = JobQueue.get_instance()
+    job_queue.clear_dead_letters()
+
+    job = TransientJob(failures=1)
+    job_queue.add_job(job)
+    job_queue.wait_completion()
+
+    assert job.attempts == 2
+    assert not job_queue.get_dead_letters()
+    assert job.analytic.get_result().is_success()
+
+
+def test_create_error_result() -> None:
+    assert Job.create_error_result(OSError("disk")).is_retryable()
+    assert Job.create_error_result(
+        RuntimeError("CUDA out of memory")
+    ).is_retryable()
+    assert not Job.create_error_result(ValueError("shape")).is_retryable()
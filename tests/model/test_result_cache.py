@@ -0,0 +1,169 @@
+from pytest_mock.plugin import MockerFixture
+
+import neuroshift.config as conf
+from neuroshift.model.data.analytic import Analytic
+from neuroshift.model.data.analytics import Analytics
+from neuroshift.model.data.dataset import Dataset
+from neuroshift.model.data.model import Model
+from neuroshift.model.fingerprint import Fingerprint
+from neuroshift.model.jobs.job_result import JobResult
+from neuroshift.model.noises.additive_gaussian import AdditiveGaussian
+from neuroshift.model.result_cache import ResultCache
+
+
+def create_analytic(model: Model, dataset: Dataset) -> Analytic:
+    analytic = Analytic(
+        job_id=Analytic.get_new_name(),
+        total_predictions=dataset.get_size(),
+        model=model,
+        dataset=dataset,
+    )
+    Analytics.get_instance().add_analytic(analytic)
+
+    return analytic
+
+
+def test_get_put(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    analytic = create_analytic(mnist_model, mnist_dataset)
+
+    assert cache.get(mnist_model, mnist_dataset) is None
+
+    cache.put(analytic.job_id, mnist_model, mnist_dataset)
+
+    assert cache.get(mnist_model, mnist_dataset) == analytic.job_id
+
+
+def test_perturbation_requires_seed(
+    mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    perturbation = AdditiveGaussian.get_instance()
+    analytic = create_analytic(mnist_model, mnist_dataset)
+
+    cache.put(analytic.job_id, mnist_model, mnist_dataset, perturbation)
+    assert len(cache) == 0
+
+    cache.put(analytic.job_id, mnist_model, mnist_dataset, perturbation, 1)
+    assert cache.get(mnist_model, mnist_dataset) is None
+    assert cache.get(mnist_model, mnist_dataset, perturbation, 2) is None
+    assert (
+        cache.get(mnist_model, mnist_dataset, perturbation, 1)
+        == analytic.job_id
+    )
+
+    perturbation.get_parameters()[0].set_value(
+        perturbation.get_parameters()[0].get_value() / 2
+    )
+    assert cache.get(mnist_model, mnist_dataset, perturbation, 1) is None
+
+
+def test_parameter_values(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    perturbation = AdditiveGaussian.get_instance()
+    parameter = perturbation.get_parameters()[0]
+    value = parameter.get_value()
+    parameter_values = [(parameter.get_name(), value)]
+    analytic = create_analytic(mnist_model, mnist_dataset)
+
+    try:
+        cache.put(
+            analytic.job_id,
+            mnist_model,
+            mnist_dataset,
+            perturbation,
+            1,
+            parameter_values=parameter_values,
+        )
+        parameter.set_value(value / 2)
+
+        assert cache.get(mnist_model, mnist_dataset, perturbation, 1) is None
+        assert (
+            cache.get(
+                mnist_model,
+                mnist_dataset,
+                perturbation,
+                1,
+                parameter_values=parameter_values,
+            )
+            == analytic.job_id
+        )
+    finally:
+        parameter.set_value(value)
+
+
+def test_failed_result(mnist_model: Model, mnist_dataset: Dataset) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    analytic = create_analytic(mnist_model, mnist_dataset)
+    cache.put(analytic.job_id, mnist_model, mnist_dataset)
+
+    analytic.set_result(JobResult(error_msg="error"))
+
+    assert cache.get(mnist_model, mnist_dataset) is None
+    assert len(cache) == 0
+
+
+def test_eviction(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    perturbation = AdditiveGaussian.get_instance()
+    mocker.patch.object(conf, "RESULT_CACHE_SIZE", 2)
+
+    for seed in range(3):
+        analytic = create_analytic(mnist_model, mnist_dataset)
+        cache.put(
+            analytic.job_id, mnist_model, mnist_dataset, perturbation, seed
+        )
+
+    assert len(cache) == 2
+    assert cache.get(mnist_model, mnist_dataset, perturbation, 0) is None
+
+    mocker.patch.object(conf, "RESULT_CACHE_AGE", -1)
+
+    assert cache.get(mnist_model, mnist_dataset, perturbation, 2) is None
+    assert len(cache) == 0
+
+
+def test_invalidation(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    analytic = create_analytic(mnist_model, mnist_dataset)
+    cache.put(analytic.job_id, mnist_model, mnist_dataset)
+
+    mocker.patch.object(Fingerprint, "of_model", return_value="changed")
+
+    assert cache.get(mnist_model, mnist_dataset) is None
+    assert len(cache) == 0
+
+
+def test_saved_analytic_after_restart(
+    mocker: MockerFixture, mnist_model: Model, mnist_dataset: Dataset
+) -> None:
+    cache = ResultCache.get_instance()
+    cache.clear()
+    analytic = create_analytic(mnist_model, mnist_dataset)
+    analytic.set_result(JobResult())
+    analytic.set_done()
+    Analytics.get_instance().save_analytic(analytic)
+    cache.put(analytic.job_id, mnist_model, mnist_dataset)
+
+    # the saved analytics are not loaded by a new instance
+    restarted = Analytics()
+    mocker.patch.object(Analytics, "_Analytics__instance", restarted)
+    assert restarted.get_analytic(analytic.job_id) is None
+
+    assert cache.get(mnist_model, mnist_dataset) == analytic.job_id
+    assert len(cache) == 1
+    assert restarted.get_analytic(analytic.job_id) is not None
+
+    Analytics.get_instance().delete_analytic(
+        restarted.get_analytic(analytic.job_id)
+    )
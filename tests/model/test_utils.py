@@ -81,3 +81,13 @@ def test_utils_normalize_error() -> None:
     assert (
         exception
     ), "The shape_to function should have raise a ConversionError"
+
+
+def test_utils_image_to_thumbnail_url() -> None:
+    image = Utils.tensor_to_image(torch.rand(3, 300, 200))
+
+    thumbnail = Utils.image_to_thumbnail_url(image, 100)
+
+    assert thumbnail.startswith("data:image/png;base64,")
+    assert image.size == (200, 300)
+    assert len(thumbnail) < len(Utils.image_to_url(image))